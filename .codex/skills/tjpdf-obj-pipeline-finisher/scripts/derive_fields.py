@@ -10,6 +10,7 @@ Rules are in references/final_fields.md.
 
 Usage:
   python scripts/derive_fields.py --in fields.json --out fields_out.json
+  python scripts/derive_fields.py --batch results.jsonl --batch export.csv --out derived.csv --summary summary.json
 
 Input:
   JSON object containing at least:
@@ -17,6 +18,19 @@ Input:
     plus candidate dates (repo-specific naming). This script provides a
     reference implementation; adapt field names to your repo contracts.
 
+Batch mode:
+  --batch (repeatable) loads many results at once: JSONL (one object per line;
+  a nested `final_fields` object is flattened), CSV or XLSX (needs openpyxl;
+  first row is the header). Rows are held as columns and the precedence is
+  evaluated column by column, so a year of output can be re-derived after a
+  rule change without rerunning the C# pipeline. Output is JSONL or CSV
+  (by --out extension) and the `_DERIVATION_RULE` distribution is printed
+  (and written with --summary), along with how many rows changed their
+  previous VALOR_ARBITRADO_FINAL / DATA_ARBITRADO_FINAL and how many had no
+  previous value (counted apart, not as changes).
+  CSV/XLSX value cells (VALOR_ARBITRADO_*) are normalized before the precedence
+  so they match pick_final() on JSON: blank -> null, "0" / "0,00" -> 0.
+
 Note:
   This script is primarily meant as a deterministic reference for unit tests
   and to prevent regressions when refactoring mapfields.
@@ -25,31 +39,211 @@ Note:
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+import re
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DERIVED_KEYS = ["VALOR_ARBITRADO_FINAL", "DATA_ARBITRADO_FINAL", "_DERIVATION_RULE"]
+VALOR_KEYS = ["VALOR_ARBITRADO_JZ", "VALOR_ARBITRADO_DE", "VALOR_ARBITRADO_CM", "VALOR_ARBITRADO_FINAL"]
+ZERO_CELL_RE = re.compile(r"^(?:R\$\s*)?0+(?:[.,]0+)?$")
+
+
+def has_value(v: Any) -> bool:
+    return v not in (None, "", 0)
+
+
+def normalize_cell(v: Any) -> Any:
+    """CSV/XLSX value cell -> what the JSON output would hold: blank -> None, "0"/"0,00"/"R$ 0,00" -> 0."""
+    if not isinstance(v, str):
+        return v
+    text = v.strip()
+    if not text:
+        return None
+    if ZERO_CELL_RE.match(text):
+        return 0
+    return v
+
+
+def normalize_valor_cells(row: Dict[str, Any]) -> Dict[str, Any]:
+    for k in VALOR_KEYS:
+        if k in row:
+            row[k] = normalize_cell(row[k])
+    return row
 
 
 def pick_final(valor_cm, valor_de, valor_jz, data_cm, data_despacho, data_req) -> Tuple[Any, Any, str]:
     """
     Return (valor_final, data_final, rule_used).
     """
-    if valor_cm not in (None, "", 0):
+    if has_value(valor_cm):
         return valor_cm, data_cm, "CM"
-    if valor_de not in (None, "", 0):
+    if has_value(valor_de):
         return valor_de, data_despacho, "DE"
     return valor_jz, (data_despacho or data_req), "JZ"
 
 
+def iter_jsonl_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            ff = row.get("final_fields")
+            if isinstance(ff, dict):
+                row = {**{k: v for k, v in row.items() if k != "final_fields"}, **ff}
+            yield row
+
+
+def iter_csv_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            yield normalize_valor_cells(row)
+
+
+def iter_xlsx_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        import openpyxl  # type: ignore
+    except ImportError as e:
+        raise SystemExit(f"ERROR: reading {path} needs openpyxl (pip install openpyxl)") from e
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(h) if h is not None else "" for h in next(rows, ())]
+        for values in rows:
+            yield normalize_valor_cells({k: v for k, v in zip(header, values) if k})
+    finally:
+        wb.close()
+
+
+def load_columns(paths: List[Path]) -> Tuple[Dict[str, List[Any]], int]:
+    """Load every row of every input into columns (key -> list of values, None where absent)."""
+    readers = {".jsonl": iter_jsonl_rows, ".ndjson": iter_jsonl_rows, ".csv": iter_csv_rows, ".xlsx": iter_xlsx_rows}
+    columns: Dict[str, List[Any]] = {}
+    n = 0
+    for path in paths:
+        reader = readers.get(path.suffix.lower())
+        if reader is None:
+            raise SystemExit(f"ERROR: unsupported input (use .jsonl, .csv or .xlsx): {path}")
+        for row in reader(path):
+            for k, v in row.items():
+                col = columns.get(k)
+                if col is None:
+                    col = columns[k] = [None] * n
+                col.append(v)
+            n += 1
+            for col in columns.values():
+                if len(col) < n:
+                    col.append(None)
+    return columns, n
+
+
+def derive_columns(
+    columns: Dict[str, List[Any]], n: int, data_cm_key: str, data_despacho_key: str, data_req_key: str
+) -> Dict[str, List[Any]]:
+    """Same precedence as pick_final(), evaluated over whole columns."""
+    empty = [None] * n
+    valor_cm = columns.get("VALOR_ARBITRADO_CM", empty)
+    valor_de = columns.get("VALOR_ARBITRADO_DE", empty)
+    valor_jz = columns.get("VALOR_ARBITRADO_JZ", empty)
+    data_cm = [a or b for a, b in zip(columns.get(data_cm_key, empty), columns.get("DATA_ARBITRADO_CM", empty))]
+    data_despacho = columns.get(data_despacho_key, empty)
+    data_req = columns.get(data_req_key, empty)
+
+    use_cm = [has_value(v) for v in valor_cm]
+    use_de = [not cm and has_value(v) for cm, v in zip(use_cm, valor_de)]
+    rule = ["CM" if cm else "DE" if de else "JZ" for cm, de in zip(use_cm, use_de)]
+    valor_final = [
+        cm_v if r == "CM" else de_v if r == "DE" else jz_v
+        for r, cm_v, de_v, jz_v in zip(rule, valor_cm, valor_de, valor_jz)
+    ]
+    data_final = [
+        cm_d if r == "CM" else desp if r == "DE" else (desp or req)
+        for r, cm_d, desp, req in zip(rule, data_cm, data_despacho, data_req)
+    ]
+    return {"VALOR_ARBITRADO_FINAL": valor_final, "DATA_ARBITRADO_FINAL": data_final, "_DERIVATION_RULE": rule}
+
+
+def write_rows(out: Path, columns: Dict[str, List[Any]], n: int) -> None:
+    keys = list(columns.keys())
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if out.suffix.lower() == ".csv":
+        with out.open("w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(keys)
+            for values in zip(*(columns[k] for k in keys)):
+                w.writerow(["" if v is None else v for v in values])
+        return
+    with out.open("w", encoding="utf-8") as f:
+        for values in zip(*(columns[k] for k in keys)):
+            row = {k: v for k, v in zip(keys, values) if v is not None or k in DERIVED_KEYS}
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    paths = [Path(p).resolve() for p in args.batch]
+    missing = [p for p in paths if not p.exists()]
+    if missing:
+        print(f"ERROR: input not found: {missing[0]}")
+        return 2
+
+    columns, n = load_columns(paths)
+    derived = derive_columns(columns, n, args.data_cm_key, args.data_despacho_key, args.data_req_key)
+
+    def changed(key: str) -> Tuple[int, int]:
+        """(rows whose previous value differs, rows with no previous value); absent column = all rows new."""
+        before = columns.get(key)
+        if before is None:
+            return 0, n
+        # CSV cells are strings, so compare as text
+        as_text = lambda v: "" if v is None else str(v)  # noqa: E731
+        previous = [(old, new) for old, new in zip(before, derived[key]) if old not in (None, "")]
+        return sum(1 for old, new in previous if as_text(old) != as_text(new)), n - len(previous)
+
+    changed_valor, new_valor = changed("VALOR_ARBITRADO_FINAL")
+    changed_data, new_data = changed("DATA_ARBITRADO_FINAL")
+    summary = {
+        "rows": n,
+        "rules": dict(sorted(Counter(derived["_DERIVATION_RULE"]).items())),
+        "changed_valor_final": changed_valor,
+        "changed_data_final": changed_data,
+        "no_previous_valor_final": new_valor,
+        "no_previous_data_final": new_data,
+    }
+    columns.update(derived)
+
+    if args.out:
+        out = Path(args.out).resolve()
+        write_rows(out, columns, n)
+        print(f"Wrote: {out}")
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    rules = ", ".join(f"{k}={v} ({v / n:.1%})" for k, v in summary["rules"].items()) if n else "-"
+    print(f"rows={n} rules: {rules}")
+    print(f"changed: VALOR_ARBITRADO_FINAL={changed_valor} DATA_ARBITRADO_FINAL={changed_data}")
+    print(f"no previous value: VALOR_ARBITRADO_FINAL={new_valor} DATA_ARBITRADO_FINAL={new_data}")
+    return 0
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--in", dest="inp", required=True, help="Input JSON path (object with fields)")
-    ap.add_argument("--out", dest="out", required=True, help="Output JSON path")
+    ap.add_argument("--in", dest="inp", help="Input JSON path (object with fields)")
+    ap.add_argument("--out", dest="out", help="Output path (JSON; batch: .jsonl or .csv)")
+    ap.add_argument("--batch", action="append", default=[], help="Batch input: .jsonl, .csv or .xlsx (repeatable)")
+    ap.add_argument("--summary", default="", help="Batch: write the rule distribution/changes as JSON")
     ap.add_argument("--data-cm-key", default="DATA_DECISAO_CM", help="Key used for CM decision date")
     ap.add_argument("--data-despacho-key", default="DATA_DESPACHO", help="Key used for despacho date")
     ap.add_argument("--data-req-key", default="DATA_REQUISICAO", help="Key used for requerimento date")
     args = ap.parse_args()
 
+    if args.batch:
+        return run_batch(args)
+    if not args.inp or not args.out:
+        ap.error("--in and --out are required (or use --batch)")
+
     inp = Path(args.inp).resolve()
     out = Path(args.out).resolve()
 
@@ -8,21 +8,42 @@ Purpose:
 
 Usage:
   python scripts/triage_repo.py /path/to/repo
+  python scripts/triage_repo.py /path/to/repo --keyword alignrange
+  python scripts/triage_repo.py /path/to/repo --no-refresh      # answer from the index only
 
 Output:
   - locations of authoritative docs (OBJETOS_PIPELINE.md, ALIGN_RANGE.md, etc.)
   - candidate entrypoints (main scripts / CLIs)
   - keyword hits for OBJ/alignrange/mapfields
+
+Index:
+  Scan results (path, mtime, size, doc flag, entrypoint score, keywords found)
+  are persisted outside the analyzed tree, in
+  $XDG_CACHE_HOME/triage/<hash of the resolved root>.json (~/.cache when
+  XDG_CACHE_HOME is unset); --index PATH picks another file. Later runs re-read only files
+  whose mtime/size changed, so repeated queries take milliseconds. Files come
+  from `git ls-files --cached --others --exclude-standard` (honors .gitignore)
+  or, outside git, a walk that skips the root .gitignore patterns. Pipeline
+  artifacts (*.json under io/, outputs/, run/, probe/) and files larger than
+  --max-bytes (default 1 MB) are indexed by name only, unless --include-data /
+  --include-large are given. Entrypoint hints are only evaluated for .py files
+  (the only ones reported as entrypoint candidates).
 """
 
 from __future__ import annotations
 
+import argparse
+import fnmatch
+import hashlib
+import json
 import os
 import re
+import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Any, Dict, List, Optional
 
 
 DOC_FILENAMES = {
@@ -59,6 +80,16 @@ KEYWORDS = [
 
 TEXT_FILE_EXTS = {".py", ".md", ".txt", ".yaml", ".yml", ".json"}
 
+INDEX_NAME = ".triage_index.json"
+INDEX_VERSION = 1
+READ_LIMIT = 250_000
+DEFAULT_MAX_BYTES = 1_000_000
+ALWAYS_SKIP_DIRS = {".git"}
+# top-level dirs whose JSON files are run artifacts, not source/config
+DATA_DIRS = {"io", "outputs", "run", "probe"}
+
+ENTRYPOINT_RES = [re.compile(pat) for pat in ENTRYPOINT_HINTS]
+
 
 @dataclass
 class Hit:
@@ -67,59 +98,224 @@ class Hit:
     detail: str
 
 
-def iter_files(root: Path) -> Iterable[Path]:
-    for p in root.rglob("*"):
-        if p.is_file() and (p.suffix.lower() in TEXT_FILE_EXTS or p.name in DOC_FILENAMES):
-            yield p
+def is_candidate(name: str) -> bool:
+    return Path(name).suffix.lower() in TEXT_FILE_EXTS or name in DOC_FILENAMES
 
 
-def safe_read(p: Path, limit: int = 250_000) -> str:
+def safe_read(p: Path, limit: int = READ_LIMIT) -> str:
     try:
-        data = p.read_text(encoding="utf-8", errors="ignore")
-        return data[:limit]
+        with p.open("r", encoding="utf-8", errors="ignore") as f:
+            return f.read(limit)
     except Exception:
         return ""
 
 
-def main() -> int:
-    if len(sys.argv) != 2:
-        print("Usage: python scripts/triage_repo.py /path/to/repo")
-        return 2
+def rules_digest() -> str:
+    """Changes when the scan rules change; an index built with other rules is discarded."""
+    payload = json.dumps([sorted(DOC_FILENAMES), ENTRYPOINT_HINTS, KEYWORDS, sorted(TEXT_FILE_EXTS), READ_LIMIT])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-    root = Path(sys.argv[1]).resolve()
-    if not root.exists():
-        print(f"ERROR: path does not exist: {root}")
-        return 2
 
-    hits: List[Hit] = []
+def git_listed_files(root: Path) -> Optional[List[str]]:
+    """Tracked + untracked-but-not-ignored files (relative, posix); None when root is not a git checkout."""
+    try:
+        p = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    if p.returncode != 0:
+        return None
+    return [f for f in p.stdout.decode("utf-8", errors="surrogateescape").split("\0") if f]
+
 
-    # 1) Filename-based doc discovery
-    for p in root.rglob("*"):
-        if p.is_file() and p.name in DOC_FILENAMES:
-            hits.append(Hit(str(p), "doc", f"Found doc file {p.name}"))
+def load_gitignore_patterns(root: Path) -> List[str]:
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8", errors="ignore").splitlines()
+    except OSError:
+        return []
+    return [ln.strip() for ln in lines if ln.strip() and not ln.startswith(("#", "!"))]
+
+
+def is_ignored(rel: str, name: str, patterns: List[str]) -> bool:
+    for pat in patterns:
+        anchored = pat.startswith("/")
+        pat = pat.strip("/")
+        if anchored or "/" in pat:
+            if fnmatch.fnmatch(rel, pat):
+                return True
+        elif fnmatch.fnmatch(name, pat):
+            return True
+    return False
 
-    # 2) Content-based discovery
-    for p in iter_files(root):
-        text = safe_read(p)
-        if not text:
+
+def walk_files(root: Path, patterns: List[str]) -> List[str]:
+    """Fallback outside git: one os.scandir walk, pruning ignored directories early."""
+    out: List[str] = []
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(root / rel_dir))
+        except OSError:
             continue
+        for e in entries:
+            rel = f"{rel_dir}/{e.name}" if rel_dir else e.name
+            if e.name in ALWAYS_SKIP_DIRS or is_ignored(rel, e.name, patterns):
+                continue
+            if e.is_dir(follow_symlinks=False):
+                stack.append(rel)
+            elif e.is_file():
+                out.append(rel)
+    return out
+
+
+def is_data_file(rel: str) -> bool:
+    return rel.lower().endswith(".json") and rel.split("/", 1)[0] in DATA_DIRS
 
-        # entrypoint score
-        entry_score = 0
-        for pat in ENTRYPOINT_HINTS:
-            if re.search(pat, text):
-                entry_score += 1
-        if entry_score >= 2 and p.suffix.lower() == ".py":
-            hits.append(Hit(str(p), "entrypoint_candidate", f"Matched {entry_score} entrypoint hints"))
 
-        # keyword hits (first match per keyword)
-        for kw in KEYWORDS:
-            if kw in text:
-                hits.append(Hit(str(p), "keyword", f"Contains keyword: {kw}"))
-                break
+def scan_file(p: Path) -> Dict[str, Any]:
+    text = safe_read(p)
+    entry_score = sum(1 for rx in ENTRYPOINT_RES if rx.search(text)) if text and p.suffix.lower() == ".py" else 0
+    keywords = [kw for kw in KEYWORDS if kw in text] if text else []
+    return {"entry_score": entry_score, "keywords": keywords}
+
+
+def default_index_path(root: Path) -> Path:
+    """Per-root index in the user cache dir, so the analyzed repo is never written to."""
+    cache = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    key = hashlib.sha256(str(root).encode("utf-8", errors="surrogateescape")).hexdigest()[:16]
+    return Path(cache) / "triage" / f"{key}.json"
+
+
+def load_index(path: Path, digest: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != INDEX_VERSION or data.get("rules") != digest:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_index(path: Path, digest: str, files: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": INDEX_VERSION, "rules": digest, "files": files}, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def refresh_index(
+    root: Path, old: Dict[str, Dict[str, Any]], max_bytes: int, include_data: bool, use_gitignore: bool
+) -> tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """Re-scan only new/changed files; entries for deleted or now-ignored files are dropped."""
+    listed = git_listed_files(root) if use_gitignore else None
+    if listed is None:
+        listed = walk_files(root, load_gitignore_patterns(root) if use_gitignore else [])
+    stats = {"listed": 0, "reused": 0, "scanned": 0, "skipped": 0}
+    files: Dict[str, Dict[str, Any]] = {}
+    for rel in listed:
+        name = rel.rsplit("/", 1)[-1]
+        if name == INDEX_NAME or not is_candidate(name):
+            continue
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            continue
+        stats["listed"] += 1
+        skip = ""
+        if not include_data and is_data_file(rel):
+            skip = "data"
+        elif max_bytes > 0 and st.st_size > max_bytes:
+            skip = "large"
+        prev = old.get(rel)
+        if (
+            prev
+            and prev.get("mtime_ns") == st.st_mtime_ns
+            and prev.get("size") == st.st_size
+            and prev.get("skipped", "") == skip
+        ):
+            files[rel] = prev
+            stats["reused"] += 1
+            continue
+        entry: Dict[str, Any] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "doc": name in DOC_FILENAMES}
+        if skip:
+            entry.update(skipped=skip, entry_score=0, keywords=[])
+            stats["skipped"] += 1
+        else:
+            entry.update(scan_file(root / rel))
+            stats["scanned"] += 1
+        files[rel] = entry
+    return files, stats
+
+
+def hits_from_index(root: Path, files: Dict[str, Dict[str, Any]], keyword: str = "") -> List[Hit]:
+    hits: List[Hit] = []
+    for rel, entry in files.items():
+        path = str(root / rel)
+        if entry.get("doc"):
+            hits.append(Hit(path, "doc", f"Found doc file {rel.rsplit('/', 1)[-1]}"))
+        score = entry.get("entry_score", 0)
+        if score >= 2 and rel.lower().endswith(".py"):
+            hits.append(Hit(path, "entrypoint_candidate", f"Matched {score} entrypoint hints"))
+        kws = entry.get("keywords") or []
+        if keyword:
+            if keyword in kws:
+                hits.append(Hit(path, "keyword", f"Contains keyword: {keyword}"))
+        elif kws:
+            # first match per keyword list order
+            hits.append(Hit(path, "keyword", f"Contains keyword: {kws[0]}"))
+    return hits
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Map docs, entrypoints and keyword hits of a TJPDF-style repository.")
+    ap.add_argument("root", help="Repository root")
+    ap.add_argument("--index", default="", help="Index path (default: $XDG_CACHE_HOME/triage/<root hash>.json)")
+    ap.add_argument("--no-refresh", action="store_true", help="Answer from the existing index without rescanning")
+    ap.add_argument("--rebuild", action="store_true", help="Discard the index and scan everything again")
+    ap.add_argument("--no-gitignore", action="store_true", help="Also index files ignored by .gitignore")
+    ap.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help="Skip files larger than this (0 = no limit)")
+    ap.add_argument("--include-large", action="store_true", help="Same as --max-bytes 0")
+    ap.add_argument("--include-data", action="store_true", help="Also scan JSON artifacts under io/, outputs/, run/, probe/")
+    ap.add_argument("--keyword", default="", help=f"Only list files containing this keyword (one of: {', '.join(KEYWORDS)})")
+    args = ap.parse_args()
+
+    root = Path(args.root).resolve()
+    if not root.exists():
+        print(f"ERROR: path does not exist: {root}")
+        return 2
+    if args.keyword and args.keyword not in KEYWORDS:
+        print(f"ERROR: unknown keyword: {args.keyword}")
+        return 2
+
+    started = time.perf_counter()
+    index_path = Path(args.index).resolve() if args.index else default_index_path(root)
+    digest = rules_digest()
+    old = {} if args.rebuild else load_index(index_path, digest)
+    if args.no_refresh:
+        if not old:
+            print(f"ERROR: no usable index at {index_path} (run without --no-refresh first)")
+            return 2
+        files, stats = old, {"listed": len(old), "reused": len(old), "scanned": 0, "skipped": 0}
+    else:
+        max_bytes = 0 if args.include_large else args.max_bytes
+        files, stats = refresh_index(root, old, max_bytes, args.include_data, not args.no_gitignore)
+        if stats["scanned"] or len(files) != len(old):
+            save_index(index_path, digest, files)
+
+    hits = hits_from_index(root, files, args.keyword)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
 
     # Print summary
     print(f"Repository root: {root}")
+    print(
+        f"Index: {index_path} files={stats['listed']} reused={stats['reused']} scanned={stats['scanned']} "
+        f"skipped={stats['skipped']} ({elapsed_ms:.0f} ms)"
+    )
     print("")
 
     def section(title: str, kind: str) -> None:
@@ -129,6 +325,10 @@ def main() -> int:
             print(f"- {h.path} :: {h.detail}")
         print("")
 
+    if args.keyword:
+        section(f"Keyword hits: {args.keyword}", "keyword")
+        return 0
+
     section("Authoritative docs", "doc")
     section("Entrypoint candidates", "entrypoint_candidate")
     section("Keyword hits (OBJ/alignrange/mapfields/etc.)", "keyword")
@@ -8,17 +8,35 @@ Usage:
   python scripts/validate_output.py --json path/to/output.json
   python scripts/validate_output.py --json path/to/output.json --schema references/output_schema.json
 
+Batch mode (directories and/or globs, validated in parallel):
+  python scripts/validate_output.py --dir outputs/nightly --report report.jsonl --jobs 8
+  python scripts/validate_output.py --glob "outputs/**/*__final.json" --fast
+
 Notes:
-  - Uses `jsonschema` if installed.
+  - Uses `jsonschema` if installed; the validator is compiled once per process.
   - Falls back to a lightweight validator if `jsonschema` is not available.
+  - --fast only checks that every document has all FINAL_FIELDS keys. It scans the
+    file text and decodes only object keys and scalars: strings, arrays and nested
+    objects are skipped by a regex scan, so no document is turned into Python objects
+    (malformed JSON inside a skipped value is not detected in this mode).
+  - The schema is loaded and checked once in the main process before the pool starts;
+    an invalid schema stops the batch with exit code 2.
+  - The JSONL report has one line per file: status, validator and an `errors` list
+    with {document, field, path, message} for each problem found.
 """
 
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import glob
 import json
+import os
+import re
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 FINAL_FIELDS = [
@@ -49,64 +67,367 @@ def load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def try_jsonschema_validate(instance: Any, schema: Dict[str, Any]) -> Tuple[bool, str]:
+def compile_validator(schema: Dict[str, Any]) -> Optional[Any]:
+    """Build the jsonschema validator for `schema` once; None if jsonschema is not installed."""
     try:
         import jsonschema  # type: ignore
-        jsonschema.validate(instance=instance, schema=schema)
-        return True, "jsonschema: ok"
     except ImportError:
-        return False, "jsonschema not installed"
+        return None
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def try_jsonschema_validate(instance: Any, schema: Dict[str, Any], validator: Optional[Any] = None) -> Tuple[bool, str]:
+    try:
+        if validator is None:
+            validator = compile_validator(schema)
+        if validator is None:
+            return False, "jsonschema not installed"
+        validator.validate(instance)
+        return True, "jsonschema: ok"
     except Exception as e:
         return False, f"jsonschema validation failed: {e}"
 
 
-def lightweight_validate(data: Any) -> List[str]:
-    errors: List[str] = []
+def make_error(path: List[Any], message: str) -> Dict[str, Any]:
+    """Report entry; `document` and `field` are pulled out of the JSON path when present."""
+    document = path[1] if len(path) > 1 and path[0] == "documents" and isinstance(path[1], int) else None
+    field = None
+    if document is not None and len(path) > 3 and path[2] == "final_fields":
+        field = path[3]
+    elif document is not None and len(path) > 2:
+        field = path[2]
+    return {
+        "document": document,
+        "field": field,
+        "path": "/".join(str(p) for p in path),
+        "message": message,
+    }
+
+
+def lightweight_errors(data: Any) -> List[Dict[str, Any]]:
+    errors: List[Dict[str, Any]] = []
     if not isinstance(data, dict):
-        return ["Root must be an object/dict"]
+        return [make_error([], "Root must be an object/dict")]
 
     if "meta" not in data or "documents" not in data:
-        errors.append("Missing required keys: meta, documents")
+        errors.append(make_error([], "Missing required keys: meta, documents"))
 
     docs = data.get("documents")
     if not isinstance(docs, list) or len(docs) == 0:
-        errors.append("documents must be a non-empty array")
+        errors.append(make_error(["documents"], "documents must be a non-empty array"))
 
     for i, d in enumerate(docs if isinstance(docs, list) else []):
         if not isinstance(d, dict):
-            errors.append(f"documents[{i}] must be an object")
+            errors.append(make_error(["documents", i], f"documents[{i}] must be an object"))
             continue
 
         for k in ["doc_type", "pages", "confidence", "final_fields", "field_results"]:
             if k not in d:
-                errors.append(f"documents[{i}] missing required key: {k}")
+                errors.append(make_error(["documents", i, k], f"documents[{i}] missing required key: {k}"))
 
         ff = d.get("final_fields")
         if isinstance(ff, dict):
-            missing = [k for k in FINAL_FIELDS if k not in ff]
-            if missing:
-                errors.append(f"documents[{i}].final_fields missing keys: {missing}")
+            for k in FINAL_FIELDS:
+                if k not in ff:
+                    errors.append(make_error(["documents", i, "final_fields", k], f"documents[{i}].final_fields missing key: {k}"))
         else:
-            errors.append(f"documents[{i}].final_fields must be an object")
+            errors.append(make_error(["documents", i, "final_fields"], f"documents[{i}].final_fields must be an object"))
 
     return errors
 
 
+def lightweight_validate(data: Any) -> List[str]:
+    # same checks as lightweight_errors, with the missing final_fields keys grouped per document
+    errors: List[Any] = []
+    missing_by_doc: Dict[Any, List[str]] = {}
+    for e in lightweight_errors(data):
+        if e["path"] == f"documents/{e['document']}/final_fields/{e['field']}" and e["field"] in FINAL_FIELDS:
+            if e["document"] not in missing_by_doc:
+                missing_by_doc[e["document"]] = []
+                errors.append(e["document"])
+            missing_by_doc[e["document"]].append(e["field"])
+            continue
+        errors.append(e["message"])
+    return [
+        e if isinstance(e, str) else f"documents[{e}].final_fields missing keys: {missing_by_doc[e]}"
+        for e in errors
+    ]
+
+
+_DECODER = json.JSONDecoder()
+_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WS_RE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, chars: str) -> int:
+    """Position of the expected delimiter (after whitespace); raises JSONDecodeError otherwise."""
+    pos = _skip_ws(text, pos)
+    if pos >= len(text) or text[pos] not in chars:
+        raise json.JSONDecodeError(f"Expecting one of {chars!r}", text, pos)
+    return pos
+
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING_RE = re.compile(_STRING, re.S)
+_STRUCT_RE = re.compile(_STRING + r"|[\[\]{}]", re.S)
+
+
+def _skip_value(text: str, pos: int) -> int:
+    """End of the JSON value at `pos`; strings and containers are scanned, not decoded."""
+    c = text[pos] if pos < len(text) else ""
+    if c == '"':
+        m = _STRING_RE.match(text, pos)
+        if m is None:
+            raise json.JSONDecodeError("Unterminated string", text, pos)
+        return m.end()
+    if c == "[" or c == "{":
+        depth = 0
+        for m in _STRUCT_RE.finditer(text, pos):
+            tok = m.group()
+            if tok == "[" or tok == "{":
+                depth += 1
+            elif tok == "]" or tok == "}":
+                depth -= 1
+                if depth == 0:
+                    return m.end()
+        raise json.JSONDecodeError("Unterminated array or object", text, pos)
+    _, end = _DECODER.raw_decode(text, pos)
+    return end
+
+
+def _scan_object(text: str, pos: int, want: str = "") -> Tuple[set, int, int]:
+    """(keys, position of the `want` value or -1, end) for the object at `pos`, skipping all values."""
+    keys = set()
+    want_pos = -1
+    pos = _expect(text, pos + 1, '"}')
+    if text[pos] == "}":
+        return keys, want_pos, pos + 1
+    while True:
+        pos = _expect(text, pos, '"')
+        key, pos = _DECODER.raw_decode(text, pos)
+        pos = _skip_ws(text, _expect(text, pos, ":") + 1)
+        keys.add(key)
+        if key == want:
+            want_pos = pos
+        pos = _expect(text, _skip_value(text, pos), ",}")
+        if text[pos] == "}":
+            return keys, want_pos, pos + 1
+        pos += 1
+
+
+def walk_documents(text: str, visit: Callable[[int, int], int]) -> int:
+    """Call visit(index, start) for each entry of the top-level `documents` array; returns the count.
+
+    `visit` returns the end position of the entry. Only the root object is walked: other
+    top-level values (meta) are skipped, so a nested `documents` key cannot be mistaken for
+    the real one. Raises JSONDecodeError on malformed structure and ValueError when
+    `documents` is missing or not an array.
+    """
+    pos = _expect(text, 0, "{") + 1
+    if text[_expect(text, pos, '"}')] == "}":
+        raise ValueError("Missing required key: documents")
+    while True:
+        pos = _expect(text, pos, '"')
+        key, pos = _DECODER.raw_decode(text, pos)
+        pos = _expect(text, pos, ":") + 1
+        pos = _skip_ws(text, pos)
+        if key == "documents":
+            if not text.startswith("[", pos):
+                raise ValueError("documents must be a non-empty array")
+            pos += 1
+            if text.startswith("]", _skip_ws(text, pos)):
+                return 0
+            i = 0
+            while True:
+                pos = visit(i, _skip_ws(text, pos))
+                i += 1
+                pos = _expect(text, pos, ",]")
+                if text[pos] == "]":
+                    return i
+                pos += 1
+        pos = _expect(text, _skip_value(text, pos), ",}")
+        if text[pos] == "}":
+            raise ValueError("Missing required key: documents")
+        pos += 1
+
+
+def fast_final_fields_errors(text: str) -> List[Dict[str, Any]]:
+    """Check FINAL_FIELDS presence per document from object keys alone (values are never decoded)."""
+    errors: List[Dict[str, Any]] = []
+
+    def visit(i: int, pos: int) -> int:
+        if not text.startswith("{", pos):
+            errors.append(make_error(["documents", i], f"documents[{i}] must be an object"))
+            return _skip_value(text, pos)
+        _, ff_pos, end = _scan_object(text, pos, "final_fields")
+        if ff_pos < 0:
+            errors.append(make_error(["documents", i, "final_fields"], f"documents[{i}] missing required key: final_fields"))
+            return end
+        if not text.startswith("{", ff_pos):
+            errors.append(make_error(["documents", i, "final_fields"], f"documents[{i}].final_fields must be an object"))
+            return end
+        ff_keys, _, _ = _scan_object(text, ff_pos)
+        for k in FINAL_FIELDS:
+            if k not in ff_keys:
+                errors.append(make_error(["documents", i, "final_fields", k], f"documents[{i}].final_fields missing key: {k}"))
+        return end
+
+    try:
+        count = walk_documents(text, visit)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        errors.append(make_error(["documents"] if "array" in str(e) else [], str(e)))
+        return errors
+    if count == 0:
+        errors.append(make_error(["documents"], "documents must be a non-empty array"))
+    return errors
+
+
+# Per-process state for batch mode (set by _init_worker in each pool process).
+_WORKER_SCHEMA: Dict[str, Any] = {}
+_WORKER_VALIDATOR: Optional[Any] = None
+_WORKER_FAST = False
+
+
+def _init_worker(schema_path: str, fast: bool) -> None:
+    global _WORKER_SCHEMA, _WORKER_VALIDATOR, _WORKER_FAST
+    _WORKER_FAST = fast
+    if not fast:
+        _WORKER_SCHEMA = load_json(Path(schema_path))
+        _WORKER_VALIDATOR = compile_validator(_WORKER_SCHEMA)
+
+
+def validate_file(path_str: str) -> Dict[str, Any]:
+    """Validate one file with the per-process validator; returns its report record."""
+    started = time.perf_counter()
+    path = Path(path_str)
+    record: Dict[str, Any] = {"file": path_str}
+    try:
+        raw = path.read_bytes()
+        record["bytes"] = len(raw)
+        text = raw.decode("utf-8")
+        if _WORKER_FAST:
+            record["validator"] = "fast"
+            errors = fast_final_fields_errors(text)
+        else:
+            data = json.loads(text)
+            if _WORKER_VALIDATOR is not None:
+                record["validator"] = "jsonschema"
+                errors = [
+                    make_error(list(e.absolute_path), e.message)
+                    for e in sorted(_WORKER_VALIDATOR.iter_errors(data), key=lambda e: list(map(str, e.absolute_path)))
+                ]
+            else:
+                record["validator"] = "lightweight"
+                errors = lightweight_errors(data)
+        record["status"] = "invalid" if errors else "valid"
+        record["errors"] = errors
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        record["status"] = "error"
+        record["errors"] = [make_error([], f"{type(e).__name__}: {e}")]
+    record["ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+    return record
+
+
+def iter_batch_files(dirs: List[str], globs: List[str], pattern: str) -> Iterator[Path]:
+    seen = set()
+    candidates: List[Path] = []
+    for d in dirs:
+        candidates.extend(sorted(Path(d).rglob(pattern)))
+    for g in globs:
+        candidates.extend(sorted(Path(p) for p in glob.glob(g, recursive=True)))
+    for p in candidates:
+        key = p.resolve()
+        if p.is_file() and key not in seen:
+            seen.add(key)
+            yield p
+
+
+def run_batch(args: argparse.Namespace, schema_path: Path) -> int:
+    files = [str(p) for p in iter_batch_files(args.dir, args.glob, args.pattern)]
+    if not files:
+        print("ERROR: no files matched")
+        return 2
+
+    if not args.fast:
+        # checked here so a bad schema is one clear error instead of a broken pool initializer
+        try:
+            compile_validator(load_json(schema_path))
+        except Exception as e:
+            print(f"ERROR: invalid schema {schema_path}: {type(e).__name__}: {e}")
+            return 2
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    jobs = max(1, min(jobs, len(files)))
+    chunksize = max(1, min(64, len(files) // (jobs * 4) or 1))
+    report = open(args.report, "w", encoding="utf-8") if args.report else None
+    counts = {"valid": 0, "invalid": 0, "error": 0}
+    total_bytes = 0
+    validator = "fast" if args.fast else None
+    started = time.perf_counter()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(str(schema_path), args.fast)
+        ) as ex:
+            for record in ex.map(validate_file, files, chunksize=chunksize):
+                counts[record["status"]] += 1
+                total_bytes += record.get("bytes", 0)
+                validator = validator or record.get("validator")
+                if report is not None:
+                    report.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if record["status"] != "valid" and not args.quiet:
+                    print(f"INVALID ❌ {record['file']} ({len(record['errors'])} errors)")
+                    for e in record["errors"][:5]:
+                        print("  -", e["path"] or "<root>", e["message"])
+    finally:
+        if report is not None:
+            report.close()
+    elapsed = time.perf_counter() - started
+
+    rate = len(files) / elapsed if elapsed > 0 else 0.0
+    mb_rate = total_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"files={len(files)} valid={counts['valid']} invalid={counts['invalid']} error={counts['error']} "
+        f"validator={validator} jobs={jobs}"
+    )
+    print(f"throughput: {rate:.1f} files/s, {mb_rate:.2f} MB/s ({elapsed:.2f}s)")
+    return 0 if counts["valid"] == len(files) else 1
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--json", required=True, help="Path to output JSON")
+    ap.add_argument("--json", help="Path to output JSON")
+    ap.add_argument("--dir", action="append", default=[], help="Batch: directory searched recursively (repeatable)")
+    ap.add_argument("--glob", action="append", default=[], help="Batch: glob pattern, ** allowed (repeatable)")
+    ap.add_argument("--pattern", default="*__final.json", help="Batch: file name pattern used with --dir")
+    ap.add_argument("--jobs", type=int, default=0, help="Batch: worker processes (0 = CPU count)")
+    ap.add_argument("--report", default="", help="Batch: write a JSONL report (one line per file)")
+    ap.add_argument("--fast", action="store_true", help="Batch: only check FINAL_FIELDS presence (no full parse)")
+    ap.add_argument("--quiet", action="store_true", help="Batch: do not print per-file errors")
     ap.add_argument("--schema", default=str(Path(__file__).resolve().parent.parent / "references" / "output_schema.json"))
     args = ap.parse_args()
 
-    json_path = Path(args.json).resolve()
     schema_path = Path(args.schema).resolve()
+    if not schema_path.exists():
+        print(f"ERROR: schema not found: {schema_path}")
+        return 2
+
+    if args.dir or args.glob:
+        return run_batch(args, schema_path)
+    if not args.json:
+        ap.error("one of --json, --dir or --glob is required")
+
+    json_path = Path(args.json).resolve()
 
     if not json_path.exists():
         print(f"ERROR: JSON not found: {json_path}")
         return 2
-    if not schema_path.exists():
-        print(f"ERROR: schema not found: {schema_path}")
-        return 2
 
     data = load_json(json_path)
     schema = load_json(schema_path)
@@ -33,7 +33,14 @@ namespace Obj.OperCli
             var rawRest = args.Length > 1 ? args[1..] : Array.Empty<string>();
             if (IsBuildAlignExeMode(rawMode))
                 return ExecuteBuildAlignExe(rawRest);
+            if (IsWorkerMode(rawMode))
+                return ExecuteWorker(rawRest);
 
+            return RunCommand(args);
+        }
+
+        private static int RunCommand(string[] args)
+        {
             InitLogger(args);
             args = ApplyGlobalOutputConfig(args);
             args = PathUtils.NormalizeArgs(args);
@@ -43,6 +50,9 @@ namespace Obj.OperCli
                 return 1;
             }
 
+            if (IsInspectAliasesMode(args, out var aliasesArgs))
+                return ExecuteInspectAliases(aliasesArgs);
+
             if (!ReturnUtils.IsEnabled())
                 InputPreview.PrintPlannedInputs(args);
             Preflight.Run(args);
@@ -506,6 +516,377 @@ namespace Obj.OperCli
             }
         }
 
+        private static bool IsInspectAliasesMode(string[] args, out string[] rest)
+        {
+            rest = Array.Empty<string>();
+            var mode = (args[0] ?? "").Trim();
+            if (string.Equals(mode, "aliases", StringComparison.OrdinalIgnoreCase))
+            {
+                rest = args[1..];
+                return true;
+            }
+            if (string.Equals(mode, "inspect", StringComparison.OrdinalIgnoreCase) &&
+                args.Length > 1 &&
+                string.Equals((args[1] ?? "").Trim(), "aliases", StringComparison.OrdinalIgnoreCase))
+            {
+                rest = args[2..];
+                return true;
+            }
+            return false;
+        }
+
+        // Lista os aliases de índice (:D, :Q, ...) sem carregar modelo nem rodar alinhamento.
+        private static int ExecuteInspectAliases(string[] args)
+        {
+            var asJson = false;
+            var withFiles = true;
+            var keys = new List<string>();
+            for (var i = 0; i < args.Length; i++)
+            {
+                var arg = (args[i] ?? "").Trim();
+                if (arg.Equals("--help", StringComparison.OrdinalIgnoreCase) || arg.Equals("-h", StringComparison.OrdinalIgnoreCase))
+                {
+                    ShowInspectAliasesHelp();
+                    return 0;
+                }
+                if (arg.Equals("--json", StringComparison.OrdinalIgnoreCase))
+                {
+                    asJson = true;
+                    continue;
+                }
+                if (arg.Equals("--no-files", StringComparison.OrdinalIgnoreCase))
+                {
+                    withFiles = false;
+                    continue;
+                }
+                if (arg.Equals("--keys", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
+                {
+                    AddInputTokens(args[++i], keys);
+                    continue;
+                }
+                if (arg.StartsWith("--keys=", StringComparison.OrdinalIgnoreCase))
+                {
+                    AddInputTokens(arg.Split('=', 2)[1], keys);
+                    continue;
+                }
+
+                Console.Error.WriteLine($"Argumento não suportado: {arg}");
+                ShowInspectAliasesHelp();
+                return 1;
+            }
+
+            if (keys.Count == 0)
+                keys.AddRange(PathUtils.ListIndexAliasKeys());
+
+            var aliases = new List<Dictionary<string, object>>();
+            foreach (var rawKey in keys)
+            {
+                var key = rawKey.Trim().TrimStart(':').ToUpperInvariant();
+                var resolved = PathUtils.TryListIndexAlias(key, out var dir, out var files, out var invalidCount);
+                var entry = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                {
+                    ["key"] = key,
+                    ["dir"] = dir ?? "",
+                    ["resolved"] = resolved,
+                    ["count"] = files.Count,
+                    ["invalid"] = invalidCount
+                };
+                if (withFiles)
+                {
+                    var fileEntries = new List<Dictionary<string, object>>(files.Count);
+                    for (var i = 0; i < files.Count; i++)
+                    {
+                        var info = new FileInfo(files[i]);
+                        fileEntries.Add(new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                        {
+                            ["index"] = i + 1,
+                            ["path"] = files[i],
+                            ["size"] = info.Exists ? info.Length : 0L,
+                            ["mtime_utc"] = info.Exists ? info.LastWriteTimeUtc.ToString("O", CultureInfo.InvariantCulture) : ""
+                        });
+                    }
+                    entry["files"] = fileEntries;
+                }
+                aliases.Add(entry);
+            }
+
+            var models = new List<Dictionary<string, object>>();
+            foreach (var modelAlias in new[] { "@M-DESP", "@M-CER", "@M-REQ" })
+            {
+                var modelFiles = PathUtils.ListTypedModelAliasFiles(modelAlias);
+                models.Add(new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                {
+                    ["alias"] = modelAlias,
+                    ["resolved"] = modelFiles.Count > 0,
+                    ["files"] = modelFiles
+                });
+            }
+
+            if (asJson)
+            {
+                var payload = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                {
+                    ["generated_utc"] = DateTime.UtcNow.ToString("O", CultureInfo.InvariantCulture),
+                    ["aliases"] = aliases,
+                    ["models"] = models
+                };
+                Console.WriteLine(JsonSerializer.Serialize(payload));
+                return 0;
+            }
+
+            foreach (var entry in aliases)
+            {
+                var resolved = (bool)entry["resolved"];
+                Console.WriteLine($"[ALIAS :{entry["key"]}] {(resolved ? entry["dir"] : "(não resolvido)")} total={entry["count"]} invalidos={entry["invalid"]}");
+            }
+            foreach (var model in models)
+            {
+                var modelFiles = (List<string>)model["files"];
+                Console.WriteLine($"[MODELO {model["alias"]}] {(modelFiles.Count > 0 ? string.Join(", ", modelFiles) : "(não resolvido)")}");
+            }
+            return 0;
+        }
+
+        private static bool IsWorkerMode(string mode)
+        {
+            return string.Equals(mode, "worker", StringComparison.OrdinalIgnoreCase) ||
+                   string.Equals(mode, "serve", StringComparison.OrdinalIgnoreCase);
+        }
+
+        // Processo persistente: cada linha do stdin é uma requisição JSON {"id":..,"args":[..]}
+        // e cada resposta sai como uma linha JSON no stdout. O console dos comandos é capturado
+        // por requisição, então o stdout real fica reservado ao protocolo.
+        private static int ExecuteWorker(string[] args)
+        {
+            var warmupArgs = new List<string>();
+            for (var i = 0; i < args.Length; i++)
+            {
+                var arg = (args[i] ?? "").Trim();
+                if (arg.Equals("--help", StringComparison.OrdinalIgnoreCase) || arg.Equals("-h", StringComparison.OrdinalIgnoreCase))
+                {
+                    ShowWorkerHelp();
+                    return 0;
+                }
+                if (arg.Equals("--warmup", StringComparison.OrdinalIgnoreCase))
+                {
+                    for (var j = i + 1; j < args.Length; j++)
+                        warmupArgs.Add(args[j]);
+                    break;
+                }
+
+                Console.Error.WriteLine($"Argumento não suportado: {arg}");
+                ShowWorkerHelp();
+                return 1;
+            }
+
+            var utf8 = new UTF8Encoding(encoderShouldEmitUTF8Identifier: false);
+            using var protocolOut = new StreamWriter(Console.OpenStandardOutput(), utf8) { AutoFlush = true };
+            using var protocolIn = new StreamReader(Console.OpenStandardInput(), utf8);
+
+            var warmupStopwatch = Stopwatch.StartNew();
+            var warmupExitCode = 0;
+            if (warmupArgs.Count > 0)
+                warmupExitCode = RunWorkerRequest(warmupArgs.ToArray(), out _, out _);
+            warmupStopwatch.Stop();
+
+            WriteWorkerMessage(protocolOut, new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+            {
+                ["event"] = "ready",
+                ["pid"] = Environment.ProcessId,
+                ["warmup_ms"] = warmupStopwatch.Elapsed.TotalMilliseconds,
+                ["warmup_exit_code"] = warmupExitCode
+            });
+
+            string? line;
+            while ((line = protocolIn.ReadLine()) != null)
+            {
+                line = line.Trim();
+                if (line.Length == 0)
+                    continue;
+
+                if (!TryParseWorkerRequest(line, out var id, out var requestArgs, out var captureOutput, out var logPath, out var shutdown, out var error))
+                {
+                    WriteWorkerMessage(protocolOut, new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                    {
+                        ["id"] = id,
+                        ["exit_code"] = 2,
+                        ["error"] = error
+                    });
+                    continue;
+                }
+                if (shutdown)
+                    break;
+
+                if (logPath.Length > 0)
+                {
+                    // "log": o console do comando vai direto para o arquivo (stdout e stderr intercalados
+                    // como saem); a resposta so traz exit_code, sem guardar a saida na memoria.
+                    WriteWorkerMessage(protocolOut, RunWorkerRequestToLog(id, requestArgs, logPath, utf8));
+                    continue;
+                }
+
+                var stopwatch = Stopwatch.StartNew();
+                var exitCode = RunWorkerRequest(requestArgs, out var stdout, out var stderr);
+                stopwatch.Stop();
+
+                var response = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                {
+                    ["id"] = id,
+                    ["exit_code"] = exitCode,
+                    ["duration_ms"] = stopwatch.Elapsed.TotalMilliseconds,
+                    ["stdout_len"] = stdout.Length,
+                    ["stderr_len"] = stderr.Length
+                };
+                if (captureOutput)
+                {
+                    response["stdout"] = stdout;
+                    response["stderr"] = stderr;
+                }
+                WriteWorkerMessage(protocolOut, response);
+            }
+
+            return 0;
+        }
+
+        private static Dictionary<string, object> RunWorkerRequestToLog(object id, string[] args, string logPath, Encoding encoding)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            var response = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase) { ["id"] = id };
+            try
+            {
+                var dir = Path.GetDirectoryName(Path.GetFullPath(logPath));
+                if (!string.IsNullOrEmpty(dir))
+                    Directory.CreateDirectory(dir);
+                int exitCode;
+                using (var logWriter = new StreamWriter(logPath, append: false, encoding))
+                {
+                    var shared = TextWriter.Synchronized(logWriter);
+                    exitCode = RunWorkerRequest(args, shared, shared);
+                }
+                response["exit_code"] = exitCode;
+                response["log"] = logPath;
+            }
+            catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException || ex is ArgumentException || ex is NotSupportedException)
+            {
+                response["exit_code"] = 2;
+                response["error"] = $"log inválido: {ex.Message}";
+            }
+            stopwatch.Stop();
+            response["duration_ms"] = stopwatch.Elapsed.TotalMilliseconds;
+            return response;
+        }
+
+        private static int RunWorkerRequest(string[] args, out string stdout, out string stderr)
+        {
+            var stdoutCapture = new StringWriter(CultureInfo.InvariantCulture);
+            var stderrCapture = new StringWriter(CultureInfo.InvariantCulture);
+            var exitCode = RunWorkerRequest(args, stdoutCapture, stderrCapture);
+            stdout = stdoutCapture.ToString();
+            stderr = stderrCapture.ToString();
+            return exitCode;
+        }
+
+        private static int RunWorkerRequest(string[] args, TextWriter stdout, TextWriter stderr)
+        {
+            var originalOut = Console.Out;
+            var originalErr = Console.Error;
+            Console.SetOut(stdout);
+            Console.SetError(stderr);
+
+            var exitCode = 0;
+            try
+            {
+                ReturnUtils.Disable();
+                Environment.ExitCode = 0;
+                exitCode = RunCommand(args);
+            }
+            catch (Exception ex)
+            {
+                Console.Error.WriteLine($"Erro ao executar requisição do worker: {ex}");
+                exitCode = 1;
+            }
+            finally
+            {
+                Console.SetOut(originalOut);
+                Console.SetError(originalErr);
+                Environment.ExitCode = 0;
+            }
+
+            return exitCode;
+        }
+
+        private static bool TryParseWorkerRequest(
+            string line,
+            out object id,
+            out string[] args,
+            out bool captureOutput,
+            out string logPath,
+            out bool shutdown,
+            out string error)
+        {
+            id = "";
+            args = Array.Empty<string>();
+            captureOutput = true;
+            logPath = "";
+            shutdown = false;
+            error = "";
+
+            try
+            {
+                using var doc = JsonDocument.Parse(line);
+                var root = doc.RootElement;
+                if (root.ValueKind != JsonValueKind.Object)
+                {
+                    error = "requisição deve ser um objeto JSON";
+                    return false;
+                }
+
+                if (root.TryGetProperty("id", out var idEl))
+                    id = idEl.ValueKind == JsonValueKind.Number ? idEl.GetDouble() : (object)(idEl.ToString() ?? "");
+                if (root.TryGetProperty("cmd", out var cmdEl) &&
+                    cmdEl.ValueKind == JsonValueKind.String &&
+                    string.Equals(cmdEl.GetString(), "shutdown", StringComparison.OrdinalIgnoreCase))
+                {
+                    shutdown = true;
+                    return true;
+                }
+                if (root.TryGetProperty("capture", out var captureEl) &&
+                    (captureEl.ValueKind == JsonValueKind.True || captureEl.ValueKind == JsonValueKind.False))
+                {
+                    captureOutput = captureEl.GetBoolean();
+                }
+                if (root.TryGetProperty("log", out var logEl) && logEl.ValueKind == JsonValueKind.String)
+                    logPath = (logEl.GetString() ?? "").Trim();
+                if (!root.TryGetProperty("args", out var argsEl) || argsEl.ValueKind != JsonValueKind.Array)
+                {
+                    error = "campo args ausente ou inválido";
+                    return false;
+                }
+
+                var list = new List<string>();
+                foreach (var item in argsEl.EnumerateArray())
+                    list.Add(item.ValueKind == JsonValueKind.String ? item.GetString() ?? "" : item.ToString());
+                if (list.Count == 0 || IsWorkerMode(list[0]) || IsBuildAlignExeMode(list[0]))
+                {
+                    error = "comando inválido para o worker";
+                    return false;
+                }
+
+                args = list.ToArray();
+                return true;
+            }
+            catch (JsonException ex)
+            {
+                error = $"JSON inválido: {ex.Message}";
+                return false;
+            }
+        }
+
+        private static void WriteWorkerMessage(TextWriter writer, Dictionary<string, object> message)
+        {
+            writer.WriteLine(JsonSerializer.Serialize(message));
+        }
+
         private static bool IsBuildAlignExeMode(string mode)
         {
             return string.Equals(mode, "build-align-exe", StringComparison.OrdinalIgnoreCase) ||
@@ -1000,6 +1381,8 @@ namespace Obj.OperCli
             Console.WriteLine("  build-anchor-model-despacho  gera PDF de âncoras do modelo de despacho");
             Console.WriteLine("  build-merged-page          gera PDF com duas páginas combinadas em uma página grande");
             Console.WriteLine("  build-align-exe            publica e atualiza align.exe na raiz");
+            Console.WriteLine("  worker                     processo persistente (JSON-lines no stdin/stdout)");
+            Console.WriteLine("  inspect aliases            lista aliases :D/:Q/... (diretório, total, arquivos)");
             Console.WriteLine();
             Console.WriteLine("Global");
             Console.WriteLine("  return/--return [arquivo.json]  JSON puro + salva em io/arquivo.json");
@@ -1017,10 +1400,44 @@ namespace Obj.OperCli
             Console.WriteLine("  operpdf textopsrun-despacho run 1-8 --inputs @M-DESP --inputs :Q22 --with-objdiff");
             Console.WriteLine("  operpdf build-anchor-model-despacho --model reference/models/tjpb_despacho_model.pdf --out reference/models/tjpb_despacho_anchor_model.pdf");
             Console.WriteLine("  operpdf build-merged-page --input models/nossos/despacho_p1-2.pdf --page-a 1 --page-b 2 --layout vertical");
+            Console.WriteLine("  operpdf inspect aliases --json --keys D,Q");
+            Console.WriteLine("  operpdf worker --warmup textopsalign-despacho --inputs @M-DESP --inputs @M-DESP");
             Console.WriteLine("  operpdf build-align-exe");
             Console.WriteLine("  operpdf build-align-exe --rid win-x64 --config Release");
         }
 
+        private static void ShowInspectAliasesHelp()
+        {
+            Console.WriteLine("Uso: operpdf inspect aliases [--json] [--keys D,Q] [--no-files]");
+            Console.WriteLine("Alias: aliases");
+            Console.WriteLine();
+            Console.WriteLine("Lista diretórios dos aliases de índice (OBJPDF_ALIAS_<K>_DIR), total de PDFs");
+            Console.WriteLine("e arquivos (índice, caminho, tamanho, mtime) na mesma ordem usada por :K<n>.");
+            Console.WriteLine("Inclui também os PDFs resolvidos pelos modelos tipados @M-DESP/@M-CER/@M-REQ.");
+            Console.WriteLine();
+            Console.WriteLine("Opções:");
+            Console.WriteLine("  --json       saída JSON em uma linha");
+            Console.WriteLine("  --keys D,Q   restringe às chaves informadas (padrão: todas configuradas)");
+            Console.WriteLine("  --no-files   omite a lista de arquivos (apenas totais)");
+        }
+
+        private static void ShowWorkerHelp()
+        {
+            Console.WriteLine("Uso: operpdf worker [--warmup <comando> [opções]]");
+            Console.WriteLine("Alias: serve");
+            Console.WriteLine();
+            Console.WriteLine("Processo persistente com protocolo JSON-lines (stdin -> stdout):");
+            Console.WriteLine("  entrada: {\"id\":1,\"args\":[\"textopsrun-despacho\",\"run\",\"1-8\",\"--inputs\",\"@M-DESP\",\"--inputs\",\":Q22\"]}");
+            Console.WriteLine("  saída:   {\"id\":1,\"exit_code\":0,\"duration_ms\":..,\"stdout\":\"..\",\"stderr\":\"..\"}");
+            Console.WriteLine("  \"capture\":false omite stdout/stderr na resposta; {\"cmd\":\"shutdown\"} encerra.");
+            Console.WriteLine("  \"log\":\"caminho\" grava o console do comando nesse arquivo (sem guardar em memória);");
+            Console.WriteLine("           a resposta traz só {\"id\",\"exit_code\",\"duration_ms\",\"log\"}.");
+            Console.WriteLine();
+            Console.WriteLine("Opções:");
+            Console.WriteLine("  --warmup <comando> ...  executa o comando uma vez antes do evento ready");
+            Console.WriteLine("                          (carrega modelo, registries e JIT)");
+        }
+
         private static void ShowBuildAlignExeHelp()
         {
             Console.WriteLine("Uso: operpdf build-align-exe [opções]");
@@ -385,36 +385,13 @@ namespace Obj.Utils
                 end = tmp;
             }
 
-            var isOutputs = string.Equals(key, "O", StringComparison.OrdinalIgnoreCase) ||
-                            string.Equals(key, "J", StringComparison.OrdinalIgnoreCase);
-            var files = Directory
-                .EnumerateFiles(dir, isOutputs ? "*" : "*.pdf", SearchOption.AllDirectories)
-                .OrderBy(p => p, StringComparer.OrdinalIgnoreCase)
-                .ToList();
-
+            var files = ListIndexFiles(key, dir, out var invalidCount);
             if (files.Count == 0)
                 return value;
-
-            if (!isOutputs)
+            if (invalidCount > 0)
             {
-                var validFiles = new List<string>(files.Count);
-                var invalidCount = 0;
-                foreach (var file in files)
-                {
-                    if (IsValidPdfFile(file))
-                        validFiles.Add(file);
-                    else
-                        invalidCount++;
-                }
-
-                files = validFiles;
-                if (files.Count == 0)
-                    return value;
-                if (invalidCount > 0)
-                {
-                    if (!ReturnUtils.IsEnabled())
-                        Console.Error.WriteLine($"[INDEX {key}] ignorados {invalidCount} arquivos invalidos");
-                }
+                if (!ReturnUtils.IsEnabled())
+                    Console.Error.WriteLine($"[INDEX {key}] ignorados {invalidCount} arquivos invalidos");
             }
 
             var resolvedList = new List<string>();
@@ -441,6 +418,69 @@ namespace Obj.Utils
         }
 
 
+        // Mesma ordenação/filtro usada por :K<n>, para que o índice listado seja o índice resolvido.
+        private static List<string> ListIndexFiles(string key, string dir, out int invalidCount)
+        {
+            invalidCount = 0;
+            var isOutputs = string.Equals(key, "O", StringComparison.OrdinalIgnoreCase) ||
+                            string.Equals(key, "J", StringComparison.OrdinalIgnoreCase);
+            var files = Directory
+                .EnumerateFiles(dir, isOutputs ? "*" : "*.pdf", SearchOption.AllDirectories)
+                .OrderBy(p => p, StringComparer.OrdinalIgnoreCase)
+                .ToList();
+
+            if (isOutputs || files.Count == 0)
+                return files;
+
+            var validFiles = new List<string>(files.Count);
+            foreach (var file in files)
+            {
+                if (IsValidPdfFile(file))
+                    validFiles.Add(file);
+                else
+                    invalidCount++;
+            }
+            return validFiles;
+        }
+
+        public static List<string> ListIndexAliasKeys()
+        {
+            var keys = new SortedSet<string>(StringComparer.OrdinalIgnoreCase);
+            foreach (System.Collections.DictionaryEntry entry in Environment.GetEnvironmentVariables())
+            {
+                var name = entry.Key?.ToString() ?? "";
+                var match = Regex.Match(name, @"^OBJPDF_ALIAS_([A-Za-z])_DIR$", RegexOptions.IgnoreCase);
+                if (match.Success && !string.IsNullOrWhiteSpace(entry.Value?.ToString()))
+                    keys.Add(match.Groups[1].Value.ToUpperInvariant());
+            }
+            if (!string.IsNullOrWhiteSpace(Environment.GetEnvironmentVariable("OBJPDF_QUARENTENA_DIR")))
+                keys.Add("Q");
+            return keys.ToList();
+        }
+
+        public static bool TryListIndexAlias(string key, out string dir, out List<string> files, out int invalidCount)
+        {
+            files = new List<string>();
+            invalidCount = 0;
+            var normalizedKey = (key ?? "").Trim().TrimStart(':').ToUpperInvariant();
+            if (!TryResolveIndexDir(normalizedKey, out dir))
+                return false;
+            if (!Directory.Exists(dir))
+                return false;
+
+            files = ListIndexFiles(normalizedKey, dir, out invalidCount);
+            return true;
+        }
+
+        // Arquivos resolvidos por um alias tipado de modelo (@M-DESP/@M-CER/@M-REQ); vazio se não for alias tipado.
+        public static List<string> ListTypedModelAliasFiles(string token)
+        {
+            var resolved = ResolveTypedModelAliasToken(token ?? "");
+            if (string.Equals(resolved, token ?? "", StringComparison.Ordinal))
+                return new List<string>();
+            return resolved.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries).ToList();
+        }
+
         private static bool TryParseIndexToken(string value, out string key, out int start, out int end)
         {
             key = "";
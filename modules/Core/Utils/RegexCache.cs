@@ -0,0 +1,251 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text.RegularExpressions;
+using System.Threading;
+
+namespace Obj.Utils
+{
+    /// <summary>
+    /// Registro central de Regex por (padrao, opcoes), para as chamadas estaticas do tipo
+    /// <c>Regex.IsMatch(texto, padrao)</c> e padroes vindos de YAML (alignrange_fields/, extract_fields/).
+    /// O cache interno do Regex guarda so 15 padroes; com centenas de padroes por documento o
+    /// mapfields reparseava quase tudo a cada chamada.
+    /// Politica: a primeira instancia e interpretada (construcao barata); depois de
+    /// OBJ_REGEX_COMPILE_AFTER usos (padrao 64; 0 ou 1 = compila ja; negativo = nunca) troca por
+    /// RegexOptions.Compiled. Padroes fixos do codigo (Get/IsMatch/Match/...) nao tem timeout, como os
+    /// Regex estaticos que substituem; so padroes vindos de YAML (<c>GetBounded</c>, com tratamento de
+    /// RegexMatchTimeoutException no chamador) usam OBJ_REGEX_TIMEOUT_MS (padrao 5000; 0 = sem timeout).
+    /// Contadores (hits/misses/compilacoes/timeouts/tempo de construcao) saem em <c>Snapshot()</c> no probe.
+    /// </summary>
+    public static class RegexCache
+    {
+        private static readonly ConcurrentDictionary<(string Pattern, RegexOptions Options, bool Bounded), Entry> Entries =
+            new ConcurrentDictionary<(string Pattern, RegexOptions Options, bool Bounded), Entry>();
+
+        private static int? _compileAfter;
+        private static TimeSpan? _matchTimeout;
+        private static long _hits;
+        private static long _misses;
+        private static long _compiled;
+        private static long _timeouts;
+        private static long _buildTicks;
+
+        private sealed class Entry
+        {
+            public Entry(Regex regex)
+            {
+                Regex = regex;
+            }
+
+            public volatile Regex Regex;
+            public int Uses;
+        }
+
+        private static int CompileAfter
+        {
+            get
+            {
+                if (_compileAfter.HasValue)
+                    return _compileAfter.Value;
+                var raw = Environment.GetEnvironmentVariable("OBJ_REGEX_COMPILE_AFTER");
+                var value = int.TryParse(raw, out var parsed) ? parsed : 64;
+                _compileAfter = value;
+                return value;
+            }
+        }
+
+        private static TimeSpan BoundedMatchTimeout
+        {
+            get
+            {
+                if (_matchTimeout.HasValue)
+                    return _matchTimeout.Value;
+                var raw = Environment.GetEnvironmentVariable("OBJ_REGEX_TIMEOUT_MS");
+                var ms = int.TryParse(raw, out var parsed) ? parsed : 5000;
+                var value = ms > 0 ? TimeSpan.FromMilliseconds(ms) : Regex.InfiniteMatchTimeout;
+                _matchTimeout = value;
+                return value;
+            }
+        }
+
+        /// <summary>Instancia compartilhada, sem timeout; padrao invalido lanca ArgumentException (nada e guardado).</summary>
+        public static Regex Get(string pattern, RegexOptions options = RegexOptions.None)
+        {
+            return Get(pattern, options, bounded: false);
+        }
+
+        /// <summary>
+        /// Como Get, com o timeout OBJ_REGEX_TIMEOUT_MS: para padroes de YAML/usuario. O chamador trata
+        /// RegexMatchTimeoutException (e chama CountTimeout).
+        /// </summary>
+        public static Regex GetBounded(string pattern, RegexOptions options = RegexOptions.None)
+        {
+            return Get(pattern, options, bounded: true);
+        }
+
+        private static Regex Get(string pattern, RegexOptions options, bool bounded)
+        {
+            pattern ??= "";
+            var key = (pattern, options, bounded);
+            if (Entries.TryGetValue(key, out var entry))
+            {
+                Interlocked.Increment(ref _hits);
+                var uses = Interlocked.Increment(ref entry.Uses);
+                // >=: a criacao ja conta 1 uso; em corrida dois threads podem compilar (mesmo resultado)
+                if (CompileAfter > 0 && uses >= CompileAfter && (entry.Regex.Options & RegexOptions.Compiled) == 0)
+                {
+                    entry.Regex = Build(pattern, options | RegexOptions.Compiled, bounded);
+                    Interlocked.Increment(ref _compiled);
+                }
+                return entry.Regex;
+            }
+
+            Interlocked.Increment(ref _misses);
+            var compiled = (options & RegexOptions.Compiled) != 0 || CompileAfter is 0 or 1;
+            var created = new Entry(Build(pattern, compiled ? options | RegexOptions.Compiled : options, bounded)) { Uses = 1 };
+            if (compiled && (options & RegexOptions.Compiled) == 0)
+                Interlocked.Increment(ref _compiled);
+            return Entries.GetOrAdd(key, created).Regex;
+        }
+
+        public static bool IsMatch(string input, string pattern, RegexOptions options = RegexOptions.None)
+        {
+            var regex = Get(pattern, options);
+            try
+            {
+                return regex.IsMatch(input);
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                Interlocked.Increment(ref _timeouts);
+                throw;
+            }
+        }
+
+        public static Match Match(string input, string pattern, RegexOptions options = RegexOptions.None)
+        {
+            var regex = Get(pattern, options);
+            try
+            {
+                return regex.Match(input);
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                Interlocked.Increment(ref _timeouts);
+                throw;
+            }
+        }
+
+        public static MatchCollection Matches(string input, string pattern, RegexOptions options = RegexOptions.None)
+        {
+            return Matches(Get(pattern, options), input);
+        }
+
+        /// <summary>
+        /// Regex.Matches avalia sob demanda; com timeout a colecao e materializada aqui (Count) para o
+        /// timeout sair nesta chamada e entrar nos contadores. Sem timeout continua preguicosa.
+        /// </summary>
+        public static MatchCollection Matches(Regex regex, string input)
+        {
+            var matches = regex.Matches(input);
+            if (regex.MatchTimeout == Regex.InfiniteMatchTimeout)
+                return matches;
+            try
+            {
+                _ = matches.Count;
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                Interlocked.Increment(ref _timeouts);
+                throw;
+            }
+            return matches;
+        }
+
+        public static string Replace(string input, string pattern, string replacement, RegexOptions options = RegexOptions.None)
+        {
+            var regex = Get(pattern, options);
+            try
+            {
+                return regex.Replace(input, replacement);
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                Interlocked.Increment(ref _timeouts);
+                throw;
+            }
+        }
+
+        public static string Replace(string input, string pattern, MatchEvaluator evaluator, RegexOptions options = RegexOptions.None)
+        {
+            var regex = Get(pattern, options);
+            try
+            {
+                return regex.Replace(input, evaluator);
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                Interlocked.Increment(ref _timeouts);
+                throw;
+            }
+        }
+
+        /// <summary>Para quem usa a instancia de Get() diretamente e trata o timeout por conta propria.</summary>
+        public static void CountTimeout()
+        {
+            Interlocked.Increment(ref _timeouts);
+        }
+
+        /// <summary>Zera os contadores (o cache e os usos acumulados por padrao continuam).</summary>
+        public static void ResetCounters()
+        {
+            Interlocked.Exchange(ref _hits, 0);
+            Interlocked.Exchange(ref _misses, 0);
+            Interlocked.Exchange(ref _compiled, 0);
+            Interlocked.Exchange(ref _timeouts, 0);
+            Interlocked.Exchange(ref _buildTicks, 0);
+        }
+
+        public static Dictionary<string, object> Snapshot()
+        {
+            var top = Entries
+                .GroupBy(kv => kv.Key.Pattern)
+                .Select(g => (Pattern: g.Key, Uses: g.Sum(kv => kv.Value.Uses)))
+                .OrderByDescending(v => v.Uses)
+                .Take(5)
+                .Select(v => (object)new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                {
+                    ["pattern"] = v.Pattern.Length <= 80 ? v.Pattern : v.Pattern.Substring(0, 80) + "...",
+                    ["uses"] = v.Uses
+                })
+                .ToList();
+            return new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+            {
+                ["entries"] = Entries.Count,
+                ["hits"] = Interlocked.Read(ref _hits),
+                ["misses"] = Interlocked.Read(ref _misses),
+                ["compiled"] = Interlocked.Read(ref _compiled),
+                ["timeouts"] = Interlocked.Read(ref _timeouts),
+                ["build_ms"] = Math.Round(Interlocked.Read(ref _buildTicks) * 1000.0 / Stopwatch.Frequency, 3),
+                ["timeout_ms"] = BoundedMatchTimeout == Regex.InfiniteMatchTimeout ? 0 : (long)BoundedMatchTimeout.TotalMilliseconds,
+                ["top"] = top
+            };
+        }
+
+        private static Regex Build(string pattern, RegexOptions options, bool bounded)
+        {
+            var start = Stopwatch.GetTimestamp();
+            try
+            {
+                return new Regex(pattern, options, bounded ? BoundedMatchTimeout : Regex.InfiniteMatchTimeout);
+            }
+            finally
+            {
+                Interlocked.Add(ref _buildTicks, Stopwatch.GetTimestamp() - start);
+            }
+        }
+    }
+}
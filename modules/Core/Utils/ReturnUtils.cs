@@ -21,6 +21,12 @@ namespace Obj.Utils
                 OutputFileName = outputFileName.Trim();
         }
 
+        public static void Disable()
+        {
+            Enabled = false;
+            OutputFileName = "";
+        }
+
         public static bool IsEnabled()
         {
             return Enabled;
@@ -0,0 +1,148 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+
+namespace Obj.Utils
+{
+    /// <summary>
+    /// Acumulador de tempo por etapa (stream_decode, tokenize, anchors...).
+    /// Uso: <c>using (StageTimer.Measure("tokenize")) { ... }</c>.
+    /// Etapas aninhadas sao contadas de forma inclusiva (cada uma mede seu proprio intervalo).
+    /// Cada etapa tambem acumula os bytes alocados pela thread dentro do escopo e, via
+    /// <c>Count(...)</c>, itens processados (ex.: tokens) para o bench reportar itens/s.
+    /// </summary>
+    public static class StageTimer
+    {
+        private static readonly object Sync = new object();
+        private static readonly Dictionary<string, StageTotals> Totals = new Dictionary<string, StageTotals>(StringComparer.OrdinalIgnoreCase);
+        private static long _allocatedAtReset = GC.GetTotalAllocatedBytes(false);
+
+        private sealed class StageTotals
+        {
+            public long Ticks;
+            public int Calls;
+            public long AllocatedBytes;
+            public long Items;
+            public long InputBytes;
+        }
+
+        public readonly struct Scope : IDisposable
+        {
+            private readonly string _stage;
+            private readonly long _start;
+            private readonly long _allocatedStart;
+
+            internal Scope(string stage)
+            {
+                _stage = stage;
+                _start = Stopwatch.GetTimestamp();
+                _allocatedStart = GC.GetAllocatedBytesForCurrentThread();
+            }
+
+            public void Dispose()
+            {
+                if (string.IsNullOrEmpty(_stage))
+                    return;
+                Add(_stage, Stopwatch.GetTimestamp() - _start, GC.GetAllocatedBytesForCurrentThread() - _allocatedStart);
+            }
+        }
+
+        public static Scope Measure(string stage)
+        {
+            return new Scope(stage ?? "");
+        }
+
+        /// <summary>Soma itens (e bytes de entrada) processados numa etapa; nao conta como chamada.</summary>
+        public static void Count(string stage, long items, long inputBytes = 0)
+        {
+            if (string.IsNullOrEmpty(stage))
+                return;
+            lock (Sync)
+            {
+                var totals = GetTotals(stage);
+                totals.Items += items;
+                totals.InputBytes += inputBytes;
+            }
+        }
+
+        public static void Reset()
+        {
+            lock (Sync)
+            {
+                Totals.Clear();
+                _allocatedAtReset = GC.GetTotalAllocatedBytes(false);
+            }
+        }
+
+        public static Dictionary<string, object> Snapshot()
+        {
+            var stages = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase);
+            lock (Sync)
+            {
+                foreach (var kv in Totals)
+                {
+                    var ms = kv.Value.Ticks * 1000.0 / Stopwatch.Frequency;
+                    var entry = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                    {
+                        ["ms"] = Math.Round(ms, 3),
+                        ["calls"] = kv.Value.Calls,
+                        ["allocated_bytes"] = kv.Value.AllocatedBytes
+                    };
+                    if (kv.Value.Items > 0)
+                    {
+                        entry["items"] = kv.Value.Items;
+                        entry["input_bytes"] = kv.Value.InputBytes;
+                        entry["items_per_sec"] = ms > 0 ? Math.Round(kv.Value.Items * 1000.0 / ms, 1) : 0.0;
+                    }
+                    stages[kv.Key] = entry;
+                }
+            }
+            return stages;
+        }
+
+        /// <summary>Memoria do processo: pico de RSS, RSS atual e bytes alocados desde o ultimo Reset().</summary>
+        public static Dictionary<string, object> MemorySnapshot()
+        {
+            var payload = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase);
+            try
+            {
+                using var proc = Process.GetCurrentProcess();
+                proc.Refresh();
+                payload["peak_rss_bytes"] = proc.PeakWorkingSet64;
+                payload["rss_bytes"] = proc.WorkingSet64;
+            }
+            catch
+            {
+                payload["peak_rss_bytes"] = 0L;
+                payload["rss_bytes"] = 0L;
+            }
+            long allocatedAtReset;
+            lock (Sync)
+                allocatedAtReset = _allocatedAtReset;
+            payload["allocated_bytes"] = Math.Max(0L, GC.GetTotalAllocatedBytes(false) - allocatedAtReset);
+            payload["managed_heap_bytes"] = GC.GetTotalMemory(false);
+            return payload;
+        }
+
+        private static void Add(string stage, long ticks, long allocatedBytes)
+        {
+            lock (Sync)
+            {
+                var totals = GetTotals(stage);
+                totals.Ticks += ticks;
+                totals.Calls++;
+                totals.AllocatedBytes += Math.Max(0L, allocatedBytes);
+            }
+        }
+
+        private static StageTotals GetTotals(string stage)
+        {
+            if (!Totals.TryGetValue(stage, out var totals))
+            {
+                totals = new StageTotals();
+                Totals[stage] = totals;
+            }
+            return totals;
+        }
+    }
+}
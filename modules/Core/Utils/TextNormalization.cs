@@ -10,7 +10,7 @@ namespace Obj.Utils
         public static string NormalizeWhitespace(string text)
         {
             if (string.IsNullOrEmpty(text)) return "";
-            var cleaned = Regex.Replace(text, "\\s+", " ");
+            var cleaned = RegexCache.Replace(text, "\\s+", " ");
             return cleaned.Trim();
         }
 
@@ -18,13 +18,13 @@ namespace Obj.Utils
         {
             if (string.IsNullOrWhiteSpace(text)) return text ?? "";
             var t = text;
-            t = Regex.Replace(t, @"(?<=[,:;])(?=\S)", " ");
-            t = Regex.Replace(t, @"(?<=\))(?=\S)", ") ");
-            t = Regex.Replace(t, @"(?<=\S)(?=\()", " ");
-            t = Regex.Replace(t, @"(?<=[A-Za-zÀ-ÿ])(?=[0-9])", " ");
-            t = Regex.Replace(t, @"(?<=[0-9])(?=[A-Za-zÀ-ÿ])", " ");
-            t = Regex.Replace(t, @"(?<=[a-zà-ÿ])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
-            t = Regex.Replace(t, "\\s+", " ");
+            t = RegexCache.Replace(t, @"(?<=[,:;])(?=\S)", " ");
+            t = RegexCache.Replace(t, @"(?<=\))(?=\S)", ") ");
+            t = RegexCache.Replace(t, @"(?<=\S)(?=\()", " ");
+            t = RegexCache.Replace(t, @"(?<=[A-Za-zÀ-ÿ])(?=[0-9])", " ");
+            t = RegexCache.Replace(t, @"(?<=[0-9])(?=[A-Za-zÀ-ÿ])", " ");
+            t = RegexCache.Replace(t, @"(?<=[a-zà-ÿ])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
+            t = RegexCache.Replace(t, "\\s+", " ");
             return t.Trim();
         }
 
@@ -39,7 +39,7 @@ namespace Obj.Utils
                 .Replace('\u200C', ' ')
                 .Replace('\u200D', ' ')
                 .Replace('\uFEFF', ' ');
-            var parts = Regex.Matches(t, "\\S+|\\s+");
+            var parts = RegexCache.Matches(t, "\\S+|\\s+");
             if (parts.Count == 0) return "";
             var sb = new StringBuilder();
             var buffer = new StringBuilder();
@@ -83,7 +83,7 @@ namespace Obj.Utils
             if (buffer.Length > 0)
                 AppendWithSpace(sb, buffer.ToString());
 
-            return Regex.Replace(sb.ToString(), "\\s+", " ").Trim();
+            return RegexCache.Replace(sb.ToString(), "\\s+", " ").Trim();
         }
 
         public static string FixUppercaseSplitTokens(string text)
@@ -152,9 +152,9 @@ namespace Obj.Utils
             if (!IsMostlyUppercase(text) || CountSpaces(text) > 2) return text;
 
             var t = text;
-            t = Regex.Replace(t, @"(?<=\p{Lu})(DA|DE|DO|DAS|DOS|E|EM|NO|NA|NOS|NAS|AO|AOS)(?=\p{Lu})", " $1 ");
-            t = Regex.Replace(t, @"(?<=[0-9])(?=\p{Lu})", " ");
-            t = Regex.Replace(t, @"(?<=\p{Lu})(?=[0-9])", " ");
+            t = RegexCache.Replace(t, @"(?<=\p{Lu})(DA|DE|DO|DAS|DOS|E|EM|NO|NA|NOS|NAS|AO|AOS)(?=\p{Lu})", " $1 ");
+            t = RegexCache.Replace(t, @"(?<=[0-9])(?=\p{Lu})", " ");
+            t = RegexCache.Replace(t, @"(?<=\p{Lu})(?=[0-9])", " ");
             return NormalizeWhitespace(t);
         }
 
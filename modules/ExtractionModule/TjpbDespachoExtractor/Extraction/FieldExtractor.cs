@@ -60,17 +60,17 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             _cfg = cfg;
             _template = new TemplateFieldExtractor();
             _strategies = new FieldStrategyEngine(cfg);
-            _cnj = new Regex(cfg.Regex.ProcessoCnj, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _cnj = RegexCache.Get(cfg.Regex.ProcessoCnj, RegexOptions.Compiled | RegexOptions.IgnoreCase);
             var cnjLoose = string.IsNullOrWhiteSpace(cfg.Regex.ProcessoCnjLoose)
                 ? @"\d{7}\s*-\s*\d{2}\s*\.\s*\d{4}\s*\.\s*\d\s*\.\s*\d{2}\s*\.\s*\d{4}"
                 : cfg.Regex.ProcessoCnjLoose;
-            _cnjLoose = new Regex(cnjLoose, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _sei = new Regex(cfg.Regex.ProcessoSei, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _adme = new Regex(cfg.Regex.ProcessoAdme, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _cpf = new Regex(cfg.Regex.Cpf, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _money = new Regex(cfg.Regex.Money, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _datePt = new Regex(cfg.Regex.DatePt, RegexOptions.Compiled | RegexOptions.IgnoreCase);
-            _dateSlash = new Regex(cfg.Regex.DateSlash, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _cnjLoose = RegexCache.Get(cnjLoose, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _sei = RegexCache.Get(cfg.Regex.ProcessoSei, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _adme = RegexCache.Get(cfg.Regex.ProcessoAdme, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _cpf = RegexCache.Get(cfg.Regex.Cpf, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _money = RegexCache.Get(cfg.Regex.Money, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _datePt = RegexCache.Get(cfg.Regex.DatePt, RegexOptions.Compiled | RegexOptions.IgnoreCase);
+            _dateSlash = RegexCache.Get(cfg.Regex.DateSlash, RegexOptions.Compiled | RegexOptions.IgnoreCase);
             _peritoCatalog = PeritoCatalog.Load(cfg.BaseDir, cfg.Reference.PeritosCatalogPaths);
             _honorarios = new HonorariosTable(cfg.Reference.Honorarios, cfg.BaseDir);
             _dmpField = new diff_match_patch
@@ -251,7 +251,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             if (diffHits.Count > 0)
                 return diffHits;
 
-            var placeholder = new Regex(@"\{\{\s*([A-Z0-9_]+)\s*\}\}", RegexOptions.IgnoreCase);
+            var placeholder = RegexCache.Get(@"\{\{\s*([A-Z0-9_]+)\s*\}\}", RegexOptions.IgnoreCase);
             var fields = new List<string>();
             var pattern = new System.Text.StringBuilder();
             int last = 0;
@@ -274,9 +274,9 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             pattern.Append(BuildLooseLiteralPattern(template.Substring(last)));
 
             var rxPattern = pattern.ToString();
-            rxPattern = Regex.Replace(rxPattern, "\\\\s\\+", "\\\\s+");
-            rxPattern = Regex.Replace(rxPattern, "\\s+", "\\\\s+");
-            var rx = new Regex(rxPattern, RegexOptions.IgnoreCase | RegexOptions.Singleline);
+            rxPattern = RegexCache.Replace(rxPattern, "\\\\s\\+", "\\\\s+");
+            rxPattern = RegexCache.Replace(rxPattern, "\\s+", "\\\\s+");
+            var rx = RegexCache.Get(rxPattern, RegexOptions.IgnoreCase | RegexOptions.Singleline);
             var match = rx.Match(region.Text);
             if (!match.Success) return output;
 
@@ -312,7 +312,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             if (textNorm.Length != collapsedText.Length)
                 textNorm = collapsedText.ToLowerInvariant();
 
-            var placeholder = new Regex(@"\{\{\s*([A-Z0-9_]+)\s*\}\}", RegexOptions.IgnoreCase);
+            var placeholder = RegexCache.Get(@"\{\{\s*([A-Z0-9_]+)\s*\}\}", RegexOptions.IgnoreCase);
             var segments = new List<(string literal, string? field)>();
             int last = 0;
             foreach (Match m in placeholder.Matches(template))
@@ -517,13 +517,13 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             {
                 var m = _datePt.Match(v);
                 if (!m.Success) m = _dateSlash.Match(v);
-                if (!m.Success) m = Regex.Match(v, @"\d{1,2}de[A-Za-z]+de\d{4}");
+                if (!m.Success) m = RegexCache.Match(v, @"\d{1,2}de[A-Za-z]+de\d{4}");
                 if (m.Success)
                 {
                     var rawDate = m.Value;
                     if (!rawDate.Contains(" "))
                     {
-                        rawDate = Regex.Replace(rawDate, @"(\d{1,2})de([A-Za-z]+)de(\d{4})", "$1 de $2 de $3", RegexOptions.IgnoreCase);
+                        rawDate = RegexCache.Replace(rawDate, @"(\d{1,2})de([A-Za-z]+)de(\d{4})", "$1 de $2 de $3", RegexOptions.IgnoreCase);
                     }
                     if (TextUtils.TryParseDate(rawDate, out var iso)) return iso;
                 }
@@ -534,7 +534,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             {
                 var m = _money.Match(v);
                 if (!m.Success)
-                    m = Regex.Match(v, @"\d{1,3}(?:\.\d{3})*,\d{2}");
+                    m = RegexCache.Match(v, @"\d{1,3}(?:\.\d{3})*,\d{2}");
                 if (m.Success) return TextUtils.NormalizeMoney(m.Value);
                 return TextUtils.NormalizeMoney(v);
             }
@@ -550,7 +550,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             }
             if (field.Equals("ESPECIALIDADE", StringComparison.OrdinalIgnoreCase))
             {
-                var m = Regex.Match(v, @"(?i)(grafot[eé]cnico|m[eé]dic[oa]|cont[aá]bil|engenh[aá]ria|psicol[oó]gic[oa])");
+                var m = RegexCache.Match(v, @"(?i)(grafot[eé]cnico|m[eé]dic[oa]|cont[aá]bil|engenh[aá]ria|psicol[oó]gic[oa])");
                 if (m.Success) return m.Value;
             }
             if (field.StartsWith("PROCESSO_", StringComparison.OrdinalIgnoreCase))
@@ -743,7 +743,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                 {
                     var m = MatchAny(text, FieldRegexCatalog.Get("vara_line"));
                     if (!m.Success)
-                        m = Regex.Match(text, @"(?i)\bvara\b\s*[:\-]?\s*([^\n;]+)");
+                        m = RegexCache.Match(text, @"(?i)\bvara\b\s*[:\-]?\s*([^\n;]+)");
                     if (m.Success)
                         vara = BuildFieldFromMatch(m.Groups[1].Value.Trim(), 0.7, "regex", p, m, 1, Snip(text, m));
                 }
@@ -752,7 +752,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                 {
                     var m = MatchAny(text, FieldRegexCatalog.Get("comarca_line"));
                     if (!m.Success)
-                        m = Regex.Match(text, @"(?i)\bcomarca\b\s*[:\-]?\s*([^\n;]+)");
+                        m = RegexCache.Match(text, @"(?i)\bcomarca\b\s*[:\-]?\s*([^\n;]+)");
                     if (m.Success)
                         comarca = BuildFieldFromMatch(m.Groups[1].Value.Trim(), 0.7, "regex", p, m, 1, Snip(text, m));
                 }
@@ -894,10 +894,10 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             if (string.IsNullOrWhiteSpace(movid) || string.IsNullOrWhiteSpace(reuStart))
                 return (null, null);
 
-            var autor = Regex.Match(text,
+            var autor = RegexCache.Match(text,
                 $@"(?i)(?:{movid})\s+(.+?)(?=(?:\s+(?:{face})|\s+{perante}|\s+{juizo}|[\\.;\\n]))",
                 RegexOptions.Singleline);
-            var reu = Regex.Match(text,
+            var reu = RegexCache.Match(text,
                 $@"(?i)(?:{reuStart})\s+(.+?)(?=(?:,|\\n|\\.|;|\\s+{perante}|\\s+{juizo}|$))",
                 RegexOptions.Singleline);
             return (autor.Success ? autor : null, reu.Success ? reu : null);
@@ -1060,7 +1060,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                     patterns.Add(@"(?i)proceder\s*(?:à|a)?\s*reserva\s+orçament[aá]ria[^\d]{0,120}?(R\$\s*\d{1,3}(?:\.\d{3})*,\d{2})");
                 foreach (var pat in patterns)
                 {
-                    var m = Regex.Match(text, pat);
+                    var m = RegexCache.Match(text, pat);
                     if (!m.Success) continue;
                     var raw = m.Groups.Count > 1 ? m.Groups[1].Value : m.Value;
                     var money = TextUtils.NormalizeMoney(raw);
@@ -1092,7 +1092,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                     }
                     if (valorDe.Method == "not_found")
                     {
-                        var numRx = new Regex(@"\b\d{1,3}(?:\.\d{3})*,\d{2}\b");
+                        var numRx = RegexCache.Get(@"\b\d{1,3}(?:\.\d{3})*,\d{2}\b");
                         var numMatches = numRx.Matches(collapsed);
                         for (int i = numMatches.Count - 1; i >= 0; i--)
                         {
@@ -1327,7 +1327,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                 {
                     var m = MatchAny(text, FieldRegexCatalog.Get("percentual"));
                     if (!m.Success)
-                        m = Regex.Match(text, @"\b\d{1,2}%\b");
+                        m = RegexCache.Match(text, @"\b\d{1,2}%\b");
                     if (m.Success)
                         percentual = BuildFieldFromMatch(m.Value, 0.6, "regex", p, m, 0, Snip(text, m));
                 }
@@ -1336,7 +1336,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
                 {
                     var m = MatchAny(text, FieldRegexCatalog.Get("parcela"));
                     if (!m.Success)
-                        m = Regex.Match(text, @"(?i)(\d+ª\s*parcela|primeira\s*parcela|segunda\s*parcela|terceira\s*parcela)");
+                        m = RegexCache.Match(text, @"(?i)(\d+ª\s*parcela|primeira\s*parcela|segunda\s*parcela|terceira\s*parcela)");
                     if (m.Success)
                         parcela = BuildFieldFromMatch(m.Value, 0.6, "regex", p, m, 0, Snip(text, m));
                 }
@@ -1614,7 +1614,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             if (idx < 0) return null;
 
             var window = text.Substring(idx, Math.Min(140, text.Length - idx));
-            var m = Regex.Match(window, @"([\\p{L}][\\p{L}'\\-]+(?:\\s+[\\p{L}][\\p{L}'\\-]+){0,5})");
+            var m = RegexCache.Match(window, @"([\\p{L}][\\p{L}'\\-]+(?:\\s+[\\p{L}][\\p{L}'\\-]+){0,5})");
             if (m.Success)
             {
                 var name = CleanPersonName(m.Groups[1].Value.Trim());
@@ -1630,7 +1630,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             var idx = text.IndexOf(hint, StringComparison.OrdinalIgnoreCase);
             if (idx < 0) return null;
             var window = text.Substring(idx, Math.Min(140, text.Length - idx));
-            var m = Regex.Match(window, @"([\\p{L}][\\p{L}'\\-]+(?:\\s+[\\p{L}][\\p{L}'\\-]+){0,5})");
+            var m = RegexCache.Match(window, @"([\\p{L}][\\p{L}'\\-]+(?:\\s+[\\p{L}][\\p{L}'\\-]+){0,5})");
             if (m.Success)
             {
                 var name = CleanPersonName(m.Groups[1].Value.Trim());
@@ -1741,7 +1741,7 @@ namespace Obj.TjpbDespachoExtractor.Extraction
         {
             if (string.IsNullOrWhiteSpace(value)) return "";
             var t = TextUtils.RemoveDiacritics(value);
-            t = Regex.Replace(t, @"[^A-Za-z]", "");
+            t = RegexCache.Replace(t, @"[^A-Za-z]", "");
             return t.ToLowerInvariant();
         }
 
@@ -1766,19 +1766,19 @@ namespace Obj.TjpbDespachoExtractor.Extraction
             {
                 var m = MatchAny(p.Text, FieldRegexCatalog.Get("perito_num"));
                 if (!m.Success)
-                    m = Regex.Match(p.Text ?? "", @"(?i)(matricula|cadastro|numero do perito|num\.\s*perito)\s*[:\-]?\s*(\d{3,})");
+                    m = RegexCache.Match(p.Text ?? "", @"(?i)(matricula|cadastro|numero do perito|num\.\s*perito)\s*[:\-]?\s*(\d{3,})");
                 if (m.Success)
                     return BuildFieldFromMatch(m.Groups[2].Value.Trim(), 0.55, "regex", p, m, 2, Snip(p.Text, m));
 
                 var mInss = MatchAny(p.Text, FieldRegexCatalog.Get("perito_inss"));
                 if (!mInss.Success)
-                    mInss = Regex.Match(p.Text ?? "", @"(?i)inscri[cç][aã]o\\s*no\\s*inss.*?n[ºo]\\s*(\\d{6,})");
+                    mInss = RegexCache.Match(p.Text ?? "", @"(?i)inscri[cç][aã]o\\s*no\\s*inss.*?n[ºo]\\s*(\\d{6,})");
                 if (mInss.Success)
                     return BuildFieldFromMatch(mInss.Groups[1].Value.Trim(), 0.5, "regex", p, mInss, 1, Snip(p.Text, mInss));
 
                 var mPis = MatchAny(p.Text, FieldRegexCatalog.Get("perito_pis"));
                 if (!mPis.Success)
-                    mPis = Regex.Match(p.Text ?? "", @"(?i)pis\\s*/?\\s*pasep.*?n[ºo]\\s*(\\d{6,})");
+                    mPis = RegexCache.Match(p.Text ?? "", @"(?i)pis\\s*/?\\s*pasep.*?n[ºo]\\s*(\\d{6,})");
                 if (mPis.Success)
                     return BuildFieldFromMatch(mPis.Groups[1].Value.Trim(), 0.5, "regex", p, mPis, 1, Snip(p.Text, mPis));
             }
@@ -29,6 +29,14 @@ namespace Obj.Align
         private sealed class AlignHelperLexicon
         {
             public List<AlignHelperPhrase> Phrases { get; } = new List<AlignHelperPhrase>();
+            public HashSet<(string Key, string Normalized)> Seen { get; } = new HashSet<(string Key, string Normalized)>();
+            public AlignHelperMatcher Matcher { get; private set; } = new AlignHelperMatcher(new List<AlignHelperPhrase>());
+
+            // Chamado uma vez, depois de carregar todas as frases.
+            public void Compile()
+            {
+                Matcher = new AlignHelperMatcher(Phrases);
+            }
         }
 
         private sealed class AlignHelperCertidaoHintsDoc
@@ -186,48 +194,14 @@ namespace Obj.Align
             if (text.Length == 0)
                 return "";
 
-            var compact = text.Replace(" ", "", StringComparison.Ordinal);
-            string bestKey = "";
-            double bestScore = 0.0;
-
-            foreach (var phrase in lexicon.Phrases)
-            {
-                if (phrase.Normalized.Length == 0)
-                    continue;
-                if (!IsHelperKeyAllowedForCurrentDoc(phrase.Key))
-                    continue;
-
-                var matchPos = text.IndexOf(phrase.Normalized, StringComparison.Ordinal);
-                bool matched;
-                if (phrase.RequirePrefix)
-                {
-                    matched = matchPos >= 0 && matchPos <= 24;
-                    if (!matched && phrase.Compact.Length >= 4)
-                        matched = compact.StartsWith(phrase.Compact, StringComparison.Ordinal);
-                }
-                else
-                {
-                    matched = matchPos >= 0;
-                    if (!matched && phrase.Compact.Length >= 4)
-                        matched = compact.Contains(phrase.Compact, StringComparison.Ordinal);
-                }
-                if (!matched)
-                    continue;
-
-                var positionBonus = matchPos >= 0 && matchPos <= 36 ? 0.12 : 0.0;
-                var score = Math.Min(0.99, phrase.Weight + positionBonus);
-                if (score > bestScore)
-                {
-                    bestScore = score;
-                    bestKey = phrase.Key;
-                }
-            }
-
-            return bestScore >= 0.86 ? bestKey : "";
+            var best = lexicon.Matcher.FindBest(text, out var bestScore);
+            return best != null && bestScore >= 0.86 ? best.Key : "";
         }
 
-        private static List<AnchorPair> BuildAnchorPairsAlignHelper(List<string> normA, List<string> normB, double minLenRatio, out AlignHelperDiagnostics diagnostics)
+        private static List<AnchorPair> BuildAnchorPairsAlignHelper(BlockSimilarityMatrix sims, double minLenRatio, out AlignHelperDiagnostics diagnostics)
         {
+            var normA = sims.NormA;
+            var normB = sims.NormB;
             diagnostics = new AlignHelperDiagnostics();
             var lexicon = AlignHelperLexiconCache.Value;
             if (lexicon.Phrases.Count == 0 || normA.Count == 0 || normB.Count == 0)
@@ -252,7 +226,7 @@ namespace Obj.Align
 
                 foreach (var hitB in hitsForKey)
                 {
-                    var sim = ComputeAlignmentSimilarity(normA[hitA.Index], normB[hitB.Index]);
+                    var sim = sims.Get(hitA.Index, hitB.Index);
                     var lenRatio = ComputeLenRatio(normA[hitA.Index], normB[hitB.Index]);
                     if (minLenRatio > 0 && lenRatio < minLenRatio * 0.50)
                     {
@@ -415,53 +389,14 @@ namespace Obj.Align
                 if (text.Length == 0)
                     continue;
 
-                var compact = text.Replace(" ", "", StringComparison.Ordinal);
-                string bestKey = "";
-                string bestPhrase = "";
-                double bestScore = 0.0;
-
-                foreach (var phrase in lexicon.Phrases)
-                {
-                    if (phrase.Normalized.Length == 0)
-                        continue;
-                    if (!IsHelperKeyAllowedForCurrentDoc(phrase.Key))
-                        continue;
-
-                    var matchPos = text.IndexOf(phrase.Normalized, StringComparison.Ordinal);
-                    bool matched;
-                    if (phrase.RequirePrefix)
-                    {
-                        matched = matchPos >= 0 && matchPos <= 24;
-                        if (!matched && phrase.Compact.Length >= 4)
-                            matched = compact.StartsWith(phrase.Compact, StringComparison.Ordinal);
-                    }
-                    else
-                    {
-                        matched = matchPos >= 0;
-                        if (!matched && phrase.Compact.Length >= 4)
-                            matched = compact.Contains(phrase.Compact, StringComparison.Ordinal);
-                    }
-                    if (!matched)
-                        continue;
-
-                    // Prioriza marcador em posição de cabeçalho/label.
-                    var positionBonus = matchPos >= 0 && matchPos <= 36 ? 0.12 : 0.0;
-                    var score = Math.Min(0.99, phrase.Weight + positionBonus);
-                    if (score > bestScore)
-                    {
-                        bestScore = score;
-                        bestKey = phrase.Key;
-                        bestPhrase = phrase.Phrase;
-                    }
-                }
-
-                if (bestKey.Length > 0)
+                var best = lexicon.Matcher.FindBest(text, out var bestScore);
+                if (best != null)
                 {
                     hits.Add(new AlignHelperHit
                     {
                         Index = i,
-                        Key = bestKey,
-                        Phrase = bestPhrase,
+                        Key = best.Key,
+                        Phrase = best.Phrase,
                         Score = bestScore
                     });
                 }
@@ -585,6 +520,7 @@ namespace Obj.Align
                 // Keep lexicon with whatever could be loaded.
             }
 
+            lexicon.Compile();
             return lexicon;
         }
 
@@ -673,9 +609,7 @@ namespace Obj.Align
                 if (compact.Length < 3)
                     continue;
 
-                if (lexicon.Phrases.Any(p =>
-                    string.Equals(p.Key, key, StringComparison.Ordinal) &&
-                    string.Equals(p.Normalized, normalized, StringComparison.Ordinal)))
+                if (!lexicon.Seen.Add((key, normalized)))
                     continue;
 
                 var weightBoost = Math.Min(0.08, normalized.Length / 120.0);
@@ -0,0 +1,277 @@
+using System;
+using System.Collections.Generic;
+
+namespace Obj.Align
+{
+    internal static partial class ObjectsTextOpsDiff
+    {
+        // Automato Aho-Corasick sobre as frases do lexico do AlignHelper (Normalized e Compact),
+        // montado uma vez junto com o lexico. Cada bloco e varrido uma vez sobre o texto e uma vez
+        // sobre o compacto (pulando espacos, sem montar a string); so as frases que ocorreram sao
+        // pontuadas. Regras iguais as do laco antigo (IndexOf/StartsWith/Contains por frase):
+        // primeira ocorrencia, prefixo ate 24, bonus ate 36 e empate para a frase mais antiga.
+        private sealed class AlignHelperMatcher
+        {
+            [ThreadStatic]
+            private static MatchScratch? _scratch;
+
+            private readonly List<AlignHelperPhrase> _phrases;
+            private readonly int[] _textIdOf;
+            private readonly int[] _compactIdOf;
+            private readonly int[][] _phrasesByText;
+            private readonly int[][] _phrasesByCompact;
+            private readonly int[] _patternLength;
+            private readonly int[] _asciiColumn;
+            private readonly Dictionary<char, int> _otherColumn;
+            private readonly int _columns;
+            private readonly int[] _delta;
+            private readonly int[] _terminal;
+            private readonly int[] _outLink;
+
+            public AlignHelperMatcher(List<AlignHelperPhrase> phrases)
+            {
+                _phrases = phrases;
+                _textIdOf = new int[phrases.Count];
+                _compactIdOf = new int[phrases.Count];
+
+                // Padroes distintos (mesmo texto pode servir de Normalized e de Compact).
+                var ids = new Dictionary<string, int>(StringComparer.Ordinal);
+                var patterns = new List<string>();
+                var byText = new List<List<int>>();
+                var byCompact = new List<List<int>>();
+                int Intern(string pattern)
+                {
+                    if (ids.TryGetValue(pattern, out var id))
+                        return id;
+                    id = patterns.Count;
+                    ids[pattern] = id;
+                    patterns.Add(pattern);
+                    byText.Add(new List<int>());
+                    byCompact.Add(new List<int>());
+                    return id;
+                }
+
+                for (int p = 0; p < phrases.Count; p++)
+                {
+                    _textIdOf[p] = -1;
+                    _compactIdOf[p] = -1;
+                    var phrase = phrases[p];
+                    if (phrase.Normalized.Length == 0)
+                        continue;
+                    _textIdOf[p] = Intern(phrase.Normalized);
+                    byText[_textIdOf[p]].Add(p);
+                    if (phrase.Compact.Length >= 4)
+                    {
+                        _compactIdOf[p] = Intern(phrase.Compact);
+                        byCompact[_compactIdOf[p]].Add(p);
+                    }
+                }
+                _phrasesByText = byText.ConvertAll(v => v.ToArray()).ToArray();
+                _phrasesByCompact = byCompact.ConvertAll(v => v.ToArray()).ToArray();
+                _patternLength = patterns.ConvertAll(v => v.Length).ToArray();
+
+                _asciiColumn = new int[128];
+                Array.Fill(_asciiColumn, -1);
+                _otherColumn = new Dictionary<char, int>();
+                foreach (var pattern in patterns)
+                {
+                    foreach (var ch in pattern)
+                    {
+                        if (Column(ch) >= 0)
+                            continue;
+                        if (ch < 128)
+                            _asciiColumn[ch] = _columns++;
+                        else
+                            _otherColumn[ch] = _columns++;
+                    }
+                }
+
+                // Trie em goto denso (no x coluna); 0 = sem filho durante a montagem (raiz nunca e filho).
+                var gotoTable = new List<int>();
+                var terminal = new List<int>();
+                int NewNode()
+                {
+                    for (int c = 0; c < _columns; c++)
+                        gotoTable.Add(0);
+                    terminal.Add(-1);
+                    return terminal.Count - 1;
+                }
+                NewNode();
+                for (int id = 0; id < patterns.Count; id++)
+                {
+                    int node = 0;
+                    foreach (var ch in patterns[id])
+                    {
+                        var cell = node * _columns + Column(ch);
+                        if (gotoTable[cell] == 0)
+                        {
+                            var child = NewNode();
+                            gotoTable[cell] = child;
+                        }
+                        node = gotoTable[cell];
+                    }
+                    terminal[node] = id;
+                }
+
+                int nodes = terminal.Count;
+                _delta = gotoTable.ToArray();
+                _terminal = terminal.ToArray();
+                _outLink = new int[nodes];
+                var fail = new int[nodes];
+                _outLink[0] = -1;
+
+                // BFS: delta(u, c) = filho ou delta(fail(u), c); outLink = proximo terminal na cadeia de falhas.
+                var queue = new Queue<int>();
+                for (int c = 0; c < _columns; c++)
+                {
+                    var child = _delta[c];
+                    if (child == 0)
+                        continue;
+                    fail[child] = 0;
+                    _outLink[child] = -1;
+                    queue.Enqueue(child);
+                }
+                while (queue.Count > 0)
+                {
+                    var u = queue.Dequeue();
+                    for (int c = 0; c < _columns; c++)
+                    {
+                        var cell = u * _columns + c;
+                        var child = _delta[cell];
+                        var viaFail = _delta[fail[u] * _columns + c];
+                        if (child == 0)
+                        {
+                            _delta[cell] = viaFail;
+                            continue;
+                        }
+                        fail[child] = viaFail;
+                        _outLink[child] = _terminal[viaFail] >= 0 ? viaFail : _outLink[viaFail];
+                        queue.Enqueue(child);
+                    }
+                }
+            }
+
+            public int PatternCount => _patternLength.Length;
+
+            /// <summary>Melhor frase (maior score; empate: a primeira do lexico) para um texto ja normalizado.</summary>
+            public AlignHelperPhrase? FindBest(string text, out double bestScore)
+            {
+                bestScore = 0.0;
+                if (PatternCount == 0 || text.Length == 0)
+                    return null;
+
+                var s = _scratch;
+                if (s == null || s.First.Length < PatternCount * 2)
+                    _scratch = s = new MatchScratch(PatternCount * 2);
+                s.Begin();
+
+                Scan(text, compact: false, s);
+                Scan(text, compact: true, s);
+
+                AlignHelperPhrase? best = null;
+                int bestIndex = -1;
+                foreach (var p in s.Candidates)
+                {
+                    var phrase = _phrases[p];
+                    if (!IsHelperKeyAllowedForCurrentDoc(phrase.Key))
+                        continue;
+
+                    var matchPos = s.Get(_textIdOf[p]);
+                    var compactPos = _compactIdOf[p] >= 0 ? s.Get(PatternCount + _compactIdOf[p]) : -1;
+                    bool matched;
+                    if (phrase.RequirePrefix)
+                        matched = (matchPos >= 0 && matchPos <= 24) || compactPos == 0;
+                    else
+                        matched = matchPos >= 0 || compactPos >= 0;
+                    if (!matched)
+                        continue;
+
+                    // Prioriza marcador em posição de cabeçalho/label.
+                    var positionBonus = matchPos >= 0 && matchPos <= 36 ? 0.12 : 0.0;
+                    var score = Math.Min(0.99, phrase.Weight + positionBonus);
+                    if (score > bestScore || (score == bestScore && best != null && p < bestIndex))
+                    {
+                        bestScore = score;
+                        best = phrase;
+                        bestIndex = p;
+                    }
+                }
+                return best;
+            }
+
+            private int Column(char ch)
+            {
+                if (ch < 128)
+                    return _asciiColumn[ch];
+                return _otherColumn.TryGetValue(ch, out var col) ? col : -1;
+            }
+
+            // Registra a primeira ocorrencia (posicao inicial) de cada padrao; no modo compacto os
+            // espacos sao pulados e as posicoes contam so os demais caracteres.
+            private void Scan(string text, bool compact, MatchScratch s)
+            {
+                int state = 0;
+                int pos = -1;
+                var slotBase = compact ? PatternCount : 0;
+                var byPattern = compact ? _phrasesByCompact : _phrasesByText;
+                foreach (var ch in text)
+                {
+                    if (compact && ch == ' ')
+                        continue;
+                    pos++;
+                    var col = Column(ch);
+                    if (col < 0)
+                    {
+                        state = 0;
+                        continue;
+                    }
+                    state = _delta[state * _columns + col];
+                    for (int node = _terminal[state] >= 0 ? state : _outLink[state]; node >= 0; node = _outLink[node])
+                    {
+                        var id = _terminal[node];
+                        if (byPattern[id].Length == 0 || !s.TrySet(slotBase + id, pos - _patternLength[id] + 1))
+                            continue;
+                        s.Candidates.AddRange(byPattern[id]);
+                    }
+                }
+            }
+
+            private sealed class MatchScratch
+            {
+                private readonly int[] _stamp;
+                private int _generation;
+
+                public MatchScratch(int slots)
+                {
+                    First = new int[slots];
+                    _stamp = new int[slots];
+                }
+
+                public int[] First { get; }
+                public List<int> Candidates { get; } = new List<int>();
+
+                public void Begin()
+                {
+                    Candidates.Clear();
+                    if (_generation == int.MaxValue)
+                    {
+                        Array.Clear(_stamp);
+                        _generation = 0;
+                    }
+                    _generation++;
+                }
+
+                public int Get(int slot) => slot >= 0 && _stamp[slot] == _generation ? First[slot] : -1;
+
+                public bool TrySet(int slot, int start)
+                {
+                    if (_stamp[slot] == _generation)
+                        return false;
+                    _stamp[slot] = _generation;
+                    First[slot] = start;
+                    return true;
+                }
+            }
+        }
+    }
+}
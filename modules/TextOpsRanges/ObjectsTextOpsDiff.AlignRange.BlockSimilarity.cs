@@ -0,0 +1,238 @@
+using System;
+using System.Collections.Generic;
+
+namespace Obj.Align
+{
+    internal static partial class ObjectsTextOpsDiff
+    {
+        // Assinatura de um bloco normalizado, calculada uma vez por stream: tudo que
+        // ComputeAlignmentSimilarity refazia a cada par (tokens de palavra, chave do helper, rotulo
+        // de campo, cue de ancora) mais bigramas de caracteres e hashes de palavras para o limite
+        // superior barato da similaridade.
+        private sealed class BlockSignature
+        {
+            public BlockSignature(string text)
+            {
+                Text = text ?? "";
+                Words = TokenizeForWordSimilarity(Text);
+                HelperKey = DetectAlignHelperKey(Text);
+                Label = AnalyzeLeadingFieldLabel(Text);
+                AnchorCue = IsAnchorModelCue(Text);
+
+                Bigrams = new int[Math.Max(0, Text.Length - 1)];
+                for (int i = 0; i < Bigrams.Length; i++)
+                    Bigrams[i] = (Text[i] << 16) | Text[i + 1];
+                Array.Sort(Bigrams);
+
+                WordHashes = new int[Words.Count];
+                for (int i = 0; i < WordHashes.Length; i++)
+                    WordHashes[i] = StringComparer.Ordinal.GetHashCode(Words[i]);
+                Array.Sort(WordHashes);
+            }
+
+            public string Text { get; }
+            public List<string> Words { get; }
+            public string HelperKey { get; }
+            public LabelInfo Label { get; }
+            public bool AnchorCue { get; }
+            public int[] Bigrams { get; }
+            public int[] WordHashes { get; }
+        }
+
+        // Similaridades A x B de um BuildBlockAlignments: valor exato memorizado por par (ancoras auto,
+        // explicitas, helper e DP de segmentos reaproveitam) e limite superior por assinaturas, que
+        // poda pares incapazes de virar melhor casamento antes de rodar o diff.
+        private sealed class BlockSimilarityMatrix
+        {
+            private const long MaxDenseCells = 4_000_000;
+            private readonly double[]? _dense;
+            private readonly Dictionary<long, double>? _sparse;
+            private BestMatches? _bestMatches;
+
+            public BlockSimilarityMatrix(List<string> normA, List<string> normB)
+            {
+                NormA = normA;
+                NormB = normB;
+                A = new BlockSignature[normA.Count];
+                B = new BlockSignature[normB.Count];
+                for (int i = 0; i < A.Length; i++)
+                    A[i] = new BlockSignature(normA[i]);
+                for (int j = 0; j < B.Length; j++)
+                    B[j] = new BlockSignature(normB[j]);
+
+                var cells = (long)A.Length * B.Length;
+                if (cells <= MaxDenseCells)
+                {
+                    _dense = new double[cells];
+                    Array.Fill(_dense, double.NaN);
+                }
+                else
+                {
+                    _sparse = new Dictionary<long, double>();
+                }
+            }
+
+            public List<string> NormA { get; }
+            public List<string> NormB { get; }
+            public BlockSignature[] A { get; }
+            public BlockSignature[] B { get; }
+
+            public double Get(int i, int j)
+            {
+                long k = (long)i * B.Length + j;
+                if (_dense != null)
+                {
+                    var cached = _dense[k];
+                    if (!double.IsNaN(cached))
+                        return cached;
+                }
+                else if (_sparse!.TryGetValue(k, out var cached))
+                {
+                    return cached;
+                }
+
+                var a = A[i];
+                var b = B[j];
+                var sim = AdjustAlignmentSimilarity(
+                    ComputeSimilarity(a.Text, b.Text, a.Words, b.Words),
+                    a.HelperKey,
+                    b.HelperKey,
+                    a.Label,
+                    b.Label);
+                if (_dense != null)
+                    _dense[k] = sim;
+                else
+                    _sparse![k] = sim;
+                return sim;
+            }
+
+            public bool RejectAsAnchorMismatch(int i, int j) => ShouldRejectAsAnchorMismatch(A[i].Label, B[j].Label);
+
+            /// <summary>Limite superior de Get(i, j) sem diff: distancia de edicao >= limite por bigramas/palavras em comum.</summary>
+            public double UpperBound(int i, int j)
+            {
+                var a = A[i];
+                var b = B[j];
+                int la = a.Text.Length;
+                int lb = b.Text.Length;
+                double combined;
+                if (la == 0 || lb == 0)
+                {
+                    combined = la == 0 && lb == 0 ? 1.0 : 0.0;
+                }
+                else
+                {
+                    var maxLen = Math.Max(la, lb);
+                    // cada edicao destroi no maximo 2 bigramas: d >= (maxLen - 1 - comuns) / 2
+                    var bigramBound = (maxLen - 1 - CountCommon(a.Bigrams, b.Bigrams) + 1) / 2;
+                    var distBound = Math.Max(Math.Abs(la - lb), bigramBound);
+                    var textSim = 1.0 - (double)distBound / maxLen;
+                    var lenSim = 1.0 - (double)Math.Abs(la - lb) / maxLen;
+                    var charSim = (textSim * 0.7) + (lenSim * 0.3);
+
+                    int ta = a.Words.Count;
+                    int tb = b.Words.Count;
+                    double wordSim = 1.0;
+                    // EncodeTokensForDiff satura em char.MaxValue tokens distintos; ai o limite nao vale
+                    if (ta > 0 && tb > 0 && ta + tb < char.MaxValue - 1)
+                    {
+                        var maxTok = Math.Max(ta, tb);
+                        var wordDist = maxTok - CountCommon(a.WordHashes, b.WordHashes);
+                        var wordTextSim = 1.0 - (double)wordDist / maxTok;
+                        var wordLenSim = 1.0 - (double)Math.Abs(ta - tb) / maxTok;
+                        wordSim = (wordTextSim * 0.78) + (wordLenSim * 0.22);
+                    }
+                    combined = CombineCharWordSimilarity(charSim, wordSim, ta, tb);
+                }
+                return AdjustAlignmentSimilarity(combined, a.HelperKey, b.HelperKey, a.Label, b.Label) + 1e-9;
+            }
+
+            public BestMatches GetBestMatches()
+            {
+                return _bestMatches ??= ComputeBestMatches();
+            }
+
+            // Melhor B de cada A e melhor A de cada B (empate: menor indice; so sim > 0), como o laco
+            // A x B completo. Dentro da linha os pares vao em ordem decrescente de limite superior e
+            // param de rodar o diff quando o limite nao supera o melhor atual da linha nem da coluna.
+            private BestMatches ComputeBestMatches()
+            {
+                var best = new BestMatches(A.Length, B.Length);
+                var order = new int[B.Length];
+                var bounds = new double[B.Length];
+                for (int i = 0; i < A.Length; i++)
+                {
+                    int count = 0;
+                    for (int j = 0; j < B.Length; j++)
+                    {
+                        if (RejectAsAnchorMismatch(i, j))
+                            continue;
+                        order[count] = j;
+                        bounds[count] = -UpperBound(i, j);
+                        count++;
+                    }
+                    Array.Sort(bounds, order, 0, count);
+
+                    double rowBest = 0.0;
+                    int rowIdx = -1;
+                    for (int k = 0; k < count; k++)
+                    {
+                        var j = order[k];
+                        var bound = -bounds[k];
+                        var canWinRow = bound > rowBest || (bound >= rowBest && rowIdx >= 0 && j < rowIdx);
+                        var canWinColumn = bound > best.SimB[j];
+                        if (!canWinRow && !canWinColumn)
+                            continue;
+                        var sim = Get(i, j);
+                        if (sim > rowBest || (sim == rowBest && rowIdx >= 0 && j < rowIdx))
+                        {
+                            rowBest = sim;
+                            rowIdx = j;
+                        }
+                        if (sim > best.SimB[j])
+                        {
+                            best.SimB[j] = sim;
+                            best.IdxB[j] = i;
+                        }
+                    }
+                    best.SimA[i] = rowBest;
+                    best.IdxA[i] = rowIdx;
+                    if (rowBest > best.MaxSim)
+                        best.MaxSim = rowBest;
+                }
+                return best;
+            }
+
+            private static int CountCommon(int[] x, int[] y)
+            {
+                int i = 0, j = 0, common = 0;
+                while (i < x.Length && j < y.Length)
+                {
+                    if (x[i] == y[j]) { common++; i++; j++; }
+                    else if (x[i] < y[j]) i++;
+                    else j++;
+                }
+                return common;
+            }
+        }
+
+        private sealed class BestMatches
+        {
+            public BestMatches(int countA, int countB)
+            {
+                SimA = new double[countA];
+                IdxA = new int[countA];
+                SimB = new double[countB];
+                IdxB = new int[countB];
+                Array.Fill(IdxA, -1);
+                Array.Fill(IdxB, -1);
+            }
+
+            public double[] SimA { get; }
+            public int[] IdxA { get; }
+            public double[] SimB { get; }
+            public int[] IdxB { get; }
+            public double MaxSim { get; set; }
+        }
+    }
+}
@@ -6,45 +6,24 @@ namespace Obj.Align
 {
     internal static partial class ObjectsTextOpsDiff
     {
-        private static List<AnchorPair> BuildAnchorPairsAuto(List<string> normA, List<string> normB, double minLenRatio, out double maxSim)
+        private static List<AnchorPair> BuildAnchorPairsAuto(BlockSimilarityMatrix sims, double minLenRatio, out double maxSim)
         {
+            var normA = sims.NormA;
+            var normB = sims.NormB;
             var anchors = new List<AnchorPair>();
             maxSim = 0.0;
             if (normA.Count == 0 || normB.Count == 0)
                 return anchors;
 
-            var bestSimA = new double[normA.Count];
-            var bestIdxA = new int[normA.Count];
-            var bestSimB = new double[normB.Count];
-            var bestIdxB = new int[normB.Count];
-            for (int i = 0; i < bestIdxA.Length; i++) bestIdxA[i] = -1;
-            for (int i = 0; i < bestIdxB.Length; i++) bestIdxB[i] = -1;
-
-            maxSim = 0.0;
-            for (int i = 0; i < normA.Count; i++)
-            {
-                for (int j = 0; j < normB.Count; j++)
-                {
-                    if (ShouldRejectAsAnchorMismatch(normA[i], normB[j]))
-                        continue;
-                    var sim = ComputeAlignmentSimilarity(normA[i], normB[j]);
-                    if (sim > maxSim) maxSim = sim;
-                    if (sim > bestSimA[i])
-                    {
-                        bestSimA[i] = sim;
-                        bestIdxA[i] = j;
-                    }
-                    if (sim > bestSimB[j])
-                    {
-                        bestSimB[j] = sim;
-                        bestIdxB[j] = i;
-                    }
-                }
-            }
+            var best = sims.GetBestMatches();
+            var bestSimA = best.SimA;
+            var bestIdxA = best.IdxA;
+            var bestIdxB = best.IdxB;
+            maxSim = best.MaxSim;
 
             var anchorCueRateA = normA.Count == 0
                 ? 0.0
-                : normA.Count(IsAnchorModelCue) / (double)normA.Count;
+                : sims.A.Count(v => v.AnchorCue) / (double)normA.Count;
             var anchorMode = anchorCueRateA >= 0.25;
             var threshold = anchorMode
                 ? Math.Max(0.10, maxSim - 0.30)
@@ -58,7 +37,7 @@ namespace Obj.Align
                 if (bestIdxB[j] != i)
                     continue;
                 var sim = bestSimA[i];
-                var anchorCue = IsAnchorModelCue(normA[i]) || IsAnchorModelCue(normB[j]);
+                var anchorCue = sims.A[i].AnchorCue || sims.B[j].AnchorCue;
                 // Do not relax similarity floor for cue labels; very low-sim auto anchors
                 // tend to over-constrain segmentation and inflate artificial gaps.
                 var localThreshold = threshold;
@@ -5,58 +5,37 @@ namespace Obj.Align
 {
     internal static partial class ObjectsTextOpsDiff
     {
-        private static List<AnchorPair> BuildAnchorPairsExplicit(List<string> normA, List<string> normB, double minSim, double minLenRatio)
+        private static List<AnchorPair> BuildAnchorPairsExplicit(BlockSimilarityMatrix sims, double minSim, double minLenRatio)
         {
+            var normA = sims.NormA;
+            var normB = sims.NormB;
             var anchors = new List<AnchorPair>();
             if (minSim <= 0 && minLenRatio <= 0)
                 return anchors;
 
+            // So pares mutuamente melhores sobrevivem ao filtro abaixo; os melhores por linha/coluna
+            // vem de GetBestMatches (mesmos indices do laco A x B completo, sem diff em pares podados).
+            var best = sims.GetBestMatches();
+            var bestIdxA = best.IdxA;
+            var bestIdxB = best.IdxB;
             var candidates = new List<AnchorPair>();
-            var bestSimA = new double[normA.Count];
-            var bestIdxA = new int[normA.Count];
-            var bestSimB = new double[normB.Count];
-            var bestIdxB = new int[normB.Count];
-            for (int i = 0; i < bestIdxA.Length; i++) bestIdxA[i] = -1;
-            for (int i = 0; i < bestIdxB.Length; i++) bestIdxB[i] = -1;
-
             for (int i = 0; i < normA.Count; i++)
             {
-                for (int j = 0; j < normB.Count; j++)
-                {
-                    if (ShouldRejectAsAnchorMismatch(normA[i], normB[j]))
-                        continue;
-                    var sim = ComputeAlignmentSimilarity(normA[i], normB[j]);
-                    if (sim > bestSimA[i])
-                    {
-                        bestSimA[i] = sim;
-                        bestIdxA[i] = j;
-                    }
-                    if (sim > bestSimB[j])
-                    {
-                        bestSimB[j] = sim;
-                        bestIdxB[j] = i;
-                    }
-                    if (minSim > 0 && sim < minSim)
-                        continue;
-                    var lenRatio = ComputeLenRatio(normA[i], normB[j]);
-                    var anchorCue = IsAnchorModelCue(normA[i]) || IsAnchorModelCue(normB[j]);
-                    if (minLenRatio > 0 && lenRatio < minLenRatio && !anchorCue)
-                        continue;
-                    candidates.Add(new AnchorPair { AIndex = i, BIndex = j, Score = sim });
-                }
+                var j = bestIdxA[i];
+                if (j < 0 || bestIdxB[j] != i)
+                    continue;
+                var sim = best.SimA[i];
+                if (minSim > 0 && sim < minSim)
+                    continue;
+                var lenRatio = ComputeLenRatio(normA[i], normB[j]);
+                var anchorCue = sims.A[i].AnchorCue || sims.B[j].AnchorCue;
+                if (minLenRatio > 0 && lenRatio < minLenRatio && !anchorCue)
+                    continue;
+                candidates.Add(new AnchorPair { AIndex = i, BIndex = j, Score = sim });
             }
             if (candidates.Count == 0)
                 return anchors;
 
-            // Keep only mutual best pairs to avoid noisy anchors.
-            candidates = candidates
-                .Where(c => bestIdxA[c.AIndex] == c.BIndex && bestIdxB[c.BIndex] == c.AIndex)
-                .OrderBy(c => c.AIndex)
-                .ThenBy(c => c.BIndex)
-                .ToList();
-            if (candidates.Count == 0)
-                return anchors;
-
             var dp = new double[candidates.Count];
             var prev = new int[candidates.Count];
             for (int i = 0; i < candidates.Count; i++)
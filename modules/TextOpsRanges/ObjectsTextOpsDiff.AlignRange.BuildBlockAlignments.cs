@@ -1,6 +1,7 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using Obj.Utils;
 
 namespace Obj.Align
 {
@@ -51,18 +52,31 @@ namespace Obj.Align
             double anchorMinLenRatio = 0.0,
             double gapPenalty = -0.35)
         {
-            normA = blocksA.Select(b => NormalizeForSimilarity(b.Text ?? "")).ToList();
-            normB = blocksB.Select(b => NormalizeForSimilarity(b.Text ?? "")).ToList();
+            using (StageTimer.Measure("normalize"))
+            {
+                normA = blocksA.Select(b => NormalizeForSimilarity(b.Text ?? "")).ToList();
+                normB = blocksB.Select(b => NormalizeForSimilarity(b.Text ?? "")).ToList();
+            }
+            BlockSimilarityMatrix sims;
+            using (StageTimer.Measure("signatures"))
+                sims = new BlockSimilarityMatrix(normA, normB);
             anchors = new List<AnchorPair>();
             helperDiagnostics = new AlignHelperDiagnostics();
 
             double autoMaxSim = 0.0;
             var explicitAnchorMode = anchorMinSim > 0 || anchorMinLenRatio > 0;
-            var explicitAnchors = explicitAnchorMode
-                ? BuildAnchorPairsExplicit(normA, normB, anchorMinSim, anchorMinLenRatio)
-                : new List<AnchorPair>();
-            var autoAnchors = BuildAnchorPairsAuto(normA, normB, Math.Max(0.05, minLenRatio), out autoMaxSim);
-            var helperAnchors = BuildAnchorPairsAlignHelper(normA, normB, Math.Max(0.05, minLenRatio), out helperDiagnostics);
+            List<AnchorPair> explicitAnchors;
+            List<AnchorPair> autoAnchors;
+            using (StageTimer.Measure("anchors"))
+            {
+                explicitAnchors = explicitAnchorMode
+                    ? BuildAnchorPairsExplicit(sims, anchorMinSim, anchorMinLenRatio)
+                    : new List<AnchorPair>();
+                autoAnchors = BuildAnchorPairsAuto(sims, Math.Max(0.05, minLenRatio), out autoMaxSim);
+            }
+            List<AnchorPair> helperAnchors;
+            using (StageTimer.Measure("anchors_helper"))
+                helperAnchors = BuildAnchorPairsAlignHelper(sims, Math.Max(0.05, minLenRatio), out helperDiagnostics);
             var diagnosticAnchors = MergeAnchorPairsWithHelper(autoAnchors, helperAnchors);
             var helperSet = new HashSet<(int A, int B)>(helperAnchors.Select(v => (v.AIndex, v.BIndex)));
 
@@ -83,12 +97,13 @@ namespace Obj.Align
                 helperDiagnostics.UsedInFinalAnchors = anchors.Count(v => helperSet.Contains((v.AIndex, v.BIndex)));
             }
 
+            using var segmentStage = StageTimer.Measure("segment_align");
             if (!explicitAnchorMode || anchors.Count == 0)
             {
                 var effectiveMinSim = minSim;
                 if (effectiveMinSim <= 0)
                     effectiveMinSim = autoMaxSim > 0 ? Math.Max(0.12, autoMaxSim * 0.6) : 0.12;
-                return BuildSegmentAlignments(normA, normB, 0, blocksA.Count, 0, blocksB.Count, effectiveMinSim, band, minLenRatio, lenPenalty, gapPenalty);
+                return BuildSegmentAlignments(sims, 0, blocksA.Count, 0, blocksB.Count, effectiveMinSim, band, minLenRatio, lenPenalty, gapPenalty);
             }
 
             var result = new List<BlockAlignment>();
@@ -98,7 +113,7 @@ namespace Obj.Align
             {
                 if (a.AIndex > prevA || a.BIndex > prevB)
                 {
-                    result.AddRange(BuildSegmentAlignments(normA, normB, prevA, a.AIndex, prevB, a.BIndex, minSim, band, minLenRatio, lenPenalty, gapPenalty));
+                    result.AddRange(BuildSegmentAlignments(sims, prevA, a.AIndex, prevB, a.BIndex, minSim, band, minLenRatio, lenPenalty, gapPenalty));
                 }
                 result.Add(new BlockAlignment(a.AIndex, a.BIndex, a.Score));
                 prevA = a.AIndex + 1;
@@ -106,7 +121,7 @@ namespace Obj.Align
             }
             if (prevA < blocksA.Count || prevB < blocksB.Count)
             {
-                result.AddRange(BuildSegmentAlignments(normA, normB, prevA, blocksA.Count, prevB, blocksB.Count, minSim, band, minLenRatio, lenPenalty, gapPenalty));
+                result.AddRange(BuildSegmentAlignments(sims, prevA, blocksA.Count, prevB, blocksB.Count, minSim, band, minLenRatio, lenPenalty, gapPenalty));
             }
             return result;
         }
@@ -0,0 +1,365 @@
+using System;
+using System.Collections.Generic;
+
+namespace Obj.Align
+{
+    internal static partial class ObjectsTextOpsDiff
+    {
+        // DP de blocos entre ancoras (A x B). Fora da banda (|i - j| > banda) nao ha diagonal, so gaps,
+        // entao a matriz inteira nao precisa existir: guardamos so as celulas da banda (movimentos em
+        // 2 bits) e duas linhas de score. As celulas fora da banda viram duas recorrencias 1-D (a
+        // primeira diagonal abaixo e a primeira acima da banda); dentro da regiao so de gaps o valor
+        // de qualquer celula sai dessas diagonais somando gaps, com a mesma aritmetica da DP cheia,
+        // inclusive empates. Resultado identico ao da matriz cheia, que continua disponivel como
+        // referencia via OBJ_TEXTOPSALIGN_SEGMENT_DP=full.
+        private const double SegmentNegInf = -1e9;
+        private static bool? _segmentDpFull;
+
+        private static bool SegmentDpFull
+        {
+            get
+            {
+                if (_segmentDpFull.HasValue)
+                    return _segmentDpFull.Value;
+                var raw = Environment.GetEnvironmentVariable("OBJ_TEXTOPSALIGN_SEGMENT_DP");
+                var full = string.Equals(raw?.Trim(), "full", StringComparison.OrdinalIgnoreCase);
+                _segmentDpFull = full;
+                return full;
+            }
+        }
+
+        private static List<BlockAlignment> BuildSegmentAlignments(
+            BlockSimilarityMatrix sims,
+            int startA,
+            int endA,
+            int startB,
+            int endB,
+            double minSim,
+            int band,
+            double minLenRatio,
+            double lenPenalty,
+            double gapPenalty)
+        {
+            int n = Math.Max(0, endA - startA);
+            int m = Math.Max(0, endB - startB);
+            if (n == 0 && m == 0)
+                return new List<BlockAlignment>();
+
+            // Banda adaptativa: evita cascata de gaps quando um lado tem mais blocos.
+            var dynamicBand = band <= 0 ? 0 : Math.Max(band, Math.Abs(n - m) + 2);
+            var cueA = new bool[n];
+            var cueB = new bool[m];
+            for (int i = 0; i < n; i++)
+                cueA[i] = sims.A[startA + i].AnchorCue;
+            for (int j = 0; j < m; j++)
+                cueB[j] = sims.B[startB + j].AnchorCue;
+
+            return SegmentDpFull
+                ? BuildSegmentAlignmentsFull(sims, startA, n, startB, m, cueA, cueB, dynamicBand, minSim, minLenRatio, lenPenalty, gapPenalty)
+                : BuildSegmentAlignmentsBanded(sims, startA, n, startB, m, cueA, cueB, dynamicBand, minSim, minLenRatio, lenPenalty, gapPenalty);
+        }
+
+        private static double ScoreSegmentDiag(BlockSimilarityMatrix sims, int aIdx, int bIdx, bool anchorCue, double diagPrev, double minSim, double minLenRatio, double lenPenalty)
+        {
+            var sim = sims.Get(aIdx, bIdx);
+            var lenRatio = ComputeLenRatio(sims.NormA[aIdx], sims.NormB[bIdx]);
+            var scoreDiag = SegmentNegInf;
+            var effectiveMinSim = anchorCue ? Math.Min(minSim, 0.08) : minSim;
+            var lenOk = (minLenRatio <= 0 || lenRatio >= minLenRatio || anchorCue);
+            if (sim >= effectiveMinSim && lenOk)
+            {
+                var penalty = (lenPenalty > 0 && !anchorCue) ? (1.0 - lenRatio) * lenPenalty : 0.0;
+                scoreDiag = diagPrev + sim - penalty;
+            }
+            if (double.IsNegativeInfinity(scoreDiag) || scoreDiag <= SegmentNegInf / 2)
+            {
+                // DMP-first fallback:
+                // quando a similaridade não passa o corte, ainda tentamos parear
+                // como variável fraca para evitar cascatas de gap_a/gap_b espúrios.
+                var weakPenalty = lenOk ? 0.0 : 0.05;
+                scoreDiag = diagPrev + (sim * 0.35) - 0.15 - weakPenalty;
+            }
+            return scoreDiag;
+        }
+
+        private static List<BlockAlignment> BuildSegmentAlignmentsBanded(
+            BlockSimilarityMatrix sims,
+            int startA,
+            int n,
+            int startB,
+            int m,
+            bool[] cueA,
+            bool[] cueB,
+            int dynamicBand,
+            double minSim,
+            double minLenRatio,
+            double lenPenalty,
+            double gapPenalty)
+        {
+            var g = gapPenalty;
+            var moves = new SegmentMoveTable(n, m, dynamicBand > 0 ? dynamicBand : Math.Max(n, m));
+            int w = moves.Band;
+            var prev = new double[m + 1];
+            var cur = new double[m + 1];
+            // below[j] = celula (j+w+1, j); above[i] = celula (i, i+w+1). *Up = o movimento dela e "up".
+            var below = new double[m + 1];
+            var belowUp = new bool[m + 1];
+            var above = new double[n + 1];
+            var aboveUp = new bool[n + 1];
+
+            for (int i = 0; i <= n; i++)
+            {
+                int lo = moves.Lo(i);
+                int hi = moves.Hi(i);
+                if (i == 0)
+                {
+                    cur[0] = 0;
+                    for (int j = 1; j <= hi; j++)
+                    {
+                        cur[j] = cur[j - 1] + g;
+                        moves.Set(0, j, 2);
+                    }
+                }
+                else
+                {
+                    (prev, cur) = (cur, prev);
+                    int hiPrev = moves.Hi(i - 1);
+                    var aIdx = startA + (i - 1);
+                    for (int j = lo; j <= hi; j++)
+                    {
+                        var up = j <= hiPrev ? prev[j] : above[i - 1];
+                        if (j == 0)
+                        {
+                            cur[0] = up + g;
+                            moves.Set(i, 0, 1);
+                            continue;
+                        }
+                        var left = j - 1 >= lo ? cur[j - 1] : below[j - 1];
+                        var anchorCue = cueA[i - 1] || cueB[j - 1];
+                        var scoreDiag = ScoreSegmentDiag(sims, aIdx, startB + (j - 1), anchorCue, prev[j - 1], minSim, minLenRatio, lenPenalty);
+                        var scoreUp = up + g;
+                        var scoreLeft = left + g;
+
+                        if (scoreDiag >= scoreUp && scoreDiag >= scoreLeft)
+                        {
+                            cur[j] = scoreDiag;
+                            moves.Set(i, j, 0);
+                        }
+                        else if (scoreUp >= scoreLeft)
+                        {
+                            cur[j] = scoreUp;
+                            moves.Set(i, j, 1);
+                        }
+                        else
+                        {
+                            cur[j] = scoreLeft;
+                            moves.Set(i, j, 2);
+                        }
+                    }
+                }
+
+                // Primeira diagonal abaixo da banda: vem da borda (up) ou da diagonal seguinte, que
+                // por sua vez so cresce a partir desta (left + up = dois gaps).
+                if (i >= w && i + 1 <= n)
+                {
+                    int j = i - w;
+                    var scoreUp = cur[j] + g;
+                    var scoreLeft = j > 0 ? (below[j - 1] + g) + g : double.NegativeInfinity;
+                    belowUp[j] = scoreUp >= scoreLeft;
+                    below[j] = belowUp[j] ? scoreUp : scoreLeft;
+                }
+                // Primeira diagonal acima da banda (simetrico; na linha 0 so ha left).
+                if (i + w + 1 <= m)
+                {
+                    var scoreLeft = cur[i + w] + g;
+                    var scoreUp = i > 0 ? (above[i - 1] + g) + g : double.NegativeInfinity;
+                    aboveUp[i] = scoreUp >= scoreLeft;
+                    above[i] = aboveUp[i] ? scoreUp : scoreLeft;
+                }
+            }
+
+            // Valor de (r, r+w+d) na regiao acima da banda: a celula da 1a diagonal somada a d-1 gaps.
+            double AboveValue(int r, int depth)
+            {
+                var v = above[r];
+                for (int k = 1; k < depth; k++)
+                    v += g;
+                return v;
+            }
+
+            var alignments = new List<BlockAlignment>();
+            int x = n;
+            int y = m;
+            while (x > 0 || y > 0)
+            {
+                int move;
+                if (x == 0)
+                    move = 2;
+                else if (y == 0)
+                    move = 1;
+                else if (y < moves.Lo(x))
+                    move = (x - y - w) >= 2 || belowUp[y] ? 1 : 2;
+                else if (y > moves.Hi(x))
+                {
+                    int depth = y - x - w;
+                    if (depth == 1)
+                        move = aboveUp[x] ? 1 : 2;
+                    else
+                        move = AboveValue(x - 1, depth + 1) + g >= AboveValue(x, depth - 1) + g ? 1 : 2;
+                }
+                else
+                    move = moves.Get(x, y);
+
+                if (move == 0)
+                {
+                    var aIdx = startA + (x - 1);
+                    var bIdx = startB + (y - 1);
+                    var sim = sims.Get(aIdx, bIdx);
+                    alignments.Add(new BlockAlignment(aIdx, bIdx, sim));
+                    x--;
+                    y--;
+                }
+                else if (move == 1)
+                {
+                    alignments.Add(new BlockAlignment(startA + (x - 1), -1, 0));
+                    x--;
+                }
+                else
+                {
+                    alignments.Add(new BlockAlignment(-1, startB + (y - 1), 0));
+                    y--;
+                }
+            }
+            alignments.Reverse();
+            return alignments;
+        }
+
+        // Referencia: matriz (n+1) x (m+1) completa; fora da banda so gaps.
+        private static List<BlockAlignment> BuildSegmentAlignmentsFull(
+            BlockSimilarityMatrix sims,
+            int startA,
+            int n,
+            int startB,
+            int m,
+            bool[] cueA,
+            bool[] cueB,
+            int dynamicBand,
+            double minSim,
+            double minLenRatio,
+            double lenPenalty,
+            double gapPenalty)
+        {
+            var dp = new double[n + 1, m + 1];
+            var move = new byte[n + 1, m + 1];
+            for (int i = 0; i <= n; i++)
+            {
+                for (int j = 0; j <= m; j++)
+                    dp[i, j] = SegmentNegInf;
+            }
+            dp[0, 0] = 0;
+            for (int i = 1; i <= n; i++)
+            {
+                dp[i, 0] = dp[i - 1, 0] + gapPenalty;
+                move[i, 0] = 1;
+            }
+            for (int j = 1; j <= m; j++)
+            {
+                dp[0, j] = dp[0, j - 1] + gapPenalty;
+                move[0, j] = 2;
+            }
+
+            for (int i = 1; i <= n; i++)
+            {
+                for (int j = 1; j <= m; j++)
+                {
+                    var withinBand = dynamicBand <= 0 || Math.Abs(i - j) <= dynamicBand;
+                    var scoreDiag = withinBand
+                        ? ScoreSegmentDiag(sims, startA + (i - 1), startB + (j - 1), cueA[i - 1] || cueB[j - 1], dp[i - 1, j - 1], minSim, minLenRatio, lenPenalty)
+                        : SegmentNegInf;
+                    var scoreUp = dp[i - 1, j] + gapPenalty;
+                    var scoreLeft = dp[i, j - 1] + gapPenalty;
+
+                    if (scoreDiag >= scoreUp && scoreDiag >= scoreLeft)
+                    {
+                        dp[i, j] = scoreDiag;
+                        move[i, j] = 0;
+                    }
+                    else if (scoreUp >= scoreLeft)
+                    {
+                        dp[i, j] = scoreUp;
+                        move[i, j] = 1;
+                    }
+                    else
+                    {
+                        dp[i, j] = scoreLeft;
+                        move[i, j] = 2;
+                    }
+                }
+            }
+
+            var alignments = new List<BlockAlignment>();
+            int x = n;
+            int y = m;
+            while (x > 0 || y > 0)
+            {
+                if (x > 0 && y > 0 && move[x, y] == 0)
+                {
+                    var aIdx = startA + (x - 1);
+                    var bIdx = startB + (y - 1);
+                    var sim = sims.Get(aIdx, bIdx);
+                    alignments.Add(new BlockAlignment(aIdx, bIdx, sim));
+                    x--;
+                    y--;
+                }
+                else if (x > 0 && (y == 0 || move[x, y] == 1))
+                {
+                    alignments.Add(new BlockAlignment(startA + (x - 1), -1, 0));
+                    x--;
+                }
+                else
+                {
+                    alignments.Add(new BlockAlignment(-1, startB + (y - 1), 0));
+                    y--;
+                }
+            }
+            alignments.Reverse();
+            return alignments;
+        }
+
+        // Movimentos (0=diag, 1=up, 2=left) so das celulas da banda, 2 bits cada, linha a linha.
+        private sealed class SegmentMoveTable
+        {
+            private readonly int _m;
+            private readonly long[] _offsets;
+            private readonly byte[] _bits;
+
+            public SegmentMoveTable(int n, int m, int band)
+            {
+                _m = m;
+                Band = band;
+                _offsets = new long[n + 2];
+                for (int i = 0; i <= n; i++)
+                    _offsets[i + 1] = _offsets[i] + (Hi(i) - Lo(i) + 1);
+                _bits = new byte[(_offsets[n + 1] + 3) / 4];
+            }
+
+            public int Band { get; }
+
+            public int Lo(int i) => Math.Max(0, i - Band);
+
+            public int Hi(int i) => (int)Math.Min(_m, (long)i + Band);
+
+            public int Get(int i, int j)
+            {
+                long k = _offsets[i] + (j - Lo(i));
+                return (_bits[k >> 2] >> (int)((k & 3) * 2)) & 3;
+            }
+
+            public void Set(int i, int j, int move)
+            {
+                long k = _offsets[i] + (j - Lo(i));
+                _bits[k >> 2] |= (byte)(move << (int)((k & 3) * 2));
+            }
+        }
+    }
+}
@@ -8,13 +8,8 @@ namespace Obj.Align
 {
     internal static partial class ObjectsTextOpsDiff
     {
-        private static double ComputeWordSimilarity(string a, string b, out int tokenCountA, out int tokenCountB)
+        private static double ComputeWordSimilarity(List<string> tokensA, List<string> tokensB)
         {
-            var tokensA = TokenizeForWordSimilarity(a);
-            var tokensB = TokenizeForWordSimilarity(b);
-            tokenCountA = tokensA.Count;
-            tokenCountB = tokensB.Count;
-
             if (tokensA.Count == 0 && tokensB.Count == 0)
                 return 1.0;
             if (tokensA.Count == 0 || tokensB.Count == 0)
@@ -173,6 +173,11 @@ namespace Obj.Align
         }
 
         private static double ComputeSimilarity(string a, string b)
+        {
+            return ComputeSimilarity(a, b, TokenizeForWordSimilarity(a), TokenizeForWordSimilarity(b));
+        }
+
+        private static double ComputeSimilarity(string a, string b, List<string> wordsA, List<string> wordsB)
         {
             if (a.Length == 0 && b.Length == 0)
                 return 1.0;
@@ -189,7 +194,12 @@ namespace Obj.Align
             var lenSim = 1.0 - (double)Math.Abs(a.Length - b.Length) / maxLen;
             var charSim = (textSim * 0.7) + (lenSim * 0.3);
 
-            var wordSim = ComputeWordSimilarity(a, b, out var tokA, out var tokB);
+            var wordSim = ComputeWordSimilarity(wordsA, wordsB);
+            return CombineCharWordSimilarity(charSim, wordSim, wordsA.Count, wordsB.Count);
+        }
+
+        private static double CombineCharWordSimilarity(double charSim, double wordSim, int tokA, int tokB)
+        {
             if (tokA == 0 || tokB == 0)
                 return charSim;
 
@@ -208,9 +218,17 @@ namespace Obj.Align
 
         private static double ComputeAlignmentSimilarity(string a, string b)
         {
-            var sim = ComputeSimilarity(a, b);
-            var helperKeyA = DetectAlignHelperKey(a);
-            var helperKeyB = DetectAlignHelperKey(b);
+            return AdjustAlignmentSimilarity(
+                ComputeSimilarity(a, b),
+                DetectAlignHelperKey(a),
+                DetectAlignHelperKey(b),
+                AnalyzeLeadingFieldLabel(a),
+                AnalyzeLeadingFieldLabel(b));
+        }
+
+        // Ajustes por chave do helper e rotulo de campo; monotono em sim (usado tambem no limite superior).
+        private static double AdjustAlignmentSimilarity(double sim, string helperKeyA, string helperKeyB, LabelInfo labelA, LabelInfo labelB)
+        {
             if (helperKeyA.Length > 0 && helperKeyB.Length > 0)
             {
                 if (string.Equals(helperKeyA, helperKeyB, StringComparison.Ordinal))
@@ -223,9 +241,6 @@ namespace Obj.Align
                 sim -= 0.10;
             }
 
-            var labelA = AnalyzeLeadingFieldLabel(a);
-            var labelB = AnalyzeLeadingFieldLabel(b);
-
             if (labelA.Label.Length > 0 && labelB.Label.Length > 0)
             {
                 if (string.Equals(labelA.Label, labelB.Label, StringComparison.Ordinal))
@@ -257,10 +272,8 @@ namespace Obj.Align
             return sim;
         }
 
-        private static bool ShouldRejectAsAnchorMismatch(string a, string b)
+        private static bool ShouldRejectAsAnchorMismatch(LabelInfo labelA, LabelInfo labelB)
         {
-            var labelA = AnalyzeLeadingFieldLabel(a);
-            var labelB = AnalyzeLeadingFieldLabel(b);
             if (labelA.Label.Length == 0 || labelB.Label.Length == 0)
                 return false;
             if (string.Equals(labelA.Label, labelB.Label, StringComparison.Ordinal))
@@ -917,132 +930,6 @@ namespace Obj.Align
             };
         }
 
-        private static List<BlockAlignment> BuildSegmentAlignments(
-            List<string> normA,
-            List<string> normB,
-            int startA,
-            int endA,
-            int startB,
-            int endB,
-            double minSim,
-            int band,
-            double minLenRatio,
-            double lenPenalty,
-            double gapPenalty)
-        {
-            int n = Math.Max(0, endA - startA);
-            int m = Math.Max(0, endB - startB);
-            if (n == 0 && m == 0)
-                return new List<BlockAlignment>();
-
-            const double negInf = -1e9;
-            // Banda adaptativa: evita cascata de gaps quando um lado tem mais blocos.
-            var dynamicBand = band <= 0 ? 0 : Math.Max(band, Math.Abs(n - m) + 2);
-
-            var dp = new double[n + 1, m + 1];
-            var move = new byte[n + 1, m + 1];
-            for (int i = 0; i <= n; i++)
-            {
-                for (int j = 0; j <= m; j++)
-                    dp[i, j] = negInf;
-            }
-            dp[0, 0] = 0;
-            for (int i = 1; i <= n; i++)
-            {
-                dp[i, 0] = dp[i - 1, 0] + gapPenalty;
-                move[i, 0] = 1;
-            }
-            for (int j = 1; j <= m; j++)
-            {
-                dp[0, j] = dp[0, j - 1] + gapPenalty;
-                move[0, j] = 2;
-            }
-
-            for (int i = 1; i <= n; i++)
-            {
-                for (int j = 1; j <= m; j++)
-                {
-                    var withinBand = dynamicBand <= 0 || Math.Abs(i - j) <= dynamicBand;
-                    var aIdx = startA + (i - 1);
-                    var bIdx = startB + (j - 1);
-                    var anchorCueA = IsAnchorModelCue(normA[aIdx]);
-                    var anchorCueB = IsAnchorModelCue(normB[bIdx]);
-                    var anchorCue = anchorCueA || anchorCueB;
-                    var sim = ComputeAlignmentSimilarity(normA[aIdx], normB[bIdx]);
-                    var lenRatio = ComputeLenRatio(normA[aIdx], normB[bIdx]);
-                    var scoreDiag = negInf;
-                    var effectiveMinSim = anchorCue ? Math.Min(minSim, 0.08) : minSim;
-                    var lenOk = (minLenRatio <= 0 || lenRatio >= minLenRatio || anchorCue);
-                    if (withinBand)
-                    {
-                        if (sim >= effectiveMinSim)
-                        {
-                            if (lenOk)
-                            {
-                                var penalty = (lenPenalty > 0 && !anchorCue) ? (1.0 - lenRatio) * lenPenalty : 0.0;
-                                scoreDiag = dp[i - 1, j - 1] + sim - penalty;
-                            }
-                        }
-                        if (double.IsNegativeInfinity(scoreDiag) || scoreDiag <= negInf / 2)
-                        {
-                            // DMP-first fallback:
-                            // quando a similaridade não passa o corte, ainda tentamos parear
-                            // como variável fraca para evitar cascatas de gap_a/gap_b espúrios.
-                            var weakPenalty = lenOk ? 0.0 : 0.05;
-                            var weakDiag = dp[i - 1, j - 1] + (sim * 0.35) - 0.15 - weakPenalty;
-                            scoreDiag = weakDiag;
-                        }
-                    }
-                    var scoreUp = dp[i - 1, j] + gapPenalty;
-                    var scoreLeft = dp[i, j - 1] + gapPenalty;
-
-                    if (scoreDiag >= scoreUp && scoreDiag >= scoreLeft)
-                    {
-                        dp[i, j] = scoreDiag;
-                        move[i, j] = 0;
-                    }
-                    else if (scoreUp >= scoreLeft)
-                    {
-                        dp[i, j] = scoreUp;
-                        move[i, j] = 1;
-                    }
-                    else
-                    {
-                        dp[i, j] = scoreLeft;
-                        move[i, j] = 2;
-                    }
-                }
-            }
-
-            var alignments = new List<BlockAlignment>();
-            int x = n;
-            int y = m;
-            while (x > 0 || y > 0)
-            {
-                if (x > 0 && y > 0 && move[x, y] == 0)
-                {
-                    var aIdx = startA + (x - 1);
-                    var bIdx = startB + (y - 1);
-                    var sim = ComputeAlignmentSimilarity(normA[aIdx], normB[bIdx]);
-                    alignments.Add(new BlockAlignment(aIdx, bIdx, sim));
-                    x--;
-                    y--;
-                }
-                else if (x > 0 && (y == 0 || move[x, y] == 1))
-                {
-                    alignments.Add(new BlockAlignment(startA + (x - 1), -1, 0));
-                    x--;
-                }
-                else
-                {
-                    alignments.Add(new BlockAlignment(-1, startB + (y - 1), 0));
-                    y--;
-                }
-            }
-            alignments.Reverse();
-            return alignments;
-        }
-
         private static List<BlockAlignment> BuildAllGaps(int countA, int countB)
         {
             var list = new List<BlockAlignment>();
@@ -0,0 +1,272 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Text;
+
+namespace Obj.Align
+{
+    internal static partial class ObjectsTextOpsDiff
+    {
+        // Tokenizador do content stream por offsets: cada token e (kind, start, length) sobre o
+        // buffer decodificado; nada e alocado na varredura. Operadores e delimitadores saem de
+        // uma tabela interna (mesma instancia de string sempre) e o resto so vira string quando
+        // o chamador pede (MaterializeToken). Arrays TJ enormes de PDFs OCR eram o maior ponto
+        // de alocacao: antes cada byte passava por (char) + string por token.
+        private enum ContentTokenKind : byte
+        {
+            Word,
+            Literal,
+            Hex,
+            Dict,
+            Array,
+            Name,
+            Delimiter
+        }
+
+        private readonly struct ContentToken
+        {
+            public ContentToken(ContentTokenKind kind, int start, int length)
+            {
+                Kind = kind;
+                Start = start;
+                Length = length;
+            }
+
+            public ContentTokenKind Kind { get; }
+            public int Start { get; }
+            public int Length { get; }
+        }
+
+        private ref struct ContentTokenReader
+        {
+            private readonly ReadOnlySpan<byte> _bytes;
+            private readonly Stopwatch? _sw;
+            private readonly double _timeoutSec;
+            private int _pos;
+
+            public ContentTokenReader(ReadOnlySpan<byte> bytes, double timeoutSec)
+            {
+                _bytes = bytes;
+                _timeoutSec = timeoutSec;
+                _sw = timeoutSec > 0 ? Stopwatch.StartNew() : null;
+                _pos = 0;
+                TimedOut = false;
+            }
+
+            public bool TimedOut { get; private set; }
+
+            public bool Next(out ContentToken token)
+            {
+                var bytes = _bytes;
+                while (_pos < bytes.Length)
+                {
+                    if (Expired())
+                    {
+                        TimedOut = true;
+                        break;
+                    }
+                    byte c = bytes[_pos];
+                    if (IsWhiteByte(c)) { _pos++; continue; }
+                    if (c == (byte)'%')
+                    {
+                        while (_pos < bytes.Length && bytes[_pos] != (byte)'\n' && bytes[_pos] != (byte)'\r') _pos++;
+                        continue;
+                    }
+
+                    int start = _pos;
+                    ContentTokenKind kind;
+                    if (c == (byte)'(') { kind = ContentTokenKind.Literal; ScanNested((byte)'(', (byte)')'); }
+                    else if (c == (byte)'[') { kind = ContentTokenKind.Array; ScanNested((byte)'[', (byte)']'); }
+                    else if (c == (byte)'<' && _pos + 1 < bytes.Length && bytes[_pos + 1] == (byte)'<') { kind = ContentTokenKind.Dict; ScanDict(); }
+                    else if (c == (byte)'<') { kind = ContentTokenKind.Hex; ScanHex(); }
+                    else if (c == (byte)'/') { kind = ContentTokenKind.Name; _pos++; ScanRegular(); }
+                    else if (IsDelimiterByte(c)) { kind = ContentTokenKind.Delimiter; _pos++; }
+                    else { kind = ContentTokenKind.Word; ScanRegular(); }
+
+                    token = new ContentToken(kind, start, Math.Min(_pos, bytes.Length) - start);
+                    return true;
+                }
+                token = default;
+                return false;
+            }
+
+            private bool Expired() => _sw != null && _sw.Elapsed.TotalSeconds > _timeoutSec;
+
+            private void ScanRegular()
+            {
+                while (_pos < _bytes.Length && !IsWhiteByte(_bytes[_pos]) && !IsDelimiterByte(_bytes[_pos]))
+                    _pos++;
+            }
+
+            // (...) e [...]: profundidade por parenteses/colchetes, '\' pula o proximo byte.
+            private void ScanNested(byte open, byte close)
+            {
+                _pos++;
+                int depth = 1;
+                while (_pos < _bytes.Length && depth > 0)
+                {
+                    if (Expired())
+                        break;
+                    byte c = _bytes[_pos];
+                    if (c == (byte)'\\')
+                    {
+                        _pos += 2;
+                        continue;
+                    }
+                    if (c == open) depth++;
+                    if (c == close) depth--;
+                    _pos++;
+                }
+            }
+
+            private void ScanHex()
+            {
+                _pos++;
+                while (_pos < _bytes.Length && _bytes[_pos] != (byte)'>')
+                {
+                    if (Expired())
+                        break;
+                    _pos++;
+                }
+                if (_pos < _bytes.Length) _pos++;
+            }
+
+            private void ScanDict()
+            {
+                int depth = 0;
+                while (_pos < _bytes.Length)
+                {
+                    if (Expired())
+                        break;
+                    if (_pos + 1 < _bytes.Length && _bytes[_pos] == (byte)'<' && _bytes[_pos + 1] == (byte)'<') depth++;
+                    if (_pos + 1 < _bytes.Length && _bytes[_pos] == (byte)'>' && _bytes[_pos + 1] == (byte)'>') depth--;
+                    _pos++;
+                    if (depth == 0) { _pos++; break; }
+                }
+            }
+        }
+
+        private static bool IsWhiteByte(byte c) => c == (byte)' ' || c == (byte)'\t' || c == (byte)'\r' || c == (byte)'\n' || c == (byte)'\f';
+
+        private static bool IsDelimiterByte(byte c)
+            => c == (byte)'(' || c == (byte)')' || c == (byte)'<' || c == (byte)'>' || c == (byte)'[' || c == (byte)']'
+               || c == (byte)'{' || c == (byte)'}' || c == (byte)'/' || c == (byte)'%';
+
+        // Operadores + delimitadores avulsos, agrupados pelo primeiro byte. Classe aninhada para a
+        // tabela ser montada so no primeiro uso, depois de Operators (ordem entre parciais e indefinida).
+        private static class InternedTokens
+        {
+            public static readonly string[]?[] Buckets = Build();
+
+            private static string[]?[] Build()
+            {
+                var groups = new List<string>?[128];
+                foreach (var token in Operators)
+                    (groups[token[0]] ??= new List<string>()).Add(token);
+                foreach (var delimiter in ")>]{}")
+                    (groups[delimiter] ??= new List<string>()).Add(delimiter.ToString());
+
+                var buckets = new string[]?[128];
+                for (int i = 0; i < groups.Length; i++)
+                    buckets[i] = groups[i]?.ToArray();
+                return buckets;
+            }
+        }
+
+        private static bool TryGetInternedToken(ReadOnlySpan<byte> span, out string token)
+        {
+            token = "";
+            if (span.IsEmpty || span.Length > 3 || span[0] >= 128)
+                return false;
+            var bucket = InternedTokens.Buckets[span[0]];
+            if (bucket == null)
+                return false;
+            foreach (var candidate in bucket)
+            {
+                if (candidate.Length != span.Length)
+                    continue;
+                int k = 1;
+                while (k < span.Length && candidate[k] == span[k]) k++;
+                if (k == span.Length)
+                {
+                    token = candidate;
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        /// <summary>Operador do content stream (instancia interna) ou null, sem alocar.</summary>
+        private static string? GetOperatorToken(ReadOnlySpan<byte> bytes, in ContentToken token)
+        {
+            if (token.Kind != ContentTokenKind.Word)
+                return null;
+            return TryGetInternedToken(bytes.Slice(token.Start, token.Length), out var op) ? op : null;
+        }
+
+        // Percurso operador a operador sobre os offsets ja tokenizados: os operandos de cada
+        // operador ficam como intervalo de tokens e so viram string em CopyOperands, que os
+        // chamadores usam apenas para os operadores de texto. `operators` restringe o conjunto
+        // reconhecido (palavras fora dele contam como operandos, como num tokenizador com
+        // tabela propria); null usa Operators inteiro.
+        internal struct ContentOpCursor
+        {
+            private readonly byte[] _bytes;
+            private readonly ContentToken[] _tokens;
+            private readonly HashSet<string>? _operators;
+            private int _next;
+            private int _operandStart;
+            private int _operandEnd;
+
+            public ContentOpCursor(byte[] bytes, HashSet<string>? operators)
+            {
+                _bytes = bytes;
+                _tokens = TokenizeContent(bytes);
+                _operators = operators;
+                _next = 0;
+                _operandStart = 0;
+                _operandEnd = 0;
+            }
+
+            public int OperandCount => _operandEnd - _operandStart;
+
+            public bool Next(out string op)
+            {
+                _operandStart = _next;
+                while (_next < _tokens.Length)
+                {
+                    int index = _next++;
+                    var candidate = GetOperatorToken(_bytes, _tokens[index]);
+                    if (candidate != null && (_operators == null || _operators.Contains(candidate)))
+                    {
+                        _operandEnd = index;
+                        op = candidate;
+                        return true;
+                    }
+                }
+                _operandEnd = _operandStart;
+                op = "";
+                return false;
+            }
+
+            public void CopyOperands(List<string> into)
+            {
+                into.Clear();
+                for (int i = _operandStart; i < _operandEnd; i++)
+                    into.Add(MaterializeToken(_bytes, _tokens[i]));
+            }
+        }
+
+        internal static ContentOpCursor ReadContentOps(byte[] bytes, HashSet<string>? operators = null)
+            => new ContentOpCursor(bytes, operators);
+
+        private static string MaterializeToken(byte[] bytes, in ContentToken token)
+        {
+            var span = bytes.AsSpan(token.Start, token.Length);
+            if ((token.Kind == ContentTokenKind.Word || token.Kind == ContentTokenKind.Delimiter)
+                && TryGetInternedToken(span, out var interned))
+                return interned;
+            return Encoding.Latin1.GetString(span);
+        }
+    }
+}
@@ -27,27 +27,26 @@ namespace Obj.Align
             var bytes = ExtractStreamBytes(stream);
             if (bytes.Length == 0) return new List<string>();
 
-            var tokens = TokenizeContent(bytes);
+            var ops = ReadContentOps(bytes);
             var result = new List<string>();
             var operands = new List<string>();
             var textQueue = tokenMode == TokenMode.Text
                 ? new Queue<string>(PdfTextExtraction.CollectTextOperatorTexts(stream, resources))
                 : new Queue<string>();
 
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
+                // so operadores de texto geram linha; os demais nem materializam operandos
+                if (!TextOperators.Contains(tok))
                     continue;
-                }
 
+                ops.CopyOperands(operands);
                 var rawLine = operands.Count > 0 ? $"{string.Join(" ", operands)} {tok}" : tok;
                 string decodedForOp = "";
                 if (tokenMode == TokenMode.Text && IsTextShowingOperator(tok))
                     decodedForOp = DequeueDecodedText(tok, operands, rawLine, textQueue);
 
-                if (TextOperators.Contains(tok) && (opFilter.Count == 0 || opFilter.Contains(tok)))
+                if (opFilter.Count == 0 || opFilter.Contains(tok))
                 {
                     var line = PdfOperatorLegend.AppendDescription(rawLine, tok);
                     if (tokenMode == TokenMode.Text && (tok == "Tj" || tok == "TJ" || tok == "'" || tok == "\""))
@@ -57,8 +56,6 @@ namespace Obj.Align
                     }
                     result.Add(line);
                 }
-
-                operands.Clear();
             }
 
             return result;
@@ -91,7 +88,7 @@ namespace Obj.Align
             if (bytes.Length == 0)
                 return new TokenOpsResult(new List<string>(), new List<int>(), new List<int>(), new List<string>());
 
-            var tokens = TokenizeContent(bytes);
+            var ops = ReadContentOps(bytes);
             var result = new List<string>();
             var opStarts = new List<int>();
             var opEnds = new List<int>();
@@ -102,16 +99,11 @@ namespace Obj.Align
                 : new Queue<string>();
 
             int opIndex = 0;
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
-                    continue;
-                }
-
                 if (IsTextShowingOperator(tok))
                 {
+                    ops.CopyOperands(operands);
                     var allowed = IsTextOpAllowed(tok, opFilter);
                     string text = "";
                     if (tokenMode == TokenMode.Text)
@@ -157,8 +149,6 @@ namespace Obj.Align
                         }
                     }
                 }
-
-                operands.Clear();
             }
 
             return new TokenOpsResult(result, opStarts, opEnds, opNames);
@@ -239,7 +229,7 @@ namespace Obj.Align
                 return new FullTextOpsResult("", new List<int>(), new List<string>());
 
             var allTextOps = PdfTextExtraction.CollectTextOperatorTexts(stream, resources);
-            var tokens = TokenizeContent(bytes);
+            var ops = ReadContentOps(bytes);
             var sb = new StringBuilder();
             var opIndexes = new List<int>();
             var opNames = new List<string>();
@@ -279,16 +269,11 @@ namespace Obj.Align
                 }
             }
 
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
-                    continue;
-                }
-
                 if (IsTextShowingOperator(tok))
                 {
+                    ops.CopyOperands(operands);
                     var decoded = DequeueDecodedText(tok, operands, null, textQueue) ?? "";
                     if (IsTextOpAllowed(tok, opFilter))
                     {
@@ -305,11 +290,13 @@ namespace Obj.Align
                         AppendBreak(lastTextOpIndex, "");
                     else if (includeTdLineBreaks && (tok == "Td" || tok == "TD"))
                     {
+                        ops.CopyOperands(operands);
                         if (TryParseTdY(operands, out var ty) && Math.Abs(ty) > 0.01)
                             AppendBreak(lastTextOpIndex, "");
                     }
                     else if (includeTmLineBreaks && tok == "Tm")
                     {
+                        ops.CopyOperands(operands);
                         if (TryParseTmY(operands, out var y))
                         {
                             if (hasTm && Math.Abs(y - lastTmY) > 0.01)
@@ -319,8 +306,6 @@ namespace Obj.Align
                         }
                     }
                 }
-
-                operands.Clear();
             }
 
             if (allTextOps.Count > 0 && opIndex < allTextOps.Count)
@@ -567,6 +552,7 @@ namespace Obj.Align
 
         private static byte[] ExtractStreamBytes(PdfStream stream)
         {
+            using var stage = StageTimer.Measure("stream_decode");
             var timeoutSec = PdfTextExtraction.TimeoutSec;
             if (timeoutSec <= 0)
             {
@@ -588,153 +574,32 @@ namespace Obj.Align
             return Array.Empty<byte>();
         }
 
-        private static List<string> TokenizeContent(byte[] bytes)
+        private static ContentToken[] TokenizeContent(byte[] bytes)
         {
-            var tokens = new List<string>();
-            int i = 0;
-            var timeoutSec = PdfTextExtraction.TimeoutSec;
-            Stopwatch? sw = null;
-            if (timeoutSec > 0)
-                sw = Stopwatch.StartNew();
-            while (i < bytes.Length)
+            using var stage = StageTimer.Measure("tokenize");
+            if (TryGetCachedTokens(bytes, out var cacheKey, out var cached))
             {
-                if (sw != null && sw.Elapsed.TotalSeconds > timeoutSec)
-                {
-                    Console.Error.WriteLine($"[timeout] tokenize > {timeoutSec:0.0}s");
-                    break;
-                }
-                char c = (char)bytes[i];
-                if (IsWhite(c)) { i++; continue; }
-                if (c == '%') { i = SkipToEol(bytes, i); continue; }
-                if (c == '(') { tokens.Add(ReadLiteralString(bytes, ref i, sw, timeoutSec)); continue; }
-                if (c == '<')
-                {
-                    if (i + 1 < bytes.Length && bytes[i + 1] == '<')
-                    {
-                        tokens.Add(ReadBalanced(bytes, ref i, "<<", ">>", sw, timeoutSec));
-                        continue;
-                    }
-                    tokens.Add(ReadHexString(bytes, ref i, sw, timeoutSec));
-                    continue;
-                }
-                if (c == '[') { tokens.Add(ReadArray(bytes, ref i, sw, timeoutSec)); continue; }
-                if (c == '/') { tokens.Add(ReadName(bytes, ref i)); continue; }
-                if (IsDelimiter(c)) { tokens.Add(c.ToString()); i++; continue; }
-                tokens.Add(ReadToken(bytes, ref i));
+                StageTimer.Count("tokenize", cached.Length, bytes.Length);
+                return cached;
             }
+            var tokens = TokenizeContentUncached(bytes, out var complete);
+            if (complete)
+                StoreCachedTokens(cacheKey, tokens);
+            StageTimer.Count("tokenize", tokens.Length, bytes.Length);
             return tokens;
         }
 
-        private static bool IsOperatorToken(string token) => Operators.Contains(token);
-
-        private static bool IsWhite(char c) => c == ' ' || c == '\t' || c == '\r' || c == '\n' || c == '\f';
-
-        private static bool IsDelimiter(char c)
-            => c == '(' || c == ')' || c == '<' || c == '>' || c == '[' || c == ']' || c == '{' || c == '}' || c == '/' || c == '%';
-
-        private static int SkipToEol(byte[] bytes, int i)
-        {
-            while (i < bytes.Length && bytes[i] != '\n' && bytes[i] != '\r') i++;
-            return i;
-        }
-
-        private static string ReadToken(byte[] bytes, ref int i)
-        {
-            int start = i;
-            while (i < bytes.Length)
-            {
-                char c = (char)bytes[i];
-                if (IsWhite(c) || IsDelimiter(c)) break;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadLiteralString(byte[] bytes, ref int i, Stopwatch? sw = null, double timeoutSec = 0)
-        {
-            int start = i;
-            i++; // '('
-            int depth = 1;
-            while (i < bytes.Length && depth > 0)
-            {
-                if (sw != null && timeoutSec > 0 && sw.Elapsed.TotalSeconds > timeoutSec)
-                    break;
-                char c = (char)bytes[i];
-                if (c == '\\')
-                {
-                    i += 2;
-                    continue;
-                }
-                if (c == '(') depth++;
-                if (c == ')') depth--;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadHexString(byte[] bytes, ref int i, Stopwatch? sw = null, double timeoutSec = 0)
-        {
-            int start = i;
-            i++; // '<'
-            while (i < bytes.Length && bytes[i] != '>')
-            {
-                if (sw != null && timeoutSec > 0 && sw.Elapsed.TotalSeconds > timeoutSec)
-                    break;
-                i++;
-            }
-            if (i < bytes.Length) i++;
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadBalanced(byte[] bytes, ref int i, string open, string close, Stopwatch? sw = null, double timeoutSec = 0)
+        private static ContentToken[] TokenizeContentUncached(byte[] bytes, out bool complete)
         {
-            int start = i;
-            int depth = 0;
-            while (i < bytes.Length)
-            {
-                if (sw != null && timeoutSec > 0 && sw.Elapsed.TotalSeconds > timeoutSec)
-                    break;
-                if (i + 1 < bytes.Length && bytes[i] == open[0] && bytes[i + 1] == open[1]) depth++;
-                if (i + 1 < bytes.Length && bytes[i] == close[0] && bytes[i + 1] == close[1]) depth--;
-                i++;
-                if (depth == 0) { i++; break; }
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadArray(byte[] bytes, ref int i, Stopwatch? sw = null, double timeoutSec = 0)
-        {
-            int start = i;
-            i++; // '['
-            int depth = 1;
-            while (i < bytes.Length && depth > 0)
-            {
-                if (sw != null && timeoutSec > 0 && sw.Elapsed.TotalSeconds > timeoutSec)
-                    break;
-                char c = (char)bytes[i];
-                if (c == '\\')
-                {
-                    i += 2;
-                    continue;
-                }
-                if (c == '[') depth++;
-                if (c == ']') depth--;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadName(byte[] bytes, ref int i)
-        {
-            int start = i;
-            i++; // '/'
-            while (i < bytes.Length)
-            {
-                char c = (char)bytes[i];
-                if (IsWhite(c) || IsDelimiter(c)) break;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
+            var tokens = new List<ContentToken>(Math.Max(16, bytes.Length / 6));
+            var timeoutSec = PdfTextExtraction.TimeoutSec;
+            var reader = new ContentTokenReader(bytes, timeoutSec);
+            while (reader.Next(out var token))
+                tokens.Add(token);
+            complete = !reader.TimedOut;
+            if (!complete)
+                Console.Error.WriteLine($"[timeout] tokenize > {timeoutSec:0.0}s");
+            return tokens.ToArray();
         }
 
         private static string ExtractTextOperand(string? token)
@@ -72,13 +72,14 @@ namespace Obj.Align
 
         private static List<SelfBlock> ExtractSelfBlocks(PdfStream stream, PdfResources resources, HashSet<string> opFilter, bool allowFix = true, double timeoutSec = 0)
         {
+            using var stage = StageTimer.Measure("self_blocks");
             var blocks = new List<SelfBlock>();
             var bytes = ExtractStreamBytes(stream);
             if (bytes.Length == 0) return blocks;
 
             var allTextOps = PdfTextExtraction.CollectTextOperatorTexts(stream, resources);
             var allTextItems = PdfTextExtraction.CollectTextOperatorItems(stream, resources);
-            var tokens = TokenizeContent(bytes);
+            var ops = ReadContentOps(bytes);
             var operands = new List<string>();
             var textQueue = new Queue<string>(allTextOps);
             var itemQueue = new Queue<PdfTextExtraction.TextOpItem>(allTextItems);
@@ -166,18 +167,16 @@ namespace Obj.Align
                 currentItems.Clear();
             }
 
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
                 if (sw != null && sw.Elapsed.TotalSeconds > timeoutSec)
                 {
                     timedOut = true;
                     break;
                 }
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
-                    continue;
-                }
+                // operandos so para texto e para BT/ET/T*/Tm/Td/TD (ShouldFlushForPosition)
+                if (TextOperators.Contains(tok))
+                    ops.CopyOperands(operands);
 
                 if (IsTextShowingOperator(tok))
                 {
@@ -4,6 +4,7 @@ using System.IO;
 using System.Linq;
 using System.Text;
 using System.Text.RegularExpressions;
+using Obj.Utils;
 using iText.Kernel.Pdf;
 using iText.Kernel.Pdf.Canvas.Parser;
 using iText.Kernel.Pdf.Canvas.Parser.Listener;
@@ -373,13 +374,18 @@ namespace Obj.Align
             if (bytes.Length == 0)
                 return entries;
 
-            var tokens = TokenizeContent(bytes);
             var textQueue = new Queue<PdfTextExtraction.TextOpItem>(PdfTextExtraction.CollectTextOperatorItems(stream, resources));
             int index = 0;
 
-            foreach (var tok in tokens)
+            // so os operadores importam aqui: varre por offsets e nao materializa operandos
+            using var stage = StageTimer.Measure("tokenize");
+            var reader = new ContentTokenReader(bytes, PdfTextExtraction.TimeoutSec);
+            int tokenCount = 0;
+            while (reader.Next(out var token))
             {
-                if (!IsOperatorToken(tok))
+                tokenCount++;
+                var tok = GetOperatorToken(bytes, token);
+                if (tok == null)
                     continue;
 
                 if (IsTextShowingOperator(tok))
@@ -392,6 +398,7 @@ namespace Obj.Align
                     }
                 }
             }
+            StageTimer.Count("tokenize", tokenCount, bytes.Length);
 
             return entries;
         }
@@ -0,0 +1,76 @@
+using System;
+using System.Collections.Generic;
+using System.Security.Cryptography;
+
+namespace Obj.Align
+{
+    internal static partial class ObjectsTextOpsDiff
+    {
+        // Cache de tokenização por conteúdo do stream (SHA-256 dos bytes decodificados); guarda
+        // só os offsets (ContentToken), as strings continuam sendo materializadas sob demanda.
+        // O mesmo stream é tokenizado várias vezes por execução (self blocks, tokens de texto,
+        // template fields) e, no `operpdf worker`, de novo a cada modo/modelo do mesmo alvo.
+        // Limite em tokens via OBJ_TEXTOPSALIGN_TOKEN_CACHE (0 desativa); despejo FIFO.
+        private const int DefaultTokenCacheMaxTokens = 2_000_000;
+        private static readonly object TokenCacheLock = new object();
+        private static readonly Dictionary<string, ContentToken[]> TokenCache = new Dictionary<string, ContentToken[]>(StringComparer.Ordinal);
+        private static readonly Queue<string> TokenCacheOrder = new Queue<string>();
+        private static long _tokenCacheTokens;
+        private static int? _tokenCacheMaxTokens;
+
+        private static int TokenCacheMaxTokens
+        {
+            get
+            {
+                if (_tokenCacheMaxTokens.HasValue)
+                    return _tokenCacheMaxTokens.Value;
+                var raw = Environment.GetEnvironmentVariable("OBJ_TEXTOPSALIGN_TOKEN_CACHE");
+                var max = DefaultTokenCacheMaxTokens;
+                if (!string.IsNullOrWhiteSpace(raw) && int.TryParse(raw.Trim(), out var parsed))
+                    max = Math.Max(0, parsed);
+                _tokenCacheMaxTokens = max;
+                return max;
+            }
+        }
+
+        private static bool TryGetCachedTokens(byte[] bytes, out string key, out ContentToken[] tokens)
+        {
+            key = "";
+            tokens = null!;
+            if (bytes.Length == 0 || TokenCacheMaxTokens <= 0)
+                return false;
+
+            key = Convert.ToHexString(SHA256.HashData(bytes)) + ":" + bytes.Length.ToString();
+            lock (TokenCacheLock)
+            {
+                if (!TokenCache.TryGetValue(key, out var cached))
+                    return false;
+                // offsets imutáveis: a mesma instância serve a todos os chamadores
+                tokens = cached;
+                return true;
+            }
+        }
+
+        private static void StoreCachedTokens(string key, ContentToken[] tokens)
+        {
+            var max = TokenCacheMaxTokens;
+            if (string.IsNullOrEmpty(key) || max <= 0 || tokens.Length > max)
+                return;
+
+            lock (TokenCacheLock)
+            {
+                if (TokenCache.ContainsKey(key))
+                    return;
+                while (_tokenCacheTokens + tokens.Length > max && TokenCacheOrder.Count > 0)
+                {
+                    var oldest = TokenCacheOrder.Dequeue();
+                    if (TokenCache.Remove(oldest, out var evicted))
+                        _tokenCacheTokens -= evicted.Length;
+                }
+                TokenCache[key] = tokens;
+                TokenCacheOrder.Enqueue(key);
+                _tokenCacheTokens += tokens.Length;
+            }
+        }
+    }
+}
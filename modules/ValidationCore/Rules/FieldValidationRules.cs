@@ -17,27 +17,27 @@ namespace Obj.ValidationCore
         public static bool LooksLikeCpf(string? value)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
-            var digits = Regex.Replace(value, "[^0-9]", "");
+            var digits = RegexCache.Replace(value, "[^0-9]", "");
             return digits.Length == 11;
         }
 
         public static bool ContainsCpfPattern(string? value)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
-            return Regex.IsMatch(value, @"\b\d{3}\s*\.?\s*\d{3}\s*\.?\s*\d{3}\s*-?\s*\d{2}\b");
+            return RegexCache.IsMatch(value, @"\b\d{3}\s*\.?\s*\d{3}\s*\.?\s*\d{3}\s*-?\s*\d{2}\b");
         }
 
         public static bool ContainsEmail(string? value)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
-            return Regex.IsMatch(value, @"[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}", RegexOptions.IgnoreCase);
+            return RegexCache.IsMatch(value, @"[A-Z0-9._%+\-]+@[A-Z0-9.\-]+\.[A-Z]{2,}", RegexOptions.IgnoreCase);
         }
 
         public static bool ContainsInstitutional(string? value)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            var compact = Regex.Replace(v, @"\s+", "");
+            var compact = RegexCache.Replace(v, @"\s+", "");
             return v.Contains("juizo") || v.Contains("vara") || v.Contains("comarca") ||
                 v.Contains("tribunal") || v.Contains("forum") || v.Contains("justica") ||
                 v.Contains("judiciario") ||
@@ -55,7 +55,7 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            var compact = Regex.Replace(v, @"\s+", "");
+            var compact = RegexCache.Replace(v, @"\s+", "");
             return v.Contains("vara") || v.Contains("comarca") || v.Contains("juizo") ||
                 v.Contains("juizado") || v.Contains("forum") || v.Contains("cartorio") ||
                 compact.Contains("vara") || compact.Contains("comarca") || compact.Contains("juizo") ||
@@ -66,18 +66,18 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            return Regex.IsMatch(v, @"\b(aposentadoria|auxilio|beneficio|procedimento|classe|assunto|processo|requerente|interessad[oa]|promovent[eo]|promovid[oa]|reu|autor|juiz|juiza|juizo|vara|comarca|tribunal|diretoria|diretor|diretora|documento|pagina|p[aá]gina|fls|assinado|eletronicamente|honorari\w*|pagamento|requer\w*|reserva|orcament\w*|conta|bancari\w*|natureza|servic\w*|relatoria|desembargador|sess[aã]o|excel[êe]ncia|considera[cç][aã]o|submet\w*)\b");
+            return RegexCache.IsMatch(v, @"\b(aposentadoria|auxilio|beneficio|procedimento|classe|assunto|processo|requerente|interessad[oa]|promovent[eo]|promovid[oa]|reu|autor|juiz|juiza|juizo|vara|comarca|tribunal|diretoria|diretor|diretora|documento|pagina|p[aá]gina|fls|assinado|eletronicamente|honorari\w*|pagamento|requer\w*|reserva|orcament\w*|conta|bancari\w*|natureza|servic\w*|relatoria|desembargador|sess[aã]o|excel[êe]ncia|considera[cç][aã]o|submet\w*)\b");
         }
 
         public static bool ContainsDocumentBoilerplate(string? value)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            if (Regex.IsMatch(v, @"\bdocumento\s*\d+\b")) return true;
-            if (Regex.IsMatch(v, @"\bp[aá]gina\b")) return true;
-            if (Regex.IsMatch(v, @"\bassinad[ao]\b")) return true;
-            if (Regex.IsMatch(v, @"\bprocesso\s*n[ºo]?\b")) return true;
-            if (Regex.IsMatch(v, @"\b(diretoria|tribunal|forum|cartorio|juizo)\b")) return true;
+            if (RegexCache.IsMatch(v, @"\bdocumento\s*\d+\b")) return true;
+            if (RegexCache.IsMatch(v, @"\bp[aá]gina\b")) return true;
+            if (RegexCache.IsMatch(v, @"\bassinad[ao]\b")) return true;
+            if (RegexCache.IsMatch(v, @"\bprocesso\s*n[ºo]?\b")) return true;
+            if (RegexCache.IsMatch(v, @"\b(diretoria|tribunal|forum|cartorio|juizo)\b")) return true;
             return false;
         }
 
@@ -95,15 +95,15 @@ namespace Obj.ValidationCore
                 return true;
 
             // Evita vazamento de rótulos/ruído processual no valor capturado.
-            if (Regex.IsMatch(norm, @"(interessad|requerente|autor|r[eé]u|reu|promovent|promovid|movid[oa]|em\s+face|processo|autos|vara|cartorio|tribunal|diretoria)"))
+            if (RegexCache.IsMatch(norm, @"(interessad|requerente|autor|r[eé]u|reu|promovent|promovid|movid[oa]|em\s+face|processo|autos|vara|cartorio|tribunal|diretoria)"))
                 return false;
 
             // Formato clássico: "Cidade / UF".
-            if (Regex.IsMatch(v, @"[A-Za-zÀ-ÿ]{3,}(?:\s+[A-Za-zÀ-ÿ]{2,})*\s*/\s*[A-Z]{2}"))
+            if (RegexCache.IsMatch(v, @"[A-Za-zÀ-ÿ]{3,}(?:\s+[A-Za-zÀ-ÿ]{2,})*\s*/\s*[A-Z]{2}"))
                 return true;
 
             // Formato comum: apenas o nome do município (com UF opcional via "- PB" ou "/PB").
-            return Regex.IsMatch(v, @"^[A-Za-zÀ-ÿ]{3,}(?:[ '\-][A-Za-zÀ-ÿ]{2,}){0,6}(?:\s*(?:-|/)?\s*[A-Z]{2})?$");
+            return RegexCache.IsMatch(v, @"^[A-Za-zÀ-ÿ]{3,}(?:[ '\-][A-Za-zÀ-ÿ]{2,}){0,6}(?:\s*(?:-|/)?\s*[A-Z]{2})?$");
         }
 
         public static bool LooksLikeVaraValue(string? value)
@@ -119,7 +119,7 @@ namespace Obj.ValidationCore
             if (containsEspecialidadeToken != null && containsEspecialidadeToken(value))
                 return true;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            return Regex.IsMatch(v, @"\b(engenheir\w*|engenhar\w*|arquitet\w*|psicolog\w*|psiquiatr\w*|medic\w*|fonoaud\w*|fisioterap\w*|odont\w*|contador\w*|assistente\s+social|grafotec\w*|economist\w*|administrador\w*|biolog\w*|quimic\w*|farmac\w*|ortoped\w*|cardiolog\w*|neurolog\w*|nutricion\w*|terapeut\w*|seguranca\s+do\s+trabalho)\b");
+            return RegexCache.IsMatch(v, @"\b(engenheir\w*|engenhar\w*|arquitet\w*|psicolog\w*|psiquiatr\w*|medic\w*|fonoaud\w*|fisioterap\w*|odont\w*|contador\w*|assistente\s+social|grafotec\w*|economist\w*|administrador\w*|biolog\w*|quimic\w*|farmac\w*|ortoped\w*|cardiolog\w*|neurolog\w*|nutricion\w*|terapeut\w*|seguranca\s+do\s+trabalho)\b");
         }
 
         public static bool LooksLikePartyValue(
@@ -131,8 +131,8 @@ namespace Obj.ValidationCore
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.NormalizeWhitespace(value).Trim();
             if (v.Length < 4 || v.Length > 120) return false;
-            if (!Regex.IsMatch(v, @"[\p{L}]")) return false;
-            if (Regex.IsMatch(v, @"\d")) return false;
+            if (!RegexCache.IsMatch(v, @"[\p{L}]")) return false;
+            if (RegexCache.IsMatch(v, @"\d")) return false;
             if (ContainsEmail(v) || ContainsCpfPattern(v)) return false;
 
             var isInstitutional = institutionalCheck ?? ContainsInstitutional;
@@ -140,10 +140,10 @@ namespace Obj.ValidationCore
             var hasProcessualNoise = processualNoiseCheck ?? ContainsProcessualNoise;
             if (isInstitutional(v) || hasBoilerplate(v) || hasProcessualNoise(v)) return false;
 
-            if (Regex.IsMatch(v, @"(?i)\b(R\s*\$|valor|honor[aá]ri|percentual|resolu[cç][aã]o|guarda\s+unilateral)\b"))
+            if (RegexCache.IsMatch(v, @"(?i)\b(R\s*\$|valor|honor[aá]ri|percentual|resolu[cç][aã]o|guarda\s+unilateral)\b"))
                 return false;
             var tokens = v.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            var hasCompanySuffix = Regex.IsMatch(v, @"(?i)(?:S\s*[\./]?\s*A\.?$|LTDA\.?$|EIRELI$)");
+            var hasCompanySuffix = RegexCache.IsMatch(v, @"(?i)(?:S\s*[\./]?\s*A\.?$|LTDA\.?$|EIRELI$)");
             if (tokens.Length < 2 && !hasCompanySuffix) return false;
             if (tokens.Any(t => t.Length > 28)) return false;
             return true;
@@ -165,33 +165,33 @@ namespace Obj.ValidationCore
 
             if (field.Equals("PROCESSO_JUDICIAL", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                var digits = Regex.Replace(compact, @"\D", "");
-                if (Regex.IsMatch(compact, @"^\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$")) return true;
-                if (Regex.IsMatch(compact, @"^\d{7}-\d{2}\.\d{4}\.\d{3}\.\d{4}$")) return true;
-                if (Regex.IsMatch(compact, @"^\d{7}\.\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$")) return true;
-                if (Regex.IsMatch(compact, @"^\d{7}\.\d{2}\.\d{4}\.\d{3}\.\d{4}$")) return true;
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                var digits = RegexCache.Replace(compact, @"\D", "");
+                if (RegexCache.IsMatch(compact, @"^\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$")) return true;
+                if (RegexCache.IsMatch(compact, @"^\d{7}-\d{2}\.\d{4}\.\d{3}\.\d{4}$")) return true;
+                if (RegexCache.IsMatch(compact, @"^\d{7}\.\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$")) return true;
+                if (RegexCache.IsMatch(compact, @"^\d{7}\.\d{2}\.\d{4}\.\d{3}\.\d{4}$")) return true;
                 // Legacy format still present in older TJPB records.
-                if (Regex.IsMatch(compact, @"^\d{3}\.\d{4}\.\d{3}\.\d{3}-\d$")) return true;
+                if (RegexCache.IsMatch(compact, @"^\d{3}\.\d{4}\.\d{3}\.\d{3}-\d$")) return true;
                 if (digits.Length == 20)
                     return true;
-                return Regex.IsMatch(compact, @"^\d{20}$");
+                return RegexCache.IsMatch(compact, @"^\d{20}$");
             }
 
             if (field.Equals("PROCESSO_ADMINISTRATIVO", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                if (Regex.IsMatch(compact, @"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"))
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                if (RegexCache.IsMatch(compact, @"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"))
                     return false;
-                if (Regex.IsMatch(compact, @"^\d{5}-\d{3}$"))
+                if (RegexCache.IsMatch(compact, @"^\d{5}-\d{3}$"))
                     return false;
-                if (Regex.IsMatch(compact, @"^\d{2}/\d{4}$") || Regex.IsMatch(compact, @"^\d{4}/\d{2}$"))
+                if (RegexCache.IsMatch(compact, @"^\d{2}/\d{4}$") || RegexCache.IsMatch(compact, @"^\d{4}/\d{2}$"))
                     return false;
-                if (Regex.IsMatch(compact, @"^\d{6,7}-\d{2}\.\d{4}\.\d\.\d{2}(?:\.\d{4})?$"))
+                if (RegexCache.IsMatch(compact, @"^\d{6,7}-\d{2}\.\d{4}\.\d\.\d{2}(?:\.\d{4})?$"))
                     return true;
-                if (Regex.IsMatch(compact, @"^\d{4}\.\d{3}\.\d{3}$"))
+                if (RegexCache.IsMatch(compact, @"^\d{4}\.\d{3}\.\d{3}$"))
                     return true;
-                if (Regex.IsMatch(compact, @"^(?:19|20)\d{8}$"))
+                if (RegexCache.IsMatch(compact, @"^(?:19|20)\d{8}$"))
                     return true;
                 return false;
             }
@@ -202,8 +202,8 @@ namespace Obj.ValidationCore
                 field.Equals("VALOR_ARBITRADO_CM", StringComparison.OrdinalIgnoreCase) ||
                 field.Equals("VALOR_TABELADO_ANEXO_I", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                return Regex.IsMatch(compact, @"^(?:R\$)?(?:\d{1,3}(?:\.\d{3})*|\d+),\d{2}$");
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                return RegexCache.IsMatch(compact, @"^(?:R\$)?(?:\d{1,3}(?:\.\d{3})*|\d+),\d{2}$");
             }
 
             if (field.Equals("DATA_ARBITRADO_FINAL", StringComparison.OrdinalIgnoreCase) ||
@@ -215,24 +215,24 @@ namespace Obj.ValidationCore
 
             if (field.Equals("PERCENTUAL", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                return Regex.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$");
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                return RegexCache.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$");
             }
 
             if (field.Equals("ADIANTAMENTO", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                if (Regex.IsMatch(compact, @"^(?:R\$)?\d{1,3}(?:\.\d{3})*,\d{2}$"))
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                if (RegexCache.IsMatch(compact, @"^(?:R\$)?\d{1,3}(?:\.\d{3})*,\d{2}$"))
                     return true;
-                return Regex.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$");
+                return RegexCache.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$");
             }
 
             if (field.Equals("PARCELA", StringComparison.OrdinalIgnoreCase))
             {
-                var compact = Regex.Replace(value, @"\s+", "");
-                if (Regex.IsMatch(compact, @"^(?:R\$)?(?:\d{1,3}(?:\.\d{3})*|\d+),\d{2}$"))
+                var compact = RegexCache.Replace(value, @"\s+", "");
+                if (RegexCache.IsMatch(compact, @"^(?:R\$)?(?:\d{1,3}(?:\.\d{3})*|\d+),\d{2}$"))
                     return true;
-                if (Regex.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$"))
+                if (RegexCache.IsMatch(compact, @"^\d{1,3}(?:[.,]\d{1,2})?%$"))
                     return true;
                 return false;
             }
@@ -281,7 +281,7 @@ namespace Obj.ValidationCore
                 }
 
                 var fallback = TextUtils.NormalizeWhitespace(value);
-                var okLoose = fallback.Length >= 4 && Regex.IsMatch(fallback, @"[\p{L}]");
+                var okLoose = fallback.Length >= 4 && RegexCache.IsMatch(fallback, @"[\p{L}]");
                 if (Environment.GetEnvironmentVariable("OPERPDF_VAL_DEBUG") == "1")
                     Console.WriteLine($"[VALDBG-core] field={field} accept=loose:{okLoose.ToString().ToLowerInvariant()} value=\"{fallback}\"");
                 return okLoose;
@@ -308,7 +308,7 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
             var v = TextUtils.RemoveDiacritics(value).ToLowerInvariant();
-            return Regex.IsMatch(v, @"\b(engenheir\w*|engenhar\w*|arquitet\w*|psicolog\w*|psiquiatr\w*|medic\w*|fonoaud\w*|fisioterap\w*|odont\w*|contador\w*|assistente\s+social|grafotec\w*|economist\w*|administrador\w*|biolog\w*|quimic\w*|farmac\w*|ortoped\w*|cardiolog\w*|neurolog\w*|nutricion\w*|terapeut\w*|seguranca\s+do\s+trabalho)\b");
+            return RegexCache.IsMatch(v, @"\b(engenheir\w*|engenhar\w*|arquitet\w*|psicolog\w*|psiquiatr\w*|medic\w*|fonoaud\w*|fisioterap\w*|odont\w*|contador\w*|assistente\s+social|grafotec\w*|economist\w*|administrador\w*|biolog\w*|quimic\w*|farmac\w*|ortoped\w*|cardiolog\w*|neurolog\w*|nutricion\w*|terapeut\w*|seguranca\s+do\s+trabalho)\b");
         }
 
         public static bool LooksLikePersonNameLoose(string text)
@@ -317,9 +317,9 @@ namespace Obj.ValidationCore
             var norm = TextUtils.NormalizeWhitespace(text);
             if (norm.Any(char.IsDigit)) return false;
             var lower = TextUtils.RemoveDiacritics(norm).ToLowerInvariant();
-            if (Regex.IsMatch(lower, @"\b(perito|perita|interessad[oa]|cpf|cnpj|pis|pasep|inss|rg)\b"))
+            if (RegexCache.IsMatch(lower, @"\b(perito|perita|interessad[oa]|cpf|cnpj|pis|pasep|inss|rg)\b"))
                 return false;
-            if (Regex.IsMatch(lower, @"\b(engenheir|arquitet|contador|psicol|medic|odont|assistente\s+social|fonoaud|fisioterap|economist|administrador|b[ií]olog|qu[ií]mic|farmac)\b"))
+            if (RegexCache.IsMatch(lower, @"\b(engenheir|arquitet|contador|psicol|medic|odont|assistente\s+social|fonoaud|fisioterap|economist|administrador|b[ií]olog|qu[ií]mic|farmac)\b"))
                 return false;
             var tokens = norm.Split(' ', StringSplitOptions.RemoveEmptyEntries);
             if (tokens.Length < 2) return false;
@@ -340,16 +340,16 @@ namespace Obj.ValidationCore
             if (string.IsNullOrWhiteSpace(name)) return false;
             if (name.Contains('@')) return false;
             if (name.Length < 5) return false;
-            if (Regex.IsMatch(name, "interessad[oa]", RegexOptions.IgnoreCase)) return false;
-            if (Regex.IsMatch(name, "sighop", RegexOptions.IgnoreCase)) return false;
-            return Regex.IsMatch(name, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]", RegexOptions.IgnoreCase);
+            if (RegexCache.IsMatch(name, "interessad[oa]", RegexOptions.IgnoreCase)) return false;
+            if (RegexCache.IsMatch(name, "sighop", RegexOptions.IgnoreCase)) return false;
+            return RegexCache.IsMatch(name, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]", RegexOptions.IgnoreCase);
         }
 
         public static bool TryNormalizeProcessoJudicial(string? value, Regex cnjRegex, out string normalized)
         {
             normalized = "";
             if (string.IsNullOrWhiteSpace(value)) return false;
-            var cleaned = Regex.Replace(value, "\\s+", "");
+            var cleaned = RegexCache.Replace(value, "\\s+", "");
             var m = cnjRegex.Match(cleaned);
             if (!m.Success) return false;
             normalized = m.Value;
@@ -359,7 +359,7 @@ namespace Obj.ValidationCore
         public static bool IsValidProcessoJudicial(string? value, Regex cnjRegex)
         {
             if (string.IsNullOrWhiteSpace(value)) return false;
-            var cleaned = Regex.Replace(value, "\\s+", "");
+            var cleaned = RegexCache.Replace(value, "\\s+", "");
             return cnjRegex.IsMatch(cleaned);
         }
 
@@ -395,7 +395,7 @@ namespace Obj.ValidationCore
             if (v.Contains("@")) return false;
             var norm = TextUtils.NormalizeForMatch(v);
             if (norm.Contains("perito")) return false;
-            if (!Regex.IsMatch(v, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]")) return false;
+            if (!RegexCache.IsMatch(v, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]")) return false;
             return true;
         }
 
@@ -416,7 +416,7 @@ namespace Obj.ValidationCore
             var norm = TextUtils.NormalizeForMatch(value);
             if (string.IsNullOrWhiteSpace(norm))
                 return true;
-            return Regex.IsMatch(norm, @"\b(sua excelencia|consideracao|submet|presentes|movido por|processo|autos do processo|perante)\b");
+            return RegexCache.IsMatch(norm, @"\b(sua excelencia|consideracao|submet|presentes|movido por|processo|autos do processo|perante)\b");
         }
 
         public static bool IsWeakPartyValue(string? value)
@@ -426,8 +426,8 @@ namespace Obj.ValidationCore
             var norm = TextUtils.NormalizeForMatch(value);
             if (string.IsNullOrWhiteSpace(norm))
                 return true;
-            norm = Regex.Replace(norm, @"\s+", " ").Trim();
-            if (Regex.IsMatch(norm, @"\b(relatoria|desembargador|sessao|excelencia|consideracao|submet)\b"))
+            norm = RegexCache.Replace(norm, @"\s+", " ").Trim();
+            if (RegexCache.IsMatch(norm, @"\b(relatoria|desembargador|sessao|excelencia|consideracao|submet)\b"))
                 return true;
             return norm is "e outros" or "e outras" or "outros" or "outras" or "outro" or "outra" or "autor" or "autora" or "autores" or "reu" or "reu(s)" or "reu(s)." or "reus";
         }
@@ -464,11 +464,11 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(value)) return "";
             var v = TextUtils.CollapseSpacedLettersText(value);
-            v = Regex.Replace(v, @"(?i)\b(CPF|CNPJ)\b.*$", "");
-            v = Regex.Replace(v, @"(?i)\bperante\b.*$", "");
-            v = Regex.Replace(v, @"(?i)\bju[ií]zo\b.*$", "");
-            v = Regex.Replace(v, @"\d+", "");
-            v = Regex.Replace(v, @"[^A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ\\s'\\-]+", " ");
+            v = RegexCache.Replace(v, @"(?i)\b(CPF|CNPJ)\b.*$", "");
+            v = RegexCache.Replace(v, @"(?i)\bperante\b.*$", "");
+            v = RegexCache.Replace(v, @"(?i)\bju[ií]zo\b.*$", "");
+            v = RegexCache.Replace(v, @"\d+", "");
+            v = RegexCache.Replace(v, @"[^A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ\\s'\\-]+", " ");
             v = v.Trim();
             v = v.Trim(',', ';', '-', '–', ' ');
             return TextUtils.NormalizeWhitespace(v);
@@ -487,9 +487,9 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(value)) return "";
             var v = TextUtils.CollapseSpacedLettersText(value);
-            v = Regex.Replace(v, @"(?i)\bperit[oa]\b", "");
-            v = Regex.Replace(v, @"(?i)\\s*[-–]\\s*[^\\s@]*@[^\\s,;]+", "");
-            v = Regex.Replace(v, @"[^A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ\s'-]+", " ");
+            v = RegexCache.Replace(v, @"(?i)\bperit[oa]\b", "");
+            v = RegexCache.Replace(v, @"(?i)\\s*[-–]\\s*[^\\s@]*@[^\\s,;]+", "");
+            v = RegexCache.Replace(v, @"[^A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ\s'-]+", " ");
             v = RestoreNameSpacing(v);
             v = TextUtils.NormalizeWhitespace(v);
             return v;
@@ -500,16 +500,16 @@ namespace Obj.ValidationCore
             if (string.IsNullOrWhiteSpace(value)) return "";
             var v = TextUtils.CollapseSpacedLettersText(value);
             v = TextUtils.NormalizeWhitespace(TextUtils.FixMissingSpaces(v));
-            v = Regex.Replace(v, @"(?i)^\\s*(?:interessad[oa]|perit[oa])\\s*[:\\-–—]\\s*", "");
+            v = RegexCache.Replace(v, @"(?i)^\\s*(?:interessad[oa]|perit[oa])\\s*[:\\-–—]\\s*", "");
             var dashIdx = v.IndexOfAny(new[] { '-', '–', '—' });
             if (dashIdx > 0)
             {
                 var right = v.Substring(dashIdx + 1).Trim();
-                if (Regex.IsMatch(right, @"(?i)\\b(perit[oa]|grafot[eê]cnic[oa]|m[eé]dic[oa]|engenheir[oa]|arquitet[oa]|contador[a]?|psic[oó]log[oa]|odont[oó]log[oa]|assistente\\s+social|fonoaudi[oó]log[oa]|fisioterapeut[oa]|economist[a]|administrador[a]|b[ií]olog[oa]|qu[ií]mic[oa]|farmac[eê]utic[oa])\\b"))
+                if (RegexCache.IsMatch(right, @"(?i)\\b(perit[oa]|grafot[eê]cnic[oa]|m[eé]dic[oa]|engenheir[oa]|arquitet[oa]|contador[a]?|psic[oó]log[oa]|odont[oó]log[oa]|assistente\\s+social|fonoaudi[oó]log[oa]|fisioterapeut[oa]|economist[a]|administrador[a]|b[ií]olog[oa]|qu[ií]mic[oa]|farmac[eê]utic[oa])\\b"))
                     v = v.Substring(0, dashIdx).Trim();
             }
-            v = Regex.Replace(v, @"(?i)\\s*(?:CPF|PIS|CRM|CREA|CNPJ)\\b.*$", "");
-            v = Regex.Replace(v, @"(?i)\\s+perit[oa]\\b.*$", "");
+            v = RegexCache.Replace(v, @"(?i)\\s*(?:CPF|PIS|CRM|CREA|CNPJ)\\b.*$", "");
+            v = RegexCache.Replace(v, @"(?i)\\s+perit[oa]\\b.*$", "");
             v = v.Trim().Trim(',', '-', '–', '—');
             v = TextUtils.NormalizeWhitespace(v);
             return v;
@@ -605,12 +605,12 @@ namespace Obj.ValidationCore
             if (key == "CLEANPARTE")
             {
                 v = TextUtils.NormalizeWhitespace(v);
-                v = Regex.Replace(v, "(?i)\\bCPF\\s*[:\\-]?\\s*\\d{3}\\.\\d{3}\\.\\d{3}-\\d{2}\\b", "");
-                v = Regex.Replace(v, "\\b\\d{3}\\.\\d{3}\\.\\d{3}-\\d{2}\\b", "");
-                v = Regex.Replace(v, "(?i)\\s+perante\\s+o\\s+ju[ií]zo.+$", "");
+                v = RegexCache.Replace(v, "(?i)\\bCPF\\s*[:\\-]?\\s*\\d{3}\\.\\d{3}\\.\\d{3}-\\d{2}\\b", "");
+                v = RegexCache.Replace(v, "\\b\\d{3}\\.\\d{3}\\.\\d{3}-\\d{2}\\b", "");
+                v = RegexCache.Replace(v, "(?i)\\s+perante\\s+o\\s+ju[ií]zo.+$", "");
                 v = TextUtils.NormalizeWhitespace(v);
-                v = Regex.Replace(v, "\\s*,\\s+e\\s+", " e ");
-                v = Regex.Replace(v, "\\s*,\\s*$", "");
+                v = RegexCache.Replace(v, "\\s*,\\s+e\\s+", " e ");
+                v = RegexCache.Replace(v, "\\s*,\\s*$", "");
                 return v.Trim().Trim(',', ';', '-');
             }
 
@@ -629,7 +629,7 @@ namespace Obj.ValidationCore
             if (key == "VALIDATEMONEY")
                 return moneyRegex.IsMatch(value);
             if (key == "VALIDATEPARTE")
-                return Regex.IsMatch(value, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]");
+                return RegexCache.IsMatch(value, "[A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ]");
             if (key == "VALIDATEPERITO")
                 return value.Length >= 5;
             if (key == "VALIDATECOMARCA")
@@ -654,7 +654,7 @@ namespace Obj.ValidationCore
             }
             if (field.StartsWith("PROCESSO_", StringComparison.OrdinalIgnoreCase))
             {
-                var cleaned = Regex.Replace(v, "\\s+", "");
+                var cleaned = RegexCache.Replace(v, "\\s+", "");
                 var m = cnjRegex.Match(cleaned);
                 if (m.Success) return m.Value.Replace(" ", "");
             }
@@ -679,7 +679,7 @@ namespace Obj.ValidationCore
         private static string RestoreNameSpacing(string value)
         {
             if (string.IsNullOrWhiteSpace(value)) return value ?? "";
-            return Regex.Replace(value, @"(?<=[a-záâãàéêíóôõúç])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
+            return RegexCache.Replace(value, @"(?<=[a-záâãàéêíóôõúç])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
         }
 
         public static string StripKnownLabelPrefix(string? value)
@@ -693,7 +693,7 @@ namespace Obj.ValidationCore
             };
             foreach (var label in labels)
             {
-                var m = Regex.Match(v, $"(?i)^\\s*{Regex.Escape(label)}\\s*[:\\-]\\s*(.+)$");
+                var m = RegexCache.Match(v, $"(?i)^\\s*{Regex.Escape(label)}\\s*[:\\-]\\s*(.+)$");
                 if (m.Success)
                     return m.Groups[1].Value.Trim();
             }
@@ -719,7 +719,7 @@ namespace Obj.ValidationCore
             if (!string.Equals(cleaned, value, StringComparison.Ordinal))
                 value = cleaned;
 
-            var hasAnchor = Regex.IsMatch(value, @"(?i)\b(requerente|interessad[oa]|promovent[eo]|promovid[oa]|processo|perito|cpf)\b");
+            var hasAnchor = RegexCache.IsMatch(value, @"(?i)\b(requerente|interessad[oa]|promovent[eo]|promovid[oa]|processo|perito|cpf)\b");
             if (hasAnchor)
             {
                 reason = "anchor_leak";
@@ -1104,7 +1104,7 @@ namespace Obj.ValidationCore
                         string.Equals(extraWhy, "format_invalid", StringComparison.OrdinalIgnoreCase))
                     {
                         var soft = TextUtils.NormalizeWhitespace(extra);
-                        if (soft.Length >= 4 && Regex.IsMatch(soft, @"[\p{L}]"))
+                        if (soft.Length >= 4 && RegexCache.IsMatch(soft, @"[\p{L}]"))
                             continue;
                     }
 
@@ -1362,7 +1362,7 @@ namespace Obj.ValidationCore
             if (string.IsNullOrWhiteSpace(value))
                 return "empty";
             var rawLower = value.ToLowerInvariant();
-            if (Regex.IsMatch(rawLower, @"\b(raz[aã]o|per[ií]cia)\b"))
+            if (RegexCache.IsMatch(rawLower, @"\b(raz[aã]o|per[ií]cia)\b"))
                 return "stopword";
             var cleaned = cleanPeritoValue(value);
             if (string.IsNullOrWhiteSpace(cleaned))
@@ -1375,17 +1375,17 @@ namespace Obj.ValidationCore
             var lower = norm.ToLowerInvariant();
             if (lower.Contains("nomead"))
                 return "nomead";
-            if (Regex.IsMatch(lower, @"https?://|www\."))
+            if (RegexCache.IsMatch(lower, @"https?://|www\."))
                 return "url";
             if (containsInstitutional(norm))
                 return "institutional";
             if (containsProcessualNoise(norm) || containsDocumentBoilerplate(norm))
                 return "processual_noise";
-            if (Regex.IsMatch(lower, @"\b(nos\s+autos|processo|movido\s+por|perante|cpf|pis|cnpj|raz[aã]o|per[ií]cia|assunto|classe|procedimento|documento|p[aá]gina|assinad|eletronicamente|fls|honor[aá]ri|pagamento|reserva|or[cç]ament|conta|banc[aá]ri|servi[cç]o)\b"))
+            if (RegexCache.IsMatch(lower, @"\b(nos\s+autos|processo|movido\s+por|perante|cpf|pis|cnpj|raz[aã]o|per[ií]cia|assunto|classe|procedimento|documento|p[aá]gina|assinad|eletronicamente|fls|honor[aá]ri|pagamento|reserva|or[cç]ament|conta|banc[aá]ri|servi[cç]o)\b"))
                 return "stopword";
             if (norm.Any(char.IsDigit))
                 return "digit";
-            if (Regex.IsMatch(norm, @"[:;@\[\]\(\)\{\}]"))
+            if (RegexCache.IsMatch(norm, @"[:;@\[\]\(\)\{\}]"))
                 return "punct";
             if (!looksLikePersonNameLoose(norm))
                 return "not_name";
@@ -1424,7 +1424,7 @@ namespace Obj.ValidationCore
             if (string.IsNullOrWhiteSpace(value))
                 return "";
             var cut = TextNormalization.NormalizeFullText(value);
-            var perIdx = Regex.Match(cut, @"(?i)\bperit[oa]\b");
+            var perIdx = RegexCache.Match(cut, @"(?i)\bperit[oa]\b");
             if (perIdx.Success && perIdx.Index > 0)
             {
                 var prefix = cut.Substring(0, perIdx.Index);
@@ -1436,24 +1436,24 @@ namespace Obj.ValidationCore
                 if (prefixTokens.Count < 2)
                     cut = cut.Substring(perIdx.Index);
             }
-            cut = Regex.Replace(cut, @"(?i)^\s*interessad[oa]\s*[:\-–—]\s*", "");
-            cut = Regex.Replace(cut, @"(?i)^\s*perit[oa]\s*[:\-–—]\s*", "");
-            cut = Regex.Replace(cut, @"(?i)^\s*perit[oa]\s*(?:do\s*\.?\s*ju[ií]zo\s*)?(?:a|o)?\s*", "");
+            cut = RegexCache.Replace(cut, @"(?i)^\s*interessad[oa]\s*[:\-–—]\s*", "");
+            cut = RegexCache.Replace(cut, @"(?i)^\s*perit[oa]\s*[:\-–—]\s*", "");
+            cut = RegexCache.Replace(cut, @"(?i)^\s*perit[oa]\s*(?:do\s*\.?\s*ju[ií]zo\s*)?(?:a|o)?\s*", "");
             var titleRx = @"(?i)^\s*(?:dr\.?|dra\.?|doutor|doutora)\s+";
             var profRx = @"(?i)^\s*(?:m[eé]dic[oa]|psic[oó]log[oa]|psiquiatr[a]?|engenheir[oa]|grafot[eê]cnic[oa]|arquitet[oa]|contador[a]?|assistente\s+social|fonoaudi[oó]log[oa]|fisioterapeut[oa]|economist[a]|administrador[a]|b[ií]olog[oa]|qu[ií]mic[oa]|farmac[eê]utic[oa])\s+(?:[a-zçãéíóú]+\\s+){0,2}";
-            cut = Regex.Replace(cut, titleRx, "");
-            cut = Regex.Replace(cut, profRx, "");
+            cut = RegexCache.Replace(cut, titleRx, "");
+            cut = RegexCache.Replace(cut, profRx, "");
             for (int i = 0; i < 2; i++)
             {
                 var before = cut;
-                cut = Regex.Replace(cut, titleRx, "");
-                cut = Regex.Replace(cut, profRx, "");
+                cut = RegexCache.Replace(cut, titleRx, "");
+                cut = RegexCache.Replace(cut, profRx, "");
                 if (string.Equals(before, cut, StringComparison.Ordinal))
                     break;
             }
             cut = stripPeritoTrailingContext(cut);
 
-            if (Regex.IsMatch(cut, @"(?i)\bperit[oa]\b") || Regex.IsMatch(cut, @"(?i)\bju[ií]zo\b"))
+            if (RegexCache.IsMatch(cut, @"(?i)\bperit[oa]\b") || RegexCache.IsMatch(cut, @"(?i)\bju[ií]zo\b"))
             {
                 var tokens = cut.Split(' ', StringSplitOptions.RemoveEmptyEntries).ToList();
                 var skip = new HashSet<string>(StringComparer.OrdinalIgnoreCase)
@@ -1498,7 +1498,7 @@ namespace Obj.ValidationCore
                 cut = cut.Substring(0, stopIdx).Trim();
 
             lower = cut.ToLowerInvariant();
-            var stopRx = Regex.Match(lower, @"\b(para|para\s+realiza(?:cao|ção)|per[ií]cia|nos\s+autos|no\s+processo|processo|movido\s+por|perante|cpf|pis|cnpj)\b");
+            var stopRx = RegexCache.Match(lower, @"\b(para|para\s+realiza(?:cao|ção)|per[ií]cia|nos\s+autos|no\s+processo|processo|movido\s+por|perante|cpf|pis|cnpj)\b");
             if (stopRx.Success && stopRx.Index > 0)
                 cut = cut.Substring(0, stopRx.Index).Trim();
             var commaIdx = cut.IndexOf(',');
@@ -1510,20 +1510,20 @@ namespace Obj.ValidationCore
             {
                 var left = cut.Substring(0, dashIdx).Trim();
                 var right = cut.Substring(dashIdx + 1).Trim();
-                var leftCompact = Regex.Replace(TextUtils.RemoveDiacritics(left).ToLowerInvariant(), @"[^a-z]", "");
+                var leftCompact = RegexCache.Replace(TextUtils.RemoveDiacritics(left).ToLowerInvariant(), @"[^a-z]", "");
                 var leftLooksLikeEspecialidade = containsEspecialidadeToken(left) ||
-                    Regex.IsMatch(leftCompact, @"(grafotecnic|engenheir|arquitet|psicolog|psiquiatr|medic|contador|assistentesocial|fonoaudiolog|fisioterapeut|economist|administrador|biolog|quimic|farmaceutic)");
-                if (containsEspecialidadeToken(right) || Regex.IsMatch(right, @"(?i)^perit[oa]\b"))
+                    RegexCache.IsMatch(leftCompact, @"(grafotecnic|engenheir|arquitet|psicolog|psiquiatr|medic|contador|assistentesocial|fonoaudiolog|fisioterapeut|economist|administrador|biolog|quimic|farmaceutic)");
+                if (containsEspecialidadeToken(right) || RegexCache.IsMatch(right, @"(?i)^perit[oa]\b"))
                     cut = left;
                 else if (leftLooksLikeEspecialidade && looksLikePersonNameLoose(right))
                     cut = right;
             }
 
-            var peritoSuffix = Regex.Match(cut, @"(?i)^(?<name>.+?)(?:,|\s[-–—]\s)\s*perit[oa]\b");
+            var peritoSuffix = RegexCache.Match(cut, @"(?i)^(?<name>.+?)(?:,|\s[-–—]\s)\s*perit[oa]\b");
             if (peritoSuffix.Success)
                 cut = peritoSuffix.Groups["name"].Value.Trim();
-            cut = Regex.Replace(cut, @"(?i)\s*(?:CPF|PIS|CRM|CREA|CNPJ)\b.*$", "");
-            if (Regex.IsMatch(cut, @"(?i)\b(nos\s+autos|processo|movido\s+por|perante|cpf|pis|cnpj|per[ií]cia)\b"))
+            cut = RegexCache.Replace(cut, @"(?i)\s*(?:CPF|PIS|CRM|CREA|CNPJ)\b.*$", "");
+            if (RegexCache.IsMatch(cut, @"(?i)\b(nos\s+autos|processo|movido\s+por|perante|cpf|pis|cnpj|per[ií]cia)\b"))
             {
                 var extracted = extractLeadingNameCandidate(cut);
                 if (!string.IsNullOrWhiteSpace(extracted))
@@ -1544,7 +1544,7 @@ namespace Obj.ValidationCore
         {
             if (string.IsNullOrWhiteSpace(text))
                 return "";
-            var m = Regex.Match(text, @"^(?<name>[A-Za-zÀ-ÿ]{2,}(?:\s+[A-Za-zÀ-ÿ]{2,}){1,6})");
+            var m = RegexCache.Match(text, @"^(?<name>[A-Za-zÀ-ÿ]{2,}(?:\s+[A-Za-zÀ-ÿ]{2,}){1,6})");
             if (!m.Success)
                 return text;
             var name = m.Groups["name"].Value.Trim();
@@ -1584,7 +1584,7 @@ namespace Obj.ValidationCore
             if (commaIdx > 0)
             {
                 var tail = lower.Substring(commaIdx + 1);
-                if (Regex.IsMatch(tail, @"\b(para|nos\s+autos|no\s+processo|no\s+proc|em\s+tramit|em\s+tramita|para\s+realiza)\b"))
+                if (RegexCache.IsMatch(tail, @"\b(para|nos\s+autos|no\s+processo|no\s+proc|em\s+tramit|em\s+tramita|para\s+realiza)\b"))
                     cut = cut.Substring(0, commaIdx);
             }
 
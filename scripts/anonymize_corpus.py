@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Anonimiza um corpus de PDFs em lote: diretorio ou intervalo de alias -> PDFs tipados + auditoria JSONL.
+
+Para cada documento o texto e extraido uma vez, pagina a pagina sob demanda
+(typed_pdf: pdftotext -layout em streaming; PyMuPDF no processo so com --backend), cada linha
+passa pelas regras de despacho_sanitizer.sanitize_line e o resultado e
+renderizado em PDF (typed_pdf, mesmo layout dos modelos tipados).
+A auditoria registra, por documento, quantas substituicoes cada regra fez; nunca o
+texto original.
+
+Memoria limitada: cada processo guarda so a pagina corrente e o PDF de saida, e o
+processo principal mantem no maximo 2x --jobs documentos em voo.
+
+Exemplos:
+  python3 scripts/anonymize_corpus.py --input-dir /dados/despachos --out-dir outputs/anon --jobs 8
+  python3 scripts/anonymize_corpus.py --alias :D1-500 --out-dir outputs/anon --skip-existing
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from despacho_sanitizer import sanitize_line
+from typed_pdf import BACKENDS, DEFAULT_BACKEND, TypedPdfRenderer, iter_pages, resolve_backend
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ALIAS_RE = re.compile(r"^:?([A-Za-z][A-Za-z0-9_-]*?)(?:(\d+)(?:-(\d+))?)?$")
+
+
+def build_runner_cmd(mode: str, runner_path: str) -> list[str]:
+    if mode == "dll":
+        return ["dotnet", "cli/OperCli/bin/Release/net8.0/operpdf.dll"]
+    if mode == "exe":
+        return [runner_path.strip() or "./align.exe"]
+    raise ValueError(f"runner invalido: {mode}")
+
+
+def parse_alias(raw: str) -> tuple[str, int | None, int | None]:
+    """`:D1-200` -> ("D", 1, 200); `:D7` -> ("D", 7, 7); `D` -> ("D", None, None) (todos)."""
+    m = ALIAS_RE.match(raw.strip())
+    if not m:
+        raise ValueError(f"alias invalido: {raw} (use :D, :D7 ou :D1-200)")
+    key = m.group(1).upper()
+    if m.group(2) is None:
+        return key, None, None
+    start = int(m.group(2))
+    end = int(m.group(3)) if m.group(3) else start
+    return key, min(start, end), max(start, end)
+
+
+def resolve_alias(base_cmd: list[str], raw: str, timeout_sec: int) -> list[tuple[Path, str]]:
+    """PDFs do alias via `operpdf inspect aliases --json`; saida nomeada por chave+indice."""
+    key, start, end = parse_alias(raw)
+    cmd = [*base_cmd, "inspect", "aliases", "--json", "--keys", key]
+    p = subprocess.run(cmd, cwd=str(REPO_ROOT), text=True, capture_output=True, timeout=timeout_sec, check=False)
+    if p.returncode != 0:
+        raise RuntimeError(f"inspect aliases falhou (exit={p.returncode}): {(p.stderr or p.stdout)[:400]}")
+    payload = json.loads((p.stdout or "").strip().splitlines()[-1])
+    for entry in payload.get("aliases") or []:
+        if str(entry.get("key") or "").upper() != key:
+            continue
+        if not entry.get("resolved"):
+            raise RuntimeError(f"alias :{key} sem diretorio resolvido")
+        items: list[tuple[Path, str]] = []
+        for f in entry.get("files") or []:
+            idx = int(f.get("index") or 0)
+            if start is not None and not (start <= idx <= end):
+                continue
+            items.append((Path(str(f.get("path") or "")), f"{key}{idx:05d}.pdf"))
+        return sorted(items, key=lambda item: item[1])
+    raise RuntimeError(f"alias :{key} nao encontrado")
+
+
+def iter_dir_inputs(root: Path) -> Iterator[tuple[Path, str]]:
+    """PDFs sob o diretorio (recursivo, ordem estavel); a saida espelha o caminho relativo."""
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() == ".pdf":
+            yield path, path.relative_to(root).as_posix()
+
+
+def anonymize_one(src_str: str, out_str: str, audit_lines: bool, backend: str) -> dict[str, Any]:
+    """Tipa um PDF e grava a saida (atomica). Roda em processo do pool; devolve o registro de auditoria."""
+    started = time.perf_counter()
+    src = Path(src_str)
+    out = Path(out_str)
+    totals: dict[str, int] = {}
+    changed: list[dict[str, Any]] = []
+    counters = {"page": 0, "line": 0, "changed": 0}
+
+    def sanitizer(raw_line: str) -> str:
+        hits: dict[str, int] = {}
+        line = sanitize_line(raw_line, hits)
+        counters["line"] += 1
+        if hits:
+            counters["changed"] += 1
+            for rule, n in hits.items():
+                totals[rule] = totals.get(rule, 0) + n
+            if audit_lines:
+                changed.append({"page": counters["page"], "line": counters["line"], "rules": hits})
+        return line
+
+    record: dict[str, Any] = {"source": src_str, "output": out_str, "backend": backend}
+    try:
+        renderer = TypedPdfRenderer(sanitizer)
+        for page_text in iter_pages(src, backend):
+            counters["page"] += 1
+            counters["line"] = 0
+            renderer.add_page(page_text)
+        data = renderer.finish()
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(out.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, out)
+        record.update(status="ok", pages=renderer.pages, lines=renderer.lines, lines_changed=counters["changed"])
+    except (OSError, RuntimeError, subprocess.CalledProcessError) as ex:
+        record.update(status="error", error=str(ex))
+    record["replacements"] = dict(sorted(totals.items()))
+    if audit_lines:
+        record["changed_lines"] = changed
+    record["ms"] = round((time.perf_counter() - started) * 1000.0, 1)
+    return record
+
+
+def merge_audit(audit_path: Path, fresh_path: Path, written: set[str]) -> None:
+    """Troca o audit pelo antigo sem os documentos reprocessados + os registros novos (atomico)."""
+    tmp = audit_path.with_name(audit_path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as out:
+        if audit_path.exists():
+            with audit_path.open("r", encoding="utf-8") as old:
+                for line in old:
+                    try:
+                        output = json.loads(line).get("output")
+                    except (json.JSONDecodeError, AttributeError):
+                        continue
+                    if output not in written:
+                        out.write(line if line.endswith("\n") else line + "\n")
+        if fresh_path.exists():
+            with fresh_path.open("r", encoding="utf-8") as fresh:
+                for line in fresh:
+                    out.write(line)
+    os.replace(tmp, audit_path)
+    fresh_path.unlink(missing_ok=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Anonimiza PDFs em lote (diretorio ou alias) com auditoria JSONL.")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--input-dir", help="Diretorio com PDFs (recursivo).")
+    src.add_argument("--alias", help="Alias do CLI: :D (todos), :D7 ou :D1-200.")
+    parser.add_argument("--out-dir", default="outputs/anonymized_corpus", help="Diretorio de saida dos PDFs.")
+    parser.add_argument("--audit", default="", help="JSONL de auditoria (padrao: <out-dir>/audit.jsonl).")
+    parser.add_argument("--audit-lines", action="store_true", help="Inclui pagina/linha/regras de cada linha alterada.")
+    parser.add_argument("--jobs", type=int, default=0, help="Processos em paralelo (0=numero de CPUs).")
+    parser.add_argument("--limit", type=int, default=0, help="Maximo de documentos (0=todos).")
+    parser.add_argument("--skip-existing", action="store_true", help="Pula documentos cuja saida ja existe.")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Extracao de texto: pdftotext (padrao, referencia das regras), pymupdf (no processo; quebras de linha diferentes) ou auto (pymupdf se instalado).",
+    )
+    parser.add_argument("--runner", choices=["dll", "exe"], default="dll", help="Runner do CLI para resolver --alias.")
+    parser.add_argument("--runner-path", default="", help="Caminho do executavel quando --runner exe.")
+    parser.add_argument("--timeout", type=int, default=120, help="Timeout (s) do inspect aliases.")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    if not out_dir.is_absolute():
+        out_dir = REPO_ROOT / out_dir
+    audit_path = Path(args.audit) if args.audit else out_dir / "audit.jsonl"
+
+    if args.input_dir:
+        root = Path(args.input_dir)
+        if not root.is_dir():
+            print(f"Erro: diretorio nao encontrado: {root}", file=sys.stderr)
+            return 2
+        inputs: Iterator[tuple[Path, str]] = iter_dir_inputs(root)
+    else:
+        try:
+            base_cmd = build_runner_cmd(args.runner, args.runner_path)
+            inputs = iter(resolve_alias(base_cmd, args.alias, args.timeout))
+        except (RuntimeError, ValueError, OSError, json.JSONDecodeError, subprocess.TimeoutExpired) as ex:
+            print(f"Erro: {ex}", file=sys.stderr)
+            return 2
+
+    try:
+        backend = resolve_backend(args.backend)
+    except RuntimeError as ex:
+        print(f"Erro: {ex}", file=sys.stderr)
+        return 2
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    window = max(1, jobs * 2)
+    audit_path.parent.mkdir(parents=True, exist_ok=True)
+    print(f"[ANON] out={out_dir} audit={audit_path} jobs={jobs} backend={backend}")
+
+    counts = {"ok": 0, "error": 0, "skipped": 0}
+    submitted = 0
+    started = time.perf_counter()
+    # registros novos vao para um temporario; no fim ele substitui o audit, mantendo do antigo so os
+    # documentos que nao foram reprocessados (rodar de novo nao duplica entradas)
+    fresh_path = audit_path.with_name(audit_path.name + ".new")
+    written: set[str] = set()
+    ex = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    try:
+        with fresh_path.open("w", encoding="utf-8") as audit:
+            in_flight: dict[concurrent.futures.Future[dict[str, Any]], tuple[str, str]] = {}
+
+            def drain(block_until: int) -> None:
+                while len(in_flight) > block_until:
+                    done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for fut in done:
+                        src_str, out_str = in_flight.pop(fut)
+                        try:
+                            record = fut.result()
+                        except Exception as err:  # processo do pool morreu ou excecao nao prevista no documento
+                            record = {
+                                "source": src_str,
+                                "output": out_str,
+                                "backend": backend,
+                                "status": "error",
+                                "error": f"{type(err).__name__}: {err}",
+                            }
+                        counts[record["status"]] += 1
+                        written.add(record["output"])
+                        audit.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        if record["status"] != "ok":
+                            print(f"[ANON] erro: {record['source']}: {record.get('error')}", file=sys.stderr)
+                    audit.flush()
+
+            for src_path, rel in inputs:
+                if args.limit > 0 and submitted >= args.limit:
+                    break
+                out_path = out_dir / rel
+                if args.skip_existing and out_path.exists():
+                    counts["skipped"] += 1
+                    continue
+                job = (str(src_path), str(out_path))
+                try:
+                    fut = ex.submit(anonymize_one, *job, args.audit_lines, backend)
+                except concurrent.futures.BrokenExecutor:
+                    # um worker caiu (ex.: crash no backend): os pendentes ja falharam, segue com pool novo
+                    drain(0)
+                    ex.shutdown(wait=False)
+                    ex = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+                    fut = ex.submit(anonymize_one, *job, args.audit_lines, backend)
+                in_flight[fut] = job
+                submitted += 1
+                drain(window - 1)
+            drain(0)
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+        merge_audit(audit_path, fresh_path, written)
+
+    elapsed = time.perf_counter() - started
+    rate = counts["ok"] / elapsed if elapsed > 0 else 0.0
+    print(
+        f"[ANON] ok={counts['ok']} erro={counts['error']} pulados={counts['skipped']} "
+        f"tempo={elapsed:.1f}s ({rate:.1f} docs/s)"
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,26 +4,44 @@ from __future__ import annotations
 import argparse
 import concurrent.futures
 import datetime as dt
+import hashlib
 import json
 import os
+import queue
 import re
 import statistics
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
-PROBE_RE = re.compile(r"\[PROBE\].*?found=(\d+)/(\d+)\s+missing=(\d+)")
+TIMEOUT_EXIT = 124
 TOTAL_RE = re.compile(r"Total arquivos:\s*(\d+)")
-FILE_RE = re.compile(r"\[PROBE\].*?file=([^\s]+)")
+SHARD_REPORT_RE = re.compile(r"_shard(\d+)of(\d+)\.json$")
 
 
 def strip_ansi(s: str) -> str:
     return ANSI_RE.sub("", s)
 
 
-def run_cmd(cmd: list[str], cwd: Path, timeout_sec: int) -> tuple[int, str]:
+def run_cmd(cmd: list[str], cwd: Path, timeout_sec: int, capture: bool = True) -> tuple[int, str]:
+    if not capture:
+        try:
+            p = subprocess.run(
+                cmd,
+                cwd=str(cwd),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout_sec,
+                check=False,
+            )
+            return p.returncode, ""
+        except subprocess.TimeoutExpired:
+            return TIMEOUT_EXIT, ""
     try:
         p = subprocess.run(
             cmd,
@@ -37,7 +55,271 @@ def run_cmd(cmd: list[str], cwd: Path, timeout_sec: int) -> tuple[int, str]:
         return p.returncode, strip_ansi(out)
     except subprocess.TimeoutExpired as ex:
         out = (ex.stdout or "") + "\n" + (ex.stderr or "")
-        return 124, strip_ansi(out)
+        return TIMEOUT_EXIT, strip_ansi(out)
+
+
+class WorkerProcess:
+    """Processo `operpdf worker` persistente (JSON-lines no stdin/stdout)."""
+
+    def __init__(self, base_cmd: list[str], repo: Path, warmup_args: list[str], timeout_sec: int) -> None:
+        cmd = [*base_cmd, "worker"]
+        if warmup_args:
+            cmd.extend(["--warmup", *warmup_args])
+        self.proc = subprocess.Popen(
+            cmd,
+            cwd=str(repo),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._reader = threading.Thread(target=self._pump, daemon=True)
+        self._reader.start()
+        self._next_id = 0
+
+        ready = self._read(timeout_sec)
+        if not ready or ready.get("event") != "ready":
+            self.kill()
+            raise RuntimeError("worker nao respondeu ao aquecimento")
+        self.warmup_ms = float(ready.get("warmup_ms") or 0.0)
+        self.warmup_exit_code = int(ready.get("warmup_exit_code") or 0)
+
+    def _pump(self) -> None:
+        assert self.proc.stdout is not None
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def _read(self, timeout_sec: float) -> dict[str, Any] | None:
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if line is None:
+                return None
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+    def request(self, args: list[str], timeout_sec: int, capture: bool = True) -> dict[str, Any] | None:
+        self._next_id += 1
+        req_id = self._next_id
+        payload = {"id": req_id, "args": args, "capture": capture}
+        try:
+            assert self.proc.stdin is not None
+            self.proc.stdin.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            msg = self._read(max(0.0, deadline - time.monotonic()))
+            if msg is None:
+                return None
+            if msg.get("id") == req_id:
+                return msg
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def kill(self) -> None:
+        if self.alive():
+            self.proc.kill()
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def close(self) -> None:
+        try:
+            if self.alive() and self.proc.stdin is not None:
+                self.proc.stdin.write(json.dumps({"cmd": "shutdown"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except (BrokenPipeError, OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+class WorkerPool:
+    """Um worker persistente por thread do executor; aquecimento medido a parte."""
+
+    def __init__(self, base_cmd: list[str], repo: Path, warmup_args: list[str], timeout_sec: int) -> None:
+        self.base_cmd = base_cmd
+        self.repo = repo
+        self.warmup_args = warmup_args
+        self.timeout_sec = timeout_sec
+        self.warmups_ms: list[float] = []
+        self.restarts = 0
+        self._workers: list[WorkerProcess] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> WorkerProcess:
+        previous = getattr(self._local, "worker", None)
+        if previous is not None and previous.alive():
+            return previous
+        worker = WorkerProcess(self.base_cmd, self.repo, self.warmup_args, self.timeout_sec)
+        with self._lock:
+            if previous is not None:
+                self.restarts += 1
+            self._workers.append(worker)
+            self.warmups_ms.append(worker.warmup_ms)
+        self._local.worker = worker
+        return worker
+
+    def run(self, args: list[str], timeout_sec: int, capture: bool = True) -> tuple[int, str]:
+        worker = self._acquire()
+        resp = worker.request(args, timeout_sec, capture)
+        if resp is None:
+            code = TIMEOUT_EXIT if worker.alive() else 1
+            worker.kill()
+            return code, ""
+        out = (resp.get("stdout") or "") + "\n" + (resp.get("stderr") or "")
+        return int(resp.get("exit_code", 1)), strip_ansi(out)
+
+    def close(self) -> None:
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.close()
+
+
+CACHE_VERSION = 1
+REGISTRY_SUFFIXES = (".yml", ".yaml", ".json")
+
+
+class ResultCache:
+    """Cache local de linhas do bench, chaveado pelo conteudo (PDF, modelo, registry, binario, args).
+
+    Cada entrada e um JSON em `<dir>/<k[:2]>/<k>.json`; o mtime e tocado a cada acerto e o
+    excesso acima de `max_bytes` e removido do menos recente para o mais recente (LRU).
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, env_fingerprint: str) -> None:
+        self.dir = cache_dir
+        self.max_bytes = max_bytes
+        self.env_fingerprint = env_fingerprint
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+        self._hashes: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def file_hash(self, path: Path) -> str:
+        st = path.stat()
+        memo_key = (str(path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(memo_key)
+        if cached is not None:
+            return cached
+        digest = sha256_file(path)
+        with self._lock:
+            self._hashes[memo_key] = digest
+        return digest
+
+    def key(self, input_path: Path, model_paths: list[Path], cmd_args: list[str]) -> str:
+        parts = {
+            "v": CACHE_VERSION,
+            "env": self.env_fingerprint,
+            "input": self.file_hash(input_path),
+            "model": [self.file_hash(p) for p in model_paths],
+            "args": cmd_args,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            row = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return row
+
+    def put(self, key: str, row: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(row, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock:
+            self.stored += 1
+
+    def prune(self) -> None:
+        if self.max_bytes <= 0:
+            return
+        entries = []
+        total = 0
+        for path in self.dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evicted += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": True,
+            "dir": str(self.dir),
+            "env_fingerprint": self.env_fingerprint,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": self.stored,
+            "evicted": self.evicted,
+        }
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def env_fingerprint(repo: Path, runner_file: Path) -> str:
+    """Hash do binario + arquivos do registry (modules/PatternModules/registry) + OBJ_TEXTOPSALIGN_*."""
+    h = hashlib.sha256()
+    h.update(f"runner:{sha256_file(runner_file)}\n".encode("utf-8"))
+    # overrides do alinhamento mudam o resultado sem mudar binario nem registry
+    for name in sorted(k for k in os.environ if k.startswith("OBJ_TEXTOPSALIGN_")):
+        h.update(f"env:{name}={os.environ[name]}\n".encode("utf-8"))
+    registry = repo / "modules" / "PatternModules" / "registry"
+    for path in sorted(p for p in registry.rglob("*") if p.is_file() and p.suffix.lower() in REGISTRY_SUFFIXES):
+        rel = path.relative_to(registry).as_posix()
+        h.update(f"{rel}:{sha256_file(path)}\n".encode("utf-8"))
+    return h.hexdigest()
 
 
 def build_runner_cmd(repo: Path, mode: str, runner_path: str) -> list[str]:
@@ -68,34 +350,107 @@ def discover_total(base_cmd: list[str], repo: Path, alias: str, timeout_sec: int
     return int(m.group(1))
 
 
-def task(
-    base_cmd: list[str], repo: Path, alias: str, idx: int, timeout_sec: int, with_objdiff: bool
-) -> dict[str, Any]:
+def read_probe_records(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    records: list[dict[str, Any]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+
+def pick_probe_record(records: list[dict[str, Any]]) -> dict[str, Any] | None:
+    # textopsrun emite um registro por etapa (align/var/fixed); a etapa align (All) e a referencia.
+    for rec in records:
+        if rec.get("output_mode") == "All":
+            return rec
+    return records[0] if records else None
+
+
+def discover_aliases(base_cmd: list[str], repo: Path, keys: list[str], timeout_sec: int) -> dict[str, list[str]] | None:
+    """Lista os PDFs de cada alias via `operpdf inspect aliases --json` (sem alinhamento)."""
+    cmd = [*base_cmd, "inspect", "aliases", "--json", "--keys", ",".join(keys)]
+    try:
+        p = subprocess.run(cmd, cwd=str(repo), text=True, capture_output=True, timeout=timeout_sec, check=False)
+    except subprocess.TimeoutExpired:
+        return None
+    if p.returncode != 0:
+        return None
+    try:
+        payload = json.loads((p.stdout or "").strip().splitlines()[-1])
+    except (json.JSONDecodeError, IndexError):
+        return None
+
+    result: dict[str, list[str]] = {}
+    for entry in payload.get("aliases") or []:
+        if not entry.get("resolved"):
+            continue
+        files = sorted(entry.get("files") or [], key=lambda f: int(f.get("index") or 0))
+        result[str(entry.get("key") or "").upper()] = [str(f.get("path") or "") for f in files]
+    for entry in payload.get("models") or []:
+        if entry.get("resolved"):
+            result[str(entry.get("alias") or "").upper()] = [str(f) for f in entry.get("files") or []]
+    return result
+
+
+def task_args(target: str, with_objdiff: bool) -> list[str]:
     cmd = [
-        *base_cmd,
         "textopsrun-despacho",
         "run",
         "1-8",
         "--inputs",
         "@M-DESP",
         "--inputs",
-        f":{alias}{idx}",
+        target,
         "--probe",
         "--sem-alinhamento",
     ]
     if with_objdiff:
         cmd.append("--with-objdiff")
+    return cmd
 
-    code, out = run_cmd(cmd, repo, timeout_sec)
-    probe_matches = list(PROBE_RE.finditer(out))
-    first_probe = probe_matches[0] if probe_matches else None
 
-    found = int(first_probe.group(1)) if first_probe else 0
-    checked = int(first_probe.group(2)) if first_probe else 0
-    missing = int(first_probe.group(3)) if first_probe else 0
+def task(
+    run: Callable[[list[str], int], tuple[int, str]],
+    alias: str,
+    idx: int,
+    with_objdiff: bool,
+    probe_dir: Path,
+    timeout_sec: int,
+    retry_timeout_sec: int = 0,
+) -> dict[str, Any]:
+    probe_path = probe_dir / f"{alias}{idx}.jsonl"
+    cmd = [*task_args(f":{alias}{idx}", with_objdiff), "--probe-json", str(probe_path)]
+
+    # timeout (124) ganha uma segunda tentativa com orcamento maior; o tempo perdido fica separado
+    attempts = 0
+    timeout_lost_ms = 0.0
+    budget = timeout_sec
+    while True:
+        attempts += 1
+        probe_path.unlink(missing_ok=True)
+        started = time.perf_counter()
+        code, _ = run(cmd, budget)
+        duration_ms = (time.perf_counter() - started) * 1000.0
+        if code != TIMEOUT_EXIT or attempts > 1 or retry_timeout_sec <= 0:
+            break
+        timeout_lost_ms += duration_ms
+        budget = retry_timeout_sec
+    rec = pick_probe_record(read_probe_records(probe_path))
+    probe_path.unlink(missing_ok=True)
 
-    file_match = FILE_RE.search(out)
-    file_name = file_match.group(1) if file_match else ""
+    found = int(rec.get("found") or 0) if rec else 0
+    checked = int(rec.get("checked") or 0) if rec else 0
+    missing = int(rec.get("missing") or 0) if rec else 0
+    file_name = str(rec.get("file") or "") if rec else ""
+    fields = (rec.get("fields") or []) if rec else []
+    memory = (rec.get("memory") or {}) if rec else {}
 
     ratio = (found / checked) if checked > 0 else None
 
@@ -103,20 +458,538 @@ def task(
         "alias": alias,
         "index": idx,
         "exit_code": code,
+        "duration_ms": duration_ms,
+        "timed_out": code == TIMEOUT_EXIT,
+        "attempts": attempts,
+        "timeout_lost_ms": timeout_lost_ms,
         "file": file_name,
         "probe_found": found,
         "probe_checked": checked,
         "probe_missing": missing,
         "probe_ratio": ratio,
         "probe_ok": (checked > 0 and ratio is not None and ratio >= 0.95),
+        "probe_status": str(rec.get("status") or "") if rec else "",
+        "probe_missing_fields": [str(f.get("field") or "") for f in fields if not f.get("found")],
+        "timings_ms": (rec.get("timings_ms") or {}) if rec else {},
+        "stages_ms": stage_ms_from_record(rec),
+        "stage_counters": stage_counters_from_record(rec),
+        "peak_rss_bytes": int(memory.get("peak_rss_bytes") or 0),
+        "allocated_bytes": int(memory.get("allocated_bytes") or 0),
+        "regex": regex_counters_from_record(rec),
+    }
+
+
+def cached_task(
+    cache: ResultCache,
+    input_path: Path,
+    model_paths: list[Path],
+    run: Callable[[list[str], int], tuple[int, str]],
+    alias: str,
+    idx: int,
+    with_objdiff: bool,
+    probe_dir: Path,
+    timeout_sec: int,
+    retry_timeout_sec: int = 0,
+) -> dict[str, Any]:
+    # o alvo entra na chave pelo hash do conteudo, nao pelo indice (:D5 pode mudar de arquivo)
+    key = cache.key(input_path, model_paths, task_args("<target>", with_objdiff))
+    row = cache.get(key)
+    if row is not None:
+        row.update({"alias": alias, "index": idx, "cached": True})
+        return row
+    row = task(run, alias, idx, with_objdiff, probe_dir, timeout_sec, retry_timeout_sec)
+    if row["exit_code"] == 0:
+        cache.put(key, row)
+    row["cached"] = False
+    return row
+
+
+def stage_ms_from_record(rec: dict[str, Any] | None) -> dict[str, float]:
+    # stages_ms do runner vem como {etapa: {ms, calls}}; o bench guarda so os ms.
+    result: dict[str, float] = {}
+    for name, value in ((rec or {}).get("stages_ms") or {}).items():
+        if isinstance(value, dict):
+            value = value.get("ms")
+        try:
+            result[str(name)] = float(value or 0.0)
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def stage_counters_from_record(rec: dict[str, Any] | None) -> dict[str, dict[str, float]]:
+    # itens (ex.: tokens) e bytes alocados por etapa, quando o runner os reporta
+    result: dict[str, dict[str, float]] = {}
+    for name, value in ((rec or {}).get("stages_ms") or {}).items():
+        if not isinstance(value, dict) or ("items" not in value and "allocated_bytes" not in value):
+            continue
+        try:
+            result[str(name)] = {
+                "ms": float(value.get("ms") or 0.0),
+                "items": float(value.get("items") or 0.0),
+                "allocated_bytes": float(value.get("allocated_bytes") or 0.0),
+            }
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def regex_counters_from_record(rec: dict[str, Any] | None) -> dict[str, float]:
+    # contadores do RegexCache do runner (hits/misses/compilacoes/timeouts/tempo de construcao)
+    raw = (rec or {}).get("regex") or {}
+    result: dict[str, float] = {}
+    for name in ("hits", "misses", "compiled", "timeouts", "build_ms"):
+        try:
+            result[name] = float(raw.get(name) or 0.0)
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def regex_totals(rows: list[dict[str, Any]]) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for r in rows:
+        for name, value in (r.get("regex") or {}).items():
+            totals[name] = totals.get(name, 0.0) + float(value)
+    return totals
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    idx = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def latency_stats(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": statistics.mean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1],
+    }
+
+
+def stage_stats(rows: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    # Junta etapas internas (stages_ms) e etapas do pipeline (timings_ms: align/extraction/probe/total).
+    values: dict[str, list[float]] = {}
+    for r in rows:
+        for source in ("stages_ms", "timings_ms"):
+            for name, ms in (r.get(source) or {}).items():
+                try:
+                    values.setdefault(str(name), []).append(float(ms))
+                except (TypeError, ValueError):
+                    continue
+    stats = {name: latency_stats(v) for name, v in values.items()}
+    return dict(sorted(stats.items(), key=lambda kv: kv[1]["p95"], reverse=True))
+
+
+def stage_throughput(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # itens/s agregados (soma de itens / soma de ms) e bytes alocados por tarefa, por etapa com contagem
+    totals: dict[str, dict[str, float]] = {}
+    allocated: dict[str, list[float]] = {}
+    for r in rows:
+        for name, c in (r.get("stage_counters") or {}).items():
+            t = totals.setdefault(name, {"items": 0.0, "ms": 0.0})
+            t["items"] += float(c.get("items") or 0.0)
+            t["ms"] += float(c.get("ms") or 0.0)
+            allocated.setdefault(name, []).append(float(c.get("allocated_bytes") or 0.0))
+    result: dict[str, dict[str, Any]] = {}
+    for name, t in sorted(totals.items()):
+        if t["items"] <= 0:
+            continue
+        result[name] = {
+            "items": int(t["items"]),
+            "items_per_sec": (t["items"] * 1000.0 / t["ms"]) if t["ms"] > 0 else 0.0,
+            "allocated_bytes": latency_stats(allocated.get(name) or []),
+        }
+    return result
+
+
+def slowest_rows(rows: list[dict[str, Any]], top: int) -> list[dict[str, Any]]:
+    ordered = sorted(rows, key=lambda r: float(r.get("duration_ms") or 0.0), reverse=True)
+    result = []
+    for r in ordered[: max(0, top)]:
+        stages = r.get("stages_ms") or {}
+        top_stages = sorted(stages.items(), key=lambda kv: kv[1], reverse=True)[:3]
+        result.append(
+            {
+                "alias": r["alias"],
+                "index": r["index"],
+                "file": r.get("file") or "",
+                "duration_ms": r["duration_ms"],
+                "exit_code": r["exit_code"],
+                "peak_rss_bytes": r.get("peak_rss_bytes") or 0,
+                "top_stages_ms": dict(top_stages),
+            }
+        )
+    return result
+
+
+def fresh_durations(rows: list[dict[str, Any]]) -> list[float]:
+    # latencia so das linhas calculadas neste run e que terminaram (timeouts ficam em totals.timeouts)
+    return [float(r["duration_ms"]) for r in rows if not r.get("cached") and r.get("exit_code") != TIMEOUT_EXIT]
+
+
+def probe_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    checked_rows = [r for r in rows if isinstance(r.get("probe_ratio"), float)]
+    weighted_found = sum(int(r["probe_found"]) for r in checked_rows)
+    weighted_checked = sum(int(r["probe_checked"]) for r in checked_rows)
+    ratios = [float(r["probe_ratio"]) for r in checked_rows]
+    ok95 = sum(1 for r in checked_rows if float(r["probe_ratio"]) >= 0.95)
+    return {
+        "weighted_found": weighted_found,
+        "weighted_checked": weighted_checked,
+        "weighted_ratio": (weighted_found / weighted_checked) if weighted_checked > 0 else 0.0,
+        "mean_ratio": statistics.mean(ratios) if ratios else 0.0,
+        "files_with_ratio": len(checked_rows),
+        "files_ratio_ge_95": ok95,
+        "files_ratio_lt_95": len(checked_rows) - ok95,
+    }
+
+
+def exit_totals(rows: list[dict[str, Any]]) -> dict[str, int]:
+    """exit_fail nao inclui timeouts; timeouts recuperados no retry contam como exit_ok."""
+    exit_ok = sum(1 for r in rows if r.get("exit_code") == 0)
+    timeouts = sum(1 for r in rows if r.get("exit_code") == TIMEOUT_EXIT)
+    return {
+        "exit_ok": exit_ok,
+        "exit_fail": len(rows) - exit_ok - timeouts,
+        "timeouts": timeouts,
+        "timeouts_recovered": sum(1 for r in rows if int(r.get("attempts") or 1) > 1 and r.get("exit_code") != TIMEOUT_EXIT),
+    }
+
+
+def row_stats(rows: list[dict[str, Any]], top_slowest: int) -> dict[str, Any]:
+    # linhas do cache trazem duracao/etapas/memoria do run que as gravou: so entram as calculadas agora
+    fresh = [r for r in rows if not r.get("cached")]
+    return {
+        "measured_rows": len(fresh),
+        "cached_rows": len(rows) - len(fresh),
+        "stages_ms": stage_stats(fresh),
+        "stage_throughput": stage_throughput(fresh),
+        "memory": {
+            "peak_rss_bytes": latency_stats([float(r["peak_rss_bytes"]) for r in fresh if r.get("peak_rss_bytes")]),
+            "allocated_bytes": latency_stats([float(r["allocated_bytes"]) for r in fresh if r.get("allocated_bytes")]),
+        },
+        "regex": regex_totals(fresh),
+        "slowest": slowest_rows(fresh, top_slowest),
+    }
+
+
+def git_info(repo: Path) -> dict[str, Any]:
+    """Commit/branch do checkout medido (para o historico em scripts/bench_history.py)."""
+
+    def git(*args: str) -> str:
+        try:
+            p = subprocess.run(["git", "-C", str(repo), *args], text=True, capture_output=True, timeout=10, check=False)
+        except (OSError, subprocess.TimeoutExpired):
+            return ""
+        return p.stdout.strip() if p.returncode == 0 else ""
+
+    commit = git("rev-parse", "HEAD")
+    return {
+        "commit": commit,
+        "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")) if commit else False,
+    }
+
+
+def write_summary(repo: Path, summary: dict[str, Any], suffix: str = "") -> Path:
+    out_dir = repo / "run" / "io"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_file = out_dir / f"bench_dq_accuracy_{dt.datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}{suffix}.json"
+    out_file.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    return out_file
+
+
+def print_summary(summary: dict[str, Any], out_file: Path) -> None:
+    print(f"[BENCH] relatório: {out_file}")
+    lat = summary["latency_ms"]
+    print(
+        f"[BENCH] latencia/tarefa ms: p50={lat['p50']:.0f} p95={lat['p95']:.0f} max={lat['max']:.0f}"
+        f" wall={summary['wall_sec']:.1f}s"
+    )
+    if summary.get("cached_rows"):
+        print(f"[BENCH] etapas/memoria/lentos: {summary.get('measured_rows', 0)} linhas medidas, {summary['cached_rows']} do cache fora")
+    if summary["stages_ms"]:
+        print(f"[BENCH] {'etapa':<16} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+        for name, st in summary["stages_ms"].items():
+            print(
+                f"[BENCH] {name:<16} {st['count']:>5} {st['p50']:>9.1f} {st['p95']:>9.1f}"
+                f" {st['p99']:>9.1f} {st['max']:>9.1f}"
+            )
+    for name, st in (summary.get("stage_throughput") or {}).items():
+        alloc = st["allocated_bytes"]
+        print(
+            f"[BENCH] {name}: {st['items']} itens, {st['items_per_sec']:,.0f}/s;"
+            f" alocado/tarefa MB p50={alloc['p50'] / 1e6:.1f} p95={alloc['p95'] / 1e6:.1f}"
+        )
+    rx = summary.get("regex") or {}
+    if rx.get("hits") or rx.get("misses"):
+        lookups = rx.get("hits", 0.0) + rx.get("misses", 0.0)
+        print(
+            f"[BENCH] regex: hits={rx.get('hits', 0.0):.0f} misses={rx.get('misses', 0.0):.0f}"
+            f" ({rx.get('hits', 0.0) / lookups:.1%}) compiladas={rx.get('compiled', 0.0):.0f}"
+            f" timeouts={rx.get('timeouts', 0.0):.0f} construcao={rx.get('build_ms', 0.0):.0f}ms"
+        )
+    rss = summary["memory"]["peak_rss_bytes"]
+    if rss["count"]:
+        print(f"[BENCH] pico RSS MB: p50={rss['p50'] / 1e6:.0f} p95={rss['p95'] / 1e6:.0f} max={rss['max'] / 1e6:.0f}")
+    for r in summary["slowest"]:
+        stages = " ".join(f"{k}={v:.0f}" for k, v in r["top_stages_ms"].items())
+        print(f"[BENCH] lento :{r['alias']}{r['index']} {r['duration_ms']:.0f}ms {r['file']} {stages}".rstrip())
+
+
+def mem_available_bytes() -> int:
+    try:
+        for line in Path("/proc/meminfo").read_text(encoding="utf-8").splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def auto_workers(mem_per_worker_mb: int) -> int:
+    """Concorrencia = nucleos disponiveis, limitada pela RAM livre / RAM estimada por processo."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+    workers = max(1, cpus)
+    avail = mem_available_bytes()
+    if avail > 0 and mem_per_worker_mb > 0:
+        workers = min(workers, max(1, avail // (mem_per_worker_mb * 1024 * 1024)))
+    return int(workers)
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    m = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value or "")
+    if not m:
+        raise argparse.ArgumentTypeError("use i/n, ex.: 1/3")
+    index, count = int(m.group(1)), int(m.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("shard fora do intervalo: precisa 1 <= i <= n")
+    return index, count
+
+
+def shard_tasks(tasks: list[tuple[str, int]], index: int, count: int) -> list[tuple[str, int]]:
+    # round-robin sobre a lista ordenada: cada maquina recebe a mesma fatia para os mesmos totais
+    ordered = sorted(tasks)
+    return [t for pos, t in enumerate(ordered) if pos % count == index - 1]
+
+
+def report_durations(report: Path) -> dict[str, float]:
+    try:
+        rows = json.loads(report.read_text(encoding="utf-8")).get("rows") or []
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return {}
+    durations: dict[str, float] = {}
+    for r in rows:
+        try:
+            ms = float(r.get("duration_ms") or 0.0) + float(r.get("timeout_lost_ms") or 0.0)
+        except (TypeError, ValueError):
+            continue
+        if ms <= 0:
+            continue
+        durations[f"idx:{r.get('alias')}{r.get('index')}"] = ms
+        if r.get("path"):
+            durations[f"path:{r['path']}"] = ms
+    return durations
+
+
+def load_previous_durations(repo: Path) -> tuple[dict[str, float], str]:
+    """Duracoes por arquivo do ultimo bench_dq_accuracy_*.json (chaves `path:` e `idx:`).
+
+    Um relatorio `_shardIofN` cobre so uma fatia: se o mais recente for de shard, junta o
+    mais recente de cada shard da mesma particao n (o nome mais novo vence em conflito).
+    """
+    reports = sorted((repo / "run" / "io").glob("bench_dq_accuracy_*.json"))
+    for report in reversed(reports):
+        durations = report_durations(report)
+        if not durations:
+            continue
+        m = SHARD_REPORT_RE.search(report.name)
+        if m is None:
+            return durations, report.name
+        count = m.group(2)
+        seen = {m.group(1)}
+        for other in reversed(reports):
+            om = SHARD_REPORT_RE.search(other.name)
+            if om is None or om.group(2) != count or om.group(1) in seen:
+                continue
+            seen.add(om.group(1))
+            for key, ms in report_durations(other).items():
+                durations.setdefault(key, ms)
+        return durations, f"{report.name}+shards{len(seen)}of{count}"
+    return {}, ""
+
+
+def order_tasks(
+    tasks: list[tuple[str, int]], listing: dict[str, list[str]] | None, previous: dict[str, float]
+) -> list[tuple[str, int]]:
+    """Maior custo estimado primeiro: duracao do run anterior ou, sem historico, tamanho do PDF.
+
+    Arquivos novos (so com tamanho) sao convertidos para ms pela mediana ms/byte dos que tem os dois.
+    """
+
+    def path_of(alias: str, idx: int) -> str:
+        paths = (listing or {}).get(alias) or []
+        return paths[idx - 1] if 0 < idx <= len(paths) else ""
+
+    def size_of(path: str) -> int:
+        try:
+            return os.path.getsize(path) if path else 0
+        except OSError:
+            return 0
+
+    info = []
+    for alias, idx in tasks:
+        path = path_of(alias, idx)
+        prev = previous.get(f"path:{path}") if path else None
+        if prev is None and not listing:
+            prev = previous.get(f"idx:{alias}{idx}")
+        info.append((alias, idx, prev, size_of(path)))
+
+    rates = sorted(prev / size for _, _, prev, size in info if prev and size > 0)
+    ms_per_byte = statistics.median(rates) if rates else 0.0
+
+    def cost(item: tuple[str, int, float | None, int]) -> float:
+        _, _, prev, size = item
+        if prev is not None:
+            return prev
+        return size * ms_per_byte if ms_per_byte > 0 else float(size)
+
+    return [(alias, idx) for alias, idx, _, _ in sorted(info, key=cost, reverse=True)]
+
+
+def merged_cache_stats(shards: list[dict[str, Any]]) -> dict[str, Any]:
+    """Soma os contadores do cache de linhas dos shards (cada shard tem o proprio cache)."""
+    stats = [s.get("cache") or {} for s in shards]
+    enabled = [c for c in stats if c.get("enabled")]
+    if not enabled:
+        return {"enabled": False, "reason": "cache desligado nos shards"}
+    merged: dict[str, Any] = {"enabled": True, "shards_enabled": len(enabled)}
+    for name in ("hits", "misses", "stored", "evicted"):
+        merged[name] = sum(int(c.get(name) or 0) for c in enabled)
+    return merged
+
+
+def merge_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="bench_dq_accuracy.py merge",
+        description="Combina os JSONs de shards (--shard i/n) em um unico relatorio.",
+    )
+    parser.add_argument("inputs", nargs="+", help="bench_dq_accuracy_*_shard*.json")
+    parser.add_argument("--repo", default=".")
+    parser.add_argument("--top-slowest", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    shards: list[dict[str, Any]] = []
+    for raw in args.inputs:
+        try:
+            shards.append(json.loads(Path(raw).read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError) as ex:
+            print(f"Nao consegui ler {raw}: {ex}", file=sys.stderr)
+            return 2
+
+    counts = {int((s.get("shard") or {}).get("count") or 1) for s in shards}
+    seen_shards = sorted(int((s.get("shard") or {}).get("index") or 1) for s in shards)
+    if len(counts) != 1:
+        print(f"Shards de particoes diferentes: n={sorted(counts)}", file=sys.stderr)
+        return 2
+    shard_count = counts.pop()
+    missing = sorted(set(range(1, shard_count + 1)) - set(seen_shards))
+    if missing:
+        print(f"[BENCH] aviso: shards ausentes {missing} de {shard_count}", file=sys.stderr)
+
+    rows_by_key: dict[tuple[str, int], dict[str, Any]] = {}
+    for s in shards:
+        for r in s.get("rows") or []:
+            rows_by_key[(str(r["alias"]), int(r["index"]))] = r
+    rows = [rows_by_key[k] for k in sorted(rows_by_key)]
+
+    first = shards[0]
+    summary = {
+        "generated_at_utc": dt.datetime.utcnow().isoformat() + "Z",
+        "merged_from": [str(Path(p).resolve()) for p in args.inputs],
+        "git": first.get("git") or git_info(Path(args.repo).resolve()),
+        "shard": {"index": 0, "count": shard_count, "merged": seen_shards, "missing": missing},
+        "workers": sum(int(s.get("workers") or 0) for s in shards),
+        "timeout_sec": first.get("timeout_sec"),
+        "runner": first.get("runner"),
+        "runner_path": first.get("runner_path"),
+        "with_objdiff": first.get("with_objdiff"),
+        "persistent": first.get("persistent"),
+        "alias_discovery": first.get("alias_discovery"),
+        "wall_sec": max(float(s.get("wall_sec") or 0.0) for s in shards),
+        "latency_ms": latency_stats(fresh_durations(rows)),
+        "cache": merged_cache_stats(shards),
+        **row_stats(rows, args.top_slowest),
+        "totals": {
+            "D": max(int((s.get("totals") or {}).get("D") or 0) for s in shards),
+            "Q": max(int((s.get("totals") or {}).get("Q") or 0) for s in shards),
+            "tasks": len(rows),
+            **exit_totals(rows),
+        },
+        "probe": probe_summary(rows),
+        "rows": rows,
     }
 
+    out_file = write_summary(Path(args.repo).resolve(), summary, "_merged")
+    print_summary(summary, out_file)
+    probe = summary["probe"]
+    print(
+        f"[BENCH] merge shards={seen_shards}/{shard_count} weighted_ratio={probe['weighted_ratio']:.4f}"
+        f" mean_ratio={probe['mean_ratio']:.4f} >=95%={probe['files_ratio_ge_95']}/{probe['files_with_ratio']}"
+    )
+    return 0
+
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Benchmark de acuracia (probe) para :D e :Q")
+    if len(sys.argv) > 1 and sys.argv[1] == "merge":
+        return merge_main(sys.argv[2:])
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark de acuracia (probe) para :D e :Q",
+        epilog="Shards: rode `--shard i/n` em cada maquina e depois `bench_dq_accuracy.py merge <jsons...>`.",
+    )
     parser.add_argument("--repo", default=".")
-    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processos simultaneos (0=auto: nucleos disponiveis limitados por MemAvailable/--mem-per-worker-mb).",
+    )
+    parser.add_argument(
+        "--mem-per-worker-mb",
+        type=int,
+        default=700,
+        help="RAM estimada por processo operpdf para o modo auto de --workers.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=(1, 1),
+        help="Executa so a fatia i de n (ex.: 2/4); junte os JSONs com `merge`.",
+    )
     parser.add_argument("--timeout", type=int, default=180)
+    parser.add_argument(
+        "--retry-timeout",
+        type=int,
+        default=-1,
+        help="Orcamento (s) da segunda tentativa apos timeout (-1=2x --timeout, 0=sem retry).",
+    )
+    parser.add_argument(
+        "--order",
+        choices=["longest-first", "index"],
+        default="longest-first",
+        help="Ordem de submissao: maior custo estimado primeiro (duracao anterior/tamanho) ou alias/indice.",
+    )
     parser.add_argument("--max-d", type=int, default=0, help="Limita quantidade de indices D (0=todos)")
     parser.add_argument("--max-q", type=int, default=0, help="Limita quantidade de indices Q (0=todos)")
     parser.add_argument("--with-objdiff", action="store_true")
@@ -131,6 +1004,34 @@ def main() -> int:
         default="./align.exe",
         help="Caminho do executavel quando --runner exe.",
     )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Usa um pool de processos `operpdf worker` (um por worker) em vez de um processo por PDF.",
+    )
+    parser.add_argument(
+        "--warmup-input",
+        default="@M-DESP",
+        help="Alvo do aquecimento de cada worker persistente (padrao: o proprio modelo).",
+    )
+    parser.add_argument(
+        "--top-slowest",
+        type=int,
+        default=10,
+        help="Quantidade de arquivos mais lentos listados no relatorio (0=nenhum).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignora o cache de resultados e reexecuta todos os PDFs.",
+    )
+    parser.add_argument("--cache-dir", default="run/cache/bench_dq_accuracy")
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=512,
+        help="Tamanho maximo do cache; entradas menos usadas sao removidas (0=sem limite).",
+    )
     args = parser.parse_args()
 
     repo = Path(args.repo).resolve()
@@ -143,8 +1044,28 @@ def main() -> int:
 
     base_cmd = build_runner_cmd(repo, args.runner, args.runner_path)
 
-    total_d = discover_total(base_cmd, repo, "D", args.timeout)
-    total_q = discover_total(base_cmd, repo, "Q", args.timeout)
+    listing = discover_aliases(base_cmd, repo, ["D", "Q"], args.timeout)
+    if listing is not None and "D" in listing and "Q" in listing:
+        total_d = len(listing["D"])
+        total_q = len(listing["Q"])
+    else:
+        # binario sem `inspect aliases`: descobre o total pelo erro de indice invalido
+        listing = None
+        total_d = discover_total(base_cmd, repo, "D", args.timeout)
+        total_q = discover_total(base_cmd, repo, "Q", args.timeout)
+
+    cache: ResultCache | None = None
+    cache_note = "desativado (--no-cache)"
+    model_paths = [Path(p) for p in (listing or {}).get("@M-DESP", [])]
+    if not args.no_cache:
+        if listing is None or not model_paths:
+            cache_note = "desativado (sem caminhos de entrada/modelo via inspect aliases)"
+        else:
+            runner_file = repo / ("cli/OperCli/bin/Release/net8.0/operpdf.dll" if args.runner == "dll" else args.runner_path)
+            cache_dir = Path(args.cache_dir)
+            if not cache_dir.is_absolute():
+                cache_dir = repo / cache_dir
+            cache = ResultCache(cache_dir, args.cache_max_mb * 1024 * 1024, env_fingerprint(repo, runner_file))
 
     if args.max_d > 0:
         total_d = min(total_d, args.max_d)
@@ -154,72 +1075,151 @@ def main() -> int:
     tasks: list[tuple[str, int]] = []
     tasks.extend(("D", i) for i in range(1, total_d + 1))
     tasks.extend(("Q", i) for i in range(1, total_q + 1))
+    shard_index, shard_count = args.shard
+    if shard_count > 1:
+        tasks = shard_tasks(tasks, shard_index, shard_count)
 
-    print(f"[BENCH] total D={total_d} Q={total_q} total_tasks={len(tasks)} workers={args.workers}")
+    order_source = "index"
+    if args.order == "longest-first":
+        previous, previous_report = load_previous_durations(repo)
+        tasks = order_tasks(tasks, listing, previous)
+        order_source = f"previous_run:{previous_report}" if previous else ("file_size" if listing else "index")
+    retry_timeout = args.timeout * 2 if args.retry_timeout < 0 else args.retry_timeout
+
+    workers = args.workers if args.workers > 0 else auto_workers(args.mem_per_worker_mb)
+    print(
+        f"[BENCH] total D={total_d} Q={total_q} total_tasks={len(tasks)} workers={workers}"
+        f"{' (auto)' if args.workers <= 0 else ''} shard={shard_index}/{shard_count} ordem={order_source}"
+    )
+
+    pool: WorkerPool | None = None
+    if args.persistent:
+        warmup_args = [
+            "textopsalign-despacho",
+            "--inputs",
+            "@M-DESP",
+            "--inputs",
+            args.warmup_input,
+            "--probe",
+            "--sem-alinhamento",
+        ]
+        pool = WorkerPool(base_cmd, repo, warmup_args, args.timeout)
+        run: Callable[[list[str], int], tuple[int, str]] = lambda cmd, t: pool.run(cmd, t, capture=False)
+    else:
+        run = lambda cmd, t: run_cmd([*base_cmd, *cmd], repo, t, capture=False)
 
     rows: list[dict[str, Any]] = []
     done = 0
     ok = 0
+    timeouts = 0
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
-        futs = [
-            ex.submit(task, base_cmd, repo, alias, idx, args.timeout, args.with_objdiff)
-            for alias, idx in tasks
-        ]
-        for fut in concurrent.futures.as_completed(futs):
-            row = fut.result()
-            rows.append(row)
-            done += 1
-            if row["exit_code"] == 0:
-                ok += 1
-            if done % 20 == 0 or done == len(tasks):
-                print(f"[BENCH] progresso {done}/{len(tasks)} exit_ok={ok}")
+    probe_tmp = tempfile.TemporaryDirectory(prefix="bench_probe_")
+    probe_dir = Path(probe_tmp.name)
+    wall_started = time.perf_counter()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            futs = []
+            for alias, idx in tasks:
+                if cache is not None and listing is not None:
+                    futs.append(
+                        ex.submit(
+                            cached_task,
+                            cache,
+                            Path(listing[alias][idx - 1]),
+                            model_paths,
+                            run,
+                            alias,
+                            idx,
+                            args.with_objdiff,
+                            probe_dir,
+                            args.timeout,
+                            retry_timeout,
+                        )
+                    )
+                else:
+                    futs.append(
+                        ex.submit(task, run, alias, idx, args.with_objdiff, probe_dir, args.timeout, retry_timeout)
+                    )
+            for fut in concurrent.futures.as_completed(futs):
+                row = fut.result()
+                rows.append(row)
+                done += 1
+                if row["exit_code"] == 0:
+                    ok += 1
+                elif row["exit_code"] == TIMEOUT_EXIT:
+                    timeouts += 1
+                if done % 20 == 0 or done == len(tasks):
+                    print(f"[BENCH] progresso {done}/{len(tasks)} exit_ok={ok} timeouts={timeouts}")
+    finally:
+        if pool is not None:
+            pool.close()
+        probe_tmp.cleanup()
+        if cache is not None:
+            cache.prune()
+    wall_sec = time.perf_counter() - wall_started
 
     rows.sort(key=lambda r: (r["alias"], r["index"]))
-
-    checked_rows = [r for r in rows if isinstance(r.get("probe_ratio"), float)]
-    weighted_found = sum(int(r["probe_found"]) for r in checked_rows)
-    weighted_checked = sum(int(r["probe_checked"]) for r in checked_rows)
-    weighted_ratio = (weighted_found / weighted_checked) if weighted_checked > 0 else 0.0
-
-    ratios = [float(r["probe_ratio"]) for r in checked_rows]
-    ratio_mean = statistics.mean(ratios) if ratios else 0.0
-
-    ok95 = sum(1 for r in checked_rows if float(r["probe_ratio"]) >= 0.95)
+    if listing is not None:
+        for r in rows:
+            paths = listing.get(r["alias"]) or []
+            r["path"] = paths[r["index"] - 1] if 0 < r["index"] <= len(paths) else ""
 
     summary = {
         "generated_at_utc": dt.datetime.utcnow().isoformat() + "Z",
-        "workers": args.workers,
+        "git": git_info(repo),
+        "workers": workers,
+        "workers_auto": args.workers <= 0,
+        "shard": {"index": shard_index, "count": shard_count},
         "timeout_sec": args.timeout,
+        "retry_timeout_sec": retry_timeout,
+        "order": order_source,
         "runner": args.runner,
         "runner_path": args.runner_path if args.runner == "exe" else "",
         "with_objdiff": bool(args.with_objdiff),
+        "persistent": bool(args.persistent),
+        "alias_discovery": "inspect_aliases" if listing is not None else "discover_total",
+        "wall_sec": wall_sec,
+        "latency_ms": latency_stats(fresh_durations(rows)),
+        "cache": cache.stats() if cache is not None else {"enabled": False, "reason": cache_note},
+        **row_stats(rows, args.top_slowest),
+        "warmup": {
+            "workers_started": len(pool.warmups_ms) if pool else 0,
+            "worker_restarts": pool.restarts if pool else 0,
+            "warmup_ms": pool.warmups_ms if pool else [],
+            "mean_ms": statistics.mean(pool.warmups_ms) if pool and pool.warmups_ms else 0.0,
+        },
         "totals": {
             "D": total_d,
             "Q": total_q,
             "tasks": len(tasks),
-            "exit_ok": ok,
-            "exit_fail": len(tasks) - ok,
-        },
-        "probe": {
-            "weighted_found": weighted_found,
-            "weighted_checked": weighted_checked,
-            "weighted_ratio": weighted_ratio,
-            "mean_ratio": ratio_mean,
-            "files_with_ratio": len(checked_rows),
-            "files_ratio_ge_95": ok95,
-            "files_ratio_lt_95": len(checked_rows) - ok95,
+            **exit_totals(rows),
         },
+        "probe": probe_summary(rows),
         "rows": rows,
     }
 
-    out_dir = repo / "run" / "io"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    out_file = out_dir / f"bench_dq_accuracy_{dt.datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.json"
-    out_file.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
-
-    print(f"[BENCH] relatório: {out_file}")
-    print(f"[BENCH] weighted_ratio={weighted_ratio:.4f} mean_ratio={ratio_mean:.4f} >=95%={ok95}/{len(checked_rows)}")
+    suffix = f"_shard{shard_index}of{shard_count}" if shard_count > 1 else ""
+    out_file = write_summary(repo, summary, suffix)
+    print_summary(summary, out_file)
+    if cache is not None:
+        print(
+            f"[BENCH] cache: hits={cache.hits} recalculados={cache.misses} gravados={cache.stored}"
+            f" removidos={cache.evicted} dir={cache.dir}"
+        )
+    else:
+        print(f"[BENCH] cache {cache_note}")
+    if pool is not None:
+        print(f"[BENCH] aquecimento: workers={len(pool.warmups_ms)} mean_ms={summary['warmup']['mean_ms']:.0f}")
+    totals = summary["totals"]
+    print(
+        f"[BENCH] saida: ok={totals['exit_ok']} falha={totals['exit_fail']} timeouts={totals['timeouts']}"
+        f" recuperados_no_retry={totals['timeouts_recovered']}"
+    )
+    probe = summary["probe"]
+    print(
+        f"[BENCH] weighted_ratio={probe['weighted_ratio']:.4f} mean_ratio={probe['mean_ratio']:.4f}"
+        f" >=95%={probe['files_ratio_ge_95']}/{probe['files_with_ratio']}"
+    )
 
     return 0
 
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Historico dos relatorios do bench (run/io/bench_dq_accuracy_*.json) e checagem de regressao.
+
+O indice (run/cache/bench_history.json) guarda um resumo por relatorio: commit, runner, flags,
+tarefas, acertos de cache, wall, vazao, latencia p50/p95/p99, weighted_ratio e falhas. E atualizado
+incrementalmente: so relatorios novos ou alterados (mtime/tamanho) sao relidos.
+
+A vazao conta so as tarefas calculadas no run (sem acertos do cache de linhas): um run com
+metade das linhas vindas do cache nao parece 2x mais rapido. Runs todo em cache nao tem vazao
+e ficam fora do baseline do check.
+
+Runs so sao comparados com runs da mesma configuracao
+(runner, with_objdiff, persistent, workers, cache ligado, shards).
+
+Exemplos:
+  python3 scripts/bench_history.py table --last 20
+  python3 scripts/bench_history.py plot --metric throughput
+  python3 scripts/bench_history.py check --max-drop-pct 10 --window 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+INDEX_VERSION = 2
+REPORT_GLOB = "bench_dq_accuracy_*.json"
+SPARK = " ▁▂▃▄▅▆▇█"
+METRICS = {
+    "throughput": "tarefas calculadas/s (sem acertos de cache)",
+    "weighted_ratio": "weighted_ratio",
+    "p50_ms": "latencia p50 ms",
+    "p95_ms": "latencia p95 ms",
+    "p99_ms": "latencia p99 ms",
+    "exit_fail": "falhas (exit != 0, sem timeouts)",
+    "timeouts": "timeouts",
+    "wall_sec": "wall s",
+}
+
+
+def summarize_report(data: dict[str, Any]) -> dict[str, Any]:
+    """Resumo de um relatorio do bench (o JSON completo, com rows, nao fica no indice)."""
+    git = data.get("git") or {}
+    totals = data.get("totals") or {}
+    lat = data.get("latency_ms") or {}
+    probe = data.get("probe") or {}
+    cache = data.get("cache") or {}
+    shard = data.get("shard") or {}
+    rows = data.get("rows") or []
+    tasks = int(totals.get("tasks") or len(rows))
+    # linhas vindas do cache nao custaram nada; sem rows (relatorio resumido) usa cache.hits
+    if rows:
+        cache_hits = sum(1 for r in rows if isinstance(r, dict) and r.get("cached"))
+    else:
+        cache_hits = int(cache.get("hits") or 0)
+    fresh = max(0, tasks - cache_hits)
+    wall = float(data.get("wall_sec") or 0.0)
+    return {
+        "generated_at_utc": data.get("generated_at_utc") or "",
+        "commit": (git.get("commit") or "")[:12],
+        "dirty": bool(git.get("dirty")),
+        "config": {
+            "runner": data.get("runner") or "",
+            "with_objdiff": bool(data.get("with_objdiff")),
+            "persistent": bool(data.get("persistent")),
+            "workers": int(data.get("workers") or 0),
+            "cache": bool(cache.get("enabled")),
+            "shards": int(shard.get("count") or 1),
+        },
+        "merged_from": [Path(str(p)).name for p in data.get("merged_from") or []],
+        "tasks": tasks,
+        "cache_hits": cache_hits,
+        "fresh_tasks": fresh,
+        "wall_sec": wall,
+        "throughput": fresh / wall if wall > 0 else 0.0,
+        "p50_ms": float(lat.get("p50") or 0.0),
+        "p95_ms": float(lat.get("p95") or 0.0),
+        "p99_ms": float(lat.get("p99") or 0.0),
+        "weighted_ratio": float(probe.get("weighted_ratio") or 0.0),
+        "exit_fail": int(totals.get("exit_fail") or 0),
+        "timeouts": int(totals.get("timeouts") or 0),
+    }
+
+
+def config_key(entry: dict[str, Any]) -> str:
+    c = entry["config"]
+    return (
+        f"{c['runner']}|objdiff={int(c['with_objdiff'])}|persistent={int(c['persistent'])}"
+        f"|workers={c['workers']}|cache={int(c['cache'])}|shards={c['shards']}"
+    )
+
+
+def load_index(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    reports = data.get("reports")
+    return reports if isinstance(reports, dict) else {}
+
+
+def refresh_index(repo: Path, index_path: Path) -> list[dict[str, Any]]:
+    """Atualiza o indice e devolve as entradas em ordem cronologica.
+
+    Shards listados em `merged_from` de um relatorio _merged ficam de fora (o merge ja os
+    representa); shards sem merge entram como runs proprios (config com shards=N)."""
+    old = load_index(index_path)
+    reports: dict[str, dict[str, Any]] = {}
+    changed = False
+    for path in sorted((repo / "run" / "io").glob(REPORT_GLOB)):
+        st = path.stat()
+        prev = old.get(path.name)
+        if prev and prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+            reports[path.name] = prev
+            continue
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as ex:
+            print(f"[HIST] ignorado {path.name}: {ex}", file=sys.stderr)
+            continue
+        if not isinstance(data, dict):
+            continue
+        entry = summarize_report(data)
+        entry.update(file=path.name, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        reports[path.name] = entry
+        changed = True
+    if changed or set(reports) != set(old):
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "reports": reports}, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, index_path)
+
+    merged_shards = {name for e in reports.values() for name in e.get("merged_from") or []}
+    entries = [e for name, e in reports.items() if name not in merged_shards]
+    return sorted(entries, key=lambda e: (e["generated_at_utc"], e["file"]))
+
+
+def filter_entries(entries: list[dict[str, Any]], args: argparse.Namespace) -> list[dict[str, Any]]:
+    if args.runner:
+        entries = [e for e in entries if e["config"]["runner"] == args.runner]
+    if args.config:
+        entries = [e for e in entries if args.config in config_key(e)]
+    return entries
+
+
+def sparkline(values: list[float]) -> str:
+    if not values:
+        return ""
+    lo, hi = min(values), max(values)
+    if hi <= lo:
+        return SPARK[4] * len(values)
+    return "".join(SPARK[1 + int((v - lo) / (hi - lo) * (len(SPARK) - 2))] for v in values)
+
+
+def cmd_table(entries: list[dict[str, Any]], last: int) -> int:
+    rows = entries[-last:] if last > 0 else entries
+    print(
+        f"{'gerado (UTC)':<20} {'commit':<13} {'config':<48} {'tarefas':>7} {'t/s':>7} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8} {'ratio':>7} {'falha':>5} {'tmo':>4}"
+    )
+    for e in rows:
+        commit = e["commit"] + ("*" if e["dirty"] else "")
+        print(
+            f"{e['generated_at_utc'][:19]:<20} {commit:<13} {config_key(e):<48} {e['tasks']:>7} "
+            f"{e['throughput']:>7.2f} {e['p50_ms']:>8.0f} {e['p95_ms']:>8.0f} {e['p99_ms']:>8.0f} "
+            f"{e['weighted_ratio']:>7.4f} {e['exit_fail']:>5} {e['timeouts']:>4}"
+        )
+    print(f"[HIST] runs={len(rows)} (* = arvore com alteracoes nao commitadas)")
+    return 0
+
+
+def cmd_plot(entries: list[dict[str, Any]], metric: str, last: int) -> int:
+    by_config: dict[str, list[dict[str, Any]]] = {}
+    for e in entries:
+        if metric == "throughput" and e["fresh_tasks"] == 0:
+            continue  # run todo em cache: sem vazao
+        by_config.setdefault(config_key(e), []).append(e)
+    for key, items in by_config.items():
+        items = items[-last:] if last > 0 else items
+        values = [float(e[metric]) for e in items]
+        print(f"{key}")
+        print(
+            f"  {METRICS[metric]}: {sparkline(values)}  primeiro={values[0]:.4g} ultimo={values[-1]:.4g}"
+            f" min={min(values):.4g} max={max(values):.4g} (n={len(values)})"
+        )
+    return 0
+
+
+def cmd_check(entries: list[dict[str, Any]], args: argparse.Namespace) -> int:
+    """Ultimo run x mediana dos `window` runs anteriores da mesma configuracao."""
+    if not entries:
+        print("[HIST] nenhum relatorio encontrado")
+        return 2
+    latest = entries[-1]
+    key = config_key(latest)
+    previous = [e for e in entries[:-1] if config_key(e) == key][-args.window :]
+    print(f"[HIST] ultimo: {latest['file']} commit={latest['commit'] or '?'} config={key}")
+    if len(previous) < args.min_runs:
+        print(f"[HIST] baseline insuficiente: {len(previous)} runs anteriores (min {args.min_runs}); nada a checar")
+        return 0
+
+    failures: list[str] = []
+    fresh_previous = [e for e in previous if e["fresh_tasks"] > 0]
+    if latest["fresh_tasks"] == 0:
+        print(f"[HIST] vazao: ultimo run todo em cache ({latest['cache_hits']} acertos); nada a checar")
+    elif len(fresh_previous) < args.min_runs:
+        print(f"[HIST] vazao: baseline insuficiente ({len(fresh_previous)} runs com tarefas calculadas)")
+    else:
+        base_tp = statistics.median(e["throughput"] for e in fresh_previous)
+        drop = (base_tp - latest["throughput"]) / base_tp * 100.0 if base_tp > 0 else 0.0
+        print(
+            f"[HIST] vazao: {latest['throughput']:.3f} t/s x baseline {base_tp:.3f} t/s ({-drop:+.1f}%,"
+            f" n={len(fresh_previous)}; so tarefas calculadas, cache={latest['cache_hits']}/{latest['tasks']})"
+        )
+        if drop > args.max_drop_pct:
+            failures.append(f"vazao caiu {drop:.1f}% (limite {args.max_drop_pct:.1f}%)")
+
+    base_p95 = statistics.median(e["p95_ms"] for e in previous)
+    if base_p95 > 0:
+        rise = (latest["p95_ms"] - base_p95) / base_p95 * 100.0
+        print(f"[HIST] p95: {latest['p95_ms']:.0f} ms x baseline {base_p95:.0f} ms ({rise:+.1f}%)")
+        if args.max_p95_rise_pct > 0 and rise > args.max_p95_rise_pct:
+            failures.append(f"p95 subiu {rise:.1f}% (limite {args.max_p95_rise_pct:.1f}%)")
+
+    base_ratio = statistics.median(e["weighted_ratio"] for e in previous)
+    ratio_drop = base_ratio - latest["weighted_ratio"]
+    print(f"[HIST] weighted_ratio: {latest['weighted_ratio']:.4f} x baseline {base_ratio:.4f}")
+    if ratio_drop > args.max_ratio_drop:
+        failures.append(f"weighted_ratio caiu {ratio_drop:.4f} (limite {args.max_ratio_drop:.4f})")
+
+    base_fail = statistics.median(e["exit_fail"] + e["timeouts"] for e in previous)
+    now_fail = latest["exit_fail"] + latest["timeouts"]
+    print(f"[HIST] falhas+timeouts: {now_fail} x baseline {base_fail:.0f}")
+    if now_fail > base_fail + args.max_fail_increase:
+        failures.append(f"falhas+timeouts {now_fail} > baseline {base_fail:.0f} + {args.max_fail_increase}")
+
+    for f in failures:
+        print(f"[HIST] REGRESSAO: {f}")
+    print("[HIST] check: " + ("FALHOU" if failures else "ok"))
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Historico e checagem de regressao dos relatorios do bench.")
+    parser.add_argument("--repo", default=".")
+    parser.add_argument("--index", default="", help="Indice (padrao: run/cache/bench_history.json).")
+    parser.add_argument("--runner", default="", help="Filtra por runner (dll/exe).")
+    parser.add_argument("--config", default="", help="Filtra por trecho da chave de config (ex.: workers=8).")
+    sub = parser.add_subparsers(dest="cmd")
+
+    p_table = sub.add_parser("table", help="Tabela cronologica dos runs (padrao).")
+    p_table.add_argument("--last", type=int, default=30)
+
+    p_plot = sub.add_parser("plot", help="Sparkline de uma metrica por configuracao.")
+    p_plot.add_argument("--metric", choices=sorted(METRICS), default="throughput")
+    p_plot.add_argument("--last", type=int, default=60)
+
+    p_check = sub.add_parser("check", help="Falha (exit 1) se o ultimo run regrediu frente ao baseline movel.")
+    p_check.add_argument("--window", type=int, default=5, help="Runs anteriores da mesma config no baseline.")
+    p_check.add_argument("--min-runs", type=int, default=2, help="Minimo de runs anteriores para checar.")
+    p_check.add_argument("--max-drop-pct", type=float, default=10.0, help="Queda maxima de vazao (tarefas calculadas/s), em %%.")
+    p_check.add_argument("--max-p95-rise-pct", type=float, default=0.0, help="Alta maxima do p95, em %% (0=nao checa).")
+    p_check.add_argument("--max-ratio-drop", type=float, default=0.005, help="Queda maxima do weighted_ratio (absoluta).")
+    p_check.add_argument("--max-fail-increase", type=int, default=0, help="Falhas+timeouts a mais toleradas.")
+
+    args = parser.parse_args()
+    repo = Path(args.repo).resolve()
+    index_path = Path(args.index) if args.index else repo / "run" / "cache" / "bench_history.json"
+    entries = filter_entries(refresh_index(repo, index_path), args)
+
+    if args.cmd == "plot":
+        if not entries:
+            print("[HIST] nenhum relatorio encontrado")
+            return 2
+        return cmd_plot(entries, args.metric, args.last)
+    if args.cmd == "check":
+        return cmd_check(entries, args)
+    return cmd_table(entries, getattr(args, "last", 30))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Micro-benchmark de sanitize_line: regras em sequencia (antigo) x motor compilado.
+
+Mede linhas/s das duas versoes sobre o mesmo corpus e confere que a saida e identica.
+Corpus: arquivos de texto (--text), PDFs via pdftotext -layout (--pdf) ou, sem entradas,
+linhas sinteticas montadas a partir das proprias regras.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from despacho_sanitizer import (
+    BIG_NUM_RE,
+    EMAIL_RE,
+    EXPLICIT_REPLACEMENTS,
+    LABEL_REPLACEMENTS,
+    SENSITIVE_TOKEN_PATTERNS,
+    STRUCTURED_REPLACEMENTS,
+    sanitize_line,
+)
+
+
+def legacy_sanitize_line(raw_line: str) -> str:
+    """Implementacao anterior: cada regra aplicada em sequencia, padroes montados por linha."""
+    s = raw_line.rstrip("\n")
+    if not s.strip():
+        return ""
+    for pat, rep in EXPLICIT_REPLACEMENTS:
+        s = re.sub(pat, rep, s, flags=re.IGNORECASE)
+    for pat, rep in LABEL_REPLACEMENTS:
+        s = re.sub(pat, rep, s)
+    s = EMAIL_RE.sub("ppppp@ppppp.ppp", s)
+    for pat, rep in STRUCTURED_REPLACEMENTS:
+        s = pat.sub(rep, s)
+    s = BIG_NUM_RE.sub(lambda m: "0" * len(m.group(0)), s)
+    for tok in SENSITIVE_TOKEN_PATTERNS:
+        s = re.sub(rf"(?i)\b{tok}\b", "PPPPP", s)
+    s = re.sub(r"(?i)Processo\s*n[ºo]\s*[\d\.\-\/]+", "Processo nº 0000.000.000", s)
+    s = re.sub(r"(?i)Of[ií]cio\s*n[ºo]\s*[\d\.\-\/]+", "Ofício nº 00/0000", s)
+    s = re.sub(r"\d", "0", s)
+    s = re.sub(r"\s{2,}", " ", s).strip()
+    return s
+
+
+def synthetic_lines(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    names = [re.sub(r"\[(.)[^\]]*\]", r"\1", pat) for pat, _ in EXPLICIT_REPLACEMENTS]
+    tokens = [re.sub(r"\[(.)[^\]]*\]", r"\1", tok).capitalize() for tok in SENSITIVE_TOKEN_PATTERNS]
+    templates = [
+        "Processo nº {proc} - Requerente: Juízo da {n}ª Vara da Comarca de {name}",
+        "Interessada: {name} - Perita Médica, CPF {cpf}, e-mail {mail}",
+        "movido por {name} em face de {tok} {tok2}, perante o Juízo de {name}.",
+        "Autor(es): {name}; Réu(s): {tok} da Silva; data {date}",
+        "Ofício nº {n}/{year} encaminhado em {date} ao setor de {tok}",
+        "Considerando os termos do despacho de fls. {n}, defiro o pagamento dos honorários.",
+        "Valor: R$ {n},00 (processo administrativo {admin}), CNPJ {cnpj}",
+        "   ",
+        "Texto corrido sem dados sensíveis para medir o caminho rápido das regras.",
+    ]
+    lines = []
+    for _ in range(count):
+        tpl = rng.choice(templates)
+        lines.append(
+            tpl.format(
+                proc=f"{rng.randint(0, 9999999):07d}-{rng.randint(0, 99):02d}.2024.8.15.{rng.randint(0, 9999):04d}",
+                n=rng.randint(1, 999),
+                name=rng.choice(names),
+                tok=rng.choice(tokens),
+                tok2=rng.choice(tokens),
+                cpf=f"{rng.randint(0, 999):03d}.{rng.randint(0, 999):03d}.{rng.randint(0, 999):03d}-{rng.randint(0, 99):02d}",
+                mail=f"{rng.choice(tokens).lower()}@tjpb.jus.br",
+                date=f"{rng.randint(1, 28)}/{rng.randint(1, 12)}/{rng.randint(2019, 2025)}",
+                year=rng.randint(2019, 2025),
+                admin=f"{rng.randint(0, 9999):04d}.{rng.randint(0, 999):03d}.{rng.randint(0, 999):03d}",
+                cnpj=f"{rng.randint(0, 99):02d}.{rng.randint(0, 999):03d}.{rng.randint(0, 999):03d}/0001-{rng.randint(0, 99):02d}",
+            )
+        )
+    return lines
+
+
+def load_lines(texts: list[str], pdfs: list[str]) -> list[str]:
+    lines: list[str] = []
+    for path in texts:
+        lines.extend(Path(path).read_text(encoding="utf-8", errors="ignore").splitlines())
+    for path in pdfs:
+        raw = subprocess.check_output(["pdftotext", "-layout", path, "-"])
+        lines.extend(raw.decode("utf-8", errors="ignore").splitlines())
+    return lines
+
+
+def measure(fn: Callable[[str], str], lines: list[str], repeat: int) -> tuple[float, list[str]]:
+    out: list[str] = []
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        out = [fn(line) for line in lines]
+        best = min(best, time.perf_counter() - started)
+    return (len(lines) / best if best > 0 else float("inf")), out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark de sanitize_line (antigo x compilado).")
+    parser.add_argument("--text", action="append", default=[], help="Arquivo de texto (uma linha por linha).")
+    parser.add_argument("--pdf", action="append", default=[], help="PDF (extraido com pdftotext -layout).")
+    parser.add_argument("--lines", type=int, default=20000, help="Linhas sinteticas quando nao ha entradas.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticoes; vale o melhor tempo.")
+    args = parser.parse_args()
+
+    lines = load_lines(args.text, args.pdf) or synthetic_lines(args.lines)
+    legacy_rate, legacy_out = measure(legacy_sanitize_line, lines, args.repeat)
+    compiled_rate, compiled_out = measure(sanitize_line, lines, args.repeat)
+
+    mismatches = [(i, a, b) for i, (a, b) in enumerate(zip(legacy_out, compiled_out)) if a != b]
+    print(f"[SANITIZE] linhas={len(lines)} repeat={args.repeat}")
+    print(f"[SANITIZE] antigo    {legacy_rate:>12,.0f} linhas/s")
+    print(f"[SANITIZE] compilado {compiled_rate:>12,.0f} linhas/s  ({compiled_rate / legacy_rate:.1f}x)")
+    print(f"[SANITIZE] divergencias={len(mismatches)}")
+    for i, old, new in mismatches[:10]:
+        print(f"  #{i}: {lines[i]!r}\n    antigo:    {old!r}\n    compilado: {new!r}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
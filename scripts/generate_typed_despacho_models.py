@@ -5,21 +5,28 @@ Goal:
 - keep document-style text flow
 - remove real names and real numbers
 - use placeholders (AAAAA/BBBBB/PPPPP/CCCCCCCC/000...)
+
+Files are processed in parallel (--jobs) and a manifest of the generated
+hashes (models/aliases/.typed_manifest.json) lets reruns skip files that
+are already typed with the current rules.
 """
 
 from __future__ import annotations
 
 import argparse
-import re
-import subprocess
+import concurrent.futures
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Iterable
 
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+from typed_pdf import BACKENDS, DEFAULT_BACKEND, iter_pages, render_pages_to_bytes, resolve_backend
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = REPO_ROOT / "models" / "aliases" / ".typed_manifest.json"
+MANIFEST_VERSION = 1
 
 TARGET_GLOBS = [
     "models/aliases/despacho/*.pdf",
@@ -31,158 +38,6 @@ TARGET_GLOBS = [
 
 EXCLUDE_SUFFIXES: tuple[str, ...] = ()
 
-# Explicit known entities from current model corpus.
-EXPLICIT_REPLACEMENTS = [
-    (r"Christine Maria Batista de Brito Lyra", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Claudia Cristina Studart Leal", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Mara do Socorro da Silva", "AAAAA AAAAAAA AAAAA AA"),
-    (r"Francisca Maria da Silva", "BBBBB BBBBBBB BBBBB BB"),
-    (r"Felipe Queiroga Gadelha", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Robson de Lima Canan[eé]a", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Aline Santos Soares", "AAAAA AAAAAAA AAAAA AA"),
-    (r"ALINE SANTOS SOARES", "AAAAA AAAAAAA AAAAA AA"),
-    (r"Luciano da Silva Costa", "BBBBB BBBBBBB BBBBB BB"),
-    (r"LUCIANO DA SILVA COSTA", "BBBBB BBBBBBB BBBBB BB"),
-    (r"Carmen Helen Agra de Brito", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"CARMEN HELEN AGRA DE BRITO", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Elvis Sangelis Dias Marinheiro", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Marta Liane de Almeida Ramalho Loureiro", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Renata da C[âa]mara Pires Belmont", "PPPPP PPPPP PPPPP PPPPP"),
-    (r"Jo[aã]o Benedito", "PPPPP PPPPP"),
-    (r"Márcio Murilo", "PPPPP PPPPP"),
-    (r"Manoel Fons[êe]ca Xavier", "PPPPP PPPPP PPPPP"),
-    (r"Mamanguape", "CCCCCCCC"),
-    (r"Pianc[oó]", "CCCCCCCC"),
-    (r"Sousa", "CCCCCCCC"),
-    (r"Pocinhos", "CCCCCCCC"),
-    (r"Campina Grande", "CCCCCCCC"),
-    (r"Jo[aã]o Pessoa", "CCCCCCCC"),
-]
-
-SENSITIVE_TOKEN_PATTERNS = [
-    r"renata",
-    r"c[âa]mara",
-    r"pires",
-    r"belmont",
-    r"marta",
-    r"liane",
-    r"almeida",
-    r"ramalho",
-    r"loureiro",
-    r"lyra",
-    r"luciano",
-    r"aline",
-    r"carmen",
-    r"agra",
-    r"elvis",
-    r"sangelis",
-    r"marinheiro",
-    r"robson",
-    r"canan[eé]a",
-    r"jo[aã]o",
-    r"benedito",
-    r"m[áa]rcio",
-    r"murilo",
-    r"manoel",
-    r"xavier",
-]
-
-EMAIL_RE = re.compile(r"\b[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\b")
-CPF_RE = re.compile(r"\b\d{3}\.\d{3}\.\d{3}-\d{2}\b")
-CNPJ_RE = re.compile(r"\b\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}\b")
-PROC_JUD_RE = re.compile(r"\b\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}\b")
-PROC_ADMIN_RE = re.compile(r"\b\d{4}\.\d{3}\.\d{3}\b")
-DATE_RE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b")
-BIG_NUM_RE = re.compile(r"\b\d{5,}\b")
-
-
-def _run_pdftotext_layout(pdf_path: Path) -> str:
-    raw = subprocess.check_output(["pdftotext", "-layout", str(pdf_path), "-"], cwd=REPO_ROOT)
-    return raw.decode("utf-8", errors="ignore")
-
-
-def _replace_digits_keep_shape(text: str) -> str:
-    return re.sub(r"\d", "0", text)
-
-
-def _sanitize_label_line(s: str) -> str:
-    # Keep legal style, anonymize payload after labels (inline, not only line-start).
-    pairs = [
-        (r"(?i)\brequerente\s*:\s*[^;,.]+", "Requerente: Juízo da 0ª Vara da Comarca de CCCCCCCC"),
-        (r"(?i)\binteressad[oa]\s*:\s*[^;,.]+", "Interessada: PPPPP PPPPP PPPPP PPPPP - Perita Médica Neurologista"),
-        (r"(?i)\bpromovente\s*:\s*[^;,.]+", "Promovente: AAAAA AAAAAAA AAAAA AA"),
-        (r"(?i)\bpromovido\s*:\s*[^;,.]+", "Promovido: BBBBB BBBBBBB BBBBB BB"),
-        (r"(?i)\bautor(?:\(es\))?\s*:\s*[^;,.]+", "Autor(es): AAAAA AAAAAAA AAAAA AA"),
-        (r"(?i)\br[ée]u(?:\(s\))?\s*:\s*[^;,.]+", "Réu(s): BBBBB BBBBBBB BBBBB BB"),
-        (r"(?i)\bmovido por\b[^;,.]*", "movido por AAAAA AAAAAAA AAAAA AA"),
-        (r"(?i)\bem face de?\b[^;,.]*", "em face de BBBBB BBBBBBB BBBBB BB"),
-        (r"(?i)\bperante o ju[ií]zo\b[^;,.]*", "perante o Juízo da 0ª Vara da Comarca de CCCCCCCC."),
-        (r"(?i)\bem favor da perit[ao]\b[^;,.]*", "em favor da Perita Médica Neurologista PPPPP PPPPP PPPPP PPPPP,"),
-    ]
-    for pat, rep in pairs:
-        s = re.sub(pat, rep, s)
-    return s
-
-
-def sanitize_line(raw_line: str) -> str:
-    s = raw_line.rstrip("\n")
-    if not s.strip():
-        return ""
-
-    for pat, rep in EXPLICIT_REPLACEMENTS:
-        s = re.sub(pat, rep, s, flags=re.IGNORECASE)
-
-    s = _sanitize_label_line(s)
-
-    # Normalize sensitive structured data.
-    s = EMAIL_RE.sub("ppppp@ppppp.ppp", s)
-    s = CPF_RE.sub("000.000.000-00", s)
-    s = CNPJ_RE.sub("00.000.000/0000-00", s)
-    s = PROC_JUD_RE.sub("0000000-00.0000.0.00.0000", s)
-    s = PROC_ADMIN_RE.sub("0000.000.000", s)
-    s = DATE_RE.sub("00/00/0000", s)
-    s = BIG_NUM_RE.sub(lambda m: "0" * len(m.group(0)), s)
-
-    for tok in SENSITIVE_TOKEN_PATTERNS:
-        s = re.sub(rf"(?i)\b{tok}\b", "PPPPP", s)
-
-    # Keep process heading pattern stable.
-    s = re.sub(r"(?i)Processo\s*n[ºo]\s*[\d\.\-\/]+", "Processo nº 0000.000.000", s)
-    s = re.sub(r"(?i)Of[ií]cio\s*n[ºo]\s*[\d\.\-\/]+", "Ofício nº 00/0000", s)
-
-    # Final hard mask for any remaining digits.
-    s = _replace_digits_keep_shape(s)
-    s = re.sub(r"\s{2,}", " ", s).strip()
-    return s
-
-
-def render_pages_to_pdf(pages: list[str], out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    c = canvas.Canvas(str(out_path), pagesize=A4)
-    width, height = A4
-    _ = width
-    margin_x = 28
-    margin_top = 36
-    line_h = 11
-
-    for page_text in pages:
-        y = height - margin_top
-        c.setFont("Helvetica", 10)
-
-        for raw_line in page_text.splitlines():
-            line = sanitize_line(raw_line)
-            if line:
-                c.drawString(margin_x, y, line[:180])
-            y -= line_h
-            if y < 32:
-                c.showPage()
-                c.setFont("Helvetica", 10)
-                y = height - margin_top
-
-        c.showPage()
-
-    c.save()
-
 
 def iter_targets() -> Iterable[Path]:
     seen: set[Path] = set()
@@ -199,24 +54,96 @@ def iter_targets() -> Iterable[Path]:
             yield p
 
 
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def rules_hash(backend: str) -> str:
+    """Hash das regras de anonimizacao/renderizacao (este script + despacho_sanitizer + typed_pdf + backend de extracao); mudou, tudo e regenerado."""
+    here = Path(__file__).resolve()
+    parts = [here] + [here.parent / name for name in ("despacho_sanitizer.py", "typed_pdf.py")]
+    return _sha256_bytes(b"".join(part.read_bytes() for part in parts) + backend.encode("ascii"))
+
+
+def load_manifest(current_rules: str) -> dict[str, dict[str, str]]:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION or data.get("rules") != current_rules:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_manifest(current_rules: str, files: dict[str, dict[str, str]]) -> None:
+    payload = {"version": MANIFEST_VERSION, "rules": current_rules, "files": dict(sorted(files.items()))}
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(REPO_ROOT).as_posix()
+
+
+def generate_one(path_str: str, backend: str) -> tuple[str, str, str]:
+    """Tipa um PDF no lugar. Retorna (caminho, status, sha256 final); roda em processo do pool."""
+    path = Path(path_str)
+    data = render_pages_to_bytes(iter_pages(path, backend))
+    if path.read_bytes() == data:
+        return path_str, "same", _sha256_bytes(data)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return path_str, "typed", _sha256_bytes(data)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Gera modelos tipados (sem nomes/números reais).")
     parser.add_argument("--dry-run", action="store_true", help="Só lista arquivos alvo.")
+    parser.add_argument("--jobs", type=int, default=0, help="Processos em paralelo (0=número de CPUs).")
+    parser.add_argument("--force", action="store_true", help="Ignora o manifesto e regenera todos os arquivos.")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Extracao de texto: pdftotext (padrao, referencia das regras), pymupdf (no processo; quebras de linha diferentes) ou auto (pymupdf se instalado).",
+    )
     args = parser.parse_args()
 
+    backend = resolve_backend(args.backend)
     targets = list(iter_targets())
+    current_rules = rules_hash(backend)
+    manifest = {} if args.force else load_manifest(current_rules)
+
+    pending: list[Path] = []
+    for path in targets:
+        entry = manifest.get(_rel(path))
+        if entry and entry.get("sha256") == _sha256_bytes(path.read_bytes()):
+            continue
+        pending.append(path)
+
     if args.dry_run:
         for t in targets:
-            print(t)
+            print(f"{t} ({'pendente' if t in pending else 'inalterado'})")
         return
 
-    for path in targets:
-        text = _run_pdftotext_layout(path)
-        pages = text.split("\f")
-        if pages and not pages[-1].strip():
-            pages = pages[:-1]
-        render_pages_to_pdf(pages, path)
-        print(f"typed: {path}")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    jobs = max(1, min(jobs, len(pending) or 1))
+    # entradas de arquivos que nao existem mais saem do manifesto
+    files = {rel: entry for rel, entry in manifest.items() if (REPO_ROOT / rel).is_file()}
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as ex:
+            futs = {ex.submit(generate_one, str(p), backend): p for p in pending}
+            for fut in concurrent.futures.as_completed(futs):
+                path_str, status, digest = fut.result()
+                path = Path(path_str)
+                files[_rel(path)] = {"sha256": digest}
+                print(f"{status}: {path}")
+    finally:
+        save_manifest(current_rules, files)
+    print(f"typed: {len(pending)} processados, {len(targets) - len(pending)} inalterados (jobs={jobs}, backend={backend})")
 
 
 if __name__ == "__main__":
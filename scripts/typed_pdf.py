@@ -0,0 +1,145 @@
+"""Extracao pagina a pagina e renderizacao tipada em PDF.
+
+Compartilhado por generate_typed_despacho_models.py e anonymize_corpus.py.
+Backends de extracao (as paginas sao geradas sob demanda, cada pagina e desenhada
+assim que fecha, entao a memoria fica limitada a uma pagina de texto por documento):
+- pdftotext (padrao): `pdftotext -layout` lido em streaming do stdout; e a referencia
+  sobre a qual as regras de despacho_sanitizer foram ajustadas;
+- pymupdf: no proprio processo, sem subprocesso por arquivo (opcional: pip install pymupdf);
+  so quando pedido (pymupdf/auto). Cai no pdftotext se o MuPDF nao abrir o arquivo.
+Os backends NAO sao equivalentes: sanitize_line colapsa espacos dentro da linha, mas
+quebras e ordem das linhas mudam (get_text sort=True), o que muda o mascaramento de
+nomes partidos entre linhas e os bytes dos modelos tipados.
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from despacho_sanitizer import sanitize_line
+
+try:
+    import pymupdf
+except ImportError:  # versoes antigas expoem apenas o modulo fitz
+    try:
+        import fitz as pymupdf  # type: ignore[no-redef]
+    except ImportError:
+        pymupdf = None  # type: ignore[assignment]
+
+BACKENDS = ("pdftotext", "pymupdf", "auto")
+DEFAULT_BACKEND = "pdftotext"
+
+MARGIN_X = 28
+MARGIN_TOP = 36
+LINE_H = 11
+MAX_CHARS = 180
+
+LineSanitizer = Callable[[str], str]
+
+
+def iter_pdftotext_pages(pdf_path: Path) -> Iterator[str]:
+    """Texto de cada pagina (-layout), lido do stdout do pdftotext sem carregar o documento inteiro.
+
+    Mesmo recorte de ``text.split("\\f")``, descartando a ultima pagina se vazia.
+    """
+    proc = subprocess.Popen(
+        ["pdftotext", "-layout", str(pdf_path), "-"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    reader = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="ignore", newline="")
+    page: list[str] = []
+    try:
+        for line in reader:
+            parts = line.split("\f")
+            page.append(parts[0])
+            for part in parts[1:]:
+                yield "".join(page)
+                page = [part]
+    finally:
+        reader.close()
+        code = proc.wait()
+    if code != 0:
+        raise subprocess.CalledProcessError(code, ["pdftotext", "-layout", str(pdf_path), "-"])
+    last = "".join(page)
+    if last.strip():
+        yield last
+
+
+def resolve_backend(name: str) -> str:
+    """auto -> pymupdf quando instalado, senao pdftotext (o padrao dos scripts e pdftotext)."""
+    if name not in BACKENDS:
+        raise ValueError(f"backend invalido: {name} (use {', '.join(BACKENDS)})")
+    if name == "auto":
+        return "pymupdf" if pymupdf is not None else "pdftotext"
+    if name == "pymupdf" and pymupdf is None:
+        raise RuntimeError("backend pymupdf pedido, mas pymupdf nao esta instalado")
+    return name
+
+
+def iter_pages(pdf_path: Path, backend: str = DEFAULT_BACKEND) -> Iterator[str]:
+    """Paginas do PDF pelo backend escolhido; se o PyMuPDF nao abrir o arquivo, cai no pdftotext."""
+    backend = resolve_backend(backend)
+    if backend == "pymupdf":
+        try:
+            doc = pymupdf.open(str(pdf_path))
+        except Exception:  # arquivo que o MuPDF rejeita: tenta o poppler
+            yield from iter_pdftotext_pages(pdf_path)
+            return
+        with doc:
+            for page in doc:
+                yield page.get_text("text", sort=True)
+        return
+    yield from iter_pdftotext_pages(pdf_path)
+
+
+class TypedPdfRenderer:
+    """Desenha paginas de texto (Helvetica 10, A4) ja anonimizadas por linha.
+
+    invariant=1: sem data/ID aleatorio no PDF, mesma entrada gera os mesmos bytes.
+    """
+
+    def __init__(self, sanitizer: LineSanitizer = sanitize_line) -> None:
+        self.sanitizer = sanitizer
+        self._buf = io.BytesIO()
+        self._canvas = canvas.Canvas(self._buf, pagesize=A4, invariant=1)
+        self.pages = 0
+        self.lines = 0
+
+    def add_page(self, page_text: str) -> None:
+        c = self._canvas
+        height = A4[1]
+        y = height - MARGIN_TOP
+        c.setFont("Helvetica", 10)
+
+        for raw_line in page_text.splitlines():
+            line = self.sanitizer(raw_line)
+            self.lines += 1
+            if line:
+                c.drawString(MARGIN_X, y, line[:MAX_CHARS])
+            y -= LINE_H
+            if y < 32:
+                c.showPage()
+                c.setFont("Helvetica", 10)
+                y = height - MARGIN_TOP
+
+        c.showPage()
+        self.pages += 1
+
+    def finish(self) -> bytes:
+        self._canvas.save()
+        return self._buf.getvalue()
+
+
+def render_pages_to_bytes(pages: Iterable[str], sanitizer: LineSanitizer = sanitize_line) -> bytes:
+    renderer = TypedPdfRenderer(sanitizer)
+    for page_text in pages:
+        renderer.add_page(page_text)
+    return renderer.finish()
@@ -9,6 +9,7 @@ using Obj.Align;
 using YamlDotNet.Serialization;
 using YamlDotNet.Serialization.NamingConventions;
 using Obj.TjpbDespachoExtractor.Utils;
+using Obj.Utils;
 
 namespace Obj.Commands
 {
@@ -609,7 +610,7 @@ namespace Obj.Commands
         private static bool IsWord(string token)
         {
             if (string.IsNullOrWhiteSpace(token)) return false;
-            return Regex.IsMatch(token, "^\\p{L}+$");
+            return RegexCache.IsMatch(token, "^\\p{L}+$");
         }
 
         private static bool IsVeryShort(string token)
@@ -661,14 +662,24 @@ namespace Obj.Commands
                 Regex rx;
                 try
                 {
-                    rx = new Regex(pattern, RegexOptions.IgnoreCase | RegexOptions.Singleline);
+                    rx = RegexCache.GetBounded(pattern, RegexOptions.IgnoreCase | RegexOptions.Singleline);
                 }
                 catch
                 {
                     continue;
                 }
 
-                var m = rx.Match(text ?? "");
+                Match m;
+                try
+                {
+                    m = rx.Match(text ?? "");
+                }
+                catch (RegexMatchTimeoutException)
+                {
+                    // Padrao do YAML com backtracking patologico: pula a regra em vez de travar o mapfields.
+                    RegexCache.CountTimeout();
+                    continue;
+                }
                 if (!m.Success)
                     continue;
 
@@ -695,7 +706,7 @@ namespace Obj.Commands
 
             if (fieldName.StartsWith("PROCESSO_", StringComparison.OrdinalIgnoreCase))
             {
-                return Regex.Replace(trimmed, "\\s+", "");
+                return RegexCache.Replace(trimmed, "\\s+", "");
             }
 
             if (fieldName.Contains("CPF", StringComparison.OrdinalIgnoreCase))
@@ -719,8 +730,8 @@ namespace Obj.Commands
             if (fieldName.Equals("ESPECIALIDADE", StringComparison.OrdinalIgnoreCase))
             {
                 var norm = TextUtils.NormalizeWhitespace(trimmed);
-                norm = Regex.Replace(norm, "(?i)^perit[oa]\\s+", "");
-                norm = Regex.Replace(norm, "\\s*[-–]\\s*[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}.*$", "");
+                norm = RegexCache.Replace(norm, "(?i)^perit[oa]\\s+", "");
+                norm = RegexCache.Replace(norm, "\\s*[-–]\\s*[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}.*$", "");
                 norm = TextUtils.NormalizeWhitespace(norm);
                 if (string.Equals(norm, "perito", StringComparison.OrdinalIgnoreCase) ||
                     string.Equals(norm, "perita", StringComparison.OrdinalIgnoreCase) ||
@@ -733,12 +744,12 @@ namespace Obj.Commands
             if (fieldName.Equals("VARA", StringComparison.OrdinalIgnoreCase))
             {
                 var norm = TextUtils.NormalizeWhitespace(trimmed);
-                norm = Regex.Replace(norm, "(?<=[a-záâãàéêíóôõúç])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
-                norm = Regex.Replace(norm, "(?i)\\bjuiz\\s*ado\\b", "Juizado");
-                norm = Regex.Replace(norm, "(?i)\\bjuizad\\s*o\\b", "Juizado");
-                norm = Regex.Replace(norm, "(?i)\\bju[ií]zo\\s+do\\s+", "");
-                norm = Regex.Replace(norm, "(?i)\\bju[ií]zo\\s+da\\s+", "");
-                norm = Regex.Replace(norm, "(?i)\\bvara\\s*de\\b", "Vara de");
+                norm = RegexCache.Replace(norm, "(?<=[a-záâãàéêíóôõúç])(?=[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ])", " ");
+                norm = RegexCache.Replace(norm, "(?i)\\bjuiz\\s*ado\\b", "Juizado");
+                norm = RegexCache.Replace(norm, "(?i)\\bjuizad\\s*o\\b", "Juizado");
+                norm = RegexCache.Replace(norm, "(?i)\\bju[ií]zo\\s+do\\s+", "");
+                norm = RegexCache.Replace(norm, "(?i)\\bju[ií]zo\\s+da\\s+", "");
+                norm = RegexCache.Replace(norm, "(?i)\\bvara\\s*de\\b", "Vara de");
                 return TextUtils.NormalizeWhitespace(norm);
             }
 
@@ -751,15 +762,15 @@ namespace Obj.Commands
             if (string.IsNullOrWhiteSpace(norm))
                 return "";
 
-            norm = Regex.Replace(norm, "(?i)^(?:interessad[oa]\\s*:\\s*|perit[oa]\\s*[:\\-]?\\s*)", "");
+            norm = RegexCache.Replace(norm, "(?i)^(?:interessad[oa]\\s*:\\s*|perit[oa]\\s*[:\\-]?\\s*)", "");
             norm = TextUtils.NormalizeWhitespace(norm);
 
             var clipped = ClipPeritoAtNoise(norm);
             if (!string.IsNullOrWhiteSpace(clipped))
                 norm = clipped;
 
-            norm = Regex.Replace(norm, @"\s*[-–]\s*[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}.*$", "", RegexOptions.IgnoreCase);
-            norm = Regex.Replace(norm, "(?i)\\s*,\\s*(?:perit[oa]|m[eé]dic[oa]|engenheir[oa]|grafocopista|psiquiatr[ao]|contador(?:a)?|assistente\\s+t[eé]cnico).*$", "");
+            norm = RegexCache.Replace(norm, @"\s*[-–]\s*[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}.*$", "", RegexOptions.IgnoreCase);
+            norm = RegexCache.Replace(norm, "(?i)\\s*,\\s*(?:perit[oa]|m[eé]dic[oa]|engenheir[oa]|grafocopista|psiquiatr[ao]|contador(?:a)?|assistente\\s+t[eé]cnico).*$", "");
             norm = TextUtils.NormalizeWhitespace(norm).Trim(',', ';', '.', ':', '-', '–');
 
             var candidate = ExtractPeritoNameCandidate(norm);
@@ -819,7 +830,7 @@ namespace Obj.Commands
             if (string.IsNullOrWhiteSpace(value))
                 return false;
 
-            return Regex.IsMatch(
+            return RegexCache.IsMatch(
                 value,
                 "(?i)\\b(?:r\\$|processo|autos?|valor|honor[aá]rios|reserva|adiantamento|correspondente|movid[oa]|em\\s+face|tribunal|diretoria|comarca)\\b");
         }
@@ -829,7 +840,7 @@ namespace Obj.Commands
             if (string.IsNullOrWhiteSpace(value))
                 return "";
 
-            var matches = Regex.Matches(
+            var matches = RegexCache.Matches(
                 value,
                 "(?i)\\b(?:d(?:r|ra)\\.?\\s+)?[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ][A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ'`.-]+(?:\\s+(?:de|da|do|dos|das|e))?(?:\\s+[A-ZÁÂÃÀÉÊÍÓÔÕÚÇ][A-Za-zÁÂÃÀÉÊÍÓÔÕÚÇ'`.-]+){1,6}\\b");
 
@@ -851,7 +862,7 @@ namespace Obj.Commands
             if (string.IsNullOrWhiteSpace(candidate))
                 return true;
 
-            return Regex.IsMatch(candidate, "(?i)\\b(?:tribunal|justi[cç]a|diretoria|comarca|vara|ju[ií]zo|processo|conselho|documento|estado|para[ií]ba)\\b");
+            return RegexCache.IsMatch(candidate, "(?i)\\b(?:tribunal|justi[cç]a|diretoria|comarca|vara|ju[ií]zo|processo|conselho|documento|estado|para[ií]ba)\\b");
         }
 
         private static void ApplyDerivedFields(Dictionary<string, FieldOutput> output)
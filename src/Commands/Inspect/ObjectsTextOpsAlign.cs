@@ -1440,7 +1440,7 @@ namespace Obj.Commands
             Console.OutputEncoding = Encoding.UTF8;
             if (!ReturnUtils.IsEnabled())
                 PrintStage("iniciando o modo de detecção");
-            if (!ParseOptions(args, out var inputs, out var pageA, out var pageB, out var objA, out var objB, out var opFilter, out var backoff, out var outPath, out var outSpecified, out var top, out var minSim, out var band, out var minLenRatio, out var lenPenalty, out var anchorMinSim, out var anchorMinLenRatio, out var gapPenalty, out var showAlign, out var alignTop, out var pageAUser, out var pageBUser, out var objAUser, out var objBUser, out var docKey, out var useBack, out var sideSpecified, out var allowStack, out var probeEnabled, out var probeFile, out var probePage, out var probeSide, out var probeMaxFields, out var runFromStep, out var runToStep, out var stepOutputEcho, out var stepOutputSave, out var stepOutputDir, out var appliedAutoDefaults))
+            if (!ParseOptions(args, out var inputs, out var pageA, out var pageB, out var objA, out var objB, out var opFilter, out var backoff, out var outPath, out var outSpecified, out var top, out var minSim, out var band, out var minLenRatio, out var lenPenalty, out var anchorMinSim, out var anchorMinLenRatio, out var gapPenalty, out var showAlign, out var alignTop, out var pageAUser, out var pageBUser, out var objAUser, out var objBUser, out var docKey, out var useBack, out var sideSpecified, out var allowStack, out var probeEnabled, out var probeFile, out var probePage, out var probeSide, out var probeMaxFields, out var probeJsonTarget, out var runFromStep, out var runToStep, out var stepOutputEcho, out var stepOutputSave, out var stepOutputDir, out var appliedAutoDefaults))
             {
                 Environment.ExitCode = 2;
                 LastExitCode = 2;
@@ -1481,6 +1481,7 @@ namespace Obj.Commands
                     ("probe_page", probePage.ToString(CultureInfo.InvariantCulture)),
                     ("probe_target_pdf_side", string.IsNullOrWhiteSpace(probeSide) ? "(vazio)" : probeSide),
                     ("probe_max_fields", probeMaxFields.ToString(CultureInfo.InvariantCulture)),
+                    ("probe_json", string.IsNullOrWhiteSpace(probeJsonTarget) ? "(vazio)" : probeJsonTarget),
                     ("run_from", runFromStep.ToString(CultureInfo.InvariantCulture)),
                     ("run_to", runToStep.ToString(CultureInfo.InvariantCulture)),
                     ("step_output_dir", string.IsNullOrWhiteSpace(stepOutputDir) ? "(vazio)" : stepOutputDir),
@@ -2018,6 +2019,10 @@ namespace Obj.Commands
                     Console.WriteLine($"{sideLabelB}: p{localPageB} o{localObjB} ({sourceB})");
                 }
                 var stageOutputs = new List<Dictionary<string, object>>();
+                var targetStopwatch = System.Diagnostics.Stopwatch.StartNew();
+                StageTimer.Reset();
+                RegexCache.ResetCounters();
+                var stageTimingsMs = new Dictionary<string, double>(StringComparer.OrdinalIgnoreCase);
                 void EmitStage(int step, string status, IDictionary<string, object>? payload = null, string? stageKey = null, string? stageLabel = null)
                 {
                     var output = BuildStageOutput(step, status, payload, stageKey, stageLabel);
@@ -2059,6 +2064,7 @@ namespace Obj.Commands
                 }
                 if (!ReturnUtils.IsEnabled())
                     PrintStage($"iniciando o modo de alinhamento ({sideLabel})");
+                var alignStartedMs = targetStopwatch.Elapsed.TotalMilliseconds;
                 var report = ObjectsTextOpsDiff.ComputeAlignDebugForSelection(
                     aPath,
                     bPath,
@@ -2118,6 +2124,7 @@ namespace Obj.Commands
                 }
                 report.RoleA = roleA;
                 report.RoleB = roleB;
+                stageTimingsMs["align"] = targetStopwatch.Elapsed.TotalMilliseconds - alignStartedMs;
                 var anchorBridgeFile = ResolveAnchorBridgeFilePath();
                 var anchorBridgeLoaded = false;
                 var anchorBridgeApplied = false;
@@ -2248,11 +2255,13 @@ namespace Obj.Commands
                 }
 
                 Dictionary<string, object>? deferredProbePayload = null;
+                Dictionary<string, object>? probeRecordPayload = null;
                 if (runToStep >= 3)
                 {
                     if (!ReturnUtils.IsEnabled())
                         PrintStage("iniciando o modo de extração");
                     var reportForExtraction = outputMode == OutputMode.All ? report : processingReport;
+                    var extractionStartedMs = targetStopwatch.Elapsed.TotalMilliseconds;
                     report.Extraction = BuildExtractionPayload(
                         reportForExtraction,
                         backReport,
@@ -2267,6 +2276,7 @@ namespace Obj.Commands
                         {
                             EmitStage(step, status, payload, stageKey, ResolveStageLabel(step));
                         });
+                    stageTimingsMs["extraction"] = targetStopwatch.Elapsed.TotalMilliseconds - extractionStartedMs;
                 }
                 else
                 {
@@ -2313,12 +2323,14 @@ namespace Obj.Commands
                             );
                         }
 
+                        var probeStartedMs = targetStopwatch.Elapsed.TotalMilliseconds;
                         var probePayload = ExtractionProbeModule.Run(
                             effectiveProbeFile,
                             effectiveProbePage,
                             probeValues,
                             sideKey,
                             probeMaxFields);
+                        stageTimingsMs["probe"] = targetStopwatch.Elapsed.TotalMilliseconds - probeStartedMs;
 
                         var probeRawStatus = probePayload.TryGetValue("status", out var probeStatusObj) ? probeStatusObj?.ToString() ?? "" : "";
                         var probeStageStatus = string.Equals(probeRawStatus, "ok", StringComparison.OrdinalIgnoreCase) ? "ok" : "fail";
@@ -2332,12 +2344,14 @@ namespace Obj.Commands
 
                         AttachProbeToExtraction(report.Extraction, probePayload);
                         deferredProbePayload = probePayload;
+                        probeRecordPayload = probePayload;
                         EmitStage(7, probeStageStatus, new Dictionary<string, object>(probePayload, StringComparer.OrdinalIgnoreCase));
                     }
                     else
                     {
                         var skippedProbe = BuildSkippedModulePayload("Obj.RootProbe.ExtractionProbeModule", "probe_disabled");
                         AttachProbeToExtraction(report.Extraction, skippedProbe);
+                        probeRecordPayload = skippedProbe;
                         EmitStage(7, "skipped", new Dictionary<string, object>(skippedProbe, StringComparer.OrdinalIgnoreCase));
                     }
                 }
@@ -2345,8 +2359,16 @@ namespace Obj.Commands
                 {
                     var skippedProbe = BuildSkippedModulePayload("Obj.RootProbe.ExtractionProbeModule", $"run_limit_step_{runToStep}");
                     AttachProbeToExtraction(report.Extraction, skippedProbe);
+                    probeRecordPayload = skippedProbe;
                     EmitStage(7, "skipped", new Dictionary<string, object>(skippedProbe, StringComparer.OrdinalIgnoreCase));
                 }
+                if (!string.IsNullOrWhiteSpace(probeJsonTarget))
+                {
+                    stageTimingsMs["total"] = targetStopwatch.Elapsed.TotalMilliseconds;
+                    WriteProbeJsonRecord(
+                        probeJsonTarget,
+                        BuildProbeJsonRecord(outputMode, modelPdfPath, targetPdfPath, probeRecordPayload, report, stageTimingsMs));
+                }
                 var reportBaseA = Path.GetFileNameWithoutExtension(aPath);
                 var reportBaseB = Path.GetFileNameWithoutExtension(bPath);
                 var reportOutputPrefix = BuildDefaultOutputPrefix(reportBaseA, reportBaseB, outputMode, docKey, outputRunToken);
@@ -3120,6 +3142,7 @@ namespace Obj.Commands
             out string valueFullA,
             out string valueFullB)
         {
+            using var stage = StageTimer.Measure("field_mapping");
             var rangeA = ResolveRangeForParser(report.RangeA, report.Anchors, useSideA: true, report.BlocksA, report.Backoff);
             var rangeB = ResolveRangeForParser(report.RangeB, report.Anchors, useSideA: false, report.BlocksB, report.Backoff);
 
@@ -3566,10 +3589,12 @@ namespace Obj.Commands
                 return BuildExtractionResult(3, null, null, null, null, null);
             }
 
+            var honorariosStage = StageTimer.Measure("honorarios");
             HonorariosFacade.ApplyProfissaoAsEspecialidade(valuesA);
             HonorariosFacade.ApplyProfissaoAsEspecialidade(valuesB);
             var honorariosA = HonorariosFacade.ApplyBackfill(valuesA, outputDocType);
             var honorariosB = HonorariosFacade.ApplyBackfill(valuesB, outputDocType);
+            honorariosStage.Dispose();
             MarkModuleChanges(beforeHonorariosA, valuesA, fieldsA, "honorarios");
             MarkModuleChanges(beforeHonorariosB, valuesB, fieldsB, "honorarios");
 
@@ -3631,8 +3656,10 @@ namespace Obj.Commands
             var catalog = ValidatorFacade.GetPeritoCatalog(null);
             var beforeRepairA = new Dictionary<string, string>(valuesA, StringComparer.OrdinalIgnoreCase);
             var beforeRepairB = new Dictionary<string, string>(valuesB, StringComparer.OrdinalIgnoreCase);
+            var repairStage = StageTimer.Measure("repairer");
             var repairA = Obj.ValidationCore.ValidationRepairer.ApplyWithValidatorRules(valuesA, outputDocType, catalog);
             var repairB = Obj.ValidationCore.ValidationRepairer.ApplyWithValidatorRules(valuesB, outputDocType, catalog);
+            repairStage.Dispose();
             MarkModuleChanges(beforeRepairA, valuesA, fieldsA, "repairer");
             MarkModuleChanges(beforeRepairB, valuesB, fieldsB, "repairer");
             var repairReasonParts = new List<string>();
@@ -3907,6 +3934,135 @@ namespace Obj.Commands
             }
         }
 
+        private static readonly object ProbeJsonLock = new object();
+
+        private static Dictionary<string, object> BuildProbeJsonRecord(
+            OutputMode outputMode,
+            string modelPdfPath,
+            string targetPdfPath,
+            IDictionary<string, object>? probePayload,
+            ObjectsTextOpsDiff.AlignDebugReport report,
+            IDictionary<string, double> timingsMs)
+        {
+            object Get(string key, object fallback)
+                => probePayload != null && probePayload.TryGetValue(key, out var value) && value != null ? value : fallback;
+
+            var fields = new List<Dictionary<string, object>>();
+            if (probePayload != null && probePayload.TryGetValue("items", out var itemsObj) && itemsObj is List<Dictionary<string, object>> items)
+            {
+                foreach (var item in items)
+                {
+                    fields.Add(new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+                    {
+                        ["field"] = item.TryGetValue("field", out var fObj) ? fObj?.ToString() ?? "" : "",
+                        ["found"] = item.TryGetValue("found", out var ffObj) && ffObj is bool b && b,
+                        ["method"] = item.TryGetValue("method", out var mObj) ? mObj?.ToString() ?? "" : "",
+                        ["matches"] = item.TryGetValue("matches", out var mmObj) && mmObj != null ? mmObj : 0
+                    });
+                }
+            }
+
+            var helper = report.HelperDiagnostics;
+            var alignment = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+            {
+                ["pairs"] = report.Alignments.Count,
+                ["fixed"] = report.FixedPairs.Count,
+                ["variable"] = report.Alignments.Count(p => string.Equals(p.Kind, "variable", StringComparison.OrdinalIgnoreCase)),
+                ["gaps"] = report.Alignments.Count(p => p.Kind.StartsWith("gap", StringComparison.OrdinalIgnoreCase)),
+                ["helper_used"] = helper?.UsedInFinalAnchors ?? 0,
+                ["range_a"] = report.RangeA?.HasValue == true ? $"op{report.RangeA.StartOp}-op{report.RangeA.EndOp}" : "",
+                ["range_b"] = report.RangeB?.HasValue == true ? $"op{report.RangeB.StartOp}-op{report.RangeB.EndOp}" : ""
+            };
+
+            var validator = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+            {
+                ["status"] = "",
+                ["ok"] = false,
+                ["reason"] = ""
+            };
+            if (report.Extraction is IDictionary<string, object> extraction &&
+                extraction.TryGetValue("validator", out var validatorObj) &&
+                validatorObj is IDictionary<string, object> validatorPayload)
+            {
+                validator["status"] = validatorPayload.TryGetValue("status", out var vsObj) ? vsObj?.ToString() ?? "" : "";
+                validator["ok"] = validatorPayload.TryGetValue("ok", out var vOkObj) && vOkObj is bool vOk && vOk;
+                validator["reason"] = validatorPayload.TryGetValue("reason", out var vrObj) ? vrObj?.ToString() ?? "" : "";
+            }
+
+            return new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase)
+            {
+                ["event"] = "probe",
+                ["output_mode"] = outputMode.ToString(),
+                ["run_step"] = Environment.GetEnvironmentVariable("OBJ_TEXTOPSALIGN_RUN_STEP") ?? "",
+                ["model"] = modelPdfPath ?? "",
+                ["target"] = targetPdfPath ?? "",
+                ["status"] = Get("status", "").ToString() ?? "",
+                ["reason"] = Get("reason", "").ToString() ?? "",
+                ["file"] = Path.GetFileName(Get("pdf", "").ToString() ?? ""),
+                ["side"] = Get("side", "").ToString() ?? "",
+                ["page"] = Get("page", 0),
+                ["found"] = Get("found", 0),
+                ["checked"] = Get("fields_checked", 0),
+                ["missing"] = Get("missing", 0),
+                ["fields_total"] = Get("fields_total", 0),
+                ["skipped_non_textual"] = Get("skipped_non_textual_count", 0),
+                ["fields"] = fields,
+                ["alignment"] = alignment,
+                ["validator"] = validator,
+                ["timings_ms"] = timingsMs,
+                ["stages_ms"] = StageTimer.Snapshot(),
+                ["memory"] = StageTimer.MemorySnapshot(),
+                ["regex"] = RegexCache.Snapshot()
+            };
+        }
+
+        // Destino do --probe-json: "-"/"stdout", "stderr", "fd:N" (descritor herdado) ou caminho de arquivo (append, JSON-lines).
+        private static void WriteProbeJsonRecord(string target, Dictionary<string, object> record)
+        {
+            var line = JsonSerializer.Serialize(record, new JsonSerializerOptions
+            {
+                Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+            });
+            var t = (target ?? "").Trim();
+            try
+            {
+                lock (ProbeJsonLock)
+                {
+                    if (t == "-" || t.Equals("stdout", StringComparison.OrdinalIgnoreCase))
+                    {
+                        Console.Out.WriteLine(line);
+                        Console.Out.Flush();
+                        return;
+                    }
+                    if (t.Equals("stderr", StringComparison.OrdinalIgnoreCase))
+                    {
+                        Console.Error.WriteLine(line);
+                        return;
+                    }
+                    if (t.StartsWith("fd:", StringComparison.OrdinalIgnoreCase) &&
+                        int.TryParse(t.Substring(3), NumberStyles.Integer, CultureInfo.InvariantCulture, out var fd) &&
+                        fd > 2)
+                    {
+                        using var handle = new Microsoft.Win32.SafeHandles.SafeFileHandle((IntPtr)fd, ownsHandle: false);
+                        using var stream = new FileStream(handle, FileAccess.Write);
+                        var bytes = new UTF8Encoding(encoderShouldEmitUTF8Identifier: false).GetBytes(line + "\n");
+                        stream.Write(bytes, 0, bytes.Length);
+                        stream.Flush();
+                        return;
+                    }
+
+                    var dir = Path.GetDirectoryName(Path.GetFullPath(t));
+                    if (!string.IsNullOrWhiteSpace(dir))
+                        Directory.CreateDirectory(dir);
+                    File.AppendAllText(t, line + "\n", new UTF8Encoding(encoderShouldEmitUTF8Identifier: false));
+                }
+            }
+            catch (Exception ex)
+            {
+                Console.Error.WriteLine($"[PROBE-JSON] falha ao gravar em {t}: {ex.Message}");
+            }
+        }
+
         private static void PrintProbeSummary(Dictionary<string, object> probePayload)
         {
             if (probePayload == null)
@@ -4911,6 +5067,7 @@ namespace Obj.Commands
             ref int probePage,
             ref string probeSide,
             ref int probeMaxFields,
+            ref string probeJsonTarget,
             ref int runFromStep,
             ref int runToStep,
             ref bool stepOutputEcho,
@@ -5076,6 +5233,13 @@ namespace Obj.Commands
                 probeEnabled = true;
                 applied.Add($"OBJ_TEXTOPSALIGN_PROBE_MAX_FIELDS -> probe_max_fields={probeMaxFields.ToString(CultureInfo.InvariantCulture)} probe_enabled=true");
             }
+            var envProbeJson = Environment.GetEnvironmentVariable("OBJ_TEXTOPSALIGN_PROBE_JSON");
+            if (!string.IsNullOrWhiteSpace(envProbeJson))
+            {
+                probeJsonTarget = envProbeJson.Trim();
+                probeEnabled = true;
+                applied.Add($"OBJ_TEXTOPSALIGN_PROBE_JSON -> probe_json={probeJsonTarget} probe_enabled=true");
+            }
 
             var envRun = Environment.GetEnvironmentVariable("OBJ_TEXTOPSALIGN_RUN");
             if (!string.IsNullOrWhiteSpace(envRun) && TryParseRunRange(envRun, out var envFrom, out var envTo))
@@ -5138,6 +5302,7 @@ namespace Obj.Commands
             out int probePage,
             out string probeSide,
             out int probeMaxFields,
+            out string probeJsonTarget,
             out int runFromStep,
             out int runToStep,
             out bool stepOutputEcho,
@@ -5177,6 +5342,7 @@ namespace Obj.Commands
             probePage = 0;
             probeSide = "b";
             probeMaxFields = 0;
+            probeJsonTarget = "";
             runFromStep = PipelineFirstStep;
             runToStep = PipelineLastStep;
             stepOutputEcho = false;
@@ -5224,6 +5390,7 @@ namespace Obj.Commands
                 ref probePage,
                 ref probeSide,
                 ref probeMaxFields,
+                ref probeJsonTarget,
                 ref runFromStep,
                 ref runToStep,
                 ref stepOutputEcho,
@@ -5551,6 +5718,21 @@ namespace Obj.Commands
                     probeMaxFields = Math.Max(0, probeMaxFields);
                     continue;
                 }
+                if (string.Equals(arg, "--probe-json", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
+                {
+                    probeEnabled = true;
+                    probeConfiguredByCli = true;
+                    probeJsonTarget = (args[++i] ?? "").Trim().Trim('"');
+                    continue;
+                }
+                if (arg.StartsWith("--probe-json=", StringComparison.OrdinalIgnoreCase))
+                {
+                    probeEnabled = true;
+                    probeConfiguredByCli = true;
+                    var split = arg.Split('=', 2);
+                    probeJsonTarget = split.Length == 2 ? split[1].Trim().Trim('"') : "";
+                    continue;
+                }
                 if (string.Equals(arg, "--no-probe", StringComparison.OrdinalIgnoreCase))
                 {
                     probeEnabled = false;
@@ -5583,13 +5765,14 @@ namespace Obj.Commands
 
         private static void ShowHelp()
         {
-            Console.WriteLine("operpdf inspect textopsalign|textopsvar|textopsfixed <pdfA> <pdfB|pdfC|...> [--inputs a.pdf,b.pdf] [--doc tjpb_despacho] [--front|--back|--side front|back] [--pageA N] [--pageB N] [--objA N] [--objB N] [--ops Tj,TJ] [--backoff N] [--min-sim N] [--band N|--max-shift N] [--min-len-ratio N] [--len-penalty N] [--anchor-sim N] [--anchor-len N] [--top N] [--log[=N]] [--alinhamento-detalhe] [--alinhamento-top N] [--sem-alinhamento] [--out file] [--run N|N-M] [--step-output echo|save|both|none] [--step-echo] [--step-save] [--steps-dir dir] [--probe[ file.pdf] --probe-page N --probe-side a|b --probe-max-fields N] [--no-probe]");
+            Console.WriteLine("operpdf inspect textopsalign|textopsvar|textopsfixed <pdfA> <pdfB|pdfC|...> [--inputs a.pdf,b.pdf] [--doc tjpb_despacho] [--front|--back|--side front|back] [--pageA N] [--pageB N] [--objA N] [--objB N] [--ops Tj,TJ] [--backoff N] [--min-sim N] [--band N|--max-shift N] [--min-len-ratio N] [--len-penalty N] [--anchor-sim N] [--anchor-len N] [--top N] [--log[=N]] [--alinhamento-detalhe] [--alinhamento-top N] [--sem-alinhamento] [--out file] [--run N|N-M] [--step-output echo|save|both|none] [--step-echo] [--step-save] [--steps-dir dir] [--probe[ file.pdf] --probe-page N --probe-side a|b --probe-max-fields N] [--probe-json -|fd:N|arquivo.jsonl] [--no-probe]");
             Console.WriteLine("  --top N    = limite dos quadros resumo (TOP VARIAVEIS/TOP FIXOS/ALINHAMENTO HUMANO)");
             Console.WriteLine("  --log[=N]  = lista ALINHAMENTO detalhada; N linhas (0 = todas).");
             Console.WriteLine("  padrão     = saída compacta (ALINHAMENTO -> CAMPOS + RESULTADO FINAL).");
             Console.WriteLine($"  gap penalty: fixo interno ({ReportUtils.F(FixedGapPenalty, 2)}). --gap não é aceito.");
             Console.WriteLine("atalho: run N-M (sem --), ex.: textopsalign-despacho run 1-4 --inputs @M-DESP --inputs :Q22");
             Console.WriteLine("run/--run com etapa >=7 ativa probe automaticamente (use --no-probe para desativar).");
+            Console.WriteLine("--probe-json grava um registro JSON por arquivo/lado (found/checked/missing, campos, alinhamento, validator, tempos por etapa em stages_ms, memoria em memory); env OBJ_TEXTOPSALIGN_PROBE_JSON.");
             Console.WriteLine("aliases de modelo por tipo: @M-DES/@M-DESP (despacho), @M-CER (certidao), @M-REQ (requerimento). Modo estrito: somente OBJPDF_ALIAS_M_DES_DIR / OBJPDF_ALIAS_M_CER_DIR / OBJPDF_ALIAS_M_REQ_DIR (sem fallback).");
             Console.WriteLine("env: OBJ_TEXTOPSALIGN_* (defaults), ex.: OBJ_TEXTOPSALIGN_MIN_SIM=0.15 OBJ_TEXTOPSALIGN_PROBE=1 OBJ_TEXTOPSALIGN_RUN=1-4");
             Console.WriteLine("obs: OBJ_TEXTOPSALIGN_INPUTS não é suportado e aborta a execução; use sempre --inputs explícito (aliases :D/:Q/@M-*).");
@@ -2888,34 +2888,27 @@ namespace Obj.Commands
                 return;
             }
 
-            var tokens = TokenizeContent(bytes);
+            var ops = ObjectsTextOpsDiff.ReadContentOps(bytes, Operators);
             var textQueue = new Queue<string>(PdfTextExtraction.CollectTextOperatorTexts(found.Stream, found.Resources));
             var operands = new List<string>();
             var rawOps = new List<(int OpIndex, string Raw, string Decoded)>();
             var rawText = new StringBuilder();
 
             int opIndex = 0;
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
+                opIndex++;
+                if (!IsTextShowingOperator(tok))
                     continue;
-                }
 
-                opIndex++;
+                ops.CopyOperands(operands);
                 var rawLine = operands.Count > 0 ? $"{string.Join(" ", operands)} {tok}" : tok;
-                var decoded = "";
-                if (IsTextShowingOperator(tok))
-                    decoded = DequeueDecodedText(tok, operands, textQueue);
-
-                if (IsTextShowingOperator(tok) && InRange(opIndex, options.OpRangeStart, options.OpRangeEnd))
+                var decoded = DequeueDecodedText(tok, operands, textQueue);
+                if (InRange(opIndex, options.OpRangeStart, options.OpRangeEnd))
                 {
                     rawOps.Add((opIndex, rawLine, decoded));
                     rawText.Append(decoded);
                 }
-
-                operands.Clear();
             }
 
             Console.WriteLine($"PDF: {Path.GetFileName(options.Input)}");
@@ -2971,29 +2964,22 @@ namespace Obj.Commands
                 return;
             }
 
-            var tokens = TokenizeContent(bytes);
+            var ops = ObjectsTextOpsDiff.ReadContentOps(bytes, Operators);
             var textQueue = new Queue<string>(PdfTextExtraction.CollectTextOperatorTexts(found.Stream, found.Resources));
             var operands = new List<string>();
             var rawOps = new List<(int OpIndex, string Decoded)>();
 
             int opIndex = 0;
-            foreach (var tok in tokens)
+            while (ops.Next(out var tok))
             {
-                if (!IsOperatorToken(tok))
-                {
-                    operands.Add(tok);
-                    continue;
-                }
-
                 opIndex++;
-                var decoded = "";
-                if (IsTextShowingOperator(tok))
-                    decoded = DequeueDecodedText(tok, operands, textQueue);
+                if (!IsTextShowingOperator(tok))
+                    continue;
 
-                if (IsTextShowingOperator(tok) && InRange(opIndex, options.OpRangeStart, options.OpRangeEnd))
+                ops.CopyOperands(operands);
+                var decoded = DequeueDecodedText(tok, operands, textQueue);
+                if (InRange(opIndex, options.OpRangeStart, options.OpRangeEnd))
                     rawOps.Add((opIndex, decoded));
-
-                operands.Clear();
             }
 
             var ones = rawOps.Where(t => t.Decoded.Length == 1 && !char.IsWhiteSpace(t.Decoded[0])).ToList();
@@ -12099,78 +12085,6 @@ namespace Obj.Commands
             return op == "Tj" || op == "TJ" || op == "'" || op == "\"";
         }
 
-        private static List<string> TokenizeContent(byte[] bytes)
-        {
-            var tokens = new List<string>();
-            int i = 0;
-            while (i < bytes.Length)
-            {
-                char c = (char)bytes[i];
-                if (IsWhite(c))
-                {
-                    i++;
-                    continue;
-                }
-                if (c == '%')
-                {
-                    i = SkipToEol(bytes, i);
-                    continue;
-                }
-                if (c == '(')
-                {
-                    tokens.Add(ReadLiteralString(bytes, ref i));
-                    continue;
-                }
-                if (c == '<')
-                {
-                    if (i + 1 < bytes.Length && bytes[i + 1] == '<')
-                    {
-                        tokens.Add(ReadBalanced(bytes, ref i, "<<", ">>"));
-                        continue;
-                    }
-                    tokens.Add(ReadHexString(bytes, ref i));
-                    continue;
-                }
-                if (c == '[')
-                {
-                    tokens.Add(ReadArray(bytes, ref i));
-                    continue;
-                }
-                if (c == '/')
-                {
-                    tokens.Add(ReadName(bytes, ref i));
-                    continue;
-                }
-                tokens.Add(ReadToken(bytes, ref i));
-            }
-            return tokens;
-        }
-
-        private static string ReadToken(byte[] bytes, ref int i)
-        {
-            int start = i;
-            while (i < bytes.Length)
-            {
-                char c = (char)bytes[i];
-                if (IsWhite(c) || IsDelimiter(c)) break;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadName(byte[] bytes, ref int i)
-        {
-            int start = i;
-            i++; // skip '/'
-            while (i < bytes.Length)
-            {
-                char c = (char)bytes[i];
-                if (IsWhite(c) || IsDelimiter(c)) break;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
         private static string ExtractArrayToken(string operands)
         {
             if (string.IsNullOrWhiteSpace(operands)) return "";
@@ -12235,82 +12149,6 @@ namespace Obj.Commands
             return text.Substring(start, i - start);
         }
 
-        private static string ReadLiteralString(byte[] bytes, ref int i)
-        {
-            int start = i;
-            i++; // '('
-            int depth = 1;
-            while (i < bytes.Length && depth > 0)
-            {
-                byte b = bytes[i++];
-                if (b == '\\')
-                {
-                    if (i < bytes.Length) i++;
-                    continue;
-                }
-                if (b == '(') depth++;
-                else if (b == ')') depth--;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadHexString(byte[] bytes, ref int i)
-        {
-            int start = i;
-            i++; // '<'
-            while (i < bytes.Length && bytes[i] != '>')
-                i++;
-            if (i < bytes.Length) i++;
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadBalanced(byte[] bytes, ref int i, string startToken, string endToken)
-        {
-            int start = i;
-            i += startToken.Length;
-            int depth = 1;
-            while (i < bytes.Length && depth > 0)
-            {
-                if (Match(bytes, i, startToken))
-                {
-                    depth++;
-                    i += startToken.Length;
-                    continue;
-                }
-                if (Match(bytes, i, endToken))
-                {
-                    depth--;
-                    i += endToken.Length;
-                    continue;
-                }
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static string ReadArray(byte[] bytes, ref int i)
-        {
-            int start = i;
-            i++; // '['
-            int depth = 1;
-            while (i < bytes.Length && depth > 0)
-            {
-                byte b = bytes[i];
-                if (b == '[') depth++;
-                else if (b == ']') depth--;
-                i++;
-            }
-            return Encoding.GetEncoding("ISO-8859-1").GetString(bytes, start, i - start);
-        }
-
-        private static bool Match(byte[] bytes, int idx, string token)
-        {
-            if (idx + token.Length > bytes.Length) return false;
-            for (int j = 0; j < token.Length; j++)
-                if (bytes[idx + j] != token[j]) return false;
-            return true;
-        }
-
         private static string Colorize(string text, string colorCode)
         {
             if (Console.IsOutputRedirected)
@@ -12519,31 +12357,6 @@ namespace Obj.Commands
             return patternsPath;
         }
 
-        private static int SkipToEol(byte[] bytes, int i)
-        {
-            while (i < bytes.Length)
-            {
-                byte b = bytes[i++];
-                if (b == '\n' || b == '\r') break;
-            }
-            return i;
-        }
-
-        private static bool IsWhite(char c)
-        {
-            return c == ' ' || c == '\t' || c == '\n' || c == '\r' || c == '\f';
-        }
-
-        private static bool IsDelimiter(char c)
-        {
-            return c == '(' || c == ')' || c == '<' || c == '>' || c == '[' || c == ']' || c == '{' || c == '}' || c == '/' || c == '%';
-        }
-
-        private static bool IsOperatorToken(string token)
-        {
-            return Operators.Contains(token);
-        }
-
         private static readonly HashSet<string> Operators = new HashSet<string>
         {
             "q","Q","cm","w","J","j","M","d","ri","i","gs",
@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
+import gzip
 import json
+import math
 import os
+import queue
+import random
 import re
+import statistics
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+TARGET_RANGE_RE = re.compile(r"^:([A-Za-z])(\d+)-(\d+)$")
 DEFAULT_MODES = [
     "textopsalign-despacho",
     "textopsvar-despacho",
@@ -32,71 +41,275 @@ class RunMetrics:
     probe_found: Optional[int] = None
     probe_total: Optional[int] = None
     probe_missing: Optional[int] = None
+    probe_fields: Optional[Dict[str, bool]] = None
 
 
 @dataclass
 class RunResult:
+    target: str
     model_label: str
     model_path: str
     mode: str
     exit_code: int
     log_path: str
     metrics: RunMetrics
+    duration_ms: float = 0.0
 
 
 def strip_ansi(text: str) -> str:
     return ANSI_RE.sub("", text or "")
 
 
-def parse_int(text: str, pattern: str) -> Optional[int]:
-    match = re.search(pattern, text, re.MULTILINE)
-    if not match:
-        return None
-    try:
-        return int(match.group(1))
-    except ValueError:
-        return None
+class MetricsParser:
+    """Parser incremental das metricas de console: recebe uma linha por vez, memoria constante.
 
+    Cada metrica fica com a primeira ocorrencia, como no parse do log inteiro.
+    """
 
-def parse_str(text: str, pattern: str) -> Optional[str]:
-    match = re.search(pattern, text, re.MULTILINE)
-    if not match:
-        return None
-    value = match.group(1).strip()
-    return value if value else None
+    INT_PATTERNS = [
+        ("pairs", re.compile(r"^\s*pairs:\s*(\d+)\s*$")),
+        ("fixed", re.compile(r"^\s*fixed:\s*(\d+)\s*$")),
+        ("variable", re.compile(r"^\s*variable:\s*(\d+)\s*$")),
+        ("gaps", re.compile(r"^\s*gaps:\s*(\d+)\s*$")),
+        ("helper_camel", re.compile(r"^\s*helperUsed:\s*(\d+)\s*$")),
+        ("helper_snake", re.compile(r"^\s*helper_used:\s*(\d+)\s*$")),
+    ]
+    STR_PATTERNS = [
+        ("range_a", re.compile(r"^\s*rangeA:\s*(.+?)\s*$")),
+        ("range_b", re.compile(r"^\s*rangeB:\s*(.+?)\s*$")),
+    ]
+    VALIDATOR_RE = re.compile(r'^\[VALIDATOR\]\s+(true|false)(?:\s+reason="([^"]*)")?')
+    PROBE_RE = re.compile(r"^\[PROBE\]\s+\w+.*found=(\d+)/(\d+)\s+missing=(\d+)")
+
+    def __init__(self) -> None:
+        self._values: Dict[str, object] = {}
+        self._validator: Optional[Tuple[bool, Optional[str]]] = None
+        self._probe: Optional[Tuple[int, int, int]] = None
+
+    def feed(self, raw_line: str) -> None:
+        line = strip_ansi(raw_line).rstrip("\r\n")
+        for name, pattern in self.INT_PATTERNS:
+            if name not in self._values:
+                match = pattern.match(line)
+                if match:
+                    self._values[name] = int(match.group(1))
+        for name, pattern in self.STR_PATTERNS:
+            if name not in self._values:
+                match = pattern.match(line)
+                if match and match.group(1).strip():
+                    self._values[name] = match.group(1).strip()
+        if self._validator is None:
+            match = self.VALIDATOR_RE.match(line)
+            if match:
+                self._validator = (match.group(1).lower() == "true", (match.group(2) or "").strip() or None)
+        if self._probe is None:
+            match = self.PROBE_RE.match(line)
+            if match:
+                self._probe = (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    def result(self) -> RunMetrics:
+        metrics = RunMetrics()
+        metrics.pairs = self._values.get("pairs")
+        metrics.fixed = self._values.get("fixed")
+        metrics.variable = self._values.get("variable")
+        metrics.gaps = self._values.get("gaps")
+        metrics.helper_used = self._values.get("helper_camel", self._values.get("helper_snake"))
+        metrics.range_a = self._values.get("range_a")
+        metrics.range_b = self._values.get("range_b")
+        if self._validator is not None:
+            metrics.validator_ok, metrics.validator_reason = self._validator
+        if self._probe is not None:
+            metrics.probe_found, metrics.probe_total, metrics.probe_missing = self._probe
+        return metrics
 
 
 def parse_metrics(raw_output: str) -> RunMetrics:
-    text = strip_ansi(raw_output)
-    metrics = RunMetrics()
-    metrics.pairs = parse_int(text, r"^\s*pairs:\s*(\d+)\s*$")
-    metrics.fixed = parse_int(text, r"^\s*fixed:\s*(\d+)\s*$")
-    metrics.variable = parse_int(text, r"^\s*variable:\s*(\d+)\s*$")
-    metrics.gaps = parse_int(text, r"^\s*gaps:\s*(\d+)\s*$")
-    metrics.helper_used = parse_int(text, r"^\s*helperUsed:\s*(\d+)\s*$")
-    if metrics.helper_used is None:
-        metrics.helper_used = parse_int(text, r"^\s*helper_used:\s*(\d+)\s*$")
-    metrics.range_a = parse_str(text, r"^\s*rangeA:\s*(.+?)\s*$")
-    metrics.range_b = parse_str(text, r"^\s*rangeB:\s*(.+?)\s*$")
-
-    validator = re.search(r'^\[VALIDATOR\]\s+(true|false)(?:\s+reason="([^"]*)")?', text, re.MULTILINE)
-    if validator:
-        metrics.validator_ok = validator.group(1).lower() == "true"
-        metrics.validator_reason = (validator.group(2) or "").strip() or None
-
-    probe = re.search(r"^\[PROBE\]\s+\w+.*found=(\d+)/(\d+)\s+missing=(\d+)", text, re.MULTILINE)
-    if probe:
-        metrics.probe_found = int(probe.group(1))
-        metrics.probe_total = int(probe.group(2))
-        metrics.probe_missing = int(probe.group(3))
+    parser = MetricsParser()
+    for line in (raw_output or "").splitlines():
+        parser.feed(line)
+    return parser.result()
+
 
+def open_log(path: Path, compress: bool) -> TextIO:
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", errors="replace")
+    return path.open("w", encoding="utf-8", errors="replace")
+
+
+def metrics_from_probe_record(record: Dict[str, object]) -> RunMetrics:
+    alignment = record.get("alignment")
+    validator = record.get("validator")
+    if not isinstance(alignment, dict):
+        alignment = {}
+    if not isinstance(validator, dict):
+        validator = {}
+    metrics = RunMetrics()
+    metrics.pairs = alignment.get("pairs")
+    metrics.fixed = alignment.get("fixed")
+    metrics.variable = alignment.get("variable")
+    metrics.gaps = alignment.get("gaps")
+    metrics.helper_used = alignment.get("helper_used")
+    metrics.range_a = alignment.get("range_a") or None
+    metrics.range_b = alignment.get("range_b") or None
+    if str(validator.get("status") or "").lower() not in ("", "skipped"):
+        metrics.validator_ok = bool(validator.get("ok"))
+        metrics.validator_reason = str(validator.get("reason") or "").strip() or None
+    if str(record.get("status") or "").lower() != "skipped":
+        metrics.probe_found = record.get("found")
+        metrics.probe_total = record.get("checked")
+        metrics.probe_missing = record.get("missing")
+        fields = record.get("fields")
+        if isinstance(fields, list):
+            metrics.probe_fields = {
+                str(f.get("field")): bool(f.get("found")) for f in fields if isinstance(f, dict) and f.get("field")
+            }
     return metrics
 
 
+def read_probe_record(path: Path) -> Optional[Dict[str, object]]:
+    if not path.exists():
+        return None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
 def safe_name(raw: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_.-]+", "_", raw)
 
 
+def expand_targets(raw_values: List[str]) -> List[str]:
+    """Aceita `:Q22`, listas `:Q1,:Q5` e intervalos `:Q1-200` (um alvo por indice)."""
+    targets: List[str] = []
+    for raw in raw_values:
+        for item in (v.strip() for v in raw.split(",")):
+            if not item:
+                continue
+            match = TARGET_RANGE_RE.match(item)
+            if match:
+                key = match.group(1).upper()
+                start, end = int(match.group(2)), int(match.group(3))
+                step = 1 if end >= start else -1
+                targets.extend(f":{key}{i}" for i in range(start, end + step, step))
+            else:
+                targets.append(item)
+    seen = set()
+    return [t for t in targets if not (t in seen or seen.add(t))]
+
+
+class WorkerClient:
+    """`operpdf worker` persistente: os modos/modelos de um mesmo alvo reaproveitam o cache de tokens do processo.
+
+    Worker que morre (pipe quebrado, EOF) ou passa de `timeout` segundos numa requisicao e morto e
+    reiniciado: so aquele caso falha e a proxima requisicao ja vai para o processo novo.
+    """
+
+    def __init__(self, binary: str, timeout: float = 0.0) -> None:
+        self.binary = binary
+        self.timeout = timeout if timeout > 0 else None
+        self.restarts = 0
+        self._next_id = 0
+        self._start()
+
+    def _start(self) -> None:
+        self.proc = subprocess.Popen(
+            [self.binary, "worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        # leitor em thread: o stdout vira uma fila, e a espera por resposta pode ter timeout
+        self._messages: "queue.Queue[Optional[Dict[str, object]]]" = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc, self._messages), daemon=True).start()
+        ready = self._read(self.timeout)
+        if not ready or ready.get("event") != "ready":
+            self._kill()
+            raise RuntimeError("worker nao respondeu")
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, messages: "queue.Queue[Optional[Dict[str, object]]]") -> None:
+        assert proc.stdout is not None
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    messages.put(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        messages.put(None)
+
+    def _read(self, timeout: Optional[float]) -> Optional[Dict[str, object]]:
+        """Proxima mensagem; None no EOF. queue.Empty quando passa do timeout."""
+        return self._messages.get(timeout=timeout)
+
+    def _kill(self) -> None:
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def _restart(self) -> None:
+        self._kill()
+        self.restarts += 1
+        try:
+            self._start()
+        except (RuntimeError, OSError):
+            pass  # a proxima requisicao encontra o processo morto e tenta de novo
+
+    def run(self, args: List[str], log_path: Path) -> Tuple[int, str]:
+        """Executa o comando; o proprio worker grava o console em `log_path` (nada volta pelo pipe).
+
+        Devolve (exit_code, erro do protocolo ou "")."""
+        if self.proc.poll() is not None:
+            self._restart()
+        self._next_id += 1
+        request = {"id": self._next_id, "args": args, "capture": False, "log": str(log_path)}
+        try:
+            assert self.proc.stdin is not None
+            self.proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as ex:
+            self._restart()
+            return 1, f"worker caiu antes da requisicao ({type(ex).__name__}); reiniciado"
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        while True:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            try:
+                msg = self._read(remaining)
+            except queue.Empty:
+                self._restart()
+                return 124, f"timeout de {self.timeout:.0f}s; worker reiniciado"
+            if msg is None:
+                self._restart()
+                return 1, "worker encerrou sem resposta; reiniciado"
+            if msg.get("id") == self._next_id:
+                break
+        return int(msg.get("exit_code", 1)), str(msg.get("error") or "")
+
+    def close(self) -> None:
+        try:
+            if self.proc.poll() is None and self.proc.stdin is not None:
+                self.proc.stdin.write(json.dumps({"cmd": "shutdown"}) + "\n")
+                self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except (BrokenPipeError, OSError, ValueError, subprocess.TimeoutExpired):
+            self.proc.kill()
+
+
 def run_case(
     binary: str,
     mode: str,
@@ -105,23 +318,68 @@ def run_case(
     model_label: str,
     work_dir: Path,
     extra_args: List[str],
+    worker: Optional[WorkerClient] = None,
+    gzip_logs: bool = False,
 ) -> RunResult:
-    cmd = [binary, mode, "--inputs", model_path, "--inputs", target_input, "--probe"]
-    cmd.extend(extra_args)
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    output = proc.stdout or ""
+    case_name = f"{safe_name(target_input)}__{safe_name(mode)}__{model_label}"
+    log_path = work_dir / f"{case_name}.log{'.gz' if gzip_logs else ''}"
+    probe_path = work_dir / f"{case_name}.probe.jsonl"
+    probe_path.unlink(missing_ok=True)
+
+    args = [mode, "--inputs", model_path, "--inputs", target_input, "--probe", "--probe-json", str(probe_path)]
+    args.extend(extra_args)
+    # Nos dois caminhos o console nunca fica inteiro na memoria: o subprocesso e lido linha a
+    # linha do pipe; o worker (--persistent) grava o log ele mesmo e o parser le o arquivo.
+    parser = MetricsParser()
+    started = time.perf_counter()
+    if worker is not None:
+        raw_log = work_dir / f"{case_name}.log"
+        raw_log.unlink(missing_ok=True)
+        exit_code, error = worker.run(args, raw_log.resolve())
+        if error or not raw_log.exists():
+            with raw_log.open("a", encoding="utf-8") as f:
+                f.write(f"[AB] worker: {error}\n")
+        with raw_log.open(encoding="utf-8", errors="replace") as src:
+            if gzip_logs:
+                with open_log(log_path, True) as log_file:
+                    for line in src:
+                        log_file.write(line)
+                        parser.feed(line)
+            else:
+                for line in src:
+                    parser.feed(line)
+        if gzip_logs:
+            raw_log.unlink()
+    else:
+        with open_log(log_path, gzip_logs) as log_file:
+            proc = subprocess.Popen(
+                [binary, *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                log_file.write(line)
+                parser.feed(line)
+            exit_code = proc.wait()
+    duration_ms = (time.perf_counter() - started) * 1000.0
 
-    log_name = f"{safe_name(mode)}__{model_label}.log"
-    log_path = work_dir / log_name
-    log_path.write_text(output, encoding="utf-8")
+    record = read_probe_record(probe_path)
+    # binario sem --probe-json: recai nas metricas lidas do console
+    metrics = metrics_from_probe_record(record) if record is not None else parser.result()
 
     return RunResult(
+        target=target_input,
         model_label=model_label,
         model_path=model_path,
         mode=mode,
-        exit_code=proc.returncode,
+        exit_code=exit_code,
         log_path=str(log_path),
-        metrics=parse_metrics(output),
+        metrics=metrics,
+        duration_ms=duration_ms,
     )
 
 
@@ -137,6 +395,7 @@ def format_bool(value: Optional[bool]) -> str:
 
 def print_results(results: List[RunResult]) -> None:
     header = [
+        "target",
         "mode",
         "model",
         "exit",
@@ -148,6 +407,7 @@ def print_results(results: List[RunResult]) -> None:
         "probe",
         "validator",
         "reason",
+        "ms",
     ]
     rows: List[List[str]] = []
     for result in results:
@@ -156,6 +416,7 @@ def print_results(results: List[RunResult]) -> None:
             probe = f"{result.metrics.probe_found}/{result.metrics.probe_total} miss={result.metrics.probe_missing}"
         rows.append(
             [
+                result.target,
                 result.mode,
                 result.model_label,
                 str(result.exit_code),
@@ -167,6 +428,7 @@ def print_results(results: List[RunResult]) -> None:
                 probe,
                 format_bool(result.metrics.validator_ok),
                 result.metrics.validator_reason or "-",
+                f"{result.duration_ms:.0f}",
             ]
         )
 
@@ -186,8 +448,34 @@ def print_results(results: List[RunResult]) -> None:
         print_row(row)
 
 
-def build_mode_map(results: List[RunResult]) -> Dict[Tuple[str, str], RunResult]:
-    return {(r.mode, r.model_label): r for r in results}
+def print_stats(stats: Dict[str, object]) -> None:
+    modes = stats.get("modes") or {}
+    if not modes:
+        return
+    conf = int(round((1 - float(stats.get("alpha") or 0.05)) * 100))
+    print(f"PAREADO B-A (IC {conf}%, bootstrap)")
+    for mode, entry in modes.items():
+        found = entry.get("found_delta") or {}
+        runtime = entry.get("runtime_ratio") or {}
+        found_txt = (
+            f"found {found['mean']:+.2f} [{found['ci_low']:+.2f}, {found['ci_high']:+.2f}]" if found else "found -"
+        )
+        runtime_txt = (
+            f"tempo {runtime['geo_mean']:.2f}x [{runtime['ci_low']:.2f}, {runtime['ci_high']:.2f}]" if runtime else "tempo -"
+        )
+        print(f"  {mode}: n={entry.get('targets', 0)} {found_txt} {runtime_txt}")
+    worse = [f for f in stats.get("fields") or [] if f.get("worse", 0) > f.get("better", 0)]
+    for field in worse[:20]:
+        flag = " *" if field.get("significant_regression") else ""
+        print(
+            f"  {field['mode']}/{field['field']}: pioras={field['worse']} melhoras={field['better']}"
+            f" p={field['p_value']:.4f}{flag}"
+        )
+    print()
+
+
+def build_mode_map(results: List[RunResult]) -> Dict[Tuple[str, str, str], RunResult]:
+    return {(r.target, r.mode, r.model_label): r for r in results}
 
 
 def evaluate_gate(
@@ -200,38 +488,134 @@ def evaluate_gate(
     failures: List[str] = []
 
     for result in results:
+        case = f"{result.target}/{result.mode}/{result.model_label}"
         if result.exit_code != 0:
-            failures.append(f"{result.mode}/{result.model_label}: exit={result.exit_code}")
+            failures.append(f"{case}: exit={result.exit_code}")
         if min_probe_found is not None:
             found = result.metrics.probe_found
             if found is None or found < min_probe_found:
-                failures.append(f"{result.mode}/{result.model_label}: probe_found={found} < {min_probe_found}")
+                failures.append(f"{case}: probe_found={found} < {min_probe_found}")
         if max_probe_missing is not None:
             missing = result.metrics.probe_missing
             if missing is None or missing > max_probe_missing:
-                failures.append(f"{result.mode}/{result.model_label}: probe_missing={missing} > {max_probe_missing}")
+                failures.append(f"{case}: probe_missing={missing} > {max_probe_missing}")
 
     if max_gap_delta is not None or max_variable_drop is not None:
         by_mode = build_mode_map(results)
-        for mode in sorted({r.mode for r in results}):
-            a = by_mode.get((mode, "A"))
-            b = by_mode.get((mode, "B"))
+        for target, mode in sorted({(r.target, r.mode) for r in results}):
+            a = by_mode.get((target, mode, "A"))
+            b = by_mode.get((target, mode, "B"))
             if not a or not b:
                 continue
 
             if max_gap_delta is not None and a.metrics.gaps is not None and b.metrics.gaps is not None:
                 delta = b.metrics.gaps - a.metrics.gaps
                 if delta > max_gap_delta:
-                    failures.append(f"{mode}: gap_delta(B-A)={delta} > {max_gap_delta}")
+                    failures.append(f"{target}/{mode}: gap_delta(B-A)={delta} > {max_gap_delta}")
 
             if max_variable_drop is not None and a.metrics.variable is not None and b.metrics.variable is not None:
                 drop = a.metrics.variable - b.metrics.variable
                 if drop > max_variable_drop:
-                    failures.append(f"{mode}: variable_drop(A-B)={drop} > {max_variable_drop}")
+                    failures.append(f"{target}/{mode}: variable_drop(A-B)={drop} > {max_variable_drop}")
 
     return failures
 
 
+def bootstrap_mean_ci(values: List[float], alpha: float, iterations: int = 2000, seed: int = 0) -> Tuple[float, float, float]:
+    """Media e IC (1-alpha) por bootstrap percentil; semente fixa para o gate ser reprodutivel."""
+    mean = statistics.mean(values)
+    if len(values) < 2:
+        return mean, mean, mean
+    rng = random.Random(seed)
+    n = len(values)
+    means = sorted(statistics.mean(rng.choices(values, k=n)) for _ in range(iterations))
+    lo = means[max(0, int(math.floor(alpha / 2 * iterations)))]
+    hi = means[min(iterations - 1, int(math.ceil((1 - alpha / 2) * iterations)) - 1)]
+    return mean, lo, hi
+
+
+def mcnemar_exact_p(worse: int, better: int) -> float:
+    """Teste exato de McNemar (binomial nos pares discordantes), bilateral."""
+    n = worse + better
+    if n == 0:
+        return 1.0
+    k = min(worse, better)
+    tail = sum(math.comb(n, i) for i in range(k + 1)) / (2 ** n)
+    return min(1.0, 2 * tail)
+
+
+def compare_stats(
+    results: List[RunResult],
+    alpha: float,
+    min_targets: int,
+    max_slowdown: Optional[float],
+) -> Tuple[Dict[str, object], List[str]]:
+    """Deltas pareados B-A por modo (found, tempo) e por campo, agregados sobre os alvos."""
+    by_case = build_mode_map(results)
+    failures: List[str] = []
+    modes_out: Dict[str, object] = {}
+    fields_out: List[Dict[str, object]] = []
+
+    for mode in sorted({r.mode for r in results}):
+        found_deltas: List[float] = []
+        log_ratios: List[float] = []
+        field_pairs: Dict[str, Dict[str, int]] = {}
+        for target in sorted({r.target for r in results if r.mode == mode}):
+            a = by_case.get((target, mode, "A"))
+            b = by_case.get((target, mode, "B"))
+            if not a or not b or a.exit_code != 0 or b.exit_code != 0:
+                continue
+            if a.metrics.probe_found is not None and b.metrics.probe_found is not None:
+                found_deltas.append(float(b.metrics.probe_found - a.metrics.probe_found))
+            if a.duration_ms > 0 and b.duration_ms > 0:
+                log_ratios.append(math.log(b.duration_ms / a.duration_ms))
+            fields_a = a.metrics.probe_fields or {}
+            fields_b = b.metrics.probe_fields or {}
+            for field in set(fields_a) & set(fields_b):
+                counts = field_pairs.setdefault(field, {"pairs": 0, "found_a": 0, "found_b": 0, "worse": 0, "better": 0})
+                counts["pairs"] += 1
+                counts["found_a"] += int(fields_a[field])
+                counts["found_b"] += int(fields_b[field])
+                if fields_a[field] and not fields_b[field]:
+                    counts["worse"] += 1
+                elif fields_b[field] and not fields_a[field]:
+                    counts["better"] += 1
+
+        entry: Dict[str, object] = {"targets": len(found_deltas)}
+        if found_deltas:
+            mean, lo, hi = bootstrap_mean_ci(found_deltas, alpha)
+            regression = len(found_deltas) >= min_targets and hi < 0
+            entry["found_delta"] = {"mean": mean, "ci_low": lo, "ci_high": hi, "significant_regression": regression}
+            if regression:
+                failures.append(f"{mode}: found(B-A) media={mean:.2f} IC{int((1 - alpha) * 100)}%=[{lo:.2f}, {hi:.2f}] < 0")
+        if log_ratios:
+            mean, lo, hi = bootstrap_mean_ci(log_ratios, alpha)
+            slow = max_slowdown is not None and len(log_ratios) >= min_targets and math.exp(lo) > max_slowdown
+            entry["runtime_ratio"] = {
+                "geo_mean": math.exp(mean),
+                "ci_low": math.exp(lo),
+                "ci_high": math.exp(hi),
+                "significant_slowdown": slow,
+            }
+            if slow:
+                failures.append(
+                    f"{mode}: tempo B/A={math.exp(mean):.2f}x IC=[{math.exp(lo):.2f}, {math.exp(hi):.2f}] > {max_slowdown:.2f}x"
+                )
+        modes_out[mode] = entry
+
+        for field, counts in sorted(field_pairs.items()):
+            p_value = mcnemar_exact_p(counts["worse"], counts["better"])
+            regression = counts["pairs"] >= min_targets and counts["worse"] > counts["better"] and p_value < alpha
+            fields_out.append({"mode": mode, "field": field, **counts, "p_value": p_value, "significant_regression": regression})
+            if regression:
+                failures.append(
+                    f"{mode}/{field}: found A={counts['found_a']} B={counts['found_b']} de {counts['pairs']}"
+                    f" (pioras={counts['worse']} melhoras={counts['better']} p={p_value:.4f})"
+                )
+
+    return {"alpha": alpha, "min_targets": min_targets, "modes": modes_out, "fields": fields_out}, failures
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Compara dois modelos de despacho (A/B) nos modos align/var/fixed e aplica gate de regressao.",
@@ -239,18 +623,57 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--bin", default="./cli/OperCli/bin/Release/net8.0/operpdf", help="Caminho do binario operpdf.")
     parser.add_argument("--model-a", required=True, help="PDF modelo A (baseline).")
     parser.add_argument("--model-b", required=True, help="PDF modelo B.")
-    parser.add_argument("--target", default=":Q22", help="Input alvo para comparar com os modelos.")
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        help="Alvo(s) para comparar com os modelos: :Q22, :Q1,:Q5 ou intervalo :Q1-200 (repetivel; padrao :Q22).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Execucoes simultaneas da matriz alvo x modo x modelo (0=numero de CPUs).",
+    )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help=(
+            "Um `operpdf worker` por alvo: todos os modos/modelos do alvo reaproveitam os tokens ja lidos."
+            " Cada worker e aquecido (A e B, fora do tempo) e a ordem A/B alterna por alvo/modo."
+        ),
+    )
     parser.add_argument(
         "--modes",
         default=",".join(DEFAULT_MODES),
         help="Lista separada por virgula dos modos a executar.",
     )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600.0,
+        help="Com --persistent: segundos por requisicao; o worker travado e morto e reiniciado (0=sem limite).",
+    )
     parser.add_argument("--work-dir", default="/tmp/operpdf_ab_compare", help="Diretorio dos logs.")
+    parser.add_argument("--gzip-logs", action="store_true", help="Grava os logs de cada execucao comprimidos (.log.gz).")
     parser.add_argument("--json-out", default="", help="Arquivo JSON opcional para salvar resultados.")
     parser.add_argument("--min-probe-found", type=int, default=None, help="Gate opcional: minimo de campos found no PROBE.")
     parser.add_argument("--max-probe-missing", type=int, default=None, help="Gate opcional: maximo de campos missing no PROBE.")
     parser.add_argument("--max-gap-delta", type=int, default=None, help="Gate opcional: maximo de aumento de gaps de A->B por modo.")
     parser.add_argument("--max-variable-drop", type=int, default=None, help="Gate opcional: maximo de queda de variable de A->B por modo.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia do gate estatistico (pareado B-A).")
+    parser.add_argument(
+        "--min-targets",
+        type=int,
+        default=5,
+        help="Minimo de alvos pareados para o gate estatistico poder reprovar um modo/campo.",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=1.5,
+        help="Reprova o modo se o IC do tempo B/A ficar todo acima deste fator (0=desativa).",
+    )
     parser.add_argument("--extra-arg", action="append", default=[], help="Argumento extra repassado para cada comando.")
     parser.add_argument("--no-fail-on-gate", action="store_true", help="Nao retorna codigo !=0 quando o gate falhar.")
     return parser.parse_args()
@@ -275,39 +698,59 @@ def main() -> int:
         print("erro: lista de modos vazia", file=sys.stderr)
         return 2
 
+    targets = expand_targets(args.target or [":Q22"])
     work_dir = Path(args.work_dir)
     work_dir.mkdir(parents=True, exist_ok=True)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    models = [("A", model_a), ("B", model_b)]
+
+    def run_target(target_idx: int, target: str) -> List[RunResult]:
+        # Worker novo por alvo: sem aquecimento, quem roda primeiro paga JIT, carga do modelo e a 1a
+        # tokenizacao do alvo, e o outro lado reaproveita o cache de tokens -> razao B/A enviesada.
+        # Aquece os dois modelos (execucao descartada, fora do tempo) e alterna a ordem A/B por alvo e modo.
+        try:
+            worker: Optional[WorkerClient] = WorkerClient(binary, args.timeout)
+        except (RuntimeError, OSError) as ex:
+            print(f"[AB] {target}: worker nao subiu ({ex}); usando subprocesso por caso", file=sys.stderr)
+            worker = None
+        try:
+            for label, model_path in models:
+                run_case(binary, modes[0], model_path, target, f"{label}_warmup", work_dir, args.extra_arg, worker, args.gzip_logs)
+            results: List[RunResult] = []
+            for mode_idx, mode in enumerate(modes):
+                ordered = models if (target_idx + mode_idx) % 2 == 0 else models[::-1]
+                for label, model_path in ordered:
+                    results.append(run_case(binary, mode, model_path, target, label, work_dir, args.extra_arg, worker, args.gzip_logs))
+            return results
+        finally:
+            if worker is not None:
+                worker.close()
 
     results: List[RunResult] = []
-    for mode in modes:
-        results.append(
-            run_case(
-                binary=binary,
-                mode=mode,
-                model_path=model_a,
-                target_input=args.target,
-                model_label="A",
-                work_dir=work_dir,
-                extra_args=args.extra_arg,
-            )
-        )
-        results.append(
-            run_case(
-                binary=binary,
-                mode=mode,
-                model_path=model_b,
-                target_input=args.target,
-                model_label="B",
-                work_dir=work_dir,
-                extra_args=args.extra_arg,
-            )
-        )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as ex:
+        if args.persistent:
+            futs = [ex.submit(run_target, idx, target) for idx, target in enumerate(targets)]
+        else:
+            futs = [
+                ex.submit(run_case, binary, mode, model_path, target, label, work_dir, args.extra_arg, None, args.gzip_logs)
+                for target in targets
+                for mode in modes
+                for label, model_path in models
+            ]
+        for fut in concurrent.futures.as_completed(futs):
+            value = fut.result()
+            results.extend(value if isinstance(value, list) else [value])
+
+    case_order = [(t, m, label) for t in targets for m in modes for label, _ in models]
+    rank = {key: i for i, key in enumerate(case_order)}
+    results.sort(key=lambda r: rank.get((r.target, r.mode, r.model_label), len(rank)))
 
     print("AB COMPARATOR (DESPACHO)")
     print(f"  bin: {binary}")
     print(f"  model A: {model_a}")
     print(f"  model B: {model_b}")
-    print(f"  target: {args.target}")
+    print(f"  targets: {len(targets)} ({', '.join(targets[:5])}{', ...' if len(targets) > 5 else ''})")
+    print(f"  jobs: {jobs}{' (worker por alvo)' if args.persistent else ''}")
     print(f"  logs: {work_dir}")
     print()
     print_results(results)
@@ -320,19 +763,31 @@ def main() -> int:
         max_gap_delta=args.max_gap_delta,
         max_variable_drop=args.max_variable_drop,
     )
+    stats, stat_failures = compare_stats(
+        results,
+        alpha=args.alpha,
+        min_targets=args.min_targets,
+        max_slowdown=args.max_slowdown if args.max_slowdown > 0 else None,
+    )
+    print_stats(stats)
+    failures.extend(stat_failures)
 
     payload = {
         "bin": binary,
         "model_a": model_a,
         "model_b": model_b,
-        "target": args.target,
+        "targets": targets,
         "modes": modes,
         "results": [asdict(r) for r in results],
+        "stats": stats,
         "gate": {
             "min_probe_found": args.min_probe_found,
             "max_probe_missing": args.max_probe_missing,
             "max_gap_delta": args.max_gap_delta,
             "max_variable_drop": args.max_variable_drop,
+            "alpha": args.alpha,
+            "min_targets": args.min_targets,
+            "max_slowdown": args.max_slowdown,
             "failures": failures,
             "ok": len(failures) == 0,
         },
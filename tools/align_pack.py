@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""Pacote colunar compacto para os relatorios de alinhamento em io/ (align_*, find1_*, chk_textops*...).
+
+Os JSONs indentados repetem Text/Pattern/OpsLabel de cada bloco nos dois lados e de novo em
+Anchors/Alignments/FixedPairs. Aqui cada relatorio vira um segmento colunar:
+- blocos unicos do relatorio em colunas (Index/StartOp/EndOp/MaxTokenLen int32, Text/Pattern/OpsLabel
+  como ids numa tabela de strings internadas, global ao pacote);
+- listas de blocos (BlocksA, VariableBlocksB...) como arrays de ids de bloco;
+- listas de pares (Anchors, Alignments, FixedPairs) em colunas (AIndex, BIndex, Score, Kind, bloco A/B);
+- o resto do objeto (parametros, HelperDiagnostics, Extraction...) em JSON compacto.
+Segmentos sao comprimidos (zlib) e o rodape indexa nome, PdfA/PdfB e PageA/PageB de cada relatorio:
+ler um relatorio descomprime so o segmento dele (e a tabela de strings, uma vez).
+
+Uso:
+  python3 tools/align_pack.py pack io/*.json -o io/align_reports.opk
+  python3 tools/align_pack.py ls io/align_reports.opk [--pdf NOME] [--page N]
+  python3 tools/align_pack.py show io/align_reports.opk align_despacho_q22
+  python3 tools/align_pack.py verify io/align_reports.opk io/*.json
+
+Em Python:
+  pack = AlignPack("io/align_reports.opk")
+  for entry in pack.find(page=1):
+      cols = pack.pairs(entry["name"], "Alignments")   # colunas, sem montar dicts
+      report = pack.load(entry["name"])                # objeto identico ao JSON original
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"OPALPK01"
+TRAILER = struct.Struct("<QI8s")
+NULL_ID = 0xFFFFFFFF
+BLOCK_KEYS = ("Index", "StartOp", "EndOp", "Text", "Pattern", "MaxTokenLen", "OpsLabel")
+BLOCK_INT_KEYS = ("Index", "StartOp", "EndOp", "MaxTokenLen")
+BLOCK_STR_KEYS = ("Text", "Pattern", "OpsLabel")
+PAIR_KEYS = ("AIndex", "BIndex", "Score", "Kind", "A", "B")
+INT32_MIN, INT32_MAX = -(2**31), 2**31 - 1
+
+
+def _to_le(arr: array) -> bytes:
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> array:
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _pack_columns(header: Dict[str, Any], cols: Dict[str, array], tail: bytes) -> bytes:
+    # [u32 len][header JSON][colunas...][tail]; o tail (JSON do resto) so e parseado por load()
+    header = dict(header, columns=[[name, col.typecode, len(col)] for name, col in cols.items()])
+    hb = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return struct.pack("<I", len(hb)) + hb + b"".join(_to_le(col) for col in cols.values()) + tail
+
+
+def _unpack_columns(data: bytes) -> Tuple[Dict[str, Any], Dict[str, array], bytes]:
+    (hlen,) = struct.unpack_from("<I", data, 0)
+    header = json.loads(data[4 : 4 + hlen].decode("utf-8"))
+    pos = 4 + hlen
+    cols: Dict[str, array] = {}
+    for name, typecode, count in header["columns"]:
+        size = array(typecode).itemsize * count
+        cols[name] = _from_le(typecode, data[pos : pos + size])
+        pos += size
+    return header, cols, data[pos:]
+
+
+def _is_int32(v: Any) -> bool:
+    return type(v) is int and INT32_MIN <= v <= INT32_MAX
+
+
+def _is_block(v: Any) -> bool:
+    return (
+        isinstance(v, dict)
+        and tuple(v.keys()) == BLOCK_KEYS
+        and all(_is_int32(v[k]) for k in BLOCK_INT_KEYS)
+        and all(v[k] is None or isinstance(v[k], str) for k in BLOCK_STR_KEYS)
+    )
+
+
+def _is_pair(v: Any) -> bool:
+    return (
+        isinstance(v, dict)
+        and tuple(v.keys()) == PAIR_KEYS
+        and _is_int32(v["AIndex"])
+        and _is_int32(v["BIndex"])
+        and type(v["Score"]) in (int, float)
+        and (v["Kind"] is None or isinstance(v["Kind"], str))
+        and all(v[k] is None or _is_block(v[k]) for k in ("A", "B"))
+    )
+
+
+class StringTable:
+    """Strings internadas do pacote (id uint32 por string distinta)."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, s: Optional[str]) -> int:
+        if s is None:
+            return NULL_ID
+        sid = self.ids.get(s)
+        if sid is None:
+            sid = self.ids[s] = len(self.values)
+            self.values.append(s)
+        return sid
+
+    def encode(self) -> bytes:
+        blobs = [v.encode("utf-8") for v in self.values]
+        offsets = array("I", [0])
+        for b in blobs:
+            offsets.append(offsets[-1] + len(b))
+        return struct.pack("<I", len(blobs)) + _to_le(offsets) + b"".join(blobs)
+
+    @staticmethod
+    def decode(data: bytes) -> List[str]:
+        (count,) = struct.unpack_from("<I", data, 0)
+        offsets = _from_le("I", data[4 : 4 + 4 * (count + 1)])
+        base = 4 + 4 * (count + 1)
+        blob = data[base:]
+        return [blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+
+def encode_report(report: Dict[str, Any], strings: StringTable) -> bytes:
+    """Segmento colunar de um relatorio; chaves que nao tem o formato esperado ficam no JSON `rest`."""
+    block_ids: Dict[Tuple[Any, ...], int] = {}
+    bcols = {k: array("i") for k in BLOCK_INT_KEYS}
+    bcols.update({k: array("I") for k in BLOCK_STR_KEYS})
+
+    def block_id(b: Optional[Dict[str, Any]]) -> int:
+        if b is None:
+            return -1
+        key = tuple(b[k] for k in BLOCK_KEYS)
+        bid = block_ids.get(key)
+        if bid is None:
+            bid = block_ids[key] = len(block_ids)
+            for k in BLOCK_INT_KEYS:
+                bcols[k].append(b[k])
+            for k in BLOCK_STR_KEYS:
+                bcols[k].append(strings.intern(b[k]))
+        return bid
+
+    cols: Dict[str, array] = {}
+    order: List[Tuple[str, str]] = []
+    rest: Dict[str, Any] = {}
+    for key, value in report.items():
+        if isinstance(value, list) and value and all(_is_block(v) for v in value):
+            cols[f"{key}.block"] = array("i", (block_id(v) for v in value))
+            order.append((key, "blocks"))
+        elif isinstance(value, list) and value and all(_is_pair(v) for v in value):
+            cols[f"{key}.AIndex"] = array("i", (v["AIndex"] for v in value))
+            cols[f"{key}.BIndex"] = array("i", (v["BIndex"] for v in value))
+            cols[f"{key}.Score"] = array("d", (float(v["Score"]) for v in value))
+            cols[f"{key}.ScoreInt"] = array("b", (1 if type(v["Score"]) is int else 0 for v in value))
+            cols[f"{key}.Kind"] = array("I", (strings.intern(v["Kind"]) for v in value))
+            cols[f"{key}.A"] = array("i", (block_id(v["A"]) for v in value))
+            cols[f"{key}.B"] = array("i", (block_id(v["B"]) for v in value))
+            order.append((key, "pairs"))
+        else:
+            rest[key] = value
+            order.append((key, "rest"))
+    all_cols = {f"block.{k}": col for k, col in bcols.items()}
+    all_cols.update(cols)
+    tail = json.dumps(rest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(_pack_columns({"order": order}, all_cols, tail), 6)
+
+
+def write_pack(out: Path, reports: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, int]:
+    strings = StringTable()
+    entries: List[Dict[str, Any]] = []
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        for name, report in reports:
+            seg = encode_report(report, strings)
+            entries.append(
+                {
+                    "name": name,
+                    "label": report.get("Label"),
+                    "pdf_a": report.get("PdfA"),
+                    "pdf_b": report.get("PdfB"),
+                    "page_a": report.get("PageA"),
+                    "page_b": report.get("PageB"),
+                    "offset": f.tell(),
+                    "length": len(seg),
+                }
+            )
+            f.write(seg)
+        str_seg = zlib.compress(strings.encode(), 6)
+        str_offset = f.tell()
+        f.write(str_seg)
+        footer = zlib.compress(
+            json.dumps(
+                {"reports": entries, "strings": [str_offset, len(str_seg), len(strings.values)]},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8"),
+            6,
+        )
+        footer_offset = f.tell()
+        f.write(footer)
+        f.write(TRAILER.pack(footer_offset, len(footer), MAGIC))
+        size = f.tell()
+    tmp.replace(out)
+    return {"reports": len(entries), "strings": len(strings.values), "bytes": size}
+
+
+class AlignPack:
+    """Leitor preguicoso: abre so o rodape; segmentos e a tabela de strings sao lidos sob demanda."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"nao e um pacote de alinhamento: {self.path}")
+            f.seek(-TRAILER.size, 2)
+            footer_offset, footer_len, magic = TRAILER.unpack(f.read(TRAILER.size))
+            if magic != MAGIC:
+                raise ValueError(f"pacote truncado: {self.path}")
+            f.seek(footer_offset)
+            footer = json.loads(zlib.decompress(f.read(footer_len)).decode("utf-8"))
+        self.entries: List[Dict[str, Any]] = footer["reports"]
+        self._by_name = {e["name"]: e for e in self.entries}
+        self._strings_ref = footer["strings"]
+        self._strings: Optional[List[str]] = None
+
+    def _read(self, offset: int, length: int) -> bytes:
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            return zlib.decompress(f.read(length))
+
+    @property
+    def strings(self) -> List[str]:
+        if self._strings is None:
+            offset, length, _ = self._strings_ref
+            self._strings = StringTable.decode(self._read(offset, length))
+        return self._strings
+
+    def names(self) -> List[str]:
+        return [e["name"] for e in self.entries]
+
+    def find(self, name: str = "", pdf: str = "", page: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Entradas do rodape filtradas por nome/PDF (substring) e pagina (A ou B); nao le segmentos."""
+        out = []
+        for e in self.entries:
+            if name and name not in e["name"]:
+                continue
+            if pdf and pdf not in (e.get("pdf_a") or "") and pdf not in (e.get("pdf_b") or ""):
+                continue
+            if page is not None and page not in (e.get("page_a"), e.get("page_b")):
+                continue
+            out.append(e)
+        return out
+
+    def segment(self, name: str) -> Tuple[Dict[str, Any], Dict[str, array], bytes]:
+        e = self._by_name[name]
+        return _unpack_columns(self._read(e["offset"], e["length"]))
+
+    def _str(self, sid: int) -> Optional[str]:
+        return None if sid == NULL_ID else self.strings[sid]
+
+    def blocks(self, name: str, key: str = "BlocksA") -> Dict[str, list]:
+        """Colunas dos blocos de uma lista (BlocksA, VariableBlocksB...) com as strings resolvidas.
+
+        Lista vazia ou ausente no relatorio (fica em `rest`) devolve as colunas vazias.
+        """
+        _, cols, _ = self.segment(name)
+        ids = cols.get(f"{key}.block") or array("i")
+        out: Dict[str, list] = {k: [cols[f"block.{k}"][i] for i in ids] for k in BLOCK_INT_KEYS}
+        out.update({k: [self._str(cols[f"block.{k}"][i]) for i in ids] for k in BLOCK_STR_KEYS})
+        return out
+
+    def pairs(self, name: str, key: str = "Alignments") -> Dict[str, list]:
+        """Colunas de uma lista de pares; A/B sao ids de bloco (-1 = sem bloco), ver blocks_table().
+
+        Lista vazia ou ausente no relatorio devolve as colunas vazias.
+        """
+        _, cols, _ = self.segment(name)
+        if f"{key}.AIndex" not in cols:
+            return {k: [] for k in ("AIndex", "BIndex", "Score", "Kind", "A", "B")}
+        return {
+            "AIndex": list(cols[f"{key}.AIndex"]),
+            "BIndex": list(cols[f"{key}.BIndex"]),
+            "Score": list(cols[f"{key}.Score"]),
+            "Kind": [self._str(s) for s in cols[f"{key}.Kind"]],
+            "A": list(cols[f"{key}.A"]),
+            "B": list(cols[f"{key}.B"]),
+        }
+
+    def blocks_table(self, name: str) -> Dict[str, list]:
+        """Todos os blocos unicos do relatorio (linha = id de bloco usado em pairs())."""
+        _, cols, _ = self.segment(name)
+        out: Dict[str, list] = {k: list(cols[f"block.{k}"]) for k in BLOCK_INT_KEYS}
+        out.update({k: [self._str(s) for s in cols[f"block.{k}"]] for k in BLOCK_STR_KEYS})
+        return out
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """Reconstroi o relatorio como dict (mesmo conteudo e ordem de chaves do JSON original)."""
+        header, cols, tail = self.segment(name)
+
+        def block(bid: int) -> Optional[Dict[str, Any]]:
+            if bid < 0:
+                return None
+            return {
+                k: (self._str(cols[f"block.{k}"][bid]) if k in BLOCK_STR_KEYS else cols[f"block.{k}"][bid])
+                for k in BLOCK_KEYS
+            }
+
+        report: Dict[str, Any] = {}
+        rest = json.loads(tail.decode("utf-8"))
+        for key, kind in header["order"]:
+            if kind == "rest":
+                report[key] = rest[key]
+            elif kind == "blocks":
+                report[key] = [block(bid) for bid in cols[f"{key}.block"]]
+            else:
+                report[key] = [
+                    {
+                        "AIndex": a_idx,
+                        "BIndex": b_idx,
+                        "Score": int(score) if is_int else score,
+                        "Kind": self._str(kind_id),
+                        "A": block(a),
+                        "B": block(b),
+                    }
+                    for a_idx, b_idx, score, is_int, kind_id, a, b in zip(
+                        cols[f"{key}.AIndex"],
+                        cols[f"{key}.BIndex"],
+                        cols[f"{key}.Score"],
+                        cols[f"{key}.ScoreInt"],
+                        cols[f"{key}.Kind"],
+                        cols[f"{key}.A"],
+                        cols[f"{key}.B"],
+                    )
+                ]
+        return report
+
+
+def read_report_json(path: Path) -> Any:
+    # os relatorios do CLI saem com BOM
+    return json.loads(path.read_text(encoding="utf-8-sig"))
+
+
+def iter_input_files(paths: List[str]) -> List[Path]:
+    files: List[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+    return files
+
+
+def iter_input_reports(files: List[Path]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    seen = set()
+    for f in files:
+        if f.stem in seen:
+            print(f"[ALIGN_PACK] nome repetido ignorado: {f}", file=sys.stderr)
+            continue
+        try:
+            report = read_report_json(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as ex:
+            print(f"[ALIGN_PACK] ignorado {f}: {ex}", file=sys.stderr)
+            continue
+        if not isinstance(report, dict):
+            print(f"[ALIGN_PACK] ignorado {f}: raiz nao e objeto", file=sys.stderr)
+            continue
+        seen.add(f.stem)
+        yield f.stem, report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pacote colunar para relatorios de alinhamento (io/*.json).")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_pack = sub.add_parser("pack", help="Empacota JSONs (arquivos ou diretorios).")
+    p_pack.add_argument("inputs", nargs="+")
+    p_pack.add_argument("-o", "--out", required=True)
+
+    p_ls = sub.add_parser("ls", help="Lista os relatorios do pacote (so le o rodape).")
+    p_ls.add_argument("pack")
+    p_ls.add_argument("--name", default="")
+    p_ls.add_argument("--pdf", default="")
+    p_ls.add_argument("--page", type=int, default=None)
+
+    p_show = sub.add_parser("show", help="Imprime um relatorio como JSON.")
+    p_show.add_argument("pack")
+    p_show.add_argument("name")
+
+    p_verify = sub.add_parser("verify", help="Confere que o pacote reproduz os JSONs originais.")
+    p_verify.add_argument("pack")
+    p_verify.add_argument("inputs", nargs="+")
+
+    args = parser.parse_args()
+
+    if args.cmd == "pack":
+        out = Path(args.out)
+        files = iter_input_files(args.inputs)
+        src_bytes = sum(f.stat().st_size for f in files if f.is_file())
+        stats = write_pack(out, iter_input_reports(files))
+        ratio = src_bytes / stats["bytes"] if stats["bytes"] else 0.0
+        print(
+            f"[ALIGN_PACK] {out}: relatorios={stats['reports']} strings={stats['strings']} "
+            f"bytes={stats['bytes']:,} (json={src_bytes:,}, {ratio:.1f}x menor)"
+        )
+        return 0
+
+    pack = AlignPack(args.pack)
+    if args.cmd == "ls":
+        for e in pack.find(args.name, args.pdf, args.page):
+            print(f"{e['name']}\t{e.get('label') or ''}\tA={e.get('pdf_a')}:{e.get('page_a')}\tB={e.get('pdf_b')}:{e.get('page_b')}")
+        return 0
+    if args.cmd == "show":
+        if args.name not in pack.names():
+            print(f"[ALIGN_PACK] relatorio nao encontrado: {args.name}", file=sys.stderr)
+            return 2
+        print(json.dumps(pack.load(args.name), ensure_ascii=False, indent=2))
+        return 0
+
+    mismatches = 0
+    checked = 0
+    for name, report in iter_input_reports(iter_input_files(args.inputs)):
+        checked += 1
+        if name not in pack.names() or pack.load(name) != report:
+            mismatches += 1
+            print(f"[ALIGN_PACK] divergente: {name}")
+    print(f"[ALIGN_PACK] verificados={checked} divergentes={mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Diff de snapshots de alinhamento: baseline x after (io/baseline_q22 x io/after_q22, ou corpus inteiro).
+
+Cada lado e um diretorio de relatorios JSON (recursivo), um JSON avulso ou um pacote de
+tools/align_pack.py (.opk). Os relatorios sao casados por
+(comando, doc_key, PdfA, PdfB, PageA, PageB, ObjA, ObjB); o nome do arquivo nao importa
+(align_despacho_q22.json casa com after_align_despacho_q22.json).
+
+Streaming: do baseline guarda-se so um resumo compacto por relatorio (ancoras, contagem por
+Kind, ranges, campos extraidos, validador/probe, duracao); o after e lido um a um e cada diff
+sai no JSONL assim que calculado.
+
+Regressao = campo que tinha valor e ficou vazio/NOT_FOUND, valor que mudou, validador que
+passou a falhar, probe com menos campos encontrados ou relatorio que sumiu no after.
+
+Exemplos:
+  python3 tools/diff_align_snapshots.py io/baseline_q22 io/after_q22
+  python3 tools/diff_align_snapshots.py base.opk after.opk --out run/diff.jsonl --fail-on-regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from align_pack import AlignPack
+
+RecordKey = Tuple[Any, ...]
+NOT_FOUND = "NOT_FOUND"
+
+
+def iter_reports(source: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(nome, relatorio) de um diretorio, JSON avulso ou pacote .opk; um relatorio por vez."""
+    if source.suffix.lower() == ".opk":
+        pack = AlignPack(source)
+        for name in pack.names():
+            yield name, pack.load(name)
+        return
+    files = sorted(source.rglob("*.json")) if source.is_dir() else [source]
+    for f in files:
+        try:
+            report = json.loads(f.read_text(encoding="utf-8-sig"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as ex:
+            print(f"[DIFF] ignorado {f}: {ex}", file=sys.stderr)
+            continue
+        if isinstance(report, dict) and "PdfA" in report and "PdfB" in report:
+            yield str(f), report
+
+
+def record_key(report: Dict[str, Any]) -> RecordKey:
+    info = report.get("ReturnInfo") or {}
+    extraction = report.get("Extraction") or {}
+    return (
+        info.get("command") or "",
+        extraction.get("doc_key") or "",
+        report.get("PdfA"),
+        report.get("PdfB"),
+        report.get("PageA"),
+        report.get("PageB"),
+        report.get("ObjA"),
+        report.get("ObjB"),
+    )
+
+
+def _parse_ts(raw: Any) -> Optional[datetime]:
+    if not isinstance(raw, str) or not raw:
+        return None
+    raw = raw.rstrip("Z")
+    if "." in raw:
+        head, frac = raw.split(".", 1)
+        raw = f"{head}.{frac[:6]}"
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def summarize(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Resumo compacto (o que o diff compara); o relatorio completo pode ser descartado depois."""
+    anchors = sorted((a.get("AIndex"), a.get("BIndex")) for a in report.get("Anchors") or [])
+    kinds = Counter(a.get("Kind") or "" for a in report.get("Alignments") or [])
+    ranges = {
+        side: [r.get("StartOp"), r.get("EndOp"), r.get("HasValue")]
+        for side in ("RangeA", "RangeB")
+        if isinstance(r := report.get(side), dict)
+    }
+    fields: Dict[str, Dict[str, Any]] = {}
+    parsed = (report.get("Extraction") or {}).get("parsed") or {}
+    for side, data in parsed.items():
+        for name, f in ((data or {}).get("fields") or {}).items():
+            if isinstance(f, dict):
+                fields[f"{side}.{name}"] = {"value": f.get("Value") or "", "status": f.get("Status") or ""}
+
+    validator_ok = None
+    probe_found = None
+    stamps: List[datetime] = []
+    for stage in report.get("PipelineStages") or []:
+        payload = stage.get("payload") or {}
+        if stage.get("stage_key") == "validator":
+            validator_ok = payload.get("ok")
+        elif stage.get("stage_key") == "probe" and payload.get("enabled"):
+            probe_found = payload.get("found")
+        ts = _parse_ts(stage.get("timestamp_utc"))
+        if ts is not None:
+            stamps.append(ts)
+    pipeline_ms = round((max(stamps) - min(stamps)).total_seconds() * 1000.0, 1) if len(stamps) > 1 else None
+
+    return {
+        "anchors": anchors,
+        "kinds": dict(kinds),
+        "ranges": ranges,
+        "fields": fields,
+        "validator_ok": validator_ok,
+        "probe_found": probe_found,
+        "pipeline_ms": pipeline_ms,
+    }
+
+
+def _found(f: Optional[Dict[str, Any]]) -> bool:
+    return bool(f and f["value"] and f["status"] != NOT_FOUND)
+
+
+def diff_summaries(base: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    regressions: List[str] = []
+
+    a_base, a_after = set(map(tuple, base["anchors"])), set(map(tuple, after["anchors"]))
+    if a_base != a_after:
+        out["anchors"] = {
+            "before": len(a_base),
+            "after": len(a_after),
+            "added": sorted(a_after - a_base),
+            "removed": sorted(a_base - a_after),
+        }
+    kinds = sorted(set(base["kinds"]) | set(after["kinds"]))
+    kind_delta = {k: after["kinds"].get(k, 0) - base["kinds"].get(k, 0) for k in kinds}
+    if any(kind_delta.values()):
+        out["alignments"] = {k: v for k, v in kind_delta.items() if v}
+    range_changes = {
+        side: {"before": base["ranges"].get(side), "after": after["ranges"].get(side)}
+        for side in sorted(set(base["ranges"]) | set(after["ranges"]))
+        if base["ranges"].get(side) != after["ranges"].get(side)
+    }
+    if range_changes:
+        out["ranges"] = range_changes
+
+    fields: Dict[str, Dict[str, Any]] = {}
+    for name in sorted(set(base["fields"]) | set(after["fields"])):
+        fb, fa = base["fields"].get(name), after["fields"].get(name)
+        if fb == fa:
+            continue
+        was, now = _found(fb), _found(fa)
+        if was and not now:
+            change = "lost"
+            regressions.append(f"campo perdido: {name}")
+        elif now and not was:
+            change = "gained"
+        elif was and now and fb["value"] != fa["value"]:
+            change = "changed"
+            regressions.append(f"valor mudou: {name}")
+        else:
+            change = "status"
+        fields[name] = {"change": change, "before": fb, "after": fa}
+    if fields:
+        out["fields"] = fields
+
+    if base["validator_ok"] is True and after["validator_ok"] is False:
+        regressions.append("validador passou a falhar")
+    if base["validator_ok"] != after["validator_ok"]:
+        out["validator_ok"] = {"before": base["validator_ok"], "after": after["validator_ok"]}
+    if base["probe_found"] is not None and after["probe_found"] is not None:
+        if after["probe_found"] != base["probe_found"]:
+            out["probe_found"] = {"before": base["probe_found"], "after": after["probe_found"]}
+        if after["probe_found"] < base["probe_found"]:
+            regressions.append(f"probe: {base['probe_found']} -> {after['probe_found']} campos")
+    if base["pipeline_ms"] is not None and after["pipeline_ms"] is not None:
+        out["pipeline_ms"] = {"before": base["pipeline_ms"], "after": after["pipeline_ms"]}
+
+    out["regressions"] = regressions
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Diff baseline x after de relatorios de alinhamento.")
+    parser.add_argument("baseline", help="Diretorio, JSON ou pacote .opk do baseline.")
+    parser.add_argument("after", help="Diretorio, JSON ou pacote .opk do after.")
+    parser.add_argument("--out", default="", help="JSONL com o diff de cada relatorio (so os que mudaram).")
+    parser.add_argument("--all", action="store_true", help="No JSONL, inclui tambem os relatorios sem mudanca.")
+    parser.add_argument("--top", type=int, default=20, help="Quantas regressoes listar no resumo.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 se houver regressao.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    base_index: Dict[RecordKey, Tuple[str, Dict[str, Any]]] = {}
+    for name, report in iter_reports(Path(args.baseline)):
+        key = record_key(report)
+        if key in base_index:
+            print(f"[DIFF] chave repetida no baseline, mantendo a primeira: {name}", file=sys.stderr)
+            continue
+        base_index[key] = (name, summarize(report))
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else None
+    totals: Counter = Counter()
+    field_changes: Counter = Counter()
+    regressions: List[Tuple[str, str]] = []
+    base_ms: List[float] = []
+    after_ms: List[float] = []
+    try:
+        for name, report in iter_reports(Path(args.after)):
+            key = record_key(report)
+            matched = base_index.pop(key, None)
+            if matched is None:
+                totals["only_after"] += 1
+                if out is not None:
+                    out.write(json.dumps({"key": list(key), "after": name, "status": "only_after"}, ensure_ascii=False) + "\n")
+                continue
+            base_name, base_sum = matched
+            after_sum = summarize(report)
+            diff = diff_summaries(base_sum, after_sum)
+            totals["matched"] += 1
+            changed = any(k not in ("regressions", "pipeline_ms") for k in diff)
+            totals["changed" if changed else "same"] += 1
+            for field in (diff.get("fields") or {}).values():
+                field_changes[field["change"]] += 1
+            if "anchors" in diff:
+                totals["anchor_changes"] += 1
+            if "ranges" in diff:
+                totals["range_changes"] += 1
+            if diff["regressions"]:
+                totals["with_regressions"] += 1
+                regressions.extend((name, r) for r in diff["regressions"])
+            if "pipeline_ms" in diff:
+                base_ms.append(diff["pipeline_ms"]["before"])
+                after_ms.append(diff["pipeline_ms"]["after"])
+            if out is not None and (changed or args.all):
+                record = {"key": list(key), "baseline": base_name, "after": name, "status": "changed" if changed else "same"}
+                record.update(diff)
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        for key, (base_name, _) in base_index.items():
+            totals["only_baseline"] += 1
+            regressions.append((base_name, "relatorio ausente no after"))
+            if out is not None:
+                out.write(json.dumps({"key": list(key), "baseline": base_name, "status": "only_baseline"}, ensure_ascii=False) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"[DIFF] casados={totals['matched']} iguais={totals['same']} mudaram={totals['changed']} "
+        f"so_baseline={totals['only_baseline']} so_after={totals['only_after']} ({elapsed:.2f}s)"
+    )
+    print(
+        f"[DIFF] campos: perdidos={field_changes['lost']} ganhos={field_changes['gained']} "
+        f"mudaram={field_changes['changed']} status={field_changes['status']} | "
+        f"ancoras mudaram em {totals['anchor_changes']}, ranges em {totals['range_changes']}"
+    )
+    if base_ms:
+        before, after = sum(base_ms), sum(after_ms)
+        delta = (after - before) / before * 100.0 if before > 0 else 0.0
+        print(f"[DIFF] pipeline (timestamps dos estagios): {before:.0f} ms -> {after:.0f} ms ({delta:+.1f}%)")
+    print(f"[DIFF] regressoes={len(regressions)} em {totals['with_regressions'] + totals['only_baseline']} relatorios")
+    for name, reason in regressions[: max(0, args.top)]:
+        print(f"  - {name}: {reason}")
+    if args.out:
+        print(f"[DIFF] jsonl={args.out}")
+    return 1 if (args.fail_on_regression and regressions) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())